@@ -4,11 +4,29 @@ import streamlit.components.v1 as components
 import logging
 import traceback
 import tempfile
+import uuid
+import copy
+import time
 
-from src.terminal import TerminalPreviewGenerator
-from src.config import ConfigGenerator
-from src.themes import COLOR_MAPPINGS, THEME_COLOR_SCHEME_MAPPING, get_colors_for_theme
+from src.terminal import TerminalPreviewGenerator, generate_cast_config, generate_live_channel_config
+from src.config import DEFAULT_CONFIG, FIELD_RANGES, FONT_OPTIONS
+from src.model import FIELD_COERCIONS, WezTermConfig
+from src.themes import THEME_COLOR_SCHEME_MAPPING, get_colors_for_theme, scheme_names
 from src.utils import load_css, config_has_changed, update_terminal_js
+from src.prewarm import PreviewPrewarmer
+from src.artifact_cache import ArtifactCache, artifact_key
+from src.config import ConfigGenerator
+from src.keybindings import KeyBindingIndex, parse_binding_line, format_binding_line, format_conflict
+from src.cast import CastFormatError, publish_cast, touch_cast, SAMPLE_CAST_PATH
+from src.live_apply import LiveApplier, default_config_path
+from src.warm_start import build_warm_start, hyperlink_rule_warnings, session_value
+from src.fonts import BUNDLED_FONTS, font_choices, installed_font_families
+from src.live_slider import live_slider
+from src.list_editor import LAUNCH_MENU, SSH_DOMAINS, list_editor
+from src.history import ConfigHistory
+from src.sharelink import MAX_URL_CODE_LENGTH, SHARE_PARAM, ShareLinkError, decode_config, encode_config
+from src.feature_registry import FeatureRegistry
+from src.option_schema import OptionSchemaError, check_value, load_option_schema
 
 log_file = os.path.join(tempfile.gettempdir(), "wezterm_gui.log")
 logging.basicConfig(
@@ -18,60 +36,174 @@ logging.basicConfig(
 )
 logger = logging.getLogger("wezterm_gui")
 
+MAX_REPORTED_CONFLICTS = 10
+
+
+@st.cache_resource
+def get_artifact_cache():
+    """On-disk artifact cache shared with the other worker processes"""
+    return ArtifactCache()
+
+
+@st.cache_resource
+def get_prewarmer():
+    """Process-wide preview/Lua prewarmer shared by all sessions"""
+    return PreviewPrewarmer(disk_cache=get_artifact_cache())
+
+
+@st.cache_resource(show_spinner=False)
+def get_live_applier(path):
+    """One debounced writer per target file, shared by every session that applies to it"""
+    return LiveApplier(path)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_font_families():
+    """Installed monospace families; only font directories whose mtime changed are rescanned"""
+    return {family.name: family for family in installed_font_families()}
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_artifact_cache_usage():
+    """Disk usage of the artifact cache; scanning it is not free, so refresh at most every 30s"""
+    return get_artifact_cache().disk_usage()
+
+
+@st.cache_data(show_spinner=False)
+def get_hyperlink_rule_warnings(labels):
+    """Profile the selected hyperlink rules once per selection, reusing other processes' results"""
+    return hyperlink_rule_warnings(labels, get_artifact_cache())
+
+
+@st.cache_resource(show_spinner=False)
+def get_option_schema():
+    """Load the option schema and register its options once per process"""
+    schema = load_option_schema()
+    FeatureRegistry.register_defaults(schema)
+    return schema
+
+
+@st.cache_resource(show_spinner=False)
+def get_sample_cast_url():
+    """Publish the bundled demo recording once per process; pinned, so other sessions' uploads never prune it"""
+    return publish_cast(SAMPLE_CAST_PATH, pin=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_warm_start():
+    """Shared start state for new sessions; the first session of the process builds it and the other caches"""
+    get_option_schema()
+    get_font_families()
+    get_sample_cast_url()
+    get_hyperlink_rule_warnings(tuple(DEFAULT_CONFIG['hyperlinkRules']))
+    return build_warm_start(get_prewarmer())
+
 
 class WezTermConfigurator:
     """WezTerm yapılandırıcı ana sınıfı"""
     
     def __init__(self):
         """Initialize the WezTerm configurator"""
+        self.started = time.perf_counter()
         st.set_page_config(layout="wide", page_title="WezTerm Configurator", page_icon="🖥️")
-        self.initialize_session_state()
+        self.initialize_session_state(get_warm_start())
+        self.load_share_link()
         load_css()
-        
-        if 'terminal_key' not in st.session_state:
-            st.session_state.terminal_key = 0
-            
-        if 'current_config' not in st.session_state:
-            st.session_state.current_config = self.get_default_config()
+
+        if 'config_history' not in st.session_state:
+            st.session_state.config_history = ConfigHistory()
+
+        if 'prewarm_session_id' not in st.session_state:
+            st.session_state.prewarm_session_id = uuid.uuid4().hex
+
+        # Sidebar sliders post mid-drag values to this session's preview on this channel
+        self.live_channel = f"wezterm-preview-{st.session_state.prewarm_session_id}"
 
     def get_default_config(self):
         """Varsayılan yapılandırma değerlerini döndür"""
-        return {
-            'theme': 'Dark',
-            'font': 'JetBrains Mono',
-            'font_size': 14,
-            'color_scheme': 'Builtin Dark',
-            'custom_colors': {'bg': '#282828', 'fg': '#ebdbb2', 'prompt': '#b8bb26'},
-            'opacity': 0.95,
-            'enable_tab_bar': True,
-            'enable_scroll_bar': False,
-            'default_cursor_style': 'Block',
-            'padding': 8,
-            'line_height': 1.0,
-            'use_fancy_tab_bar': True,
-            'hyperlinkRules': ['URL Algılama'],
-            'leader_key': 'CTRL + a',
-            'window_width': 800,
-            'window_height': 600,
-            'window_decorations': ['TITLE', 'RESIZE'],
-            'window_position': None,
-            'window_maximized': False,
-            'window_fullscreen': False,
-            'window_always_on_top': False,
-            'window_close_confirmation': 'AlwaysPrompt',
-            'window_hide_tab_bar_if_only_one_tab': True
-        }
+        return copy.deepcopy(DEFAULT_CONFIG)
 
-    def initialize_session_state(self):
+    def initialize_session_state(self, warm_start):
         """Session state değişkenlerini başlat"""
-        defaults = self.get_default_config()
-        
-        for key, value in defaults.items():
+        # Defaults are built once per process; a session only copies the mutable ones it is missing
+        for key, value in warm_start.session_defaults.items():
             if key not in st.session_state:
-                st.session_state[key] = value
-        
-        if 'selected_color_scheme' not in st.session_state:
-            st.session_state['selected_color_scheme'] = 'Builtin Dark'
+                st.session_state[key] = session_value(value)
+
+    def widget_key(self, name):
+        """Widget key that changes after undo/redo, so every widget restarts from the restored session state"""
+        return f"{name}@{st.session_state['widget_revision']}"
+
+    def update_session_state(self, values):
+        """Seçilen değerleri bir sonraki çalıştırma için session state'e yaz"""
+        for key, value in values.items():
+            st.session_state[key] = value
+
+    def restore_config(self, config):
+        """Geçmişten gelen yapılandırmayı kenar çubuğu widget'larına geri yükle"""
+        values = config.to_dict()
+        keys = values.pop('keys')
+        custom_colors = values.pop('custom_colors')
+        if custom_colors:
+            values['custom_colors'] = custom_colors
+        if config['theme'] != 'Custom':
+            values['selected_color_scheme'] = config['color_scheme']
+        values['key_bindings_text'] = '\n'.join(format_binding_line(binding) for binding in config['keys'])
+        # Schema option widgets read their value from a session key of the same name
+        for spec in load_option_schema().editable():
+            if spec.name in values['extra_options']:
+                values[spec.name] = values['extra_options'][spec.name]
+            else:
+                st.session_state.pop(spec.name, None)
+        self.update_session_state(values)
+        st.session_state['widget_revision'] += 1
+
+    def load_share_link(self):
+        """Paylaşım bağlantısındaki yapılandırmayı ilk render'dan önce session state'e yükle"""
+        code = st.query_params.get(SHARE_PARAM)
+        # The app writes its own code back into the URL; only a code it did not write is loaded
+        if not code or code == st.session_state.get('share_link_code'):
+            return
+        st.session_state['share_link_code'] = code
+        try:
+            self.restore_config(decode_config(code))
+        except ShareLinkError as e:
+            logger.warning(f"Paylaşım bağlantısı çözülemedi: {e}")
+            st.warning(f"Paylaşım bağlantısı açılamadı: {e}")
+
+    def render_share_link(self, config):
+        """Yapılandırmanın paylaşım bağlantısını göster ve adres çubuğuna yaz"""
+        code = encode_config(config)
+        st.markdown("**Paylaşım Bağlantısı**")
+        if len(code) > MAX_URL_CODE_LENGTH:
+            # Hundreds of list entries do not fit in a URL; the download carries them instead
+            st.query_params.pop(SHARE_PARAM, None)
+            st.caption(f"Yapılandırma bir bağlantıya sığmayacak kadar büyük ({len(code)} karakter); "
+                       f"paylaşmak için wezterm.lua dosyasını kullanın.")
+            return
+        st.session_state['share_link_code'] = code
+        st.query_params[SHARE_PARAM] = code
+        base_url = (st.context.url or '').split('?')[0]
+        st.code(f"{base_url}?{SHARE_PARAM}={code}", language=None)
+
+    def undo(self):
+        config = st.session_state.config_history.undo()
+        if config is not None:
+            self.restore_config(config)
+
+    def redo(self):
+        config = st.session_state.config_history.redo()
+        if config is not None:
+            self.restore_config(config)
+
+    def render_history_controls(self, container):
+        """Geri al / yinele düğmelerini render et"""
+        history = st.session_state.config_history
+        undo_col, redo_col = container.columns(2)
+        undo_col.button('↶ Geri Al', on_click=self.undo, disabled=not history.can_undo(),
+                        use_container_width=True)
+        redo_col.button('↷ Yinele', on_click=self.redo, disabled=not history.can_redo(),
+                        use_container_width=True)
 
     def render_theme_settings(self):
         """Tema ayarları bölümünü render et"""
@@ -79,31 +211,42 @@ class WezTermConfigurator:
         
         theme = st.sidebar.selectbox('Tema', 
                                    ['Dark', 'Light', 'Custom'],
-                                   index=['Dark', 'Light', 'Custom'].index(st.session_state['theme']))
+                                   index=['Dark', 'Light', 'Custom'].index(st.session_state['theme']),
+                                   key=self.widget_key('theme'))
         
         if theme != st.session_state['theme']:
             st.session_state['theme'] = theme
             if theme != 'Custom':
                 st.session_state['selected_color_scheme'] = THEME_COLOR_SCHEME_MAPPING[theme]
 
-        font = st.sidebar.selectbox('Yazı Tipi', 
-                                  ['JetBrains Mono', 'Fira Code', 'Cascadia Code', 'Hack', 
-                                   'Source Code Pro', 'Ubuntu Mono', 'Menlo', 'Monaco'])
-        
-        font_size = st.sidebar.slider('Yazı Boyutu', 8, 32, 14)
+        families = get_font_families()
+        font_options = font_choices(families, st.session_state['font'], fallback=FONT_OPTIONS)
+        font = st.sidebar.selectbox('Yazı Tipi', font_options,
+                                    index=font_options.index(st.session_state['font']),
+                                    key=self.widget_key('font'))
+        self.render_font_info(font, families)
+        
+        font_size = live_slider('Yazı Boyutu', *FIELD_RANGES['font_size'], st.session_state['font_size'], preview_field='fontSize',
+                                channel=self.live_channel, key=self.widget_key('font_size'))
+        self.update_session_state({'font': font, 'font_size': font_size})
 
         if theme != 'Custom':
-            color_scheme_options = list(COLOR_MAPPINGS.keys())
+            color_scheme_options = scheme_names()
+            if st.session_state['selected_color_scheme'] not in color_scheme_options:
+                # A shared or restored config can name a scheme that was imported elsewhere
+                color_scheme_options.append(st.session_state['selected_color_scheme'])
             color_scheme = st.sidebar.selectbox('Renk Şeması', 
                                           color_scheme_options, 
-                                          index=color_scheme_options.index(st.session_state['selected_color_scheme']))
+                                          index=color_scheme_options.index(st.session_state['selected_color_scheme']),
+                                          key=self.widget_key('color_scheme'))
             
             if color_scheme != st.session_state['selected_color_scheme']:
                 st.session_state['selected_color_scheme'] = color_scheme
         else:
             color_scheme = 'Custom'
 
-        opacity = st.sidebar.slider('Pencere Opaklığı', 0.5, 1.0, st.session_state['opacity'])
+        opacity = live_slider('Pencere Opaklığı', *FIELD_RANGES['opacity'], st.session_state['opacity'], 0.01,
+                              preview_field='opacity', channel=self.live_channel, key=self.widget_key('opacity'))
         if opacity != st.session_state['opacity']:
             st.session_state['opacity'] = opacity
         
@@ -111,9 +254,10 @@ class WezTermConfigurator:
         if theme == 'Custom':
             st.sidebar.markdown("## Özel Renk Ayarları")
             custom_colors = st.session_state['custom_colors']
-            bg = st.sidebar.color_picker('Arka Plan Rengi', custom_colors['bg'])
-            fg = st.sidebar.color_picker('Yazı Rengi', custom_colors['fg'])
-            prompt = st.sidebar.color_picker('Prompt Rengi', custom_colors['prompt'])
+            bg = st.sidebar.color_picker('Arka Plan Rengi', custom_colors['bg'], key=self.widget_key('custom_bg'))
+            fg = st.sidebar.color_picker('Yazı Rengi', custom_colors['fg'], key=self.widget_key('custom_fg'))
+            prompt = st.sidebar.color_picker('Prompt Rengi', custom_colors['prompt'],
+                                             key=self.widget_key('custom_prompt'))
             
             if (bg, fg, prompt) != (custom_colors['bg'], custom_colors['fg'], custom_colors['prompt']):
                 st.session_state['custom_colors'] = {'bg': bg, 'fg': fg, 'prompt': prompt}
@@ -132,21 +276,49 @@ class WezTermConfigurator:
         """Terminal seçenekleri bölümünü render et"""
         st.sidebar.markdown("## Terminal Seçenekleri")
         
-        enable_tab_bar = st.sidebar.checkbox('Sekme Çubuğunu Etkinleştir', value=True)
-        enable_scroll_bar = st.sidebar.checkbox('Kaydırma Çubuğunu Etkinleştir', value=False)
-        default_cursor_style = st.sidebar.selectbox('İmleç Stili', ['Block', 'Bar', 'Underline'], index=0)
+        enable_tab_bar = st.sidebar.checkbox('Sekme Çubuğunu Etkinleştir', value=st.session_state['enable_tab_bar'],
+                                             key=self.widget_key('enable_tab_bar'))
+        enable_scroll_bar = st.sidebar.checkbox('Kaydırma Çubuğunu Etkinleştir',
+                                                value=st.session_state['enable_scroll_bar'],
+                                                key=self.widget_key('enable_scroll_bar'))
+        cursor_styles = ['Block', 'Bar', 'Underline']
+        default_cursor_style = st.sidebar.selectbox('İmleç Stili', cursor_styles,
+                                                    index=cursor_styles.index(st.session_state['default_cursor_style']),
+                                                    key=self.widget_key('default_cursor_style'))
 
         with st.sidebar.expander("Gelişmiş Seçenekler"):
-            padding = st.sidebar.slider('Dolgu', 0, 20, 8)
-            line_height = st.sidebar.slider('Satır Yüksekliği', 0.8, 2.0, 1.0, 0.1)
-            use_fancy_tab_bar = st.sidebar.checkbox('Süslü Sekme Çubuğunu Kullan', value=True)
+            padding = live_slider('Dolgu', *FIELD_RANGES['padding'], st.session_state['padding'], preview_field='padding',
+                                  channel=self.live_channel, key=self.widget_key('padding'))
+            line_height = live_slider('Satır Yüksekliği', *FIELD_RANGES['line_height'], st.session_state['line_height'], 0.1,
+                                      preview_field='lineHeight', channel=self.live_channel,
+                                      key=self.widget_key('line_height'))
+            use_fancy_tab_bar = st.sidebar.checkbox('Süslü Sekme Çubuğunu Kullan',
+                                                    value=st.session_state['use_fancy_tab_bar'],
+                                                    key=self.widget_key('use_fancy_tab_bar'))
             hyperlinkRules = st.sidebar.multiselect('Bağlantı Kuralları', 
                                       ['URL Algılama', 'Dosya Yolları', 'E-posta Adresleri'],
-                                      ['URL Algılama'])
-            leader_key = st.sidebar.text_input('Lider Tuşu', 'CTRL + a')
+                                      list(st.session_state['hyperlinkRules']),
+                                      key=self.widget_key('hyperlinkRules'))
+            for warning in get_hyperlink_rule_warnings(tuple(hyperlinkRules)):
+                st.sidebar.warning(warning)
+            leader_key = st.sidebar.text_input('Lider Tuşu', st.session_state['leader_key'] or '',
+                                               key=self.widget_key('leader_key'))
             
             if leader_key and '+' not in leader_key:
                 st.sidebar.warning("Lider tuşu formatı 'MOD + TUŞ' şeklinde olmalıdır, örneğin 'CTRL + a'")
+            
+            keys = self.render_key_bindings(leader_key)
+
+        self.update_session_state({
+            'enable_tab_bar': enable_tab_bar,
+            'enable_scroll_bar': enable_scroll_bar,
+            'default_cursor_style': default_cursor_style,
+            'padding': padding,
+            'line_height': line_height,
+            'use_fancy_tab_bar': use_fancy_tab_bar,
+            'hyperlinkRules': hyperlinkRules,
+            'leader_key': leader_key
+        })
         
         return {
             'enable_tab_bar': enable_tab_bar,
@@ -156,55 +328,102 @@ class WezTermConfigurator:
             'line_height': line_height,
             'use_fancy_tab_bar': use_fancy_tab_bar,
             'hyperlinkRules': hyperlinkRules,
-            'leader_key': leader_key
+            'leader_key': leader_key,
+            'keys': keys
         }
 
+    def render_key_bindings(self, leader_key):
+        """Tuş atamaları editörünü render et ve çakışmaları satır içinde raporla"""
+        bindings_text = st.sidebar.text_area('Tuş Atamaları', st.session_state.get('key_bindings_text', ''),
+                                             help="Her satıra bir atama: MOD + TUŞ -> aksiyon, "
+                                                  "örneğin CTRL|SHIFT + t -> act.SpawnTab 'DefaultDomain'",
+                                             key=self.widget_key('keys'))
+        st.session_state['key_bindings_text'] = bindings_text
+        
+        bindings = []
+        for line_number, line in enumerate(bindings_text.splitlines(), 1):
+            if not line.strip() or line.lstrip().startswith('--'):
+                continue
+            try:
+                bindings.append(parse_binding_line(line))
+            except ValueError as e:
+                st.sidebar.warning(f"Satır {line_number}: {e}")
+        
+        # The index lives in the session so each edit only re-indexes the changed bindings
+        if 'key_binding_index' not in st.session_state:
+            st.session_state.key_binding_index = KeyBindingIndex()
+        index = st.session_state.key_binding_index
+        
+        leader = ConfigGenerator.parse_leader_key(leader_key) if leader_key and leader_key.strip() else None
+        try:
+            index.set_leader(*(leader or (None, None)))
+        except ValueError as e:
+            st.sidebar.warning(f"Lider tuşu: {e}")
+            leader = None
+            index.set_leader(None, None)
+        index.sync(ConfigGenerator.collect_key_bindings(leader, bindings))
+        
+        conflicts = index.conflicts()
+        for conflict in conflicts[:MAX_REPORTED_CONFLICTS]:
+            st.sidebar.warning(format_conflict(conflict))
+        if len(conflicts) > MAX_REPORTED_CONFLICTS:
+            st.sidebar.warning(f"... ve {len(conflicts) - MAX_REPORTED_CONFLICTS} çakışma daha")
+        
+        return bindings
+
     def render_window_options(self):
         """Pencere özellikleri bölümünü render et"""
         st.sidebar.markdown("## Pencere Özellikleri")
         
         window_width = st.sidebar.number_input('Pencere Genişliği (pixel)', 
-                                         min_value=400, max_value=3840, 
+                                         *FIELD_RANGES['window_width'], 
                                          value=st.session_state.get('window_width', 800),
-                                         step=50)
+                                         step=50, key=self.widget_key('window_width'))
         
         window_height = st.sidebar.number_input('Pencere Yüksekliği (pixel)', 
-                                          min_value=300, max_value=2160, 
+                                          *FIELD_RANGES['window_height'], 
                                           value=st.session_state.get('window_height', 600),
-                                          step=50)
+                                          step=50, key=self.widget_key('window_height'))
         
         window_decorations = st.sidebar.multiselect('Pencere Dekorasyonları',
                                               ['TITLE', 'RESIZE', 'MACOS_FORCE_ENABLE_SHADOW', 'INTEGRATED_BUTTONS'],
-                                              default=st.session_state.get('window_decorations', ['TITLE', 'RESIZE']))
+                                              default=st.session_state.get('window_decorations', ['TITLE', 'RESIZE']),
+                                              key=self.widget_key('window_decorations'))
         
         window_position_enabled = st.sidebar.checkbox('Başlangıç Pozisyonu Belirle',
-                                                value=st.session_state.get('window_position') is not None)
+                                                value=st.session_state.get('window_position') is not None,
+                                                key=self.widget_key('window_position_enabled'))
         window_position = None
         if window_position_enabled:
+            pos_x, pos_y = st.session_state.get('window_position') or (0, 0)
             col1, col2 = st.sidebar.columns(2)
             with col1:
-                pos_x = st.number_input('X Pozisyonu', value=0, step=10)
+                pos_x = st.number_input('X Pozisyonu', value=pos_x, step=10, key=self.widget_key('window_position_x'))
             with col2:
-                pos_y = st.number_input('Y Pozisyonu', value=0, step=10)
+                pos_y = st.number_input('Y Pozisyonu', value=pos_y, step=10, key=self.widget_key('window_position_y'))
             window_position = [pos_x, pos_y]
         
         window_maximized = st.sidebar.checkbox('Pencere Başlangıçta Maksimize',
-                                         value=st.session_state.get('window_maximized', False))
+                                         value=st.session_state.get('window_maximized', False),
+                                         key=self.widget_key('window_maximized'))
         
         window_fullscreen = st.sidebar.checkbox('Pencere Başlangıçta Tam Ekran',
-                                          value=st.session_state.get('window_fullscreen', False))
+                                          value=st.session_state.get('window_fullscreen', False),
+                                          key=self.widget_key('window_fullscreen'))
         
         window_always_on_top = st.sidebar.checkbox('Her Zaman Üstte',
-                                             value=st.session_state.get('window_always_on_top', False))
+                                             value=st.session_state.get('window_always_on_top', False),
+                                             key=self.widget_key('window_always_on_top'))
         
         window_close_confirmation = st.sidebar.selectbox('Kapatma Onayı',
                                                    ['Never', 'AlwaysPrompt', 'OnlyIfMultipleTabs'],
                                                    index=['Never', 'AlwaysPrompt', 'OnlyIfMultipleTabs'].index(
                                                        st.session_state.get('window_close_confirmation', 'AlwaysPrompt')
-                                                   ))
+                                                   ), key=self.widget_key('window_close_confirmation'))
         
         window_hide_tab_bar_if_only_one_tab = st.sidebar.checkbox('Tek Sekme Varsa Sekme Çubuğunu Gizle',
-                                                            value=st.session_state.get('window_hide_tab_bar_if_only_one_tab', True))
+                                                            value=st.session_state.get('window_hide_tab_bar_if_only_one_tab', True),
+                                                            key=self.widget_key('window_hide_tab_bar_if_only_one_tab'))
         
         self.update_window_session_state({
             'window_width': window_width,
@@ -230,24 +449,90 @@ class WezTermConfigurator:
             'window_hide_tab_bar_if_only_one_tab': window_hide_tab_bar_if_only_one_tab
         }
         
+    def render_list_options(self):
+        """SSH alanları ve başlatma menüsü gibi liste seçeneklerini sayfalı tablolarla render et"""
+        st.sidebar.markdown("## Alanlar ve Başlatma Menüsü")
+        values = {}
+        for field, label, option in (('ssh_domains', 'SSH Alanları', SSH_DOMAINS),
+                                     ('launch_menu', 'Başlatma Menüsü', LAUNCH_MENU)):
+            entries = FIELD_COERCIONS[field](st.session_state[field])
+            # The label stays fixed: a changing label would make a new, closed expander
+            expander = st.sidebar.expander(label, on_change="rerun", key=f"list_{field}")
+            # Like the option categories, a closed list sends nothing to the browser
+            if expander.open:
+                entries = list_editor(label, field, option, key=self.widget_key(field), container=expander)
+            st.session_state[field] = values[field] = entries
+        return values
+
+    def render_schema_options(self):
+        """Şemadaki diğer WezTerm seçeneklerini kategori kategori render et"""
+        schema = get_option_schema()
+        st.sidebar.markdown("## Diğer Seçenekler")
+        extra_options = dict(st.session_state['extra_options'])
+        for category, specs in schema.categories.items():
+            expander = st.sidebar.expander(f"{category} ({len(specs)})", on_change="rerun",
+                                           key=f"options_{category}")
+            # Closed categories render no widgets; their values stay in extra_options
+            if not expander.open:
+                continue
+            values = FeatureRegistry.render_category(category, container=expander, header=False,
+                                                     key_suffix=f"@{st.session_state['widget_revision']}")
+            for spec in specs:
+                try:
+                    value = check_value(spec, values[spec.name])
+                except OptionSchemaError as e:
+                    expander.warning(str(e))
+                    continue
+                if value != spec.default and FeatureRegistry.is_visible(spec.name):
+                    extra_options[spec.name] = list(value) if isinstance(value, tuple) else value
+                else:
+                    extra_options.pop(spec.name, None)
+        st.session_state['extra_options'] = extra_options
+        return {'extra_options': extra_options}
+
     def update_window_session_state(self, window_config):
         """Pencere ile ilgili session state değişkenlerini güncelle"""
-        for key, value in window_config.items():
-            st.session_state[key] = value
+        self.update_session_state(window_config)
 
     def render_sidebar(self):
-        """Sidebar'ı render et ve konfigürasyon sözlüğünü döndür"""
+        """Sidebar'ı render et ve değişmez yapılandırma modelini döndür"""
+        # Filled last, so the buttons already reflect this run's edit
+        history_container = st.sidebar.container()
         theme_config = self.render_theme_settings()
         terminal_config = self.render_terminal_options()
         window_config = self.render_window_options()
+        list_config = self.render_list_options()
+        option_config = self.render_schema_options()
         
-        config = {}
-        config.update(theme_config)
-        config.update(terminal_config)
-        config.update(window_config)
-        
+        config = WezTermConfig(**theme_config, **terminal_config, **window_config, **list_config, **option_config)
+        st.session_state.config_history.record(config)
+        self.render_history_controls(history_container)
         return config
 
+    def render_cast_options(self):
+        """Kayıt oynatma bölümünü render et ve önizlemeye eklenecek etiketi döndür"""
+        st.sidebar.markdown("## Kayıt Oynatma")
+        
+        uploaded = st.sidebar.file_uploader('Asciinema Kaydı (.cast)', type=['cast'])
+        play_sample = st.sidebar.checkbox('Örnek Kaydı Oynat', value=False, disabled=uploaded is not None)
+        speed = st.sidebar.slider('Oynatma Hızı', 0.5, 4.0, 1.0, 0.5)
+        
+        try:
+            if uploaded is not None:
+                # Convert each upload once; reruns reuse the published replay unless other sessions' uploads pruned it
+                if st.session_state.get('cast_file_id') != uploaded.file_id or \
+                        not touch_cast(st.session_state.cast_url):
+                    uploaded.seek(0)
+                    st.session_state.cast_url = publish_cast(uploaded)
+                    st.session_state.cast_file_id = uploaded.file_id
+                return generate_cast_config(st.session_state.cast_url, speed)
+            if play_sample:
+                return generate_cast_config(get_sample_cast_url(), speed)
+        except (CastFormatError, OSError) as e:
+            logger.error(f"Kayıt yayınlanamadı: {e}")
+            st.sidebar.error(f"Kayıt oynatılamıyor: {e}")
+        return ""
+
     def run(self):
         """Run the WezTerm Configurator app"""
         st.title('WezTerm Yapılandırıcı')
@@ -256,30 +541,31 @@ class WezTermConfigurator:
         terminal_placeholder = st.empty()
         
         config = self.render_sidebar()
+        session_tags = self.render_cast_options() + generate_live_channel_config(self.live_channel)
+        live_apply_path = self.render_live_apply_options()
         
         has_config_changed = config_has_changed(config, st.session_state.current_config)
         
-        self.render_terminal_preview(terminal_placeholder, config, has_config_changed)
-        self.render_configuration_code(config)
+        self.render_terminal_preview(terminal_placeholder, config, has_config_changed, session_tags)
+        self.render_configuration_code(config, live_apply_path)
         
-    def render_terminal_preview(self, placeholder, config, has_config_changed):
+    def render_terminal_preview(self, placeholder, config, has_config_changed, session_tags=""):
         """Terminal önizlemesini render et"""
         st.subheader("Terminal Önizleme")
         
         try:
             if has_config_changed or 'terminal_html' not in st.session_state:
-                colors = st.session_state['custom_colors'] if config['theme'] == 'Custom' else None
-                terminal_html = TerminalPreviewGenerator.generate_dynamic_terminal_preview(
-                    config['theme'], config['font'], config['font_size'], config['color_scheme'], 
-                    colors, config['opacity'], config['enable_tab_bar'], config['enable_scroll_bar'], 
-                    config['default_cursor_style'], config['padding'], config['line_height'], 
-                    config['use_fancy_tab_bar'], config['hyperlinkRules'], config['leader_key']
-                )
+                prewarmer = get_prewarmer()
+                terminal_html = prewarmer.get_or_render(config).preview_html
                 
                 st.session_state.terminal_html = terminal_html
                 st.session_state.terminal_key += 1
                 with placeholder:
-                    components.html(terminal_html, height=450, scrolling=False)
+                    components.html(terminal_html + session_tags, height=450, scrolling=False)
+                self.record_first_paint()
+                
+                # Moving on cancels the previous batch and prewarms the new neighbours
+                prewarmer.schedule(st.session_state.prewarm_session_id, config)
             else:
                 theme_colors = get_colors_for_theme(
                     config['theme'], 
@@ -288,28 +574,82 @@ class WezTermConfigurator:
                 )
                 update_terminal_js(config, theme_colors)
                 with placeholder:
-                    components.html(st.session_state.terminal_html, height=450, scrolling=False)
+                    components.html(st.session_state.terminal_html + session_tags, height=450, scrolling=False)
             
-            st.session_state.current_config = config.copy()
+            # Immutable, so the previous state can be kept without copying
+            st.session_state.current_config = config
             
             st.caption("💡 **İpucu:** Terminal'e tıklayarak komut girebilirsiniz. Yukarı/aşağı ok tuşları ile komut geçmişini gezebilirsiniz.")
-            st.caption("📋 **Kullanılabilir Komutlar:** `clear`, `ls`, `pwd`, `date`, `echo`, `help`, `wezterm`, `config`, `whoami`,`uname`, `screenfetch`")
+            st.caption("📋 **Kullanılabilir Komutlar:** `clear`, `ls`, `pwd`, `date`, `echo`, `help`, `wezterm`, `config`, `whoami`,`uname`, `screenfetch`, `colors`, `replay`")
             
         except Exception as e:
             logger.error(f"Terminal önizleme hatası: {e}\n{traceback.format_exc()}")
             st.error(f"Terminal önizleme hatası: {e}")
     
-    def render_configuration_code(self, config):
+    def record_first_paint(self):
+        """Oturumun ilk önizlemesine kadar geçen sunucu süresini kaydet"""
+        if 'first_paint_ms' not in st.session_state:
+            st.session_state.first_paint_ms = (time.perf_counter() - self.started) * 1e3
+            logger.info(f"Yeni oturum ilk önizlemeye {st.session_state.first_paint_ms:.0f} ms'de ulaştı")
+
+    def render_font_info(self, font, families):
+        """Seçili yazı tipinin ölçülerini ya da yüklü olmadığını göster"""
+        family = families.get(font)
+        if family:
+            cell = f"hücre genişliği {family.cell_width:.2f} em · " if family.cell_width else ""
+            st.sidebar.caption(f"{cell}satır yüksekliği {family.line_height:.2f} em · {len(family.styles)} stil")
+        elif font in BUNDLED_FONTS:
+            st.sidebar.caption("WezTerm ile birlikte gelir")
+        elif families:
+            st.sidebar.warning(f"'{font}' bu sistemde yüklü değil; WezTerm yedek yazı tipini kullanır")
+
+    def render_live_apply_options(self):
+        """Canlı uygulama bölümünü render et ve hedef dosya yolunu döndür"""
+        st.sidebar.markdown("## Canlı Uygulama")
+        # Path first: enabling must not write anywhere the user has not seen yet
+        path = st.sidebar.text_input('Yapılandırma Dosyası', value=default_config_path())
+        enabled = st.sidebar.checkbox('Canlı Uygula', value=False,
+                                      help="Oluşturulan yapılandırmayı doğrudan WezTerm yapılandırma dosyasına yazar")
+        st.sidebar.checkbox('Modüllere Böl', key='live_apply_split', value=False,
+                            help="wezterm.lua küçük kalır; bağlantılar, tuşlar, alanlar, menü, seçenekler ve renkler "
+                                 "wezterm_gui/ altındaki modüllerden require ile yüklenir. "
+                                 "İçeriği değişmeyen modüllere dokunulmaz.")
+        if not enabled or not path.strip():
+            return None
+        path = path.strip()
+
+        stats = get_live_applier(path).stats()
+        if stats['last_error']:
+            st.sidebar.error(f"Yazılamadı: {stats['last_error']}")
+        elif stats['last_write']:
+            st.sidebar.caption(f"Son yazma: {time.strftime('%H:%M:%S', time.localtime(stats['last_write']))} · "
+                               f"{stats['writes']} yazma, {stats['unchanged']} değişmeyen, "
+                               f"{stats['coalesced']} birleştirilen · {stats['files_unchanged']} dosyaya dokunulmadı")
+        else:
+            st.sidebar.caption("Henüz yazılmadı. İlk yazımda mevcut dosya .bak olarak yedeklenir.")
+        return path
+
+    def render_configuration_code(self, config, live_apply_path=None):
         """Yapılandırma kodu ve ayarlar bölümünü render et"""
         st.subheader("Yapılandırma Kodu ve Ayarlar")
         code_col, settings_col = st.columns([2, 1])
         
         with code_col:
-            lua_code = ConfigGenerator.generate_wezterm_lua(config)
+            lua_code = get_prewarmer().get_or_render(config).lua_code
             
+            split_lua = None
+            if lua_code and st.session_state.get('live_apply_split'):
+                split_lua = ConfigGenerator.generate_wezterm_modules(config)
+
+            if lua_code and live_apply_path:
+                get_live_applier(live_apply_path).submit(split_lua or lua_code)
+
             if lua_code:
                 st.code(lua_code, language='lua')
+                if split_lua:
+                    self.render_split_modules(split_lua)
                 st.download_button("wezterm.lua İndir", lua_code, file_name="wezterm.lua")
+                self.render_share_link(config)
                 st.info("""
                 **Bu yapılandırmayı kullanmak için:**
                 1. "wezterm.lua İndir" düğmesini kullanarak dosyayı indirin
@@ -322,6 +662,15 @@ class WezTermConfigurator:
         with settings_col:
             self.render_settings_summary(config, settings_col)
     
+    def render_split_modules(self, split_lua):
+        """Modüllere bölünmüş çıktının dosyalarını göster"""
+        with st.expander(f"Modüller ({len(split_lua.modules) + 1} dosya)"):
+            st.caption("wezterm.lua")
+            st.code(split_lua.entry, language='lua')
+            for path, source in split_lua.modules.items():
+                st.caption(path)
+                st.code(source, language='lua')
+
     def render_settings_summary(self, config, container):
         """Ayarlar özeti bölümünü render et"""
         container.markdown("### Aktif Ayarlar")
@@ -340,15 +689,35 @@ class WezTermConfigurator:
             'window_hide_tab_bar_if_only_one_tab': config.get('window_hide_tab_bar_if_only_one_tab')
         }
         
-        settings_html = TerminalPreviewGenerator.generate_settings_table(
+        settings_args = (
             config['theme'], config['color_scheme'], config['font'], config['font_size'], 
             config['opacity'], config['padding'], config['line_height'], 
             config['default_cursor_style'], config['enable_tab_bar'], config['use_fancy_tab_bar'], 
             config['enable_scroll_bar'], config['hyperlinkRules'], config['leader_key'], 
-            display_colors, **window_props
+            dict(display_colors)
+        )
+        settings_html = get_artifact_cache().get_or_create(
+            'settings', artifact_key('settings', [settings_args, window_props]),
+            lambda: TerminalPreviewGenerator.generate_settings_table(*settings_args, **window_props)
         )
         
         components.html(settings_html, height=600, scrolling=True)
+        self.render_cache_stats(container)
+
+    def render_cache_stats(self, container):
+        """Artifact önbelleği isabet oranlarını göster"""
+        with container.expander("Önbellek İstatistikleri"):
+            stats = get_artifact_cache().stats()
+            usage = get_artifact_cache_usage()
+            total = stats['total']
+            st.metric("İsabet Oranı (bu süreç)", f"%{total['hit_rate'] * 100:.0f}",
+                      help=f"{total['hits']} isabet, {total['misses']} ıska, {total['evictions']} silme")
+            used = sum(kind_usage['bytes'] for kind_usage in usage.values())
+            st.caption(f"Disk: {used / 1024 / 1024:.1f} / {stats['max_bytes'] / 1024 / 1024:.0f} MB, "
+                       f"{sum(kind_usage['entries'] for kind_usage in usage.values())} girdi")
+            for kind, counters in sorted(stats['kinds'].items()):
+                st.caption(f"`{kind}`: %{counters['hit_rate'] * 100:.0f} isabet "
+                           f"({counters['hits']}/{counters['hits'] + counters['misses']})")
 
 if __name__ == "__main__":
     app = WezTermConfigurator()
@@ -0,0 +1,105 @@
+"""Load test for the local config API (src/api.py).
+
+    python benchmarks/api_load_test.py --start-server --connections 16 --requests 200
+    python benchmarks/api_load_test.py --port 8765 --endpoint /preview --batch 10
+
+Each connection is kept alive for all of its requests. Reports requests/sec and
+latency percentiles.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.api import ConfigApiServer
+from src.themes import COLOR_MAPPINGS
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def sample_body(index, batch):
+    schemes = list(COLOR_MAPPINGS.keys())
+    configs = [{'color_scheme': schemes[(index + i) % len(schemes)], 'font_size': 10 + (index + i) % 12}
+               for i in range(batch)]
+    return configs if batch > 1 else configs[0]
+
+
+async def run_connection(host, port, endpoint, requests, batch, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(requests):
+            method = 'GET' if endpoint.startswith('/themes') else 'POST'
+            body = b'' if method == 'GET' else json.dumps(sample_body(i, batch)).encode('utf-8')
+            request = (
+                f"{method} {endpoint} HTTP/1.1\r\nHost: {host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+            ).encode('latin-1') + body
+
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            head = await reader.readuntil(b'\r\n\r\n')
+            length = 0
+            for line in head.decode('latin-1').split('\r\n'):
+                if line.lower().startswith('content-length:'):
+                    length = int(line.split(':', 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+
+
+async def run_load_test(args):
+    server = None
+    host, port = args.host, args.port
+    if args.start_server:
+        server = ConfigApiServer(host, 0, args.workers)
+        await server.start()
+        port = server.port
+
+    latencies = []
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        run_connection(host, port, args.endpoint, args.requests, args.batch, latencies)
+        for _ in range(args.connections)
+    ])
+    elapsed = time.perf_counter() - started
+
+    if server is not None:
+        await server.close()
+
+    total = len(latencies)
+    print(f"Endpoint:       {args.endpoint} (batch={args.batch}, workers={args.workers})")
+    print(f"Connections:    {args.connections}")
+    print(f"Requests:       {total} in {elapsed:.2f}s")
+    print(f"Requests/sec:   {total / elapsed:.1f}")
+    print(f"Configs/sec:    {total * args.batch / elapsed:.1f}")
+    print(f"Latency p50:    {percentile(latencies, 50) * 1000:.2f} ms")
+    print(f"Latency p99:    {percentile(latencies, 99) * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Config API load test")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--endpoint', default='/lua')
+    parser.add_argument('--connections', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=100, help="requests per connection")
+    parser.add_argument('--batch', type=int, default=1, help="configs per request body")
+    parser.add_argument('--start-server', action='store_true', help="run an in-process server on a free port")
+    parser.add_argument('--workers', type=int, default=0, help="worker processes for --start-server")
+    asyncio.run(run_load_test(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
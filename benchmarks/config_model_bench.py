@@ -0,0 +1,75 @@
+"""Memory and comparison cost of WezTermConfig versus the plain config dict.
+
+    python benchmarks/config_model_bench.py --instances 10000
+"""
+import os
+import sys
+import copy
+import timeit
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import DEFAULT_CONFIG
+from src.model import WezTermConfig
+from src.prewarm import config_cache_key
+from src.utils import config_has_changed
+
+
+def bytes_per_instance(factory, count):
+    """Average traced allocation per instance kept alive"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del instances
+    return total / count
+
+
+def per_call_us(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WezTermConfig vs dict benchmark")
+    parser.add_argument('--instances', type=int, default=10000)
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+
+    base_dict = copy.deepcopy(DEFAULT_CONFIG)
+    base_model = WezTermConfig.from_mapping(base_dict)
+
+    # Each session keeps a config per rerun: the dict version did config.copy(),
+    # the model shares every unchanged value with its predecessor
+    dict_mem = bytes_per_instance(lambda i: dict(base_dict, font_size=i), args.instances)
+    model_mem = bytes_per_instance(lambda i: base_model.replace(font_size=i), args.instances)
+
+    same_dict, other_dict = dict(base_dict), dict(base_dict, padding=12)
+    same_model, other_model = WezTermConfig.from_mapping(same_dict), base_model.replace(padding=12)
+
+    rows = [
+        ("memory / instance (bytes)", dict_mem, model_mem, ""),
+        ("config_has_changed, equal (us)",
+         per_call_us(lambda: config_has_changed(base_dict, same_dict), args.number),
+         per_call_us(lambda: config_has_changed(base_model, same_model), args.number), ""),
+        ("config_has_changed, differs (us)",
+         per_call_us(lambda: config_has_changed(base_dict, other_dict), args.number),
+         per_call_us(lambda: config_has_changed(base_model, other_model), args.number), ""),
+        ("cache key + hash (us)",
+         per_call_us(lambda: hash(config_cache_key(base_dict)), args.number),
+         per_call_us(lambda: hash(config_cache_key(base_model)), args.number), ""),
+        ("snapshot / update one key (us)",
+         per_call_us(lambda: dict(base_dict, font_size=15), args.number),
+         per_call_us(lambda: base_model.replace(font_size=15), args.number), "copy() vs replace()"),
+    ]
+
+    print(f"{'':36} {'dict':>12} {'WezTermConfig':>14}")
+    for name, dict_value, model_value, note in rows:
+        print(f"{name:36} {dict_value:>12.2f} {model_value:>14.2f}  {note}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Visibility evaluation cost of FeatureRegistry with several hundred features.
+
+Compares re-checking every feature's depends_on on each rerun (the previous
+behaviour) with the dependency graph, which only re-evaluates the features
+below the key that changed.
+
+    python benchmarks/feature_registry_bench.py --features 600
+"""
+import os
+import sys
+import timeit
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import streamlit as st
+import streamlit.logger
+
+from src.feature_registry import Feature, FeatureRegistry
+
+
+def build_registry(count, fanout):
+    """count features in a tree: every feature but the roots depends on its parent"""
+    FeatureRegistry.reset()
+    for index in range(count):
+        parent = (index - 1) // fanout if index else None
+        depends_on = {f"feature_{parent}": True} if parent is not None and index % 7 else None
+        FeatureRegistry.register(Feature(f"feature_{index}", f"Kategori {index % 12}", True,
+                                         widget_type="checkbox", depends_on=depends_on))
+
+
+def check_all():
+    # What render_feature did before: every condition of every feature, every rerun
+    visible = 0
+    for feature in FeatureRegistry._features.values():
+        if all(st.session_state.get(key) == value for key, value in (feature.depends_on or {}).items()):
+            visible += 1
+    return visible
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FeatureRegistry dependency graph benchmark")
+    parser.add_argument('--features', type=int, default=600)
+    parser.add_argument('--fanout', type=int, default=4)
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+    # Bare mode: silence the missing-ScriptRunContext warning on every session_state access
+    # (streamlit creates its loggers lazily, so the level has to go through its own helper)
+    streamlit.logger.set_log_level(logging.ERROR)
+
+    register_ms = min(timeit.repeat(lambda: build_registry(args.features, args.fanout), number=1, repeat=3)) * 1e3
+    FeatureRegistry.topological_order()
+    FeatureRegistry.sync_with_session_state()
+
+    # A feature a couple of levels below the root, with a small subtree of its own
+    branch = f"feature_{args.fanout + 2}"
+    flip = {'value': True}
+
+    def change_branch():
+        flip['value'] = not flip['value']
+        st.session_state[branch] = flip['value']
+        return FeatureRegistry.sync_with_session_state()
+
+    def change_root():
+        flip['value'] = not flip['value']
+        st.session_state['feature_0'] = flip['value']
+        return FeatureRegistry.sync_with_session_state()
+
+    before = FeatureRegistry._evaluations
+    affected_root = len(change_root())
+    evaluations_root = FeatureRegistry._evaluations - before
+    rows = [
+        ("register all (ms)", register_ms, ""),
+        ("check every feature (us)", min(timeit.repeat(check_all, number=args.number, repeat=5)) / args.number * 1e6,
+         f"{args.features} features"),
+        ("no change, sync (us)",
+         min(timeit.repeat(FeatureRegistry.sync_with_session_state, number=args.number, repeat=5)) / args.number * 1e6,
+         ""),
+        ("branch changed, sync (us)", min(timeit.repeat(change_branch, number=args.number, repeat=5)) / args.number * 1e6,
+         f"{len(change_branch())} re-evaluated"),
+        ("root changed, sync (us)", min(timeit.repeat(change_root, number=args.number, repeat=5)) / args.number * 1e6,
+         f"{affected_root} re-evaluated ({evaluations_root} evaluations)"),
+    ]
+    for name, value, note in rows:
+        print(f"{name:30} {value:>10.1f}  {note}")
+
+
+if __name__ == '__main__':
+    main()
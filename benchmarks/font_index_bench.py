@@ -0,0 +1,78 @@
+"""Font index cost: cold scan versus startup and rerun with the persisted index.
+
+Copies one installed font file into a synthetic tree (--files files spread
+over --dirs directories) and times:
+
+    cold      no index yet: every file is opened and its sfnt tables read
+    startup   new process: load the persisted index, stat every directory
+    rerun     same process, nothing changed: one stat per directory
+    one dir   a font was added to one directory: only that directory is rescanned
+
+    python benchmarks/font_index_bench.py --files 200 2000 --dirs 50
+"""
+import os
+import sys
+import shutil
+import timeit
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.fonts import FontIndex, installed_font_families
+
+
+def build_tree(root, source, files, dirs):
+    for index in range(files):
+        directory = os.path.join(root, f"family-{index % dirs:04d}")
+        os.makedirs(directory, exist_ok=True)
+        shutil.copyfile(source, os.path.join(directory, f"face-{index:05d}.ttf"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Font index benchmark")
+    parser.add_argument('--files', type=int, nargs='+', default=[200, 2000])
+    parser.add_argument('--dirs', type=int, default=50)
+    parser.add_argument('--font', help="font file to copy (default: the first installed monospace face)")
+    args = parser.parse_args()
+
+    source = args.font
+    if source is None:
+        with tempfile.TemporaryDirectory() as directory:
+            families = installed_font_families(path=os.path.join(directory, 'index.json'))
+        if not families:
+            sys.exit("Kopyalanacak yazı tipi bulunamadı; --font ile bir .ttf dosyası verin")
+        source = families[0].paths[0]
+    print(f"font: {source}")
+    print(f"{'files':>6} {'dirs':>5} {'cold (ms)':>10} {'startup (ms)':>13} {'rerun (ms)':>11} {'one dir (ms)':>13}")
+    for files in args.files:
+        with tempfile.TemporaryDirectory() as directory:
+            fonts = os.path.join(directory, 'fonts')
+            index_path = os.path.join(directory, 'index.json')
+            build_tree(fonts, source, files, args.dirs)
+
+            def cold():
+                if os.path.exists(index_path):
+                    os.remove(index_path)
+                FontIndex([fonts], index_path).refresh()
+            cold_ms = min(timeit.repeat(cold, number=1, repeat=3)) * 1e3
+
+            startup_ms = min(timeit.repeat(lambda: FontIndex([fonts], index_path).refresh(),
+                                           number=1, repeat=5)) * 1e3
+            index = FontIndex([fonts], index_path)
+            index.refresh()
+            rerun_ms = min(timeit.repeat(index.refresh, number=10, repeat=5)) / 10 * 1e3
+
+            changed = os.path.join(fonts, "family-0000")
+            added = iter(range(10 ** 6))
+
+            def one_dir():
+                shutil.copyfile(source, os.path.join(changed, f"added-{next(added)}.ttf"))
+                index.refresh()
+            one_dir_ms = min(timeit.repeat(one_dir, number=1, repeat=5)) * 1e3
+            print(f"{files:>6} {args.dirs:>5} {cold_ms:>10.1f} {startup_ms:>13.2f} {rerun_ms:>11.2f} "
+                  f"{one_dir_ms:>13.2f}")
+
+
+if __name__ == '__main__':
+    main()
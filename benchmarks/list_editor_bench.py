@@ -0,0 +1,68 @@
+"""List editor cost: reruns and edits with growing SSH domain lists.
+
+For each --entries count, runs app.py under AppTest with the SSH domain editor
+open and reports the median rerun time, the size of what the editor sends to
+the browser (one page, so it should not grow), and what a single-row edit
+costs in Python: applying the row operation and regenerating the Lua.
+
+    python benchmarks/list_editor_bench.py --entries 0 100 1000 10000 --reruns 15
+"""
+import os
+import sys
+import time
+import timeit
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import ConfigGenerator, SshDomain
+from src.list_editor import SSH_DOMAINS, apply_row_ops
+from src.model import DEFAULT_WEZTERM_CONFIG
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+
+def domains(count):
+    return tuple(SshDomain(f"host-{index}", f"host-{index}.example.com:22", 'deploy') for index in range(count))
+
+
+def editor_payload_bytes(at):
+    """Size of the editor component's arguments, i.e. what one rerun sends for it"""
+    for expander in at.sidebar.expander:
+        if expander.label == 'SSH Alanları':
+            return sum(len(getattr(child.proto, 'json_args', '')) for child in expander.children.values())
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List editor benchmark")
+    parser.add_argument('--entries', type=int, nargs='+', default=[0, 100, 1000, 10000])
+    parser.add_argument('--reruns', type=int, default=15)
+    args = parser.parse_args()
+
+    from streamlit.testing.v1 import AppTest
+
+    print(f"{'entries':>8} {'rerun (ms)':>11} {'editor args (B)':>16} {'apply op (ms)':>14} {'lua (ms)':>9}")
+    for count in args.entries:
+        entries = domains(count)
+        at = AppTest.from_file(APP_PATH, default_timeout=120).run()
+        at.session_state['ssh_domains'] = entries
+        at.session_state['list_ssh_domains'] = True
+        at.run()
+        times = []
+        for _ in range(args.reruns):
+            started = time.perf_counter()
+            at.run()
+            times.append((time.perf_counter() - started) * 1e3)
+
+        op = [{'op': 'update', 'index': count // 2, 'cells': ['edited', 'edited.example.com', '', 'None']}]
+        apply_ms = min(timeit.repeat(lambda: apply_row_ops(entries, op, SSH_DOMAINS), number=5, repeat=3)) / 5 * 1e3
+        config = DEFAULT_WEZTERM_CONFIG.replace(ssh_domains=entries)
+        lua_ms = min(timeit.repeat(lambda: ConfigGenerator.generate_wezterm_lua(config), number=1, repeat=3)) * 1e3
+        print(f"{count:>8} {statistics.median(times):>11.1f} {editor_payload_bytes(at):>16} {apply_ms:>14.3f} "
+              f"{lua_ms:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""Single-file versus split Lua output: parse/eval time and bytes rewritten per edit.
+
+Generates a large config (user key bindings, every hyperlink rule, a Custom
+palette, changed schema options) in both layouts and times them in a local
+Lua interpreter: ``lupa`` when it is installed, otherwise a ``lua``/``luajit``
+executable. ``wezterm`` is replaced by a stub module that only builds tables,
+so the numbers are Lua parse and evaluation cost, not WezTerm's.
+
+    parse   compiling every file of the layout (load)
+    eval    loading the entry from scratch, running it and every required module
+
+The last columns are the bytes the live writer rewrites after one edit: the
+whole file in one layout, only the files whose content changed in the other
+(the entry for a font size change, keys.lua for a changed binding). Split
+output parses and evaluates slightly slower, since every module is a separate
+file lookup and chunk; what it saves is rewriting and re-watching a large file
+for a small edit.
+
+    python benchmarks/lua_split_bench.py --keys 0 200 2000
+"""
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import DEFAULT_CONFIG, HYPERLINK_RULES, ConfigGenerator
+
+# Runs with the layout's directory, entry file name, module names and iteration count as varargs
+HARNESS = r"""
+local root, entry, module_list, iterations = ...
+local modules = {}
+for name in string.gmatch(module_list, '[^,]+') do modules[#modules + 1] = name end
+
+local act = setmetatable({}, { __index = function(_, name)
+  return setmetatable({ name = name }, { __call = function(self, args) return { self.name, args } end })
+end })
+package.loaded.wezterm = {
+  action = act,
+  config_builder = function() return {} end,
+  font = function(family) return { family = family } end,
+}
+package.path = root .. '/?.lua;' .. package.path
+
+local function read(path)
+  local f = assert(io.open(path, 'r'))
+  local source = f:read('*a')
+  f:close()
+  return source
+end
+
+local sources = { read(root .. '/' .. entry) }
+for _, name in ipairs(modules) do sources[#sources + 1] = read(root .. '/' .. name:gsub('%.', '/') .. '.lua') end
+
+local function best(fn)
+  local result = math.huge
+  for _ = 1, 5 do
+    local start = os.clock()
+    for _ = 1, iterations do fn() end
+    result = math.min(result, (os.clock() - start) / iterations)
+  end
+  return result * 1e6
+end
+
+local parse = best(function()
+  for _, source in ipairs(sources) do assert(load(source)) end
+end)
+local eval = best(function()
+  for _, name in ipairs(modules) do package.loaded[name] = nil end
+  local config = assert(loadfile(root .. '/' .. entry))()
+  assert(config.font)
+end)
+return string.format('%.1f %.1f', parse, eval)
+"""
+
+
+def lua_runner():
+    """(description, run(root, entry, modules, iterations) -> 'parse eval') for the local interpreter"""
+    try:
+        import lupa
+    except ImportError:
+        lupa = None
+    if lupa is not None:
+        runtime = lupa.LuaRuntime()
+        harness = runtime.eval(f"function(...) {HARNESS} end")
+        version = '.'.join(map(str, runtime.lua_version))
+        return f"lupa (Lua {version})", harness
+    for name in ('luajit', 'lua', 'lua5.4', 'lua5.3', 'lua5.1'):
+        executable = shutil.which(name)
+        if executable:
+            def run(*args, executable=executable):
+                # The script comes from stdin; the arguments after "-" become its varargs
+                script = f"print((function(...) {HARNESS} end)(...))"
+                return subprocess.run([executable, '-', *map(str, args)], input=script,
+                                      capture_output=True, text=True, check=True).stdout.strip()
+            return executable, run
+    return None, None
+
+
+def large_config(key_count):
+    keys = [{'key': f"F{index % 24 + 1}", 'mods': 'CTRL|ALT' if index % 2 else 'SUPER',
+             'action': f"act.SpawnCommandInNewTab {{ args = {{ 'htop', '--delay', '{index}' }} }}"}
+            for index in range(key_count)]
+    return dict(DEFAULT_CONFIG, keys=keys, theme='Custom', hyperlinkRules=list(HYPERLINK_RULES),
+                extra_options={'scrollback_lines': 10000, 'audible_bell': 'Disabled', 'tab_max_width': 32})
+
+
+def write_layouts(config, directory):
+    single = os.path.join(directory, 'single')
+    os.makedirs(single)
+    with open(os.path.join(single, 'wezterm.lua'), 'w', encoding='utf-8') as f:
+        f.write(ConfigGenerator.generate_wezterm_lua(config))
+    split = os.path.join(directory, 'split')
+    split_lua = ConfigGenerator.split_wezterm_lua(config)
+    for relative, source in {'wezterm.lua': split_lua.entry, **split_lua.modules}.items():
+        path = os.path.join(split, *relative.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+    return single, split, split_lua
+
+
+def rewritten_bytes(config, edited):
+    """Bytes each layout rewrites when config turns into edited"""
+    single = ConfigGenerator.generate_wezterm_lua(edited)
+    before, after = ConfigGenerator.split_wezterm_lua(config), ConfigGenerator.split_wezterm_lua(edited)
+    split = len(after.entry) if after.entry != before.entry else 0
+    split += sum(len(source) for path, source in after.modules.items() if before.modules.get(path) != source)
+    return len(single), split
+
+
+def edits(config):
+    """(font size edit, key binding edit) of config"""
+    keys = list(config['keys']) or [{'key': 'F1', 'mods': 'SUPER', 'action': "act.ActivateCopyMode"}]
+    return (dict(config, font_size=config['font_size'] + 1),
+            dict(config, keys=keys[:-1] + [dict(keys[-1], key='F12')]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Single-file vs split Lua output benchmark")
+    parser.add_argument('--keys', type=int, nargs='+', default=[0, 200, 2000])
+    parser.add_argument('--number', type=int, default=50)
+    args = parser.parse_args()
+
+    description, run = lua_runner()
+    if run is None:
+        sys.exit("Lua yorumlayıcısı bulunamadı: lupa kurun (pip install lupa) ya da PATH'e lua/luajit ekleyin")
+    print(f"interpreter: {description}")
+    print(f"{'keys':>6} {'layout':>7} {'files':>6} {'bytes':>8} {'parse (us)':>11} {'eval (us)':>10} "
+          f"{'font edit (bytes)':>18} {'key edit (bytes)':>17}")
+    for key_count in args.keys:
+        config = large_config(key_count)
+        font_edit, key_edit = (rewritten_bytes(config, edited) for edited in edits(config))
+        with tempfile.TemporaryDirectory() as directory:
+            single, split, split_lua = write_layouts(config, directory)
+            modules = ','.join(path[:-len('.lua')].replace('/', '.') for path in split_lua.modules)
+            for column, (layout, root, module_list, files) in enumerate((
+                    ('single', single, '', {'wezterm.lua': None}),
+                    ('split', split, modules, {'wezterm.lua': None, **split_lua.modules}))):
+                parse_us, eval_us = map(float, run(root, 'wezterm.lua', module_list, args.number).split())
+                size = sum(os.path.getsize(os.path.join(root, *path.split('/'))) for path in files)
+                print(f"{key_count:>6} {layout:>7} {len(files):>6} {size:>8} {parse_us:>11.1f} {eval_us:>10.1f} "
+                      f"{font_edit[column]:>18} {key_edit[column]:>17}")
+
+
+if __name__ == '__main__':
+    main()
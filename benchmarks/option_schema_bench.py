@@ -0,0 +1,104 @@
+"""Startup and rerun cost of the schema-driven options as the schema grows.
+
+Builds synthetic schemas of increasing size (same categories and type mix as
+the bundled one) and times what the app pays per process (parse + register)
+and per rerun: with every category closed the sidebar only lays out one
+expander per category, and opening one adds the dependency sync in front of
+its widgets. Lua generation is timed with a fixed number of changed options.
+The closed rerun and Lua costs stay flat; startup grows once per process and
+the sync only with the number of options that others depend on.
+
+    python benchmarks/option_schema_bench.py --sizes 100 400 1600
+"""
+import io
+import os
+import sys
+import json
+import timeit
+import logging
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import streamlit.logger
+
+from src.feature_registry import FeatureRegistry
+from src.lua import LuaEmitter
+from src.option_schema import OptionSchema, load_option_schema, write_options
+
+
+def synthetic_schema(size):
+    """Schema dict with size options, cloned round-robin from the bundled schema"""
+    base = load_option_schema().editable()
+    copies = [(base[index % len(base)], index // len(base)) for index in range(size)]
+    names = {f"{spec.name}_{copy}" for spec, copy in copies}
+    categories = {}
+    for spec, copy in copies:
+        raw = {'name': f"{spec.name}_{copy}", 'type': spec.type,
+               'default': list(spec.default) if isinstance(spec.default, tuple) else spec.default,
+               'min': spec.min_value, 'max': spec.max_value, 'step': spec.step, 'options': spec.options}
+        # Each copy depends on the same copy of its parent, when that made it into the schema
+        depends_on = {f"{key}_{copy}": value for key, value in (spec.depends_on or {}).items()}
+        if depends_on and set(depends_on) <= names:
+            raw['depends_on'] = depends_on
+        categories.setdefault(spec.category, []).append(raw)
+    return {'version': 1, 'categories': [{'name': name, 'options': options} for name, options in categories.items()]}
+
+
+def closed_rerun(schema):
+    # What render_schema_options does when no category is open: no widgets, no dependency checks
+    return [f"{category} ({len(specs)})" for category, specs in schema.categories.items()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Option schema scaling benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 400, 1600])
+    parser.add_argument('--changed', type=int, default=8)
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+    # Bare mode: silence the missing-ScriptRunContext warning on every session_state access
+    # (streamlit creates its loggers lazily, so the level has to go through its own helper)
+    streamlit.logger.set_log_level(logging.ERROR)
+
+    print(f"{'options':>8} {'parse (ms)':>11} {'register (ms)':>14} {'closed rerun (us)':>18} "
+          f"{'open sync (us)':>15} {'lua (us)':>9}")
+    for size in args.sizes:
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump(synthetic_schema(size), f)
+        try:
+            def parse():
+                with open(f.name, encoding='utf-8') as schema_file:
+                    return OptionSchema.from_dict(json.load(schema_file))
+            schema = parse()
+            parse_ms = min(timeit.repeat(parse, number=1, repeat=3)) * 1e3
+
+            def register():
+                FeatureRegistry.reset()
+                FeatureRegistry.register_defaults(schema)
+            register_ms = min(timeit.repeat(register, number=1, repeat=3)) * 1e3
+            FeatureRegistry.sync_with_session_state()
+
+            rerun_us = min(timeit.repeat(lambda: closed_rerun(schema), number=args.number,
+                                         repeat=5)) / args.number * 1e6
+            sync_us = min(timeit.repeat(FeatureRegistry.sync_with_session_state, number=args.number,
+                                        repeat=5)) / args.number * 1e6
+            values = {}
+            for spec in schema.editable():
+                if len(values) >= args.changed:
+                    break
+                if spec.type == 'bool':
+                    values[spec.name] = not spec.default
+
+            def lua():
+                write_options(LuaEmitter(io.StringIO()), schema, values)
+            lua_us = min(timeit.repeat(lua, number=args.number, repeat=5)) / args.number * 1e6
+            print(f"{len(schema):>8} {parse_ms:>11.2f} {register_ms:>14.2f} {rerun_us:>18.1f} "
+                  f"{sync_us:>15.1f} {lua_us:>9.1f}")
+        finally:
+            os.unlink(f.name)
+            FeatureRegistry.reset()
+
+
+if __name__ == '__main__':
+    main()
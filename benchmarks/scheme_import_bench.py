@@ -0,0 +1,92 @@
+"""Scheme import throughput: serial parsing versus the process pool.
+
+Writes --files synthetic schemes (iTerm2, base16 and Alacritty TOML/YAML in
+turn, every --duplicate-every'th one a copy of an earlier palette) and imports
+them into a fresh index with each worker count.
+
+    python benchmarks/scheme_import_bench.py --files 500 5000 --workers 0 4
+"""
+import os
+import sys
+import random
+import argparse
+import plistlib
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scheme_import import ALACRITTY_COLOR_NAMES, BASE16_ANSI, import_schemes
+
+
+def random_colors(rng, count):
+    return [f"#{rng.randrange(1 << 24):06x}" for _ in range(count)]
+
+
+def write_scheme(directory, index, colors):
+    """One scheme file in the format index selects; colors is bg, fg and 16 ANSI colors"""
+    bg, fg, palette = colors[0], colors[1], colors[2:]
+    kind = index % 4
+    if kind == 0:
+        def component(color):
+            return {f'{channel} Component': int(color[1 + offset:3 + offset], 16) / 255
+                    for channel, offset in (('Red', 0), ('Green', 2), ('Blue', 4))}
+        plist = {'Background Color': component(bg), 'Foreground Color': component(fg),
+                 **{f'Ansi {number} Color': component(color) for number, color in enumerate(palette)}}
+        with open(os.path.join(directory, f"scheme-{index}.itermcolors"), 'wb') as f:
+            plistlib.dump(plist, f)
+        return
+    if kind == 1:
+        # base16 has 16 slots but several ANSI colors share one, so only those are written
+        slots = {'base00': bg, 'base05': fg}
+        for slot, color in zip(BASE16_ANSI, palette):
+            slots.setdefault(slot, color)
+        slots.update({f'base0{digit}': slots.get(f'base0{digit}', fg) for digit in '0123456789ABCDEF'})
+        text = f'scheme: "Scheme {index}"\n' + ''.join(f'{slot}: "{color[1:]}"\n' for slot, color in slots.items())
+        extension = '.yaml'
+    elif kind == 2:
+        text = (f"[colors.primary]\nbackground = '{bg}'\nforeground = '{fg}'\n[colors.normal]\n"
+                + ''.join(f"{name} = '{color}'\n" for name, color in zip(ALACRITTY_COLOR_NAMES, palette[:8]))
+                + "[colors.bright]\n"
+                + ''.join(f"{name} = '{color}'\n" for name, color in zip(ALACRITTY_COLOR_NAMES, palette[8:])))
+        extension = '.toml'
+    else:
+        text = (f"colors:\n  primary:\n    background: '0x{bg[1:]}'\n    foreground: '0x{fg[1:]}'\n  normal:\n"
+                + ''.join(f"    {name}: '{color}'\n" for name, color in zip(ALACRITTY_COLOR_NAMES, palette[:8]))
+                + "  bright:\n"
+                + ''.join(f"    {name}: '{color}'\n" for name, color in zip(ALACRITTY_COLOR_NAMES, palette[8:])))
+        extension = '.yml'
+    with open(os.path.join(directory, f"scheme-{index}{extension}"), 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scheme import throughput benchmark")
+    parser.add_argument('--files', type=int, nargs='+', default=[500, 5000])
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, os.cpu_count() or 1])
+    parser.add_argument('--duplicate-every', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'files':>6} {'workers':>8} {'seconds':>8} {'files/s':>9} {'imported':>9} {'duplicates':>11} "
+          f"{'failed':>7}")
+    for files in args.files:
+        rng = random.Random(files)
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'schemes')
+            os.makedirs(source)
+            written = []
+            for index in range(files):
+                if written and index % args.duplicate_every == args.duplicate_every - 1:
+                    colors = rng.choice(written)
+                else:
+                    colors = random_colors(rng, 18)
+                written.append(colors)
+                write_scheme(source, index, colors)
+            for workers in args.workers:
+                index_path = os.path.join(directory, f'index-{workers}.json')
+                report = import_schemes([source], index_path, workers=workers)
+                print(f"{files:>6} {workers:>8} {report['seconds']:>8.2f} {report['files_per_second']:>9.0f} "
+                      f"{report['imported']:>9} {report['duplicates']:>11} {len(report['failed']):>7}")
+
+
+if __name__ == '__main__':
+    main()
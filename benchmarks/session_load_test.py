@@ -0,0 +1,186 @@
+"""Concurrent-session load test for the Streamlit app.
+
+    python benchmarks/session_load_test.py --sessions 1,2,4,8 --rounds 3
+    python benchmarks/session_load_test.py --sessions 1,4,16 --output saturation.json
+
+For every concurrency level N, N simulated sessions are started at the same
+time, one per worker process. Each session drives app.py through Streamlit's
+AppTest and replays SIDEBAR_SCRIPT (the same sidebar interactions a user makes
+in WezTermConfigurator), timing every rerun. The report lists rerun latency
+percentiles, RSS growth per session and rerun throughput per level; together
+they form the saturation curve written to --output.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import platform
+from concurrent.futures import ProcessPoolExecutor
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(PROJECT_ROOT, "app.py")
+
+# (widget type, label, value) steps replayed in order by every session; live sliders are
+# custom components without an AppTest element, so they are named by their session_state field
+SIDEBAR_SCRIPT = [
+    ('selectbox', 'Renk Şeması', 'Dracula'),
+    ('live_slider', 'font_size', 16),
+    ('selectbox', 'İmleç Stili', 'Bar'),
+    ('checkbox', 'Sekme Çubuğunu Etkinleştir', False),
+    ('live_slider', 'opacity', 0.85),
+    ('selectbox', 'Renk Şeması', 'Nord'),
+    ('live_slider', 'padding', 12),
+    ('multiselect', 'Bağlantı Kuralları', ['URL Algılama', 'Dosya Yolları']),
+    ('selectbox', 'Tema', 'Custom'),
+    ('color_picker', 'Arka Plan Rengi', '#1e1e2e'),
+    ('selectbox', 'Tema', 'Dark'),
+    ('number_input', 'Pencere Genişliği (pixel)', 1200),
+    ('checkbox', 'Sekme Çubuğunu Etkinleştir', True),
+]
+
+
+def current_rss_kb():
+    """Resident set size of this process in KiB"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if platform.system() == 'Darwin' else rss
+
+
+def find_widget(at, widget_type, label):
+    for widget in getattr(at, widget_type):
+        if widget.label == label:
+            return widget
+    return None
+
+
+def apply_step(at, widget_type, label, value):
+    if widget_type == 'live_slider':
+        # The component's value lives under the app's widget key, as if the drag had settled
+        key = f"{label}@{at.session_state['widget_revision']}"
+        if key not in at.session_state:
+            return False
+        at.session_state[key] = value
+        return True
+    widget = find_widget(at, widget_type, label)
+    if widget is None:
+        return False
+    if widget_type == 'selectbox':
+        widget.select(value)
+    elif widget_type == 'checkbox':
+        widget.check() if value else widget.uncheck()
+    elif widget_type == 'multiselect':
+        for option in list(widget.value):
+            widget.unselect(option)
+        for option in value:
+            widget.select(option)
+    else:
+        widget.set_value(value)
+    return True
+
+
+def run_session(start_at, rounds, timeout):
+    """Worker: one simulated session, started at a shared wall-clock instant"""
+    sys.path.insert(0, PROJECT_ROOT)
+    os.chdir(PROJECT_ROOT)
+    from streamlit.testing.v1 import AppTest
+
+    rss_before = current_rss_kb()
+    time.sleep(max(0.0, start_at - time.time()))
+
+    latencies = []
+    started = time.perf_counter()
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+    t0 = time.perf_counter()
+    at.run()
+    latencies.append(time.perf_counter() - t0)
+
+    for _ in range(rounds):
+        for widget_type, label, value in SIDEBAR_SCRIPT:
+            if not apply_step(at, widget_type, label, value):
+                # A missing widget would silently leave its interaction out of the numbers
+                raise RuntimeError(f"Sidebar step not found: {widget_type} {label!r}")
+            t0 = time.perf_counter()
+            at.run()
+            latencies.append(time.perf_counter() - t0)
+
+    return {
+        'latencies': latencies,
+        'elapsed': time.perf_counter() - started,
+        'rss_kb': current_rss_kb() - rss_before,
+        'errors': len(at.exception),
+    }
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def run_level(sessions, rounds, timeout):
+    start_at = time.time() + 1.0
+    with ProcessPoolExecutor(max_workers=sessions) as pool:
+        futures = [pool.submit(run_session, start_at, rounds, timeout) for _ in range(sessions)]
+        results = [future.result() for future in futures]
+
+    latencies = [latency for result in results for latency in result['latencies']]
+    wall = max(result['elapsed'] for result in results)
+    return {
+        'sessions': sessions,
+        'reruns': len(latencies),
+        'throughput_reruns_per_sec': len(latencies) / wall if wall else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'rss_per_session_mb': sum(result['rss_kb'] for result in results) / len(results) / 1024,
+        'errors': sum(result['errors'] for result in results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent Streamlit session load test")
+    parser.add_argument('--sessions', default='1,2,4,8', help="comma-separated concurrency levels")
+    parser.add_argument('--rounds', type=int, default=2, help="times each session replays the sidebar script")
+    parser.add_argument('--timeout', type=float, default=60.0, help="per-rerun AppTest timeout in seconds")
+    parser.add_argument('--output', help="write the saturation curve as JSON to this path")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.sessions.split(',') if level.strip()]
+    curve = []
+    print(f"{'N':>4} {'reruns':>7} {'rerun/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'RSS/sess MB':>12}")
+    for sessions in levels:
+        point = run_level(sessions, args.rounds, args.timeout)
+        curve.append(point)
+        print(f"{point['sessions']:>4} {point['reruns']:>7} {point['throughput_reruns_per_sec']:>8.1f} "
+              f"{point['p50_ms']:>8.1f} {point['p95_ms']:>8.1f} {point['p99_ms']:>8.1f} "
+              f"{point['rss_per_session_mb']:>12.1f}")
+        if point['errors']:
+            print(f"     app exceptions: {point['errors']}")
+
+    if args.output:
+        report = {
+            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'cpu_count': os.cpu_count(),
+            'rounds': args.rounds,
+            'script_steps': len(SIDEBAR_SCRIPT),
+            'curve': curve,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Saturation curve written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""New-session start time: the first session of a process versus the ones after it.
+
+Each round starts a fresh Python process that runs --sessions AppTest sessions
+of app.py one after another and reports, for each, the server-side time to
+the first preview (``first_paint_ms``) and the whole script run. Rounds are run
+with an empty artifact cache and with one prepared by ``python -m src.warm_start``.
+
+    python benchmarks/warm_start_bench.py --sessions 5 --rounds 3
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_sessions(sessions):
+    # Child process: every AppTest run is a new session in the same Streamlit process
+    import time
+    from streamlit.testing.v1 import AppTest
+
+    results = []
+    for _ in range(sessions):
+        started = time.perf_counter()
+        at = AppTest.from_file(os.path.join(PROJECT_ROOT, 'app.py'), default_timeout=120).run()
+        run_ms = (time.perf_counter() - started) * 1e3
+        first_paint = at.session_state['first_paint_ms'] if 'first_paint_ms' in at.session_state else None
+        results.append({'first_paint_ms': first_paint, 'run_ms': run_ms, 'errors': len(at.exception)})
+    print(json.dumps(results))
+
+
+def round_results(sessions, cache_dir):
+    env = dict(os.environ, WEZTERM_GUI_CACHE_DIR=cache_dir, PYTHONPATH=PROJECT_ROOT)
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', str(sessions)],
+                            env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm start benchmark")
+    parser.add_argument('--sessions', type=int, default=5)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--child', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        run_sessions(args.child)
+        return
+
+    print(f"{'cache':<9} {'round':>5} {'first paint (ms)':>17} {'first run (ms)':>15} "
+          f"{'later paint (ms)':>17} {'later run (ms)':>15}")
+    for label in ('empty', 'prewarmed'):
+        for number in range(args.rounds):
+            with tempfile.TemporaryDirectory() as cache_dir:
+                if label == 'prewarmed':
+                    subprocess.run([sys.executable, '-m', 'src.warm_start', '--dir', cache_dir], cwd=PROJECT_ROOT,
+                                   check=True, capture_output=True)
+                results = round_results(args.sessions, cache_dir)
+            first, later = results[0], results[1:] or results[:1]
+            later_paint = sorted(result['first_paint_ms'] or 0 for result in later)[len(later) // 2]
+            later_run = sorted(result['run_ms'] for result in later)[len(later) // 2]
+            print(f"{label:<9} {number:>5} {first['first_paint_ms'] or 0:>17.0f} {first['run_ms']:>15.0f} "
+                  f"{later_paint:>17.0f} {later_run:>15.0f}")
+
+
+if __name__ == '__main__':
+    main()
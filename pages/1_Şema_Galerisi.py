@@ -0,0 +1,37 @@
+import streamlit as st
+
+from src.config import FONT_OPTIONS
+from src.fonts import BUNDLED_FONTS, font_choices, installed_font_families
+from src.gallery import gallery_specs, render_gallery, gallery_html
+from src.utils import load_css
+
+
+@st.cache_data(show_spinner="Küçük resimler hazırlanıyor...")
+def get_gallery_urls(specs):
+    """Thumbnail URLs for a selection; misses are rendered into the disk cache"""
+    return render_gallery(specs)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_font_names():
+    """Installed monospace family names, from the persisted font index"""
+    return [family.name for family in installed_font_families()]
+
+
+st.set_page_config(layout="wide", page_title="Şema Galerisi", page_icon="🎨")
+load_css()
+
+st.title('Renk Şeması Galerisi')
+st.write('Tüm renk şemalarını seçtiğiniz yazı tipleri ve boyutlarla yan yana karşılaştırın.')
+
+fonts = st.sidebar.multiselect('Yazı Tipleri', font_choices(get_font_names(), fallback=FONT_OPTIONS),
+                               default=BUNDLED_FONTS[:1])
+font_sizes = st.sidebar.multiselect('Yazı Boyutları', list(range(8, 33)), default=[14])
+query = st.sidebar.text_input('Şema Ara').strip().lower()
+
+specs = [spec for spec in gallery_specs(fonts, font_sizes) if query in spec.scheme.lower()]
+if not specs:
+    st.info("Seçiminize uyan şema yok.")
+else:
+    st.caption(f"{len(specs)} küçük resim")
+    st.markdown(gallery_html(specs, get_gallery_urls(tuple(specs))), unsafe_allow_html=True)
@@ -0,0 +1,225 @@
+"""ANSI escape sequence rendering for the terminal preview.
+
+SGR codes (16, 256 and truecolor, bold/dim/italic/underline/inverse/strike)
+are mapped onto the active theme: the 16 palette colors are emitted as
+``a-f<n>``/``a-g<n>`` classes backed by the ``--ansi-<n>`` CSS variables set
+on the preview, so changing the color scheme recolors existing output without
+re-rendering it. Adjacent text with identical attributes is merged into one
+span and unstyled text is emitted bare, which keeps the DOM node count down
+to the number of attribute changes.
+
+static/terminal.js implements the same mapping (``applySgr``/``spanAttributes``)
+for output produced in the browser.
+"""
+import re
+from functools import lru_cache
+from html import escape
+
+BOLD = 1
+DIM = 2
+ITALIC = 4
+UNDERLINE = 8
+INVERSE = 16
+STRIKE = 32
+
+# (foreground, background, flags); colors are None (default), 0-255 or '#rrggbb'
+DEFAULT_STYLE = (None, None, 0)
+
+_FLAG_CLASSES = ((BOLD, 'b'), (DIM, 'd'), (ITALIC, 'i'), (UNDERLINE, 'u'), (STRIKE, 's'))
+_SET_FLAGS = {1: BOLD, 2: DIM, 3: ITALIC, 4: UNDERLINE, 7: INVERSE, 9: STRIKE}
+_CLEAR_FLAGS = {21: BOLD, 22: BOLD | DIM, 23: ITALIC, 24: UNDERLINE, 27: INVERSE, 29: STRIKE}
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+ESCAPE_PATTERN = re.compile(r'\x1b(?:\[([0-?]*)[ -/]*([@-~])|\][^\x07\x1b]*(?:\x07|\x1b\\)|[()][0-9A-Za-z]|[@-Z\\^_=>])')
+# Control characters other than newline and tab have no place in rendered output
+_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b-\x1f\x7f]')
+
+
+def _extended_color(values):
+    """Parse the part after 38/48: ['5', n] or ['2', r, g, b]; returns (color, values consumed)"""
+    if values[0] == '5':
+        return int(values[1]) % 256, 2
+    if values[0] == '2':
+        red, green, blue = (int(value or 0) % 256 for value in values[1:4])
+        return f"#{red:02x}{green:02x}{blue:02x}", 4
+    raise ValueError(values[0])
+
+
+@lru_cache(maxsize=4096)
+def apply_sgr(style, params):
+    """Return the style after applying an SGR parameter string such as '1;38;5;208'
+
+    Pure and cached: real output repeats a handful of sequences over and over.
+    """
+    if params.startswith(('<', '=', '>', '?')):
+        return style
+    fg, bg, flags = style
+    codes = params.split(';') if params else ['']
+    index = 0
+    while index < len(codes):
+        code = codes[index]
+        index += 1
+        try:
+            if ':' in code:
+                # ITU sub-parameters: 38:5:n, 38:2::r:g:b (empty color space id), 4:3 curly underline
+                head, *subparams = code.split(':')
+                if head in ('38', '48'):
+                    if subparams[0] == '2' and len(subparams) == 5:
+                        del subparams[1]
+                    color, _ = _extended_color(subparams)
+                    if head == '38':
+                        fg = color
+                    else:
+                        bg = color
+                elif head == '4':
+                    flags = flags & ~UNDERLINE if subparams[0] == '0' else flags | UNDERLINE
+                continue
+
+            number = int(code) if code else 0
+            if number == 0:
+                fg, bg, flags = DEFAULT_STYLE
+            elif number in _SET_FLAGS:
+                flags |= _SET_FLAGS[number]
+            elif number in _CLEAR_FLAGS:
+                flags &= ~_CLEAR_FLAGS[number]
+            elif 30 <= number <= 37:
+                fg = number - 30
+            elif 90 <= number <= 97:
+                fg = number - 90 + 8
+            elif 40 <= number <= 47:
+                bg = number - 40
+            elif 100 <= number <= 107:
+                bg = number - 100 + 8
+            elif number == 39:
+                fg = None
+            elif number == 49:
+                bg = None
+            elif number in (38, 48):
+                color, consumed = _extended_color(codes[index:])
+                index += consumed
+                if number == 38:
+                    fg = color
+                else:
+                    bg = color
+        except (ValueError, IndexError):
+            # Malformed sequence: keep what was applied so far, like terminals do
+            break
+    return fg, bg, flags
+
+
+def color_hex(index):
+    """Hex value of a 256-color palette entry above the 16 theme colors"""
+    if index < 232:
+        index -= 16
+        return '#' + ''.join(f"{_CUBE_LEVELS[component]:02x}"
+                             for component in (index // 36, index // 6 % 6, index % 6))
+    level = 8 + 10 * (index - 232)
+    return f"#{level:02x}{level:02x}{level:02x}"
+
+
+def effective_colors(style):
+    """(fg, bg) as drawn: bold brightens colors 0-7 and inverse swaps them
+
+    The default colors come back as None, or as 'fg'/'bg' once swapped.
+    """
+    fg, bg, flags = style
+    if flags & BOLD and isinstance(fg, int) and fg < 8:
+        # WezTerm's bold_brightens_ansi_colors
+        fg += 8
+    if flags & INVERSE:
+        fg, bg = ('bg' if bg is None else bg), ('fg' if fg is None else fg)
+    return fg, bg
+
+
+def resolve_color(color, palette, colors):
+    """Concrete '#rrggbb' for an effective color; None stays None (the default)"""
+    if color is None or isinstance(color, str) and color.startswith('#'):
+        return color
+    if color in ('fg', 'bg'):
+        return colors[color]
+    return palette[color] if color < 16 else color_hex(color)
+
+
+@lru_cache(maxsize=4096)
+def span_attributes(style):
+    """(class, style) attribute values for a style; both empty for the default style"""
+    fg, bg = effective_colors(style)
+    flags = style[2]
+
+    classes, declarations = [], []
+    for prefix, css_property, color in (('f', 'color', fg), ('g', 'background', bg)):
+        if color is None:
+            continue
+        if color in ('fg', 'bg') or isinstance(color, int) and color < 16:
+            classes.append(f"a-{prefix}{color}")
+        else:
+            declarations.append(f"{css_property}:{color if isinstance(color, str) else color_hex(color)}")
+    classes.extend(f"a-{name}" for flag, name in _FLAG_CLASSES if flags & flag)
+    return ' '.join(classes), ';'.join(declarations)
+
+
+def iter_runs(text, style=DEFAULT_STYLE):
+    """Yield (style, text) runs, merging adjacent text with identical attributes
+
+    Non-SGR escape sequences and stray control characters are dropped.
+    """
+    run_style, parts = style, []
+    position = 0
+    for match in ESCAPE_PATTERN.finditer(text):
+        if match.start() > position:
+            chunk = text[position:match.start()]
+            if style != run_style and parts:
+                yield run_style, _CONTROL_CHARS.sub('', ''.join(parts))
+                parts = []
+            run_style = style
+            parts.append(chunk)
+        position = match.end()
+        if match.group(2) == 'm':
+            style = apply_sgr(style, match.group(1))
+    if position < len(text):
+        if style != run_style and parts:
+            yield run_style, _CONTROL_CHARS.sub('', ''.join(parts))
+            parts = []
+        run_style = style
+        parts.append(text[position:])
+    if parts:
+        yield run_style, _CONTROL_CHARS.sub('', ''.join(parts))
+
+
+def ansi_to_html(text):
+    """Render ANSI-colored text as HTML with one span per attribute run"""
+    html = []
+    for style, chunk in iter_runs(text):
+        if not chunk:
+            continue
+        class_name, css = span_attributes(style)
+        if not class_name and not css:
+            html.append(escape(chunk, quote=False))
+            continue
+        attributes = (f' class="{class_name}"' if class_name else '') + (f' style="{css}"' if css else '')
+        html.append(f"<span{attributes}>{escape(chunk, quote=False)}</span>")
+    return ''.join(html)
+
+
+def strip_ansi(text):
+    """Plain text with every escape sequence removed"""
+    return _CONTROL_CHARS.sub('', ESCAPE_PATTERN.sub('', text))
+
+
+def ansi_css():
+    """Class rules behind span_attributes, resolved through the preview's CSS variables"""
+    rules = [f".a-f{index}{{color:var(--ansi-{index})}}.a-g{index}{{background:var(--ansi-{index})}}"
+             for index in range(16)]
+    rules.append(".a-ffg{color:var(--term-fg)}.a-fbg{color:var(--term-bg)}"
+                 ".a-gfg{background:var(--term-fg)}.a-gbg{background:var(--term-bg)}")
+    rules.append(".a-b{font-weight:bold}.a-d{opacity:.6}.a-i{font-style:italic}"
+                 ".a-u{text-decoration:underline}.a-s{text-decoration:line-through}"
+                 ".a-u.a-s{text-decoration:underline line-through}")
+    return ''.join(rules)
+
+
+def palette_css_variables(palette, colors):
+    """Inline style declaring --ansi-0..15, --term-fg and --term-bg"""
+    declarations = [f"--ansi-{index}:{color}" for index, color in enumerate(palette)]
+    declarations += [f"--term-fg:{colors['fg']}", f"--term-bg:{colors['bg']}"]
+    return ';'.join(declarations)
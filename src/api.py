@@ -0,0 +1,279 @@
+"""Local asyncio HTTP API for config generation.
+
+Run with ``python -m src.api --port 8765`` and POST a config (or a list of
+configs for a batch) as JSON:
+
+    POST /lua            -> {"lua": "..."}
+    POST /preview        -> {"html": "..."}
+    GET  /themes         -> {"Builtin Dark": {"bg": ..., "fg": ..., "prompt": ...}, ...}
+    GET  /themes/<name>  -> {"bg": ..., "fg": ..., "prompt": ...}
+    GET  /health         -> {"status": "ok"}
+"""
+import json
+import asyncio
+import logging
+import argparse
+import traceback
+from urllib.parse import unquote
+from concurrent.futures import ProcessPoolExecutor
+
+from src.config import ConfigGenerator, DEFAULT_CONFIG
+from src.terminal import TerminalPreviewGenerator
+from src.themes import COLOR_MAPPINGS, get_colors_for_theme, imported_scheme, scheme_names
+
+logger = logging.getLogger("wezterm_gui")
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 4 * 1024 * 1024
+KEEP_ALIVE_TIMEOUT = 15
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class ApiError(Exception):
+    """HTTP hata durumunu taşıyan istisna"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+    def __reduce__(self):
+        # Keep the status when the error crosses a worker process boundary
+        return (ApiError, (self.status, str(self)))
+
+
+def merge_with_defaults(config):
+    """Fill keys missing from a request body with the app defaults"""
+    if not isinstance(config, dict):
+        raise ApiError(400, "Yapılandırma bir JSON nesnesi olmalıdır")
+    merged = json.loads(json.dumps(DEFAULT_CONFIG))
+    merged.update(config)
+    return merged
+
+
+def generate_lua(config):
+    """Worker entry point: Lua for one config"""
+    lua_code = ConfigGenerator.generate_wezterm_lua(merge_with_defaults(config))
+    if lua_code is None:
+        raise ApiError(400, "Yapılandırma kodu oluşturulamadı")
+    return {'lua': lua_code}
+
+
+def render_preview(config):
+    """Worker entry point: preview HTML for one config"""
+    config = merge_with_defaults(config)
+    colors = config['custom_colors'] if config['theme'] == 'Custom' else None
+    html = TerminalPreviewGenerator.generate_dynamic_terminal_preview(
+        config['theme'], config['font'], config['font_size'], config['color_scheme'],
+        colors, config['opacity'], config['enable_tab_bar'], config['enable_scroll_bar'],
+        config['default_cursor_style'], config['padding'], config['line_height'],
+        config['use_fancy_tab_bar'], config['hyperlinkRules'], config['leader_key']
+    )
+    return {'html': html}
+
+
+def _run_one(handler, config):
+    # Errors inside a batch are reported per item instead of failing the batch
+    try:
+        return handler(config)
+    except ApiError as e:
+        return {'error': str(e)}
+
+
+def run_batch(handler, configs):
+    """Worker entry point: a whole batch in one process round trip"""
+    return [_run_one(handler, config) for config in configs]
+
+
+class ConfigApiServer:
+    """Yapılandırma üretimini JSON uç noktaları olarak sunan asyncio HTTP sunucusu"""
+
+    POST_ROUTES = {'/lua': generate_lua, '/preview': render_preview}
+
+    def __init__(self, host='127.0.0.1', port=8765, workers=0, batch_chunk_size=64):
+        self.host = host
+        self.port = port
+        self.batch_chunk_size = batch_chunk_size
+        self._pool = ProcessPoolExecutor(max_workers=workers) if workers else None
+        self._server = None
+
+    async def start(self):
+        """Start listening; returns the asyncio server"""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        sockets = self._server.sockets or []
+        if sockets:
+            self.port = sockets[0].getsockname()[1]
+        logger.info(f"API sunucusu http://{self.host}:{self.port} adresinde dinliyor")
+        return self._server
+
+    async def serve_forever(self):
+        """Start and serve until cancelled"""
+        server = await self.start()
+        async with server:
+            await server.serve_forever()
+
+    async def close(self):
+        """Stop listening and shut down the worker pool"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if request is None:
+                    break
+
+                method, path, version, headers, body = request
+                keep_alive = self._wants_keep_alive(version, headers)
+                try:
+                    status, payload = 200, await self._dispatch(method, path, body)
+                except ApiError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except Exception as e:
+                    logger.error(f"API isteği işlenirken hata: {e}\n{traceback.format_exc()}")
+                    status, payload = 500, {'error': str(e)}
+
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ApiError as e:
+            self._write_response(writer, e.status, {'error': str(e)}, False)
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+        except asyncio.CancelledError:
+            # Server shutting down while the connection idles in keep-alive
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.LimitOverrunError:
+            raise ApiError(413, "İstek başlıkları çok büyük")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                return None
+            raise
+        if len(head) > MAX_HEADER_BYTES:
+            raise ApiError(413, "İstek başlıkları çok büyük")
+
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ', 2)
+        except ValueError:
+            raise ApiError(400, "Geçersiz istek satırı")
+
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get('content-length', 0) or 0)
+        except ValueError:
+            raise ApiError(400, "Geçersiz Content-Length başlığı")
+        if length < 0:
+            raise ApiError(400, "Geçersiz Content-Length başlığı")
+        if length > MAX_BODY_BYTES:
+            raise ApiError(413, "İstek gövdesi çok büyük")
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), target.split('?', 1)[0], version, headers, body
+
+    @staticmethod
+    def _wants_keep_alive(version, headers):
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+        return connection != 'close'
+
+    async def _dispatch(self, method, path, body):
+        if path == '/health':
+            return {'status': 'ok'}
+
+        if path == '/themes' or path.startswith('/themes/'):
+            if method != 'GET':
+                raise ApiError(405, "Yalnızca GET desteklenir")
+            if path == '/themes':
+                return {name: get_colors_for_theme('Dark', name) for name in scheme_names()}
+            name = unquote(path[len('/themes/'):])
+            if name not in COLOR_MAPPINGS and imported_scheme(name) is None:
+                raise ApiError(404, f"Renk şeması bulunamadı: {name}")
+            return get_colors_for_theme('Dark', name)
+
+        handler = self.POST_ROUTES.get(path)
+        if handler is None:
+            raise ApiError(404, f"Bilinmeyen uç nokta: {path}")
+        if method != 'POST':
+            raise ApiError(405, "Yalnızca POST desteklenir")
+
+        try:
+            data = json.loads(body or b'{}')
+        except ValueError:
+            raise ApiError(400, "Geçersiz JSON gövdesi")
+
+        if isinstance(data, list):
+            return await self._run_batch(handler, data)
+        return await self._run(handler, data)
+
+    async def _run(self, handler, config):
+        if self._pool is None:
+            return handler(config)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, handler, config)
+
+    async def _run_batch(self, handler, configs):
+        if self._pool is None:
+            return run_batch(handler, configs)
+
+        # Spread large batches over the pool in chunks to amortize pickling
+        loop = asyncio.get_running_loop()
+        size = self.batch_chunk_size
+        chunks = [configs[i:i + size] for i in range(0, len(configs), size)]
+        results = await asyncio.gather(*[
+            loop.run_in_executor(self._pool, run_batch, handler, chunk) for chunk in chunks
+        ])
+        return [item for chunk in results for item in chunk]
+
+    @staticmethod
+    def _write_response(writer, status, payload, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="WezTerm yapılandırma HTTP API'si")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=0,
+                        help="CPU-bound üretim için işçi süreç sayısı (0: olay döngüsünde çalıştır)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    server = ConfigApiServer(args.host, args.port, args.workers)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+"""Content-addressed on-disk cache for generated artifacts.
+
+Lua code, preview HTML, settings HTML and gallery thumbnails are pure
+functions of their inputs, so they are stored under a digest of those inputs
+(plus a fingerprint of the code that renders them):
+
+    <cache dir>/<kind>/<sha256 of kind, inputs and code>.<ext>
+
+Any number of processes can share a directory. Entries are written to a
+temporary file and renamed into place, so readers only ever see whole files;
+a file that disappears between lookup and read (evicted by another process)
+is just a miss. Hits refresh the file's mtime and eviction removes the least
+recently used files once the directory grows past ``max_bytes``.
+
+    python -m src.artifact_cache            # disk usage per kind
+    python -m src.artifact_cache --clear
+"""
+import os
+import json
+import hashlib
+import logging
+import argparse
+import tempfile
+import threading
+from functools import lru_cache
+
+logger = logging.getLogger("wezterm_gui")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+ARTIFACT_CACHE_DIR = os.environ.get("WEZTERM_GUI_CACHE_DIR",
+                                    os.path.join(os.path.expanduser("~"), ".cache", "wezterm-gui", "artifacts"))
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Eviction scans the directory, so it only runs after this share of the budget was written
+EVICTION_CHECK_FRACTION = 0.05
+
+KIND_SUFFIXES = {'lua': '.lua', 'preview': '.html', 'settings': '.html', 'svg': '.svg', 'warnings': '.json'}
+
+
+@lru_cache(maxsize=1)
+def code_fingerprint():
+    """Digest of the rendering code, so a deploy never serves artifacts from the old code"""
+    digest = hashlib.sha256()
+    sources = [os.path.join(PROJECT_ROOT, "static", "terminal.js")]
+    src_dir = os.path.join(PROJECT_ROOT, "src")
+    sources += sorted(os.path.join(src_dir, name) for name in os.listdir(src_dir) if name.endswith('.py'))
+    for path in sources:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def artifact_key(kind, inputs):
+    """Content address of an artifact: inputs must be JSON-serializable"""
+    material = json.dumps([kind, code_fingerprint(), inputs], sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()[:32]
+
+
+class ArtifactCache:
+    """Süreçler arasında paylaşılan, boyut sınırlı ve içerik adresli disk önbelleği
+
+    Construction touches nothing on disk, so worker processes can build their
+    own instance for the same directory cheaply. Counters are per process.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or ARTIFACT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._written_since_check = 0
+        self._counters = {}
+
+    def path(self, kind, key):
+        """File holding an artifact, whether or not it exists yet"""
+        return os.path.join(self.directory, kind, key + KIND_SUFFIXES.get(kind, ''))
+
+    def get(self, kind, key):
+        """Return the cached text, or None on a miss"""
+        path = self.path(kind, key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            self._count(kind, 'misses')
+            return None
+        try:
+            # mtime is the LRU clock; atime is often disabled (noatime)
+            os.utime(path)
+        except OSError:
+            pass
+        self._count(kind, 'hits')
+        return text
+
+    def lookup(self, kind, key):
+        """Whether an artifact exists, counted and refreshed like get() but without reading it"""
+        path = self.path(kind, key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._count(kind, 'misses')
+            return False
+        except OSError:
+            if not os.path.exists(path):
+                self._count(kind, 'misses')
+                return False
+        self._count(kind, 'hits')
+        return True
+
+    def put(self, kind, key, text):
+        """Store an artifact atomically; returns its path"""
+        path = self.path(kind, key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        data = text.encode('utf-8')
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            # mkstemp creates the file owner-only; other workers (and the static server) read it
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._count(kind, 'writes')
+
+        with self._lock:
+            self._written_since_check += len(data)
+            check = self._written_since_check >= self.max_bytes * EVICTION_CHECK_FRACTION
+            if check:
+                self._written_since_check = 0
+        if check:
+            self.evict()
+        return path
+
+    def get_or_create(self, kind, key, factory):
+        """Return the cached text, calling factory() and storing its result on a miss"""
+        text = self.get(kind, key)
+        if text is None:
+            text = factory()
+            if text is not None:
+                self.put(kind, key, text)
+        return text
+
+    def _entries(self):
+        entries = []
+        try:
+            kinds = [entry for entry in os.scandir(self.directory) if entry.is_dir()]
+        except FileNotFoundError:
+            return entries
+        for kind in kinds:
+            for entry in os.scandir(kind.path):
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, kind.name, entry.path))
+        return entries
+
+    def evict(self):
+        """Remove least recently used entries until the directory fits in max_bytes"""
+        entries = self._entries()
+        total = sum(size for _, size, _, _ in entries)
+        if total <= self.max_bytes:
+            return 0
+        entries.sort()
+        removed = 0
+        for _, size, kind, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Another process evicted it first
+                pass
+            except OSError as e:
+                logger.warning(f"Önbellek girdisi silinemedi: {path}: {e}")
+                continue
+            total -= size
+            removed += 1
+            self._count(kind, 'evictions')
+        logger.info(f"Artifact önbelleği: {removed} girdi silindi, {total / 1024 / 1024:.1f} MB kaldı")
+        return removed
+
+    def disk_usage(self):
+        """{kind: {'entries', 'bytes'}} as currently on disk, across all processes"""
+        usage = {}
+        for _, size, kind, _ in self._entries():
+            kind_usage = usage.setdefault(kind, {'entries': 0, 'bytes': 0})
+            kind_usage['entries'] += 1
+            kind_usage['bytes'] += size
+        return usage
+
+    def clear(self):
+        """Remove every entry"""
+        for _, _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _count(self, kind, counter):
+        with self._lock:
+            kind_counters = self._counters.setdefault(kind, {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0})
+            kind_counters[counter] += 1
+
+    def stats(self):
+        """Per-kind and total hit/miss/write/eviction counts of this process, with hit rates"""
+        with self._lock:
+            kinds = {kind: dict(counters) for kind, counters in self._counters.items()}
+        total = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+        for counters in kinds.values():
+            for name in total:
+                total[name] += counters[name]
+        for counters in list(kinds.values()) + [total]:
+            lookups = counters['hits'] + counters['misses']
+            counters['hit_rate'] = counters['hits'] / lookups if lookups else 0.0
+        return {'kinds': kinds, 'total': total, 'max_bytes': self.max_bytes}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Artifact önbelleğinin disk kullanımını göster")
+    parser.add_argument('--dir', default=ARTIFACT_CACHE_DIR)
+    parser.add_argument('--clear', action='store_true', help="Tüm girdileri sil")
+    args = parser.parse_args(argv)
+    cache = ArtifactCache(args.dir)
+    if args.clear:
+        cache.clear()
+    usage = cache.disk_usage()
+    for kind, kind_usage in sorted(usage.items()):
+        print(f"{kind:10} {kind_usage['entries']:8} girdi {kind_usage['bytes'] / 1024:10.1f} KB")
+    total = sum(kind_usage['bytes'] for kind_usage in usage.values())
+    print(f"{'toplam':10} {sum(u['entries'] for u in usage.values()):8} girdi {total / 1024:10.1f} KB "
+          f"(sınır {cache.max_bytes / 1024 / 1024:.0f} MB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+"""Stream asciinema recordings into the terminal preview.
+
+A ``.cast`` file (asciicast v2 or v3) is read one event at a time and
+rewritten as a compact NDJSON replay under ``static/casts/``:
+
+    {"version": 2, "width": 80, "height": 24, "title": "demo"}
+    [0.0, "output chunk"]
+    [0.016, "..."]
+
+Output events closer together than one animation frame are merged into a
+single chunk, input/marker events are dropped and long idle gaps are capped,
+so the browser only has to parse what it will actually draw. The preview
+fetches the file with a streaming reader and writes the due chunks once per
+animation frame (see ``replayCast`` in static/terminal.js).
+
+    python -m src.cast demo.cast
+"""
+import io
+import os
+import json
+import hashlib
+import logging
+import argparse
+import tempfile
+from collections import namedtuple
+
+logger = logging.getLogger("wezterm_gui")
+
+CASTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static", "casts")
+CASTS_URL = "app/static/casts"
+SAMPLE_CAST_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "samples", "demo.cast")
+
+FRAME_SECONDS = 1 / 60
+MAX_CHUNK_CHARS = 64 * 1024
+# Recordings without their own idle_time_limit would otherwise sit on a
+# frozen-looking preview for as long as the user paused while recording
+DEFAULT_IDLE_TIME_LIMIT = 3.0
+MAX_PUBLISHED_CASTS = 20
+# Pinned replays (the bundled sample) are shared by every session for the life of the process and never pruned
+PINNED_SUFFIX = '.pinned.ndjson'
+
+CastHeader = namedtuple('CastHeader', ['version', 'width', 'height', 'idle_time_limit', 'title'])
+CastChunk = namedtuple('CastChunk', ['time', 'data'])
+
+
+class CastFormatError(ValueError):
+    """Geçersiz ya da desteklenmeyen asciicast dosyası hatası"""
+
+
+def _text_stream(source):
+    """(text stream, release) over a path, a text stream or a binary stream such as an upload
+
+    release closes files opened here and detaches the wrapper from a caller's
+    binary stream, so the caller's stream stays usable.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        stream = open(source, encoding='utf-8', errors='replace')
+        return stream, stream.close
+    if isinstance(source, io.TextIOBase):
+        return source, lambda: None
+    stream = io.TextIOWrapper(source, encoding='utf-8', errors='replace')
+    return stream, stream.detach
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def read_cast(source):
+    """Return (header, events) where events lazily yields (time, code, data) with absolute times"""
+    stream, release = _text_stream(source)
+    try:
+        header = json.loads(stream.readline())
+    except json.JSONDecodeError as e:
+        release()
+        raise CastFormatError(f"Geçersiz asciicast başlığı: {e}") from e
+    if not isinstance(header, dict) or header.get('version') not in (2, 3):
+        release()
+        raise CastFormatError("Yalnızca asciicast v2 ve v3 kayıtları desteklenir")
+
+    version = header['version']
+    term = header.get('term', {}) if version == 3 else header
+    if not isinstance(term, dict):
+        release()
+        raise CastFormatError("Geçersiz asciicast başlığı: 'term' bir nesne olmalı")
+    cast_header = CastHeader(version, term.get('cols', term.get('width', 80)), term.get('rows', term.get('height', 24)),
+                             header.get('idle_time_limit'), header.get('title'))
+    if not all(_is_number(size) and size > 0 for size in (cast_header.width, cast_header.height)) or \
+            not (cast_header.idle_time_limit is None or _is_number(cast_header.idle_time_limit)) or \
+            not (cast_header.title is None or isinstance(cast_header.title, str)):
+        release()
+        raise CastFormatError("Geçersiz asciicast başlığı: boyut, bekleme sınırı ya da başlık türü hatalı")
+
+    def events():
+        clock = 0.0
+        try:
+            for line_number, line in enumerate(stream, 2):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise CastFormatError(f"Satır {line_number}: geçersiz olay ({e})") from e
+                # Every event is [time, code, data]; anything else would fail deep in the chunker
+                if not isinstance(event, list) or len(event) < 3 or not _is_number(event[0]) or \
+                        not isinstance(event[1], str) or not isinstance(event[2], str):
+                    raise CastFormatError(f"Satır {line_number}: olay [zaman, kod, veri] biçiminde olmalı")
+                time, code, data = event[:3]
+                # v3 stores the interval since the previous event, v2 the time since the start
+                clock = clock + time if version == 3 else time
+                yield clock, code, data
+        finally:
+            release()
+
+    return cast_header, events()
+
+
+def chunk_events(events, idle_time_limit=DEFAULT_IDLE_TIME_LIMIT, frame_seconds=FRAME_SECONDS,
+                 max_chunk_chars=MAX_CHUNK_CHARS):
+    """Merge output events within one frame into chunks, capping idle gaps"""
+    shift = 0.0
+    previous = None
+    chunk_time, parts, size = None, [], 0
+    for time, code, data in events:
+        if code != 'o':
+            continue
+        if previous is not None and idle_time_limit and time - previous > idle_time_limit:
+            shift += time - previous - idle_time_limit
+        previous = time
+        time -= shift
+
+        if chunk_time is not None and (time - chunk_time >= frame_seconds or size + len(data) > max_chunk_chars):
+            yield CastChunk(round(chunk_time, 3), ''.join(parts))
+            chunk_time, parts, size = None, [], 0
+        if chunk_time is None:
+            chunk_time = time
+        parts.append(data)
+        size += len(data)
+    if parts:
+        yield CastChunk(round(chunk_time, 3), ''.join(parts))
+
+
+def write_replay(source, out, idle_time_limit=None):
+    """Stream a .cast into the NDJSON replay format; returns (header, chunk count)"""
+    header, events = read_cast(source)
+    limit = idle_time_limit or header.idle_time_limit or DEFAULT_IDLE_TIME_LIMIT
+    out.write(json.dumps({'version': header.version, 'width': header.width, 'height': header.height,
+                          'title': header.title}) + '\n')
+    count = 0
+    for chunk in chunk_events(events, limit):
+        out.write(json.dumps([chunk.time, chunk.data], ensure_ascii=False) + '\n')
+        count += 1
+    return header, count
+
+
+def publish_cast(source, directory=CASTS_DIR, idle_time_limit=None, pin=False):
+    """Convert a recording into static/casts/<content hash>.ndjson and return its URL
+
+    The replay is written to a temporary file while its hash is computed, so
+    neither the recording nor the replay is ever held in memory as a whole.
+    pin=True keeps the replay out of pruning.
+    """
+    os.makedirs(directory, exist_ok=True)
+    digest = hashlib.sha256()
+
+    class _HashingWriter:
+        def __init__(self, stream):
+            self.stream = stream
+
+        def write(self, text):
+            data = text.encode('utf-8')
+            digest.update(data)
+            self.stream.write(data)
+
+    fd, temp_path = tempfile.mkstemp(suffix='.ndjson.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write_replay(source, _HashingWriter(f), idle_time_limit)
+        # mkstemp creates the file owner-only; the static server only needs to read it
+        os.chmod(temp_path, 0o644)
+        name = digest.hexdigest()[:16] + (PINNED_SUFFIX if pin else '.ndjson')
+        os.replace(temp_path, os.path.join(directory, name))
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    prune_casts(directory)
+    return f"{CASTS_URL}/{name}"
+
+
+def touch_cast(url, directory=CASTS_DIR):
+    """Mark a published replay as recently used; False when it has been pruned and must be published again"""
+    try:
+        os.utime(os.path.join(directory, url.rsplit('/', 1)[-1]))
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def prune_casts(directory=CASTS_DIR, keep=MAX_PUBLISHED_CASTS):
+    """Keep only the most recently published or used replays, and every pinned one"""
+    try:
+        entries = [entry for entry in os.scandir(directory)
+                   if entry.name.endswith('.ndjson') and not entry.name.endswith(PINNED_SUFFIX)]
+    except FileNotFoundError:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[keep:]:
+        try:
+            os.remove(entry.path)
+        except OSError as e:
+            logger.warning(f"Eski kayıt silinemedi: {entry.path}: {e}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="asciinema kaydını önizleme için yayınla")
+    parser.add_argument('cast', help=".cast dosyası")
+    parser.add_argument('--idle-time-limit', type=float, help="Boşta kalma sürelerinin üst sınırı (sn)")
+    parser.add_argument('--out-dir', default=CASTS_DIR)
+    args = parser.parse_args(argv)
+    print(publish_cast(args.cast, args.out_dir, args.idle_time_limit))
+
+
+if __name__ == '__main__':
+    main()
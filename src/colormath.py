@@ -0,0 +1,258 @@
+"""Vectorized color math and ANSI palette derivation for Custom themes.
+
+Conversions work on arrays of any leading shape, the last axis holding the
+three channels: ``hex <-> sRGB <-> linear sRGB <-> OKLab <-> OKLCH``. OKLab
+(Björn Ottosson, 2020) is perceptually uniform, so equal lightness steps look
+equal across hues, which is what makes a palette derived from three picks
+look deliberate rather than random.
+
+``derive_palettes`` turns N (background, foreground, prompt) triples into N
+complete WezTerm color sets (16 ANSI colors, selection and cursor colors) in
+one call; every chromatic color is pushed away from the background until it
+meets a minimum WCAG contrast ratio.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+# ANSI hue anchors in OKLCH degrees: red, green, yellow, blue, magenta, cyan
+ANSI_HUES = np.array([29.0, 142.0, 100.0, 264.0, 328.0, 195.0])
+# How far each hue leans towards the prompt hue (0 keeps the anchors)
+HUE_PULL = 0.12
+MIN_CHROMA = 0.09
+MAX_CHROMA = 0.19
+NORMAL_CONTRAST = 4.5
+BRIGHT_BLACK_CONTRAST = 3.0
+# Headroom so rounding to 8-bit hex never drops a color below its target
+CONTRAST_MARGIN = 0.05
+NEUTRAL_CHROMA = 0.015
+SELECTION_MIX = 0.35
+
+_LMS_FROM_LINEAR = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+_OKLAB_FROM_LMS = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+_LMS_FROM_OKLAB = np.linalg.inv(_OKLAB_FROM_LMS)
+_LINEAR_FROM_LMS = np.linalg.inv(_LMS_FROM_LINEAR)
+_LUMINANCE = np.array([0.2126, 0.7152, 0.0722])
+
+
+def hex_to_srgb(colors):
+    """'#rrggbb' strings (any shape) -> sRGB floats in [0, 1] with a trailing axis of 3"""
+    colors = np.asarray(colors, dtype=str)
+    flat = np.char.lstrip(colors.ravel(), '#')
+    if flat.size and not np.all(np.char.str_len(flat) == 6):
+        raise ValueError("Renkler #rrggbb biçiminde olmalıdır")
+    values = np.array([int(color, 16) for color in flat], dtype=np.int64)
+    channels = np.stack([(values >> 16) & 0xff, (values >> 8) & 0xff, values & 0xff], axis=-1)
+    return (channels / 255.0).reshape(colors.shape + (3,))
+
+
+def srgb_to_hex(srgb):
+    """sRGB floats -> '#rrggbb' strings, clipping out-of-gamut values"""
+    srgb = np.asarray(srgb, dtype=float)
+    channels = np.rint(np.clip(srgb, 0.0, 1.0) * 255).astype(np.int64)
+    values = (channels[..., 0] << 16) | (channels[..., 1] << 8) | channels[..., 2]
+    return np.array([f"#{value:06x}" for value in values.ravel()], dtype=object).reshape(values.shape)
+
+
+def srgb_to_linear(srgb):
+    srgb = np.asarray(srgb, dtype=float)
+    return np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(linear):
+    linear = np.asarray(linear, dtype=float)
+    return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * np.abs(linear) ** (1 / 2.4) * np.sign(linear) - 0.055)
+
+
+def linear_to_oklab(linear):
+    lms = np.cbrt(np.asarray(linear, dtype=float) @ _LMS_FROM_LINEAR.T)
+    return lms @ _OKLAB_FROM_LMS.T
+
+
+def oklab_to_linear(lab):
+    lms = np.asarray(lab, dtype=float) @ _LMS_FROM_OKLAB.T
+    return (lms * lms * lms) @ _LINEAR_FROM_LMS.T
+
+
+def oklab_to_oklch(lab):
+    lab = np.asarray(lab, dtype=float)
+    chroma = np.hypot(lab[..., 1], lab[..., 2])
+    hue = np.degrees(np.arctan2(lab[..., 2], lab[..., 1])) % 360
+    return np.stack([lab[..., 0], chroma, hue], axis=-1)
+
+
+def oklch_to_oklab(lch):
+    lch = np.asarray(lch, dtype=float)
+    hue = np.radians(lch[..., 2])
+    return np.stack([lch[..., 0], lch[..., 1] * np.cos(hue), lch[..., 1] * np.sin(hue)], axis=-1)
+
+
+def srgb_to_oklch(srgb):
+    return oklab_to_oklch(linear_to_oklab(srgb_to_linear(srgb)))
+
+
+def relative_luminance(srgb):
+    """WCAG relative luminance"""
+    return srgb_to_linear(np.clip(srgb, 0.0, 1.0)) @ _LUMINANCE
+
+
+def contrast_ratio(srgb_a, srgb_b):
+    """WCAG contrast ratio, 1 to 21"""
+    luminance_a, luminance_b = relative_luminance(srgb_a), relative_luminance(srgb_b)
+    return (np.maximum(luminance_a, luminance_b) + 0.05) / (np.minimum(luminance_a, luminance_b) + 0.05)
+
+
+def _in_gamut(linear, tolerance=1e-6):
+    return np.all((linear >= -tolerance) & (linear <= 1 + tolerance), axis=-1)
+
+
+def _lch_to_linear(lightness, chroma, hue_radians):
+    lab = np.stack([lightness, chroma * np.cos(hue_radians), chroma * np.sin(hue_radians)], axis=-1)
+    return oklab_to_linear(lab)
+
+
+def oklch_to_srgb(lch, steps=12):
+    """OKLCH -> sRGB, lowering chroma (hue and lightness kept) until the color fits the gamut"""
+    lch = np.asarray(lch, dtype=float)
+    shape = lch.shape
+    lch = lch.reshape(-1, 3)
+    hue = np.radians(lch[:, 2])
+    linear = _lch_to_linear(lch[:, 0], lch[:, 1], hue)
+    # Binary search on chroma, only for the colors that do not fit as given
+    outside = np.flatnonzero(~_in_gamut(linear))
+    if outside.size:
+        lightness, hue_outside = lch[outside, 0], hue[outside]
+        low, high = np.zeros(outside.size), lch[outside, 1].copy()
+        for _ in range(steps):
+            middle = (low + high) / 2
+            ok = _in_gamut(_lch_to_linear(lightness, middle, hue_outside))
+            low = np.where(ok, middle, low)
+            high = np.where(ok, high, middle)
+        linear[outside] = _lch_to_linear(lightness, low, hue_outside)
+    return np.clip(linear_to_srgb(linear), 0.0, 1.0).reshape(shape)
+
+
+def _meet_contrast(lch, background_srgb, minimum, direction, steps=12):
+    """Move lightness in direction (+1/-1, broadcast like lch) until contrast with the background reaches minimum"""
+    lch = np.asarray(lch, dtype=float)
+    shape = lch.shape
+    lch = lch.reshape(-1, 3).copy()
+    backgrounds = np.broadcast_to(background_srgb, shape).reshape(-1, 3)
+    limits = np.where(np.broadcast_to(direction, shape[:-1]).ravel() > 0, 1.0, 0.0)
+    # Smallest lightness change that reaches the contrast, by bisection between the start and the limit;
+    # colors that already have enough contrast are left alone
+    short = np.flatnonzero(contrast_ratio(oklch_to_srgb(lch), backgrounds) < minimum)
+    if short.size:
+        low, high = lch[short, 0], limits[short]
+        chroma_hue = lch[short, 1:]
+        for _ in range(steps):
+            middle = (low + high) / 2
+            candidate = oklch_to_srgb(np.column_stack([middle, chroma_hue]))
+            ok = contrast_ratio(candidate, backgrounds[short]) >= minimum
+            high = np.where(ok, middle, high)
+            low = np.where(ok, low, middle)
+        lch[short, 0] = high
+    return lch.reshape(shape)
+
+
+def derive_palettes_srgb(backgrounds, foregrounds, prompts):
+    """Batch palette derivation on (N, 3) sRGB arrays
+
+    Returns a dict of sRGB arrays: 'ansi' and 'brights' (N, 8, 3) plus
+    'selection_bg', 'selection_fg', 'cursor_bg', 'cursor_fg' and
+    'cursor_border' (N, 3).
+    """
+    backgrounds = np.atleast_2d(np.asarray(backgrounds, dtype=float))
+    foregrounds = np.atleast_2d(np.asarray(foregrounds, dtype=float))
+    prompts = np.atleast_2d(np.asarray(prompts, dtype=float))
+    count = backgrounds.shape[0]
+
+    background_lch = srgb_to_oklch(backgrounds)
+    foreground_lch = srgb_to_oklch(foregrounds)
+    prompt_lch = srgb_to_oklch(prompts)
+    # Text colors move away from the background, towards whichever of white/black contrasts more with it
+    dark = contrast_ratio(backgrounds, np.ones(3)) >= contrast_ratio(backgrounds, np.zeros(3))
+    direction = np.where(dark, 1.0, -1.0)
+
+    # Chromatic colors: anchor hues leaning towards the prompt, its chroma clamped to a usable band
+    hue_offset = (prompt_lch[:, None, 2] - ANSI_HUES[None, :] + 180) % 360 - 180
+    hues = (ANSI_HUES[None, :] + HUE_PULL * hue_offset) % 360
+    chroma = np.clip(prompt_lch[:, 1], MIN_CHROMA, MAX_CHROMA)[:, None].repeat(6, axis=1)
+    normal_lightness = np.where(dark, 0.70, 0.52)[:, None].repeat(6, axis=1)
+    bright_lightness = normal_lightness + 0.08 * direction[:, None]
+    background_rows = backgrounds[:, None, :]
+
+    normal = _meet_contrast(np.stack([normal_lightness, chroma, hues], axis=-1), background_rows,
+                            NORMAL_CONTRAST + CONTRAST_MARGIN, direction[:, None])
+    bright = _meet_contrast(np.stack([bright_lightness, chroma * 1.1, hues], axis=-1), background_rows,
+                            NORMAL_CONTRAST + CONTRAST_MARGIN, direction[:, None])
+    # Bright variants must stay at least as far from the background as the normal ones
+    bright[..., 0] = np.where(dark[:, None], np.maximum(bright[..., 0], normal[..., 0] + 0.04),
+                              np.minimum(bright[..., 0], normal[..., 0] - 0.04))
+
+    # Neutrals carry a trace of the background hue so greys do not look foreign
+    neutral_hue = background_lch[:, 2]
+    neutral_chroma = np.minimum(background_lch[:, 1], NEUTRAL_CHROMA)
+
+    def neutral(lightness):
+        return np.stack([np.clip(lightness, 0.0, 1.0), neutral_chroma, neutral_hue], axis=-1)
+
+    black = neutral(np.where(dark, background_lch[:, 0] + 0.08, 0.25))
+    white = neutral(np.where(dark, foreground_lch[:, 0] - 0.05, background_lch[:, 0] - 0.08))
+    bright_black = _meet_contrast(neutral(background_lch[:, 0] + 0.25 * direction), backgrounds,
+                                  BRIGHT_BLACK_CONTRAST + CONTRAST_MARGIN, direction)
+    bright_white = neutral(np.where(dark, np.maximum(foreground_lch[:, 0] + 0.05, 0.95), 0.97))
+
+    ansi = np.concatenate([oklch_to_srgb(black)[:, None], oklch_to_srgb(normal), oklch_to_srgb(white)[:, None]], axis=1)
+    brights = np.concatenate([oklch_to_srgb(bright_black)[:, None], oklch_to_srgb(bright),
+                              oklch_to_srgb(bright_white)[:, None]], axis=1)
+
+    background_lab = linear_to_oklab(srgb_to_linear(backgrounds))
+    prompt_lab = linear_to_oklab(srgb_to_linear(prompts))
+    selection = (1 - SELECTION_MIX) * background_lab + SELECTION_MIX * prompt_lab
+    selection_bg = np.clip(linear_to_srgb(oklab_to_linear(selection)), 0.0, 1.0)
+
+    return {
+        'ansi': ansi,
+        'brights': brights,
+        'selection_bg': selection_bg,
+        'selection_fg': foregrounds.reshape(count, 3),
+        'cursor_bg': prompts.reshape(count, 3),
+        'cursor_fg': backgrounds.reshape(count, 3),
+        'cursor_border': prompts.reshape(count, 3),
+    }
+
+
+def derive_palettes(colors_list):
+    """Derive color sets for many {'bg', 'fg', 'prompt'} mappings in one vectorized pass"""
+    if not colors_list:
+        return []
+    picks = hex_to_srgb([[colors['bg'], colors['fg'], colors['prompt']] for colors in colors_list])
+    derived = derive_palettes_srgb(picks[:, 0], picks[:, 1], picks[:, 2])
+    as_hex = {name: srgb_to_hex(values) for name, values in derived.items()}
+    return [{name: (list(values[index]) if values.ndim == 2 else values[index]) for name, values in as_hex.items()}
+            for index in range(len(colors_list))]
+
+
+@lru_cache(maxsize=256)
+def _derive_palette_cached(bg, fg, prompt):
+    return derive_palettes([{'bg': bg, 'fg': fg, 'prompt': prompt}])[0]
+
+
+def derive_palette(colors):
+    """WezTerm color set for one {'bg', 'fg', 'prompt'} mapping
+
+    Keys match WezTerm's ``colors`` table: 'ansi' and 'brights' (8 colors
+    each), 'selection_bg', 'selection_fg', 'cursor_bg', 'cursor_fg',
+    'cursor_border'.
+    """
+    palette = _derive_palette_cached(colors['bg'].lower(), colors['fg'].lower(), colors['prompt'].lower())
+    return {name: list(value) if isinstance(value, list) else value for name, value in palette.items()}
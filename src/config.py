@@ -1,8 +1,107 @@
+import io
 import logging
 import traceback
+from collections import namedtuple
+
+from src.lua import LuaEmitter, LuaExpr, LuaCall, lua_string
+from src.colormath import derive_palette
+from src.option_schema import load_option_schema, write_options
+from src.themes import imported_scheme
 
 logger = logging.getLogger("wezterm_gui")
 
+DEFAULT_CONFIG = {
+    'theme': 'Dark',
+    'font': 'JetBrains Mono',
+    'font_size': 14,
+    'color_scheme': 'Builtin Dark',
+    'custom_colors': {'bg': '#282828', 'fg': '#ebdbb2', 'prompt': '#b8bb26'},
+    'opacity': 0.95,
+    'enable_tab_bar': True,
+    'enable_scroll_bar': False,
+    'default_cursor_style': 'Block',
+    'padding': 8,
+    'line_height': 1.0,
+    'use_fancy_tab_bar': True,
+    'hyperlinkRules': ['URL Algılama'],
+    'leader_key': 'CTRL + a',
+    'window_width': 800,
+    'window_height': 600,
+    'window_decorations': ['TITLE', 'RESIZE'],
+    'window_position': None,
+    'window_maximized': False,
+    'window_fullscreen': False,
+    'window_always_on_top': False,
+    'window_close_confirmation': 'AlwaysPrompt',
+    'window_hide_tab_bar_if_only_one_tab': True,
+    'keys': [],
+    # Non-default values of the schema-driven options (src/option_schema.py)
+    'extra_options': {},
+    # List options edited page by page (src/list_editor.py); appended so share link field bits stay put
+    'ssh_domains': [],
+    'launch_menu': [],
+}
+
+# (min, max) of the numeric fields, shared by the sidebar widgets and share link decoding
+FIELD_RANGES = {
+    'font_size': (8, 32),
+    'opacity': (0.5, 1.0),
+    'padding': (0, 20),
+    'line_height': (0.8, 2.0),
+    'window_width': (400, 3840),
+    'window_height': (300, 2160),
+}
+
+FONT_OPTIONS = ['JetBrains Mono', 'Fira Code', 'Cascadia Code', 'Hack',
+                'Source Code Pro', 'Ubuntu Mono', 'Menlo', 'Monaco']
+
+# Split output: modules are written to <config dir>/wezterm_gui/<section>.lua and loaded with require
+LUA_MODULE_PACKAGE = 'wezterm_gui'
+
+# entry is the wezterm.lua source, modules maps paths relative to its directory to module sources
+SplitLua = namedtuple('SplitLua', ['entry', 'modules'])
+
+# action is Lua source, e.g. "act.SpawnTab 'CurrentPaneDomain'"; key_table=None means config.keys
+KeyBinding = namedtuple('KeyBinding', ['key', 'mods', 'action', 'key_table'], defaults=[None])
+
+# One entry of config.ssh_domains; an empty username leaves it to ssh, multiplexing is one of SSH_MULTIPLEXING
+SshDomain = namedtuple('SshDomain', ['name', 'remote_address', 'username', 'multiplexing'], defaults=['', 'WezTerm'])
+SSH_MULTIPLEXING = ['WezTerm', 'None']
+
+# One entry of config.launch_menu; args is the argv as a tuple of strings, an empty cwd means the default
+LaunchMenuEntry = namedtuple('LaunchMenuEntry', ['label', 'args', 'cwd'], defaults=[''])
+
+DEFAULT_CURSOR_STYLE_MAP = {'Block': 'SteadyBlock', 'Bar': 'SteadyBar', 'Underline': 'SteadyUnderline'}
+
+# label -> (comment, regex, format); order is the order rules are emitted in
+HYPERLINK_RULES = {
+    'URL Algılama': ('URL detection', r'\b\w+://[\w.-]+\.[\w.-]+\S*\b', '$0'),
+    'E-posta Adresleri': ('Email addresses', r'\b\w+@[\w.-]+\.[\w]+\b', 'mailto:$0'),
+    'Dosya Yolları': ('File paths', r'\b(\w+:)?[\/\\][\w.~-]+[\/\\][\w.~-]+\b', '$0'),
+}
+
+# tmux-style bindings emitted whenever a leader key is configured
+LEADER_KEY_BINDINGS = [
+    KeyBinding('|', 'LEADER|SHIFT', "act.SplitHorizontal { domain = 'CurrentPaneDomain' }"),
+    KeyBinding('-', 'LEADER', "act.SplitVertical { domain = 'CurrentPaneDomain' }"),
+    KeyBinding('h', 'LEADER', "act.ActivatePaneDirection 'Left'"),
+    KeyBinding('j', 'LEADER', "act.ActivatePaneDirection 'Down'"),
+    KeyBinding('k', 'LEADER', "act.ActivatePaneDirection 'Up'"),
+    KeyBinding('l', 'LEADER', "act.ActivatePaneDirection 'Right'"),
+    KeyBinding('c', 'LEADER', "act.SpawnTab 'CurrentPaneDomain'"),
+    KeyBinding('x', 'LEADER', "act.CloseCurrentPane { confirm = true }"),
+    KeyBinding('z', 'LEADER', "act.TogglePaneZoomState"),
+    KeyBinding('n', 'LEADER', "act.ActivateTabRelative(1)"),
+    KeyBinding('p', 'LEADER', "act.ActivateTabRelative(-1)"),
+    KeyBinding('[', 'LEADER', "act.ActivateCopyMode"),
+    KeyBinding('r', 'LEADER', "act.ActivateKeyTable { name = 'resize_pane', one_shot = false }"),
+    KeyBinding('h', '', "act.AdjustPaneSize { 'Left', 5 }", 'resize_pane'),
+    KeyBinding('j', '', "act.AdjustPaneSize { 'Down', 5 }", 'resize_pane'),
+    KeyBinding('k', '', "act.AdjustPaneSize { 'Up', 5 }", 'resize_pane'),
+    KeyBinding('l', '', "act.AdjustPaneSize { 'Right', 5 }", 'resize_pane'),
+    KeyBinding('Escape', '', "'PopKeyTable'", 'resize_pane'),
+]
+
 class ConfigGenerator:
     """WezTerm yapılandırma dosyası üreten sınıf"""
 
@@ -10,140 +109,298 @@ class ConfigGenerator:
     def generate_wezterm_lua(config):
         """Generate WezTerm Lua configuration based on user selections"""
         try:
-            default_cursor_style_map = {'Block': 'SteadyBlock', 'Bar': 'SteadyBar', 'Underline': 'SteadyUnderline'}
-            wezterm_default_cursor_style = default_cursor_style_map.get(config['default_cursor_style'], 'SteadyBlock')
-            
-            lua_config = [
-                "local wezterm = require 'wezterm'",
-                "local act = wezterm.action",
-                "",
-                "-- This is where you actually apply your config choices",
-                "local config = wezterm.config_builder()",
-                "",
-                "-- Basic configuration",
-                f"config.font = wezterm.font('{config['font']}')",
-                f"config.font_size = {config['font_size']}",
-                f"config.line_height = {config['line_height']}",
-                "",
-                f"config.enable_tab_bar = {str(config['enable_tab_bar']).lower()}",
-                f"config.use_fancy_tab_bar = {str(config['use_fancy_tab_bar']).lower()}",
-                f"config.enable_scroll_bar = {str(config['enable_scroll_bar']).lower()}",
-                f"config.window_background_opacity = {config['opacity']}",
-                f"config.default_cursor_style = '{wezterm_default_cursor_style}'",
-                "config.window_padding = {",
-                f"  left = {config['padding']}, right = {config['padding']},",
-                f"  top = {config['padding']}, bottom = {config['padding']}",
-                "}",
-                ""
-            ]
-
-            lua_config.extend([
-                "-- Window dimensions and position",
-                f"config.initial_cols = {config['window_width'] // 8}  -- Approximate conversion from pixels to columns",
-                f"config.initial_rows = {config['window_height'] // 16}  -- Approximate conversion from pixels to rows",
-                ""
-            ])
-            
-            if config.get('window_decorations'):
-                decorations_code = []
-                for decoration in config['window_decorations']:
-                    decorations_code.append(f"wezterm.window_decoration.{decoration}")
-                
-                if decorations_code:
-                    lua_config.append(f"config.window_decorations = {' | '.join(decorations_code)}")
-                    lua_config.append("")
-            
-            if config.get('window_position'):
-                lua_config.append(f"config.initial_position = {{ x = {config['window_position'][0]}, y = {config['window_position'][1]} }}")
-                lua_config.append("")
-            
-            if config.get('window_maximized'):
-                lua_config.append(f"config.default_gui_startup_args = {{ 'start', '--maximized' }}")
-            elif config.get('window_fullscreen'):
-                lua_config.append(f"config.default_gui_startup_args = {{ 'start', '--fullscreen' }}")
-                
-            lua_config.append(f"config.window_close_confirmation = '{config.get('window_close_confirmation', 'AlwaysPrompt')}'")
-            lua_config.append(f"config.hide_tab_bar_if_only_one_tab = {str(config.get('window_hide_tab_bar_if_only_one_tab', True)).lower()}")
-            lua_config.append(f"config.window_is_always_on_top = {str(config.get('window_always_on_top', False)).lower()}")
-            lua_config.append("")
-
-            if config['hyperlinkRules'] and len(config['hyperlinkRules']) > 0:
-                lua_config.extend(ConfigGenerator._generate_hyperlink_rules(config['hyperlinkRules']))
-
-            if config['leader_key'] and config['leader_key'].strip():
-                lua_config.extend(ConfigGenerator._generate_leader_key_config(config['leader_key']))
-
-            if config['theme'] == 'Custom' and config['custom_colors']:
-                lua_config.extend([
-                    "-- Custom colors",
-                    "config.colors = {",
-                    f"  background = '{config['custom_colors']['bg']}',",
-                    f"  foreground = '{config['custom_colors']['fg']}',",
-                    f"  cursor_bg = '{config['custom_colors']['prompt']}',",
-                    "  cursor_fg = 'black',",
-                    "}",
-                    ""
-                ])
-            else:
-                lua_config.extend([
-                    "-- Theme color scheme",
-                    f"config.color_scheme = '{config['color_scheme']}'",
-                    ""
-                ])
-            
-            lua_config.append("return config")
-            return "\n".join(lua_config)
+            stream = io.StringIO()
+            ConfigGenerator.write_wezterm_lua(config, stream)
+            return stream.getvalue()
         except Exception as e:
             logger.error(f"Lua yapılandırması oluşturulurken hata: {e}\n{traceback.format_exc()}")
             return None
 
     @staticmethod
-    def _generate_hyperlink_rules(hyperlinkRules):
-        """Generate hyperlink rule configuration"""
-        config_lines = ["-- Hyperlink settings", "config.hyperlink_rules = {"]
-        
-        if 'URL Algılama' in hyperlinkRules:
-            config_lines.extend([
-                "  -- URL detection",
-                "  {",
-                "    regex = '\\\\b\\\\w+://[\\\\w.-]+\\\\.[\\\\w.-]+\\\\S*\\\\b',",
-                "    format = '$0',",
-                "  },"
-            ])
-        
-        if 'E-posta Adresleri' in hyperlinkRules:
-            config_lines.extend([
-                "  -- Email addresses",
-                "  {",
-                "    regex = '\\\\b\\\\w+@[\\\\w.-]+\\\\.[\\\\w]+\\\\b',",
-                "    format = 'mailto:$0',",
-                "  },"
-            ])
-                
-        if 'Dosya Yolları' in hyperlinkRules:
-            config_lines.extend([
-                "  -- File paths",
-                "  {",
-                "    regex = '\\\\b(\\\\w+:)?[\\\\/\\\\\\\\][\\\\w.~-]+[\\\\/\\\\\\\\][\\\\w.~-]+\\\\b',",
-                "    format = '$0',",
-                "  },"
-            ])
-                
-        config_lines.append("}")
-        config_lines.append("")
-        return config_lines
-
-    @staticmethod
-    def _generate_leader_key_config(leader_key):
-        """Generate leader key configuration"""
+    def write_wezterm_lua(config, stream):
+        """Stream the Lua configuration into a text stream, section by section"""
+        lua = LuaEmitter(stream)
+        ConfigGenerator._write_header(lua)
+
+        ConfigGenerator._write_basic_config(lua, config)
+        ConfigGenerator._write_window_config(lua, config)
+
+        for _, write_section in ConfigGenerator._sections(config):
+            write_section(lua)
+
+        lua.ret(LuaExpr('config'))
+
+    @staticmethod
+    def generate_wezterm_modules(config, package=LUA_MODULE_PACKAGE):
+        """Generate the split layout: a small entry file plus one module per optional section"""
+        try:
+            return ConfigGenerator.split_wezterm_lua(config, package)
+        except Exception as e:
+            logger.error(f"Lua modülleri oluşturulurken hata: {e}\n{traceback.format_exc()}")
+            return None
+
+    @staticmethod
+    def split_wezterm_lua(config, package=LUA_MODULE_PACKAGE):
+        """Entry source and {relative path: source} for the sections moved out of it
+
+        The entry keeps the always-present basic and window settings and pulls
+        every other section in with require; a section the config does not use
+        gets neither a module nor a require line.
+        """
+        stream = io.StringIO()
+        lua = LuaEmitter(stream)
+        ConfigGenerator._write_header(lua)
+
+        ConfigGenerator._write_basic_config(lua, config)
+        ConfigGenerator._write_window_config(lua, config)
+
+        modules = {}
+        sections = ConfigGenerator._sections(config)
+        if sections:
+            lua.comment(f"Larger sections live in {package}/ next to this file")
+            for name, write_section in sections:
+                lua.raw(f"require({lua_string(f'{package}.{name}')}).apply_to_config(config)")
+                modules[f"{package}/{name}.lua"] = ConfigGenerator._module_source(write_section)
+            lua.blank()
+
+        lua.ret(LuaExpr('config'))
+        return SplitLua(stream.getvalue(), modules)
+
+    @staticmethod
+    def _module_source(write_section):
+        body = io.StringIO()
+        section = LuaEmitter(body)
+        section.level = 1
+        write_section(section)
+
+        stream = io.StringIO()
+        lua = LuaEmitter(stream)
+        lua.local('wezterm', LuaExpr("require 'wezterm'"))
+        lua.local('act', LuaExpr('wezterm.action'))
+        lua.blank()
+        lua.local('M', {})
+        lua.blank()
+        lua.raw("function M.apply_to_config(config)")
+        # Sections end with a blank line that only separates them in the single file
+        stream.write(body.getvalue().rstrip('\n') + '\n')
+        lua.raw("end")
+        lua.blank()
+        lua.ret(LuaExpr('M'))
+        return stream.getvalue()
+
+    @staticmethod
+    def _write_header(lua):
+        lua.local('wezterm', LuaExpr("require 'wezterm'"))
+        lua.local('act', LuaExpr('wezterm.action'))
+        lua.blank()
+        lua.comment("This is where you actually apply your config choices")
+        lua.local('config', LuaExpr('wezterm.config_builder()'))
+        lua.blank()
+
+    @staticmethod
+    def _sections(config):
+        """(module name, writer) for the optional sections of config, in output order"""
+        sections = []
+        if config['hyperlinkRules'] and len(config['hyperlinkRules']) > 0:
+            sections.append(('links', lambda lua: ConfigGenerator._write_hyperlink_rules(lua, config['hyperlinkRules'])))
+
+        leader = None
+        if config['leader_key'] and config['leader_key'].strip():
+            leader = ConfigGenerator.parse_leader_key(config['leader_key'])
+        bindings = ConfigGenerator.collect_key_bindings(leader, config.get('keys'))
+        if leader or bindings:
+            def write_keys(lua):
+                if leader:
+                    ConfigGenerator._write_leader_key_config(lua, leader)
+                if bindings:
+                    ConfigGenerator._write_key_bindings(lua, bindings)
+            sections.append(('keys', write_keys))
+
+        ssh_domains = config.get('ssh_domains')
+        if ssh_domains:
+            sections.append(('domains', lambda lua: ConfigGenerator._write_ssh_domains(lua, ssh_domains)))
+
+        launch_menu = config.get('launch_menu')
+        if launch_menu:
+            sections.append(('launch_menu', lambda lua: ConfigGenerator._write_launch_menu(lua, launch_menu)))
+
+        extra_options = config.get('extra_options') or {}
+        if extra_options:
+            sections.append(('options', lambda lua: write_options(lua, load_option_schema(), extra_options)))
+
+        sections.append(('colors', lambda lua: ConfigGenerator._write_colors(lua, config)))
+        return sections
+
+    @staticmethod
+    def _write_basic_config(lua, config):
+        wezterm_default_cursor_style = DEFAULT_CURSOR_STYLE_MAP.get(config['default_cursor_style'], 'SteadyBlock')
+
+        lua.comment("Basic configuration")
+        lua.assign('config.font', LuaCall('wezterm.font', config['font']))
+        lua.assign('config.font_size', config['font_size'])
+        lua.assign('config.line_height', config['line_height'])
+        lua.blank()
+        lua.assign('config.enable_tab_bar', bool(config['enable_tab_bar']))
+        lua.assign('config.use_fancy_tab_bar', bool(config['use_fancy_tab_bar']))
+        lua.assign('config.enable_scroll_bar', bool(config['enable_scroll_bar']))
+        lua.assign('config.window_background_opacity', config['opacity'])
+        lua.assign('config.default_cursor_style', wezterm_default_cursor_style)
+        padding = config['padding']
+        lua.assign('config.window_padding', {'left': padding, 'right': padding, 'top': padding, 'bottom': padding})
+        lua.blank()
+
+    @staticmethod
+    def _write_window_config(lua, config):
+        lua.comment("Window dimensions and position")
+        lua.assign('config.initial_cols', config['window_width'] // 8, "Approximate conversion from pixels to columns")
+        lua.assign('config.initial_rows', config['window_height'] // 16, "Approximate conversion from pixels to rows")
+        lua.blank()
+
+        if config.get('window_decorations'):
+            lua.assign('config.window_decorations', ' | '.join(config['window_decorations']))
+            lua.blank()
+
+        if config.get('window_position'):
+            x, y = config['window_position'][0], config['window_position'][1]
+            lua.assign('config.initial_position', {'x': x, 'y': y})
+            lua.blank()
+
+        if config.get('window_maximized'):
+            lua.assign('config.default_gui_startup_args', ['start', '--maximized'])
+        elif config.get('window_fullscreen'):
+            lua.assign('config.default_gui_startup_args', ['start', '--fullscreen'])
+
+        lua.assign('config.window_close_confirmation', config.get('window_close_confirmation', 'AlwaysPrompt'))
+        lua.assign('config.hide_tab_bar_if_only_one_tab', bool(config.get('window_hide_tab_bar_if_only_one_tab', True)))
+        lua.assign('config.window_is_always_on_top', bool(config.get('window_always_on_top', False)))
+        lua.blank()
+
+    @staticmethod
+    def _write_hyperlink_rules(lua, hyperlinkRules):
+        """Write hyperlink rule configuration"""
+        lua.comment("Hyperlink settings")
+        with lua.table('config.hyperlink_rules') as rules:
+            for label, (comment, regex, link_format) in HYPERLINK_RULES.items():
+                if label in hyperlinkRules:
+                    rules.comment(comment)
+                    rules.item({'regex': regex, 'format': link_format})
+        lua.blank()
+
+    @staticmethod
+    def parse_leader_key(leader_key):
+        """Parse 'CTRL + a' style input into (key, mods)"""
         parts = [part.strip() for part in leader_key.split('+')]
         if len(parts) >= 2:
-            key, mods = parts[-1].lower(), '+'.join(part.upper() for part in parts[:-1])
-        else:
-            key, mods = leader_key.strip().lower(), 'CTRL'
+            return parts[-1].lower(), '|'.join(part.upper() for part in parts[:-1])
+        return leader_key.strip().lower(), 'CTRL'
 
-        return [
-            "-- Leader key configuration",
-            f"config.leader = {{ key = '{key}', mods = '{mods}', timeout_milliseconds = 1000 }}",
-            ""
-        ]
+    @staticmethod
+    def _write_leader_key_config(lua, leader):
+        """Write leader key configuration"""
+        key, mods = leader
+        lua.comment("Leader key configuration")
+        lua.assign('config.leader', {'key': key, 'mods': mods, 'timeout_milliseconds': 1000})
+        lua.blank()
+
+    @staticmethod
+    def collect_key_bindings(leader, user_bindings=None):
+        """Leader defaults followed by user bindings, as KeyBinding tuples"""
+        bindings = []
+        if leader:
+            key, mods = leader
+            bindings.extend(LEADER_KEY_BINDINGS)
+            # Pressing the leader twice sends it through to the program
+            bindings.append(KeyBinding(key, f"LEADER|{mods}", f"act.SendKey {{ key = {lua_string(key)}, mods = {lua_string(mods)} }}"))
+        for binding in user_bindings or ():
+            bindings.append(binding if isinstance(binding, KeyBinding) else KeyBinding(**binding))
+        return bindings
+
+    @staticmethod
+    def _write_key_bindings(lua, bindings):
+        """Write config.keys and config.key_tables, one entry at a time"""
+        tables = {}
+        for binding in bindings:
+            tables.setdefault(binding.key_table, []).append(binding)
+
+        lua.comment("Key bindings")
+        with lua.table('config.keys') as keys:
+            for binding in tables.pop(None, []):
+                keys.item(ConfigGenerator._binding_entry(binding))
+        lua.blank()
+
+        if tables:
+            with lua.table('config.key_tables') as key_tables:
+                for name, table_bindings in tables.items():
+                    with key_tables.table(name) as entries:
+                        for binding in table_bindings:
+                            entries.item(ConfigGenerator._binding_entry(binding))
+            lua.blank()
+
+    @staticmethod
+    def _binding_entry(binding):
+        entry = {'key': binding.key}
+        if binding.mods:
+            entry['mods'] = binding.mods
+        entry['action'] = LuaExpr(binding.action)
+        return entry
+
+    @staticmethod
+    def _write_ssh_domains(lua, domains):
+        """Write config.ssh_domains, one entry at a time"""
+        lua.comment("SSH domains")
+        with lua.table('config.ssh_domains') as entries:
+            for domain in domains:
+                # The API passes plain dicts
+                domain = domain if isinstance(domain, SshDomain) else SshDomain(**domain)
+                entry = {'name': domain.name, 'remote_address': domain.remote_address}
+                if domain.username:
+                    entry['username'] = domain.username
+                if domain.multiplexing != 'WezTerm':
+                    entry['multiplexing'] = domain.multiplexing
+                entries.item(entry)
+        lua.blank()
+
+    @staticmethod
+    def _write_launch_menu(lua, launch_menu):
+        """Write config.launch_menu, one entry at a time"""
+        lua.comment("Launch menu")
+        with lua.table('config.launch_menu') as entries:
+            for item in launch_menu:
+                item = item if isinstance(item, LaunchMenuEntry) else LaunchMenuEntry(**item)
+                entry = {'label': item.label, 'args': list(item.args)}
+                if item.cwd:
+                    entry['cwd'] = item.cwd
+                entries.item(entry)
+        lua.blank()
+
+    @staticmethod
+    def _write_colors(lua, config):
+        if config['theme'] == 'Custom' and config['custom_colors']:
+            palette = derive_palette(config['custom_colors'])
+            lua.comment("Custom colors (ANSI, selection and cursor colors derived from the three picks)")
+            lua.assign('config.colors', {
+                'background': config['custom_colors']['bg'],
+                'foreground': config['custom_colors']['fg'],
+                'cursor_bg': palette['cursor_bg'],
+                'cursor_fg': palette['cursor_fg'],
+                'cursor_border': palette['cursor_border'],
+                'selection_bg': palette['selection_bg'],
+                'selection_fg': palette['selection_fg'],
+                'ansi': palette['ansi'],
+                'brights': palette['brights'],
+            })
+        else:
+            scheme = imported_scheme(config['color_scheme'])
+            if scheme:
+                # WezTerm does not know imported schemes by name, so the definition goes along
+                lua.comment("Imported color scheme")
+                lua.assign('config.color_schemes', {config['color_scheme']: {
+                    'background': scheme['colors']['bg'],
+                    'foreground': scheme['colors']['fg'],
+                    'ansi': scheme['palette'][:8],
+                    'brights': scheme['palette'][8:],
+                }})
+            else:
+                lua.comment("Theme color scheme")
+            lua.assign('config.color_scheme', config['color_scheme'])
+        lua.blank()
@@ -1,6 +1,10 @@
 import streamlit as st
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Callable, Optional, Union
+from typing import Dict, List, Any, Callable, Optional, Set, Union
+
+# Marks a session value that was never recorded, so None is still detected as a change
+_UNSET = object()
 
 @dataclass
 class Feature:
@@ -17,15 +21,39 @@ class Feature:
     depends_on: Optional[Dict[str, Any]] = None  # Bağımlılıklar
     render_function: Optional[Callable] = None  # Özel render fonksiyonu
 
+class FeatureDependencyError(ValueError):
+    """depends_on koşullarının döngü oluşturduğunu belirten hata"""
+
+
 class FeatureRegistry:
-    """Özellik kaydı ve yönetimi için registry sınıfı"""
+    """Özellik kaydı ve yönetimi için registry sınıfı
+
+    ``depends_on`` is compiled into a DAG at registration time (a cycle raises
+    FeatureDependencyError). Visibility is cached per feature: when a value
+    changes, only the features that transitively depend on it are
+    re-evaluated, in topological order. A feature is visible when its own
+    conditions hold and every registered feature it depends on is visible.
+    """
     
     _features: Dict[str, Feature] = {}
     _categories: Dict[str, List[Feature]] = {}
+    # key -> features whose depends_on mentions it
+    _dependents: Dict[str, List[str]] = {}
+    # feature -> position in topological order; None when it has to be rebuilt
+    _order: Optional[Dict[str, int]] = None
+    # Bumped by register(); per-session caches from an older generation are dropped
+    _generation: int = 0
+    _evaluations: int = 0
     
     @classmethod
     def register(cls, feature: Feature):
         """Bir özelliği registry'e ekle"""
+        cls._check_cycle(feature)
+        previous = cls._features.get(feature.name)
+        if previous is not None:
+            cls._categories[previous.category].remove(previous)
+            for key in previous.depends_on or {}:
+                cls._dependents[key].remove(previous.name)
         cls._features[feature.name] = feature
         
         # Kategori yoksa oluştur
@@ -34,10 +62,137 @@ class FeatureRegistry:
         
         # Özelliği kategorisine ekle
         cls._categories[feature.category].append(feature)
-        
-        # Session state'e varsayılan değeri ekle
-        if feature.name not in st.session_state:
-            st.session_state[feature.name] = feature.default_value
+
+        for key in feature.depends_on or {}:
+            cls._dependents.setdefault(key, []).append(feature.name)
+        cls._order = None
+        cls._generation += 1
+        # Session values are not seeded here: registration happens once per process and
+        # readers fall back to default_value, so startup does not grow with the schema
+
+    @classmethod
+    def reset(cls):
+        """Tüm kayıtları ve önbelleğe alınmış görünürlükleri temizle"""
+        cls._features = {}
+        cls._categories = {}
+        cls._dependents = {}
+        cls._order = None
+        cls._generation += 1
+        cls._evaluations = 0
+
+    @classmethod
+    def _session_cache(cls) -> Dict[str, Dict[str, Any]]:
+        # Features are shared by the process, visibility depends on each session's values
+        cache = st.session_state.get('_feature_registry_cache')
+        if cache is None or cache['generation'] != cls._generation:
+            # 'snapshot' holds every depended-on key's value as of the last visibility update
+            cache = {'generation': cls._generation, 'visible': {}, 'snapshot': {}}
+            st.session_state['_feature_registry_cache'] = cache
+        return cache
+
+    @classmethod
+    def _check_cycle(cls, feature: Feature):
+        # A cycle appears iff one of the new feature's dependencies already depends on it
+        dependencies = list(feature.depends_on or {})
+        seen = set()
+        while dependencies:
+            name = dependencies.pop()
+            if name == feature.name:
+                raise FeatureDependencyError(f"'{feature.name}' özelliğinin bağımlılıkları döngü oluşturuyor")
+            if name in seen:
+                continue
+            seen.add(name)
+            dependency = cls._features.get(name)
+            if dependency is not None and dependency.name != feature.name:
+                dependencies.extend(dependency.depends_on or {})
+
+    @classmethod
+    def _dependents_of(cls, keys) -> List[str]:
+        """Features that transitively depend on any of keys"""
+        found = []
+        seen = set()
+        queue = deque(keys)
+        while queue:
+            for dependent in cls._dependents.get(queue.popleft(), ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    found.append(dependent)
+                    queue.append(dependent)
+        return found
+
+    @classmethod
+    def topological_order(cls) -> List[str]:
+        """Feature names with every feature after the features it depends on"""
+        if cls._order is None:
+            # Kahn's algorithm over registered features; unregistered keys are plain inputs
+            indegree = {name: sum(1 for key in feature.depends_on or {} if key in cls._features)
+                        for name, feature in cls._features.items()}
+            queue = deque(name for name, degree in indegree.items() if degree == 0)
+            order = []
+            while queue:
+                name = queue.popleft()
+                order.append(name)
+                for dependent in cls._dependents.get(name, ()):
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        queue.append(dependent)
+            cls._order = {name: position for position, name in enumerate(order)}
+        return sorted(cls._order, key=cls._order.get)
+
+    @classmethod
+    def _evaluate(cls, feature: Feature, cache) -> bool:
+        cls._evaluations += 1
+        depends_on = feature.depends_on or {}
+        # Snapshot every key before the first failing condition returns, or sync would see the rest as changed
+        values = {key: cls._value(key) for key in depends_on}
+        cache['snapshot'].update(values)
+        for key, expected in depends_on.items():
+            if values[key] != expected:
+                return False
+            if key in cls._features and not cls._is_visible(key, cache):
+                return False
+        return True
+
+    @classmethod
+    def _is_visible(cls, feature_name: str, cache) -> bool:
+        visible = cache['visible'].get(feature_name)
+        if visible is None:
+            feature = cls._features.get(feature_name)
+            visible = cls._evaluate(feature, cache) if feature else True
+            cache['visible'][feature_name] = visible
+        return visible
+
+    @classmethod
+    def is_visible(cls, feature_name: str) -> bool:
+        """Cached visibility of a feature; computed on first use"""
+        return cls._is_visible(feature_name, cls._session_cache())
+
+    @classmethod
+    def _value(cls, key: str) -> Any:
+        # Registered features fall back to their default until the session sets them
+        feature = cls._features.get(key)
+        return st.session_state.get(key, feature.default_value if feature else None)
+
+    @classmethod
+    def notify_changed(cls, keys) -> List[str]:
+        """Re-evaluate the features below changed keys, in topological order; returns them"""
+        affected = cls._dependents_of(keys)
+        if cls._order is None:
+            cls.topological_order()
+        affected.sort(key=cls._order.get)
+        cache = cls._session_cache()
+        for name in affected:
+            cache['visible'].pop(name, None)
+        for name in affected:
+            cls._is_visible(name, cache)
+        return affected
+
+    @classmethod
+    def sync_with_session_state(cls) -> List[str]:
+        """Pick up values changed outside the registry (e.g. restored state); O(depended-on keys)"""
+        snapshot = cls._session_cache()['snapshot']
+        changed: Set[str] = {key for key in cls._dependents if cls._value(key) != snapshot.get(key, _UNSET)}
+        return cls.notify_changed(changed) if changed else []
     
     @classmethod
     def get_feature(cls, name: str) -> Optional[Feature]:
@@ -55,112 +210,111 @@ class FeatureRegistry:
         return cls._categories.get(category, [])
     
     @classmethod
-    def render_feature(cls, feature_name: str) -> Any:
+    def render_feature(cls, feature_name: str, container=None, key: Optional[str] = None) -> Any:
         """Belirli bir özelliği render et ve değerini döndür"""
         feature = cls.get_feature(feature_name)
         if not feature:
             return None
+        container = container or st.sidebar
         
         # Özel render fonksiyonu varsa onu kullan
         if feature.render_function:
             return feature.render_function(feature)
         
-        # Bağımlılıkları kontrol et
-        if feature.depends_on:
-            show_feature = True
-            for dep_key, dep_value in feature.depends_on.items():
-                if st.session_state.get(dep_key) != dep_value:
-                    show_feature = False
-                    break
-            
-            if not show_feature:
-                return st.session_state.get(feature.name)
+        current = st.session_state.get(feature.name, feature.default_value)
+        # Bağımlılıkları kontrol et (önbellekten; yalnızca etkilenen özellikler yeniden değerlendirilir)
+        if feature.depends_on and not cls.is_visible(feature.name):
+            return current
         
         # Farklı widget türlerine göre render et
         if feature.widget_type == "selectbox":
-            value = st.sidebar.selectbox(
+            value = container.selectbox(
                 feature.name, 
                 feature.options, 
-                index=feature.options.index(st.session_state[feature.name])
-                if st.session_state[feature.name] in feature.options else 0
+                index=feature.options.index(current)
+                if current in feature.options else 0,
+                help=feature.description or None,
+                key=key
             )
         elif feature.widget_type == "slider":
-            value = st.sidebar.slider(
+            # Missing bounds follow the default's type: Streamlit rejects sliders that mix int and float
+            number = float if isinstance(feature.default_value, float) else int
+            value = container.slider(
                 feature.name,
-                min_value=feature.min_value or 0,
-                max_value=feature.max_value or 100,
-                value=st.session_state[feature.name],
-                step=feature.step or 1
+                min_value=number(0) if feature.min_value is None else feature.min_value,
+                max_value=number(100) if feature.max_value is None else feature.max_value,
+                value=current,
+                step=(0.01 if number is float else 1) if feature.step is None else feature.step,
+                help=feature.description or None,
+                key=key
             )
         elif feature.widget_type == "checkbox":
-            value = st.sidebar.checkbox(
+            value = container.checkbox(
                 feature.name,
-                value=st.session_state[feature.name]
+                value=current,
+                help=feature.description or None,
+                key=key
             )
         elif feature.widget_type == "number_input":
-            value = st.sidebar.number_input(
+            value = container.number_input(
                 feature.name,
                 min_value=feature.min_value,
                 max_value=feature.max_value,
-                value=st.session_state[feature.name],
-                step=feature.step or 1
+                value=current,
+                step=feature.step or 1,
+                help=feature.description or None,
+                key=key
             )
         elif feature.widget_type == "multiselect":
-            value = st.sidebar.multiselect(
+            value = container.multiselect(
                 feature.name,
                 feature.options,
-                default=st.session_state[feature.name]
+                default=current,
+                help=feature.description or None,
+                key=key
             )
+        elif feature.widget_type == "text_input":
+            value = container.text_input(feature.name, value=current, help=feature.description or None, key=key)
+        elif feature.widget_type == "color_picker":
+            value = container.color_picker(feature.name, value=current, help=feature.description or None, key=key)
+        elif feature.widget_type == "text_list":
+            # One list item per line
+            text = container.text_area(feature.name, value='\n'.join(current), help=feature.description or None,
+                                       key=key)
+            value = [line.strip() for line in text.splitlines() if line.strip()]
         else:
-            return st.session_state.get(feature.name)
+            return current
         
         # Session state'i güncelle
+        changed = current != value
         st.session_state[feature.name] = value
+        if changed and feature.name in cls._dependents:
+            # Features rendered later in this run already see the new visibility
+            cls.notify_changed([feature.name])
         return value
 
     @classmethod
-    def render_category(cls, category: str) -> Dict[str, Any]:
+    def render_category(cls, category: str, container=None, header: bool = True,
+                        key_suffix: str = "") -> Dict[str, Any]:
         """Bir kategoriyi render et ve ayarları bir sözlük olarak döndür"""
         features = cls.get_features_by_category(category)
-        st.sidebar.markdown(f"## {category}")
+        container = container or st.sidebar
+        if header:
+            container.markdown(f"## {category}")
+        cls.sync_with_session_state()
         
         values = {}
         for feature in features:
-            values[feature.name] = cls.render_feature(feature.name)
+            values[feature.name] = cls.render_feature(feature.name, container,
+                                                      key=f"{feature.name}{key_suffix}" if key_suffix else None)
         
         return values
     
     @classmethod
-    def register_defaults(cls):
-        """Varsayılan özellikleri kaydet"""
-        # Tema özellikleri
-        cls.register(Feature(
-            name="theme",
-            category="Tema Ayarları",
-            default_value="Dark",
-            description="Tema türü",
-            options=["Dark", "Light", "Custom"],
-            widget_type="selectbox"
-        ))
-        
-        cls.register(Feature(
-            name="font",
-            category="Tema Ayarları",
-            default_value="JetBrains Mono",
-            description="Yazı tipi",
-            options=["JetBrains Mono", "Fira Code", "Cascadia Code", "Hack", 
-                    "Source Code Pro", "Ubuntu Mono", "Menlo", "Monaco"],
-            widget_type="selectbox"
-        ))
-        
-        cls.register(Feature(
-            name="font_size",
-            category="Tema Ayarları",
-            default_value=14,
-            description="Yazı boyutu",
-            min_value=8,
-            max_value=32,
-            step=1,
-            widget_type="slider"
-        ))
-        
+    def register_defaults(cls, schema=None):
+        """Seçenek şemasındaki, kenar çubuğunda özel widget'ı olmayan WezTerm seçeneklerini kaydet"""
+        # Imported here: the schema module builds Feature objects from this one
+        from src.option_schema import load_option_schema
+        schema = schema or load_option_schema()
+        for feature in schema.features():
+            cls.register(feature)
@@ -0,0 +1,272 @@
+"""Installed monospace font discovery for the font picker.
+
+Font files are read directly, without fontconfig: the sfnt tables of each
+TrueType/OpenType file or collection give the family and style names, whether
+the face is fixed pitch, and its metrics. Parsing thousands of files is slow,
+so the result is kept in a persisted index (``~/.cache/wezterm-gui/fonts.json``)
+with one entry per directory. A directory is rescanned only when its mtime
+changed, which happens when a font file is added, removed or renamed in it;
+an unchanged tree costs one stat per directory and no file reads.
+
+    python -m src.fonts            # list families with their metrics
+"""
+import os
+import sys
+import json
+import time
+import struct
+import logging
+import argparse
+from collections import namedtuple
+
+from src.live_apply import atomic_write
+
+logger = logging.getLogger("wezterm_gui")
+
+FONT_INDEX_PATH = os.environ.get("WEZTERM_GUI_FONT_INDEX",
+                                 os.path.join(os.path.expanduser("~"), ".cache", "wezterm-gui", "fonts.json"))
+FONT_INDEX_VERSION = 1
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc', '.otc')
+
+# WezTerm ships these and finds them without any installed file
+BUNDLED_FONTS = ['JetBrains Mono']
+
+FontFamily = namedtuple('FontFamily', ['name', 'styles', 'cell_width', 'line_height', 'paths'])
+
+_SFNT_VERSIONS = (b'\x00\x01\x00\x00', b'OTTO', b'true')
+_FAMILY_NAME_IDS = (16, 1)  # typographic family first, then the legacy one
+_STYLE_NAME_IDS = (17, 2)
+_PANOSE_LATIN_TEXT = 2
+_PANOSE_MONOSPACED = 9
+
+
+def font_directories():
+    """Font directories of this platform; WEZTERM_GUI_FONT_DIRS (os.pathsep separated) overrides them"""
+    override = os.environ.get("WEZTERM_GUI_FONT_DIRS")
+    if override:
+        return [path for path in override.split(os.pathsep) if path]
+    home = os.path.expanduser("~")
+    if sys.platform == 'win32':
+        return [os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"),
+                os.path.join(os.environ.get("LOCALAPPDATA", home), "Microsoft", "Windows", "Fonts")]
+    if sys.platform == 'darwin':
+        return ["/System/Library/Fonts", "/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(home, ".local", "share")
+    data_dirs = (os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share").split(':')
+    return [os.path.join(data_home, "fonts"), os.path.join(home, ".fonts"),
+            *(os.path.join(path, "fonts") for path in data_dirs if path)]
+
+
+def _decode_name(platform_id, encoding_id, data):
+    if platform_id == 1 and encoding_id == 0:
+        return data.decode('mac_roman')
+    if platform_id in (0, 3):
+        return data.decode('utf-16-be', errors='replace')
+    return None
+
+
+def _read_names(f, offset):
+    """nameID -> string, preferring English Windows records"""
+    f.seek(offset)
+    _, count, string_offset = struct.unpack('>HHH', f.read(6))
+    records = [struct.unpack('>HHHHHH', f.read(12)) for _ in range(count)]
+    names = {}
+    for platform_id, encoding_id, language_id, name_id, length, name_offset in records:
+        if name_id not in _FAMILY_NAME_IDS + _STYLE_NAME_IDS:
+            continue
+        rank = 0 if (platform_id, language_id) == (3, 0x409) else 1 if platform_id == 3 else 2
+        if name_id in names and names[name_id][0] <= rank:
+            continue
+        f.seek(offset + string_offset + name_offset)
+        text = _decode_name(platform_id, encoding_id, f.read(length))
+        if text:
+            names[name_id] = (rank, text.strip())
+    return {name_id: text for name_id, (_, text) in names.items()}
+
+
+def _read_face(f, offset):
+    """One face of a font file as a dict, or None when it is not monospace"""
+    f.seek(offset)
+    if f.read(4) not in _SFNT_VERSIONS:
+        return None
+    num_tables, = struct.unpack('>H', f.read(2))
+    f.seek(offset + 12)
+    tables = {}
+    for _ in range(num_tables):
+        tag, _, table_offset, length = struct.unpack('>4sIII', f.read(16))
+        tables[tag] = (table_offset, length)
+    if not all(tag in tables for tag in (b'head', b'hhea', b'post', b'name')):
+        return None
+
+    f.seek(tables[b'post'][0] + 12)
+    fixed_pitch, = struct.unpack('>I', f.read(4))
+    avg_width, panose = None, None
+    if b'OS/2' in tables:
+        f.seek(tables[b'OS/2'][0] + 2)
+        avg_width, = struct.unpack('>h', f.read(2))
+        f.seek(tables[b'OS/2'][0] + 32)
+        panose = f.read(10)
+    # Some monospace fonts leave isFixedPitch unset but say so in their PANOSE class
+    if not fixed_pitch and not (panose and panose[0] == _PANOSE_LATIN_TEXT and panose[3] == _PANOSE_MONOSPACED):
+        return None
+
+    f.seek(tables[b'head'][0] + 18)
+    units_per_em, = struct.unpack('>H', f.read(2))
+    f.seek(tables[b'hhea'][0] + 4)
+    ascent, descent, line_gap = struct.unpack('>hhh', f.read(6))
+    names = _read_names(f, tables[b'name'][0])
+    family = next((names[name_id] for name_id in _FAMILY_NAME_IDS if name_id in names), None)
+    if not family or not units_per_em:
+        return None
+    return {'family': family, 'style': next((names[name_id] for name_id in _STYLE_NAME_IDS if name_id in names), ''),
+            'units_per_em': units_per_em, 'ascent': ascent, 'descent': descent, 'line_gap': line_gap,
+            'avg_width': avg_width}
+
+
+def read_font_faces(path):
+    """Monospace faces of a .ttf/.otf file or .ttc/.otc collection, as dicts"""
+    with open(path, 'rb') as f:
+        header = f.read(12)
+        if header[:4] == b'ttcf':
+            num_fonts, = struct.unpack('>I', header[8:12])
+            offsets = struct.unpack(f'>{num_fonts}I', f.read(4 * num_fonts))
+        else:
+            offsets = (0,)
+        faces = []
+        for offset in offsets:
+            face = _read_face(f, offset)
+            if face:
+                faces.append(face)
+        return faces
+
+
+class FontIndex:
+    """Yüklü eş aralıklı yazı tiplerinin, dizin değişiklik zamanıyla geçersizleşen kalıcı dizini"""
+
+    def __init__(self, directories=None, path=None):
+        self.directories = font_directories() if directories is None else list(directories)
+        self.path = path or FONT_INDEX_PATH
+        self._entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != FONT_INDEX_VERSION:
+            return {}
+        return data.get('directories', {})
+
+    def refresh(self):
+        """Rescan the directories whose mtime changed and persist the index; returns scan counters"""
+        started = time.perf_counter()
+        stats = {'directories': 0, 'rescanned': 0, 'files_parsed': 0}
+        entries, seen = {}, set()
+        pending = [os.path.abspath(os.path.expanduser(path)) for path in reversed(self.directories)]
+        while pending:
+            directory = pending.pop()
+            try:
+                real = os.path.realpath(directory)
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            # Symlinked font directories can point back into the tree
+            if real in seen:
+                continue
+            seen.add(real)
+            stats['directories'] += 1
+            entry = self._entries.get(directory)
+            if entry is None or entry['mtime'] != mtime:
+                entry = self._scan_directory(directory, mtime, stats)
+            entries[directory] = entry
+            pending.extend(reversed(entry['subdirs']))
+        if entries != self._entries:
+            self._entries = entries
+            self._save()
+        stats['seconds'] = time.perf_counter() - started
+        if stats['rescanned']:
+            logger.info(f"Yazı tipi dizini güncellendi: {stats['rescanned']} klasör, "
+                        f"{stats['files_parsed']} dosya tarandı ({stats['seconds']:.2f} sn)")
+        return stats
+
+    def _scan_directory(self, directory, mtime, stats):
+        stats['rescanned'] += 1
+        subdirs, faces = [], []
+        try:
+            with os.scandir(directory) as scan:
+                children = sorted(scan, key=lambda child: child.name)
+        except OSError:
+            children = []
+        for child in children:
+            try:
+                if child.is_dir():
+                    subdirs.append(child.path)
+                elif child.name.lower().endswith(FONT_EXTENSIONS):
+                    stats['files_parsed'] += 1
+                    faces.extend(dict(face, file=child.name) for face in read_font_faces(child.path))
+            except (OSError, struct.error, ValueError) as e:
+                logger.warning(f"Yazı tipi okunamadı: {child.path}: {e}")
+        return {'mtime': mtime, 'subdirs': subdirs, 'faces': faces}
+
+    def _save(self):
+        try:
+            atomic_write(self.path, json.dumps({'version': FONT_INDEX_VERSION, 'directories': self._entries}))
+        except OSError as e:
+            logger.warning(f"Yazı tipi dizini kaydedilemedi: {self.path}: {e}")
+
+    def families(self):
+        """Monospace families sorted by name; metrics come from the regular face when there is one"""
+        faces_by_family = {}
+        for directory, entry in self._entries.items():
+            for face in entry['faces']:
+                faces_by_family.setdefault(face['family'], []).append(
+                    (face, os.path.join(directory, face['file'])))
+        families = []
+        for name, faces in sorted(faces_by_family.items(), key=lambda item: item[0].lower()):
+            regular = next((face for face, _ in faces if face['style'].lower() in ('regular', 'book', '')),
+                           faces[0][0])
+            units_per_em = regular['units_per_em']
+            cell_width = regular['avg_width'] / units_per_em if regular['avg_width'] else None
+            line_height = (regular['ascent'] - regular['descent'] + regular['line_gap']) / units_per_em
+            styles = sorted({face['style'] for face, _ in faces if face['style']})
+            families.append(FontFamily(name, styles, cell_width, line_height, sorted(path for _, path in faces)))
+        return families
+
+
+def installed_font_families(directories=None, path=None):
+    """Refresh the persisted index and return its monospace families"""
+    index = FontIndex(directories, path)
+    index.refresh()
+    return index.families()
+
+
+def font_choices(family_names, current=None, fallback=()):
+    """Font picker entries: installed and bundled families, plus the current one so it stays selectable
+
+    When discovery found nothing (no font directories on this system), fallback is used instead.
+    """
+    names = set(family_names)
+    names = names | set(BUNDLED_FONTS) if names else set(fallback) | set(BUNDLED_FONTS)
+    if current:
+        names.add(current)
+    return sorted(names, key=str.lower)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List installed monospace fonts")
+    parser.add_argument('--dir', action='append', dest='directories',
+                        help="font directory to scan (repeatable; default: the platform's font directories)")
+    parser.add_argument('--index', default=FONT_INDEX_PATH, help="persisted index file")
+    args = parser.parse_args(argv)
+    index = FontIndex(args.directories, args.index)
+    stats = index.refresh()
+    for family in index.families():
+        cell = f"{family.cell_width:.3f}" if family.cell_width else "?"
+        print(f"{family.name:<32} cell {cell} em  line {family.line_height:.3f} em  {', '.join(family.styles)}")
+    print(f"{stats['directories']} klasör, {stats['rescanned']} yeniden tarandı, "
+          f"{stats['files_parsed']} dosya okundu ({stats['seconds'] * 1e3:.1f} ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+"""Headless SVG thumbnails of the terminal preview for the scheme gallery.
+
+Each thumbnail draws the same content as the live preview (title bar, the tab
+bar from ``generate_tab_bar``'s colors, a prompt and some colored command
+output) as plain SVG shapes and text, with every color resolved to the
+scheme's concrete values. No browser, iframe or script is involved, so the
+gallery page can show hundreds of them as ordinary ``<img>`` tags.
+
+Thumbnails live in an ArtifactCache under ``static/gallery/`` (served by
+Streamlit's static file serving), addressed by (scheme, font, size) plus the
+scheme's colors, so an edited scheme never shows a stale image. Cache misses
+are rendered in a process pool.
+
+    python -m src.gallery --font "Fira Code" --size 13
+"""
+import os
+import logging
+import argparse
+from html import escape
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from src.artifact_cache import ArtifactCache, artifact_key
+from src.colormath import derive_palettes
+from src.ansi import iter_runs, effective_colors, resolve_color, BOLD, DIM, ITALIC, UNDERLINE, STRIKE
+from src.terminal import tab_bar_colors
+from src.themes import COLOR_MAPPINGS, ANSI_PALETTES, imported_schemes
+
+logger = logging.getLogger("wezterm_gui")
+
+GALLERY_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static", "gallery")
+GALLERY_URL = "app/static/gallery"
+
+THUMBNAIL_WIDTH = 280
+MAX_GALLERY_BYTES = 32 * 1024 * 1024
+# Below this many misses, starting worker processes costs more than it saves
+MIN_POOL_JOBS = 64
+
+COLUMNS = 46
+CHAR_WIDTH = 0.6
+LINE_HEIGHT = 1.3
+TITLE_BAR_HEIGHT = 22
+TAB_BAR_HEIGHT = 24
+PADDING = 8
+DIRECTORY_COLOR = '#5f87ff'
+
+# Scheme name, {'bg', 'fg', 'prompt'} and the 16 ANSI colors
+GallerySpec = namedtuple('GallerySpec', ['scheme', 'colors', 'palette', 'font', 'font_size'])
+
+SAMPLE_OUTPUT = (
+    "\x1b[1;34msrc\x1b[0m  \x1b[1;34mtests\x1b[0m  README.md  \x1b[1;32mbuild.sh\x1b[0m  app.py\n"
+    "\x1b[33mM\x1b[0m src/themes.py  \x1b[32mA\x1b[0m src/gallery.py  \x1b[31mD\x1b[0m old.py\n"
+    "\x1b[36mINFO\x1b[0m ready in \x1b[1m42ms\x1b[0m  \x1b[2m(cached)\x1b[0m  \x1b[4mhttps://wezterm.org\x1b[0m\n"
+    + ''.join(f"\x1b[4{index}m  " for index in range(8)) + "\x1b[0m "
+    + ''.join(f"\x1b[10{index}m  " for index in range(8)) + "\x1b[0m"
+)
+
+
+def scheme_catalog(extra_schemes=None):
+    """{scheme: (colors, palette)} for every scheme the gallery can show
+
+    Built-in schemes come first, then the imported ones (src/scheme_import.py).
+    extra_schemes maps names to {'bg', 'fg', 'prompt'} only; their 16 colors
+    are derived together in one vectorized call.
+    """
+    catalog = {name: (colors, ANSI_PALETTES.get(name, ANSI_PALETTES['Builtin Dark']))
+               for name, colors in COLOR_MAPPINGS.items()}
+    for name, scheme in imported_schemes().items():
+        catalog.setdefault(name, (scheme['colors'], scheme['palette']))
+    if extra_schemes:
+        derived = derive_palettes(list(extra_schemes.values()))
+        for (name, colors), palette in zip(extra_schemes.items(), derived):
+            catalog[name] = (colors, palette['ansi'] + palette['brights'])
+    return catalog
+
+
+def gallery_specs(fonts, font_sizes, catalog=None):
+    """One spec per scheme x font x size, schemes first"""
+    catalog = scheme_catalog() if catalog is None else catalog
+    return [GallerySpec(scheme, colors, tuple(palette), font, font_size)
+            for scheme, (colors, palette) in catalog.items()
+            for font in fonts for font_size in font_sizes]
+
+
+def thumbnail_key(spec):
+    """Cache key: covers the spec's colors, not only its scheme name"""
+    return artifact_key('svg', list(spec))
+
+
+def _text_line(x, y, runs, spec, char_width):
+    # One <text> per line; runs become tspans, backgrounds become rects behind it
+    rects, spans = [], []
+    column = 0
+    for style, chunk in runs:
+        if not chunk:
+            continue
+        fg, bg = (resolve_color(color, spec.palette, spec.colors) for color in effective_colors(style))
+        flags = style[2]
+        if bg is not None:
+            rects.append(f'<rect x="{x + column * char_width:.1f}" y="{y - spec.font_size:.1f}" '
+                         f'width="{len(chunk) * char_width:.1f}" height="{spec.font_size * LINE_HEIGHT:.1f}" fill="{bg}"/>')
+        attributes = [f'fill="{fg}"'] if fg is not None else []
+        if flags & BOLD:
+            attributes.append('font-weight="bold"')
+        if flags & DIM:
+            attributes.append('opacity=".6"')
+        if flags & ITALIC:
+            attributes.append('font-style="italic"')
+        decorations = [name for flag, name in ((UNDERLINE, 'underline'), (STRIKE, 'line-through')) if flags & flag]
+        if decorations:
+            attributes.append(f'text-decoration="{" ".join(decorations)}"')
+        text = escape(chunk, quote=False)
+        spans.append(f"<tspan {' '.join(attributes)}>{text}</tspan>" if attributes else text)
+        column += len(chunk)
+    return ''.join(rects) + f'<text x="{x}" y="{y:.1f}" xml:space="preserve">{"".join(spans)}</text>'
+
+
+def render_thumbnail(spec, enable_tab_bar=True, use_fancy_tab_bar=True):
+    """SVG document for one scheme/font/size; pure Python, no browser involved"""
+    colors = spec.colors
+    font_size = spec.font_size
+    char_width = font_size * CHAR_WIDTH
+    line_height = font_size * LINE_HEIGHT
+    prompt = (f"\x1b[38;2;{_rgb(colors['prompt'])}muser@machine\x1b[0m:"
+              f"\x1b[38;2;{_rgb(DIRECTORY_COLOR)}m~/projects\x1b[0m\x1b[38;2;{_rgb(colors['prompt'])}m$\x1b[0m ")
+    lines = [prompt + "ls && git status -s"] + SAMPLE_OUTPUT.split('\n') + [prompt]
+
+    width = round(COLUMNS * char_width + 2 * PADDING)
+    body_top = TITLE_BAR_HEIGHT + (TAB_BAR_HEIGHT if enable_tab_bar else 0)
+    height = round(body_top + len(lines) * line_height + 2 * PADDING)
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{THUMBNAIL_WIDTH}" '
+             f'height="{round(THUMBNAIL_WIDTH * height / width)}" viewBox="0 0 {width} {height}" '
+             f'font-family="{escape(spec.font)}, monospace" font-size="{font_size}">',
+             f'<title>{escape(spec.scheme)} · {escape(spec.font)} {font_size}px</title>',
+             f'<rect width="{width}" height="{height}" rx="6" fill="#21252b"/>']
+    for index, dot in enumerate(('#ff5f56', '#ffbd2e', '#27c93f')):
+        parts.append(f'<circle cx="{15 + index * 18}" cy="{TITLE_BAR_HEIGHT / 2}" r="6" fill="{dot}"/>')
+
+    if enable_tab_bar:
+        bar_bg, active_bg, inactive_color = tab_bar_colors(colors, use_fancy_tab_bar)
+        parts.append(f'<rect y="{TITLE_BAR_HEIGHT}" width="{width}" height="{TAB_BAR_HEIGHT}" fill="{colors["bg"]}"/>'
+                     f'<rect y="{TITLE_BAR_HEIGHT}" width="{width}" height="{TAB_BAR_HEIGHT}" fill="{bar_bg}"/>')
+        tab_x = PADDING
+        baseline = TITLE_BAR_HEIGHT + TAB_BAR_HEIGHT / 2 + 4
+        for index, name in enumerate(('bash', 'zsh', 'python')):
+            tab_width = len(name) * 7 + 20
+            if index == 0:
+                parts.append(f'<rect x="{tab_x}" y="{TITLE_BAR_HEIGHT + 4}" width="{tab_width}" '
+                             f'height="{TAB_BAR_HEIGHT - 8}" rx="3" fill="{active_bg}"/>')
+            fill = colors['fg'] if index == 0 else inactive_color
+            parts.append(f'<text x="{tab_x + 10}" y="{baseline}" font-size="11" fill="{fill}">{name}</text>')
+            tab_x += tab_width + 5
+
+    parts.append(f'<rect y="{body_top}" width="{width}" height="{height - body_top}" fill="{colors["bg"]}"/>'
+                 f'<g fill="{colors["fg"]}">')
+    for index, line in enumerate(lines):
+        y = body_top + PADDING + (index + 1) * line_height - (line_height - font_size) / 2
+        parts.append(_text_line(PADDING, y, iter_runs(line), spec, char_width))
+    cursor_x = PADDING + len('user@machine:~/projects$ ') * char_width
+    parts.append(f'</g><rect x="{cursor_x:.1f}" y="{y - font_size:.1f}" width="{char_width:.1f}" '
+                 f'height="{line_height:.1f}" fill="{colors["prompt"]}"/></svg>')
+    return ''.join(parts)
+
+
+def _rgb(color):
+    # '#rrggbb' -> 'r;g;b' for a truecolor SGR sequence
+    return ';'.join(str(int(color[index:index + 2], 16)) for index in (1, 3, 5))
+
+
+def write_thumbnail(spec, directory=GALLERY_DIR):
+    """Worker entry point: render one thumbnail into the cache; returns its key"""
+    key = thumbnail_key(spec)
+    ArtifactCache(directory, MAX_GALLERY_BYTES).put('svg', key, render_thumbnail(spec))
+    return key
+
+
+def render_gallery(specs, directory=GALLERY_DIR, workers=None):
+    """Return a thumbnail URL per spec, rendering only the ones missing from the cache"""
+    cache = ArtifactCache(directory, MAX_GALLERY_BYTES)
+    keys = [thumbnail_key(spec) for spec in specs]
+    missing = {}
+    for spec, key in zip(specs, keys):
+        if key not in missing and not cache.lookup('svg', key):
+            missing[key] = spec
+
+    if len(missing) >= MIN_POOL_JOBS and workers != 0:
+        workers = min(workers or os.cpu_count() or 1, len(missing))
+        chunksize = max(1, len(missing) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(write_thumbnail, missing.values(), [directory] * len(missing), chunksize=chunksize))
+    else:
+        for spec in missing.values():
+            write_thumbnail(spec, directory)
+    if missing:
+        logger.info(f"Galeri: {len(missing)} küçük resim oluşturuldu, {len(specs) - len(missing)} önbellekten")
+        # Workers count their own writes, so the shared budget is checked here
+        cache.evict()
+
+    return [f"{GALLERY_URL}/svg/{key}.svg" for key in keys]
+
+
+def gallery_html(specs, urls):
+    """Static grid of <img> thumbnails: no iframe and no script"""
+    figures = ''.join(
+        f'<figure><img src="{url}" loading="lazy" width="{THUMBNAIL_WIDTH}" alt="{escape(spec.scheme)}">'
+        f'<figcaption>{escape(spec.scheme)} · {escape(spec.font)} {spec.font_size}px</figcaption></figure>'
+        for spec, url in zip(specs, urls))
+    return f'<div class="scheme-gallery">{figures}</div>'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Renk şeması galerisi için küçük resimleri oluştur")
+    parser.add_argument('--font', action='append', help="Yazı tipi (birden çok verilebilir)")
+    parser.add_argument('--size', action='append', type=int, help="Yazı boyutu (birden çok verilebilir)")
+    parser.add_argument('--workers', type=int, help="İşçi süreç sayısı (0: süreç havuzu kullanma)")
+    parser.add_argument('--out-dir', default=GALLERY_DIR)
+    args = parser.parse_args(argv)
+    specs = gallery_specs(args.font or ['JetBrains Mono'], args.size or [14])
+    for spec, url in zip(specs, render_gallery(specs, args.out_dir, args.workers)):
+        print(f"{spec.scheme}\t{spec.font}\t{spec.font_size}\t{url}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""Undo/redo history of config edits.
+
+``WezTermConfig`` is immutable and ``replace`` shares every unchanged value,
+so a history entry is just a reference to a snapshot: one tuple of field
+references plus whatever values actually changed. Undo and redo move a
+snapshot between two deques, which is O(1). Both the number of entries and
+their estimated memory are capped; the oldest undo steps are dropped first.
+"""
+import os
+import sys
+from collections import deque
+
+from src.model import WezTermConfig
+
+HISTORY_MAX_ENTRIES = int(os.environ.get("WEZTERM_GUI_HISTORY_MAX_ENTRIES", 500))
+HISTORY_MAX_BYTES = int(os.environ.get("WEZTERM_GUI_HISTORY_MAX_BYTES", 512 * 1024))
+
+
+def _deep_sizeof(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_sizeof(key) + _deep_sizeof(item) for key, item in value.items())
+    elif isinstance(value, (tuple, list)):
+        size += sum(_deep_sizeof(item) for item in value)
+    elif hasattr(value, 'items'):
+        size += sum(_deep_sizeof(item) for _, item in value.items())
+    return size
+
+
+def snapshot_cost(config, previous=None):
+    """Bytes a snapshot adds on top of the one before it: its field tuple plus the changed values"""
+    cost = sys.getsizeof(config._values)
+    if previous is None:
+        return cost + sum(_deep_sizeof(value) for value in config._values)
+    return cost + sum(_deep_sizeof(config[name]) for name in config.changed_fields(previous))
+
+
+class ConfigHistory:
+    """Yapılandırma değişiklikleri için sınırlı geri alma/yineleme geçmişi"""
+
+    def __init__(self, max_entries=HISTORY_MAX_ENTRIES, max_bytes=HISTORY_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # (config, cost) pairs; the right end of _undo is the step before current
+        self._undo = deque()
+        self._redo = deque()
+        self._current = None
+        self._current_cost = 0
+        self._bytes = 0
+        self._dropped = 0
+
+    @property
+    def current(self):
+        return self._current
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def record(self, config):
+        """Make config the current state; returns False when nothing changed"""
+        config = WezTermConfig.from_mapping(config)
+        if self._current is not None and config == self._current:
+            return False
+        cost = snapshot_cost(config, self._current)
+        if self._current is not None:
+            self._undo.append((self._current, self._current_cost))
+        # A new edit forks the timeline: what could be redone is gone
+        self._bytes -= sum(entry_cost for _, entry_cost in self._redo)
+        self._redo.clear()
+        self._current, self._current_cost = config, cost
+        self._bytes += cost
+        self._trim()
+        return True
+
+    def undo(self):
+        """Step back; returns the restored config, or None at the oldest entry"""
+        if not self._undo:
+            return None
+        self._redo.append((self._current, self._current_cost))
+        self._current, self._current_cost = self._undo.pop()
+        return self._current
+
+    def redo(self):
+        """Step forward again; returns the restored config, or None if nothing was undone"""
+        if not self._redo:
+            return None
+        self._undo.append((self._current, self._current_cost))
+        self._current, self._current_cost = self._redo.pop()
+        return self._current
+
+    def _trim(self):
+        while self._undo and (len(self._undo) + len(self._redo) + 1 > self.max_entries
+                              or self._bytes > self.max_bytes):
+            _, cost = self._undo.popleft()
+            self._bytes -= cost
+            self._dropped += 1
+
+    def stats(self):
+        """Entry counts and estimated memory of the history"""
+        return {'undo': len(self._undo), 'redo': len(self._redo), 'bytes': self._bytes,
+                'dropped': self._dropped, 'max_entries': self.max_entries, 'max_bytes': self.max_bytes}
+
+    def __len__(self):
+        return len(self._undo) + len(self._redo) + (self._current is not None)
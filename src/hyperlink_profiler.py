@@ -0,0 +1,532 @@
+"""Profile hyperlink rule regexes against terminal scrollback.
+
+WezTerm runs every hyperlink rule over each line it renders, so a slow rule
+shows up as input lag on large log output. This module times each rule over a
+synthetic or user-supplied corpus and looks for backtracking blow-ups:
+
+    python -m src.hyperlink_profiler
+    python -m src.hyperlink_profiler --corpus build.log --rule 'ticket=\\bJIRA-\\d+\\b'
+"""
+import re
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import multiprocessing
+from collections import namedtuple
+from functools import lru_cache
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+from src.config import HYPERLINK_RULES
+
+# A rule this many times slower than a minimal reference rule on the
+# same corpus, or with a single line slower than a quarter of a 60 Hz frame, is
+# reported before it ends up in wezterm.lua. Relative cost keeps the verdict
+# independent of how fast the machine running the profiler is.
+MAX_SLOWDOWN = 4.0
+LINE_BUDGET_SECONDS = 0.004
+SUPERLINEAR_EXPONENT = 1.5
+
+PROBE_TIMEOUT_SECONDS = 5.0
+PROBE_STEP_SECONDS = 0.02
+PROBE_MAX_LENGTH = 1 << 16
+
+_ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)')
+
+HyperlinkRule = namedtuple('HyperlinkRule', ['name', 'regex', 'format'], defaults=['$0'])
+Risk = namedtuple('Risk', ['kind', 'detail'])
+ProbeResult = namedtuple('ProbeResult', ['exponent', 'timed_out', 'attack'])
+
+# A minimal word-boundary-anchored URL rule: linear and cheap, used as the yardstick
+REFERENCE_RULE = HyperlinkRule('referans', r'\bhttps?://\S+')
+
+
+class RuleProfile(namedtuple('RuleProfile', ['name', 'regex', 'lines', 'bytes', 'matches', 'seconds',
+                                             'worst_line_seconds', 'worst_line', 'risks', 'probe', 'error',
+                                             'baseline_seconds'], defaults=[None])):
+    """Bir bağlantı kuralının derlem üzerindeki ölçüm sonucu"""
+    __slots__ = ()
+
+    @property
+    def lines_per_second(self):
+        return self.lines / self.seconds if self.seconds else float('inf')
+
+    @property
+    def matches_per_second(self):
+        return self.matches / self.seconds if self.seconds else float('inf')
+
+    @property
+    def mb_per_second(self):
+        return self.bytes / self.seconds / 1e6 if self.seconds else float('inf')
+
+    @property
+    def slowdown(self):
+        """Cost relative to the reference rule, or None when no baseline was measured"""
+        if not self.baseline_seconds:
+            return None
+        return self.seconds / self.baseline_seconds
+
+
+def builtin_rules(labels=None):
+    """The generator's rules, optionally limited to the labels selected in the sidebar"""
+    return [HyperlinkRule(label, regex, link_format)
+            for label, (_, regex, link_format) in HYPERLINK_RULES.items()
+            if labels is None or label in labels]
+
+
+def parse_rule_arg(text):
+    """'name=regex' -> HyperlinkRule"""
+    name, separator, regex = text.partition('=')
+    if not separator or not name.strip() or not regex:
+        raise ValueError(f"Kural 'ad=regex' biçiminde olmalıdır: {text}")
+    return HyperlinkRule(name.strip(), regex)
+
+
+# --- Corpora ---
+
+_WORDS = ('request', 'handled', 'connection', 'timeout', 'retrying', 'worker', 'started', 'cache', 'miss',
+          'deploy', 'finished', 'error', 'warning', 'user', 'session', 'upload', 'failed', 'ok', 'build')
+_HOSTS = ('example.com', 'api.github.com', 'docs.rs', 'pypi.org', 'intranet.local', 'cdn.jsdelivr.net')
+_DIRS = ('usr', 'lib', 'var', 'log', 'home', 'dev', 'src', 'project', 'node_modules', 'site-packages', 'target')
+
+
+def synthetic_scrollback(lines=20000, seed=0, long_line_ratio=0.01):
+    """Yield realistic log/compiler/shell output lines, deterministically for a seed"""
+    rng = random.Random(seed)
+
+    def words(count):
+        return ' '.join(rng.choice(_WORDS) for _ in range(count))
+
+    def path(depth):
+        return '/' + '/'.join(rng.choice(_DIRS) for _ in range(depth)) + rng.choice(('.py', '.rs', '.log', '.js', ''))
+
+    templates = (
+        lambda: f"2024-05-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:"
+                f"{rng.randint(0, 59):02d}Z {rng.choice(('INFO', 'WARN', 'ERROR', 'DEBUG'))} {words(rng.randint(3, 12))}",
+        lambda: f"GET https://{rng.choice(_HOSTS)}/api/v{rng.randint(1, 3)}/items/{rng.randint(1, 99999)}"
+                f"?page={rng.randint(1, 50)} {rng.choice((200, 301, 404, 500))} {rng.randint(1, 900)}ms",
+        lambda: f'  File "{path(rng.randint(3, 7))}", line {rng.randint(1, 2000)}, in {rng.choice(_WORDS)}',
+        lambda: f"src/{rng.choice(_WORDS)}.rs:{rng.randint(1, 500)}:{rng.randint(1, 80)}: "
+                f"error[E0{rng.randint(100, 999)}]: {words(rng.randint(2, 6))}",
+        lambda: f"From: {rng.choice(_WORDS)}.{rng.choice(_WORDS)}@{rng.choice(_HOSTS)} {words(rng.randint(1, 5))}",
+        lambda: f"C:\\Users\\{rng.choice(_WORDS)}\\{rng.choice(_DIRS)}\\{rng.choice(_WORDS)}.exe {words(3)}",
+        lambda: f"$ ls -la {path(rng.randint(1, 4))}",
+        lambda: f"-rw-r--r--  1 dev staff {rng.randint(0, 10 ** 7):>9} May {rng.randint(1, 28):>2} "
+                f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d} {rng.choice(_WORDS)}.{rng.choice(('txt', 'md', 'lua'))}",
+        lambda: '',
+    )
+    alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+    for _ in range(lines):
+        if rng.random() < long_line_ratio:
+            # Minified JS, base64 blobs and progress bars: long lines with few boundaries
+            yield ''.join(rng.choice(alphabet) for _ in range(rng.randint(2000, 8000)))
+        else:
+            yield rng.choice(templates)()
+
+
+def read_scrollback(path, max_lines=None):
+    """Yield the lines of a captured terminal log with escape sequences removed"""
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for count, line in enumerate(f):
+            if max_lines is not None and count >= max_lines:
+                break
+            yield _ANSI_ESCAPE.sub('', line.rstrip('\r\n'))
+
+
+# --- Static analysis ---
+
+_PROBE_ALPHABET = ''.join(map(chr, range(32, 127))) + '\t\nığüşöçé'
+_CATEGORIES = {
+    getattr(sre_constants, name): re.compile(pattern)
+    for name, pattern in (('CATEGORY_DIGIT', r'\d'), ('CATEGORY_NOT_DIGIT', r'\D'),
+                          ('CATEGORY_SPACE', r'\s'), ('CATEGORY_NOT_SPACE', r'\S'),
+                          ('CATEGORY_WORD', r'\w'), ('CATEGORY_NOT_WORD', r'\W'))
+}
+_REPEATS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+# Possessive repeats and atomic groups never backtrack into themselves (3.11+)
+_POSSESSIVE = getattr(sre_constants, 'POSSESSIVE_REPEAT', None)
+_ATOMIC = getattr(sre_constants, 'ATOMIC_GROUP', None)
+
+
+def _set_member(items, ch):
+    negate = False
+    found = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            found = found or ord(ch) == av
+        elif op is sre_constants.RANGE:
+            found = found or av[0] <= ord(ch) <= av[1]
+        elif op is sre_constants.CATEGORY:
+            category = _CATEGORIES.get(av)
+            found = found or bool(category and category.match(ch))
+    return found != negate
+
+
+def _single_chars(op, av):
+    """Chars a one-character item can match, or None when op is not a single-character item"""
+    if op is sre_constants.LITERAL:
+        return {chr(av)}
+    if op is sre_constants.NOT_LITERAL:
+        return {ch for ch in _PROBE_ALPHABET if ord(ch) != av}
+    if op is sre_constants.ANY:
+        return set(_PROBE_ALPHABET) - {'\n'}
+    if op is sre_constants.IN:
+        return {ch for ch in _PROBE_ALPHABET if _set_member(av, ch)}
+    return None
+
+
+def _body(op, av):
+    """Child subpattern of a group-like item"""
+    if op is sre_constants.SUBPATTERN:
+        return av[-1]
+    if op in _REPEATS or op is _POSSESSIVE:
+        return av[2]
+    if op is _ATOMIC:
+        return av
+    return None
+
+
+def _first(items):
+    """(chars the sequence can start with, whether it can match the empty string)"""
+    chars = set()
+    for op, av in items:
+        item_chars, nullable = _item_first(op, av)
+        chars |= item_chars
+        if not nullable:
+            return chars, False
+    return chars, True
+
+
+def _item_first(op, av):
+    single = _single_chars(op, av)
+    if single is not None:
+        return single, False
+    if op is sre_constants.BRANCH:
+        chars, nullable = set(), False
+        for branch in av[1]:
+            branch_chars, branch_nullable = _first(branch)
+            chars |= branch_chars
+            nullable = nullable or branch_nullable
+        return chars, nullable
+    body = _body(op, av)
+    if body is not None:
+        chars, nullable = _first(body)
+        if op in _REPEATS or op is _POSSESSIVE:
+            nullable = nullable or av[0] == 0
+        return chars, nullable
+    if op is sre_constants.GROUPREF:
+        return set(_PROBE_ALPHABET), True
+    # Anchors, \b and lookarounds consume nothing
+    return set(), True
+
+
+def _all_chars(items):
+    """Every char a subpattern can consume anywhere"""
+    chars = set()
+    for op, av in items:
+        single = _single_chars(op, av)
+        if single is not None:
+            chars |= single
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                chars |= _all_chars(branch)
+        elif _body(op, av) is not None:
+            chars |= _all_chars(_body(op, av))
+        elif op is sre_constants.GROUPREF:
+            chars |= set(_PROBE_ALPHABET)
+    return chars
+
+
+def _is_unbounded(op, av):
+    return op in _REPEATS and av[1] == sre_constants.MAXREPEAT
+
+
+def _sample(chars):
+    return ''.join(sorted(chars)[:8])
+
+
+def _analyze(items, risks, loop_follow=frozenset()):
+    """Walk a sequence; loop_follow holds what may follow the sequence when it is a repeat body"""
+    for position, (op, av) in enumerate(items):
+        rest_chars, rest_nullable = _first(items[position + 1:])
+        follow = rest_chars | loop_follow if rest_nullable else rest_chars
+
+        if _is_unbounded(op, av):
+            consumed = _all_chars(av[2])
+            overlap = consumed & follow
+            if loop_follow and overlap:
+                risks.append(Risk('nested_quantifier',
+                                  f"iç içe niceleyici, '{_sample(overlap)}' karakterleri birden çok şekilde bölünebilir"))
+            # An unbounded repeat directly followed by another one over the same chars
+            for next_op, next_av in items[position + 1:]:
+                if _is_unbounded(next_op, next_av):
+                    shared = consumed & _all_chars(next_av[2])
+                    if shared:
+                        risks.append(Risk('adjacent_overlap',
+                                          f"art arda niceleyiciler '{_sample(shared)}' karakterlerini paylaşıyor"))
+                    break
+                if not _item_first(next_op, next_av)[1]:
+                    break
+
+        if op is sre_constants.BRANCH and loop_follow:
+            seen = set()
+            for branch in av[1]:
+                branch_chars = _first(branch)[0]
+                if seen & branch_chars:
+                    risks.append(Risk('overlapping_alternation',
+                                      f"tekrarlanan alternatifler '{_sample(seen & branch_chars)}' ile başlıyor"))
+                    break
+                seen |= branch_chars
+
+        body = _body(op, av)
+        if body is None:
+            if op is sre_constants.BRANCH:
+                for branch in av[1]:
+                    _analyze(branch, risks, follow if loop_follow else frozenset())
+            continue
+        if op is _POSSESSIVE or op is _ATOMIC:
+            continue
+        if op in _REPEATS and av[1] > 1:
+            # Inside a repeat, the body may be followed by its own first chars again
+            _analyze(body, risks, frozenset(follow | _first(body)[0]))
+        else:
+            _analyze(body, risks, frozenset(follow) if loop_follow else frozenset())
+
+
+def analyze_backtracking(regex):
+    """Static scan for backtracking-prone constructs; returns a list of Risk"""
+    risks = []
+    _analyze(list(sre_parse.parse(regex)), risks)
+    unique = []
+    for risk in risks:
+        if risk not in unique:
+            unique.append(risk)
+    return unique
+
+
+# --- Dynamic probe ---
+
+def _attack_strings(regex):
+    """Pumpable inputs: runs of chars the pattern's repeats consume, ending in a mismatch"""
+    parsed = list(sre_parse.parse(regex))
+    chars = _all_chars(parsed)
+    candidates = [ch for ch in 'a1/. -_:@' if ch in chars] or sorted(chars)[:3] or ['a']
+    prefix = ''
+    for op, av in parsed:
+        if op is not sre_constants.LITERAL:
+            break
+        prefix += chr(av)
+    for ch in candidates[:3]:
+        for killer in ('!', '\n'):
+            yield prefix, ch, killer
+
+
+def _time_search(pattern, text):
+    """Best-of time of one finditer pass, repeated until measurable"""
+    best = float('inf')
+    for _ in range(3):
+        repeat, started = 0, time.perf_counter()
+        while True:
+            for _ in pattern.finditer(text):
+                pass
+            repeat += 1
+            elapsed = time.perf_counter() - started
+            if elapsed > 1e-3 or repeat >= 1000:
+                break
+        best = min(best, elapsed / repeat)
+        if best > PROBE_STEP_SECONDS:
+            break
+    return best
+
+
+def _growth_exponent(regex):
+    """Largest log-log slope of match time vs input length over the attack strings"""
+    pattern = re.compile(regex)
+    worst = (0.0, '')
+    for prefix, ch, killer in _attack_strings(regex):
+        length, points = 16, []
+        while length <= PROBE_MAX_LENGTH:
+            text = prefix + ch * length + killer
+            elapsed = _time_search(pattern, text)
+            if elapsed > 5e-5:
+                points.append((length, elapsed))
+            if elapsed > PROBE_STEP_SECONDS:
+                break
+            # Grow slowly so an exponential pattern overshoots the step budget by little
+            length = int(length * 1.25) + 1
+        if len(points) >= 2:
+            # Fit over the widest span measured; adjacent steps are too close to be robust to noise
+            (first_length, first_time), (last_length, last_time) = points[0], points[-1]
+            slope = math.log(last_time / first_time) / math.log(last_length / first_length)
+            if slope > worst[0]:
+                worst = (slope, (prefix + ch * 40 + killer)[:40])
+    return worst
+
+
+def _probe_worker(regex, queue):
+    queue.put(_growth_exponent(regex))
+
+
+@lru_cache(maxsize=256)
+def probe_backtracking(regex, timeout=PROBE_TIMEOUT_SECONDS):
+    """Measure how match time grows with pumped input, in a child process with a hard timeout
+
+    Python's re is a backtracking engine, so the measured growth is a worst-case
+    proxy for WezTerm's matcher.
+    """
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_probe_worker, args=(regex, queue), daemon=True)
+    process.start()
+    process.join(timeout)
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        return ProbeResult(None, True, None)
+    exponent, attack = queue.get() if not queue.empty() else (None, None)
+    return ProbeResult(exponent, False, attack)
+
+
+# --- Profiling ---
+
+def profile_rule(rule, corpus, probe=None):
+    """Time one rule over the corpus lines
+
+    probe: True always runs the backtracking probe, None runs it only when the
+    static scan finds a risk, False never does.
+    """
+    try:
+        pattern = re.compile(rule.regex)
+        risks = analyze_backtracking(rule.regex)
+    except re.error as e:
+        return RuleProfile(rule.name, rule.regex, 0, 0, 0, 0.0, 0.0, '', [], None, str(e))
+
+    lines = total_bytes = matches = 0
+    total = worst = 0.0
+    worst_line = ''
+    clock = time.perf_counter
+    for line in corpus:
+        started = clock()
+        for _ in pattern.finditer(line):
+            matches += 1
+        elapsed = clock() - started
+        total += elapsed
+        if elapsed > worst:
+            worst, worst_line = elapsed, line
+        lines += 1
+        total_bytes += len(line) + 1
+
+    if worst_line:
+        # A single timing can be inflated by a GC pause or a context switch
+        worst = min(worst, _time_search(pattern, worst_line))
+
+    probe_result = None
+    if probe or (probe is None and risks):
+        probe_result = probe_backtracking(rule.regex)
+    return RuleProfile(rule.name, rule.regex, lines, total_bytes, matches, total, worst,
+                       worst_line[:80], risks, probe_result, None)
+
+
+def profile_rules(rules, corpus, probe=None):
+    """Profile several rules over the same corpus (materialized once) against the reference rule"""
+    corpus = corpus if isinstance(corpus, list) else list(corpus)
+    baseline = profile_rule(REFERENCE_RULE, corpus, probe=False).seconds
+    return [profile_rule(rule, corpus, probe)._replace(baseline_seconds=baseline) for rule in rules]
+
+
+def check_rules(rules, corpus_lines=2000, seed=0):
+    """Warnings for rules about to be written to wezterm.lua, from a small synthetic corpus"""
+    profiles = profile_rules(rules, synthetic_scrollback(corpus_lines, seed))
+    return [warning for profile in profiles for warning in rule_warnings(profile)]
+
+
+def rule_warnings(profile, max_slowdown=MAX_SLOWDOWN, line_budget=LINE_BUDGET_SECONDS):
+    """Turkish warnings for a profile; empty when the rule is safe to ship"""
+    name = profile.name
+    if profile.error:
+        return [f"{name}: düzenli ifade derlenemedi ({profile.error})"]
+
+    warnings = []
+    probe = profile.probe
+    if probe is not None and probe.timed_out:
+        warnings.append(f"{name}: felaket düzeyinde geri izleme, saldırı girdisi {PROBE_TIMEOUT_SECONDS:g} sn içinde "
+                        f"bitmedi ({'; '.join(risk.detail for risk in profile.risks) or 'üstel büyüme'})")
+    elif probe is not None and probe.exponent and probe.exponent >= SUPERLINEAR_EXPONENT:
+        warnings.append(f"{name}: eşleşme süresi satır uzunluğuyla yaklaşık O(n^{probe.exponent:.1f}) büyüyor "
+                        f"(örnek girdi: {probe.attack!r})")
+    if profile.lines and profile.slowdown is not None and profile.slowdown > max_slowdown:
+        warnings.append(f"{name}: referans kuraldan {profile.slowdown:.1f} kat yavaş "
+                        f"({profile.mb_per_second:.1f} MB/sn)")
+    if profile.worst_line_seconds > line_budget:
+        warnings.append(f"{name}: tek bir satır {profile.worst_line_seconds * 1e3:.1f} ms sürdü "
+                        f"({profile.worst_line!r})")
+    return warnings
+
+
+def _format_table(profiles):
+    rows = [f"{'kural':24} {'MB/sn':>8} {'kat':>6} {'satır/sn':>11} {'eşleşme/sn':>11} {'en kötü ms':>10} {'büyüme':>8}"]
+    for profile in profiles:
+        if profile.error:
+            rows.append(f"{profile.name:24} hata: {profile.error}")
+            continue
+        probe = profile.probe
+        growth = '-' if probe is None else 'zaman aşımı' if probe.timed_out else f"n^{probe.exponent or 0:.1f}"
+        slowdown = '-' if profile.slowdown is None else f"{profile.slowdown:.1f}"
+        rows.append(f"{profile.name:24} {profile.mb_per_second:>8.1f} {slowdown:>6} {profile.lines_per_second:>11,.0f} "
+                    f"{profile.matches_per_second:>11,.0f} {profile.worst_line_seconds * 1e3:>10.3f} {growth:>8}")
+        for risk in profile.risks:
+            rows.append(f"{'':24} ! {risk.kind}: {risk.detail}")
+        for warning in rule_warnings(profile):
+            rows.append(f"{'':24} ! {warning}")
+    return '\n'.join(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="WezTerm bağlantı kuralı profilleyici")
+    parser.add_argument('--labels', nargs='*', help="Profillenecek hazır kurallar (varsayılan: hepsi)")
+    parser.add_argument('--rule', action='append', default=[], metavar='AD=REGEX', help="Özel kural ekle")
+    parser.add_argument('--corpus', help="Kaydırma geçmişi dosyası (varsayılan: sentetik)")
+    parser.add_argument('--lines', type=int, default=20000, help="Sentetik satır sayısı / dosyadan okunacak en fazla satır")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--long-line-ratio', type=float, default=0.01)
+    parser.add_argument('--probe', choices=['auto', 'always', 'never'], default='always',
+                        help="Geri izleme yoklaması: riskli kurallarda, her zaman ya da hiç")
+    parser.add_argument('--json', action='store_true', help="Sonuçları JSON olarak yaz")
+    args = parser.parse_args(argv)
+
+    try:
+        rules = builtin_rules(args.labels) + [parse_rule_arg(text) for text in args.rule]
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.corpus:
+        corpus = read_scrollback(args.corpus, args.lines)
+    else:
+        corpus = synthetic_scrollback(args.lines, args.seed, args.long_line_ratio)
+    probe = {'auto': None, 'always': True, 'never': False}[args.probe]
+    profiles = profile_rules(rules, corpus, probe)
+
+    if args.json:
+        json.dump([dict(profile._asdict(), mb_per_second=profile.mb_per_second,
+                        lines_per_second=profile.lines_per_second, matches_per_second=profile.matches_per_second,
+                        slowdown=profile.slowdown,
+                        warnings=rule_warnings(profile)) for profile in profiles],
+                  sys.stdout, indent=2)
+        print()
+    else:
+        print(_format_table(profiles))
+    return 1 if any(rule_warnings(profile) for profile in profiles) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
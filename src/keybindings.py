@@ -0,0 +1,296 @@
+from collections import Counter, namedtuple
+
+from src.config import KeyBinding
+
+# Modifier bit flags; aliases map onto the names WezTerm documents
+MOD_SHIFT = 1
+MOD_CTRL = 2
+MOD_ALT = 4
+MOD_SUPER = 8
+MOD_LEADER = 16
+
+MODIFIER_BITS = {
+    'SHIFT': MOD_SHIFT,
+    'CTRL': MOD_CTRL, 'CONTROL': MOD_CTRL,
+    'ALT': MOD_ALT, 'OPT': MOD_ALT, 'META': MOD_ALT, 'OPTION': MOD_ALT,
+    'SUPER': MOD_SUPER, 'CMD': MOD_SUPER, 'WIN': MOD_SUPER, 'COMMAND': MOD_SUPER,
+    'LEADER': MOD_LEADER,
+    'NONE': 0, '': 0,
+}
+
+# Canonical WezTerm key names for common spellings
+KEY_ALIASES = {
+    'enter': 'Enter', 'return': 'Enter', 'ret': 'Enter',
+    'tab': 'Tab', 'esc': 'Escape', 'escape': 'Escape', 'space': ' ', 'spc': ' ',
+    'backspace': 'Backspace', 'bs': 'Backspace', 'delete': 'Delete', 'del': 'Delete',
+    'insert': 'Insert', 'ins': 'Insert', 'home': 'Home', 'end': 'End',
+    'pageup': 'PageUp', 'pgup': 'PageUp', 'pagedown': 'PageDown', 'pgdn': 'PageDown',
+    'left': 'LeftArrow', 'leftarrow': 'LeftArrow', 'right': 'RightArrow', 'rightarrow': 'RightArrow',
+    'up': 'UpArrow', 'uparrow': 'UpArrow', 'down': 'DownArrow', 'downarrow': 'DownArrow',
+    'plus': '+', 'minus': '-', 'equal': '=', 'equals': '=', 'pipe': '|',
+}
+
+# Shifted symbols on a US layout: SHIFT + '\\' and '|' are the same physical chord
+SHIFTED_SYMBOLS = {
+    '!': '1', '@': '2', '#': '3', '$': '4', '%': '5', '^': '6', '&': '7', '*': '8', '(': '9', ')': '0',
+    '_': '-', '+': '=', '{': '[', '}': ']', '|': '\\', ':': ';', '"': "'", '<': ',', '>': '.', '?': '/',
+    '~': '`',
+}
+
+BindingKey = namedtuple('BindingKey', ['mods', 'key', 'key_table'])
+Conflict = namedtuple('Conflict', ['binding', 'existing', 'kind'])
+
+
+def normalize_mods(mods):
+    """'CTRL|SHIFT', 'ctrl + shift', ['CMD'] -> bitmask"""
+    if isinstance(mods, int):
+        return mods
+    if isinstance(mods, str):
+        mods = mods.replace('+', '|').split('|')
+    mask = 0
+    for mod in mods or ():
+        name = mod.strip().upper()
+        if name not in MODIFIER_BITS:
+            raise ValueError(f"Bilinmeyen değiştirici tuş: {mod}")
+        mask |= MODIFIER_BITS[name]
+    return mask
+
+
+def normalize_key(key, mods_mask=0):
+    """Canonical key name and modifier mask for a key/modifier pair"""
+    if len(key) == 1:
+        if key.isalpha():
+            # WezTerm matches letters case-insensitively once SHIFT is taken into account
+            if key.isupper():
+                mods_mask |= MOD_SHIFT
+            return key.lower(), mods_mask
+        if key in SHIFTED_SYMBOLS:
+            return SHIFTED_SYMBOLS[key], mods_mask | MOD_SHIFT
+        return key, mods_mask
+
+    alias = KEY_ALIASES.get(key.lower())
+    if alias is not None:
+        return normalize_key(alias, mods_mask) if len(alias) == 1 else (alias, mods_mask)
+    if key.lower().startswith('f') and key[1:].isdigit():
+        return key.upper(), mods_mask
+    return key, mods_mask
+
+
+def binding_key(binding):
+    """Hashable (mods, key, key_table) identity of a binding"""
+    mask = normalize_mods(binding.mods)
+    key, mask = normalize_key(binding.key, mask)
+    return BindingKey(mask, key, binding.key_table)
+
+
+def format_mods(mask):
+    names = [name for name, bit in (('LEADER', MOD_LEADER), ('SUPER', MOD_SUPER), ('CTRL', MOD_CTRL),
+                                    ('ALT', MOD_ALT), ('SHIFT', MOD_SHIFT)) if mask & bit]
+    return '|'.join(names) or 'NONE'
+
+
+def describe(binding):
+    mods = format_mods(normalize_mods(binding.mods))
+    chord = binding.key if mods == 'NONE' else f"{mods} + {binding.key}"
+    return f"{chord} ({binding.key_table})" if binding.key_table else chord
+
+
+# A representative slice of WezTerm's default key assignments
+# (https://wezfurlong.org/wezterm/config/default-keys.html)
+WEZTERM_DEFAULT_BINDINGS = [
+    KeyBinding('Tab', 'CTRL', 'act.ActivateTabRelative(1)'),
+    KeyBinding('Tab', 'CTRL|SHIFT', 'act.ActivateTabRelative(-1)'),
+    KeyBinding('Enter', 'ALT', 'act.ToggleFullScreen'),
+    KeyBinding('c', 'SUPER', "act.CopyTo 'Clipboard'"),
+    KeyBinding('v', 'SUPER', "act.PasteFrom 'Clipboard'"),
+    KeyBinding('c', 'CTRL|SHIFT', "act.CopyTo 'Clipboard'"),
+    KeyBinding('v', 'CTRL|SHIFT', "act.PasteFrom 'Clipboard'"),
+    KeyBinding('Copy', 'NONE', "act.CopyTo 'Clipboard'"),
+    KeyBinding('Paste', 'NONE', "act.PasteFrom 'Clipboard'"),
+    KeyBinding('Insert', 'CTRL', "act.CopyTo 'PrimarySelection'"),
+    KeyBinding('Insert', 'SHIFT', "act.PasteFrom 'PrimarySelection'"),
+    KeyBinding('m', 'SUPER', 'act.Hide'),
+    KeyBinding('n', 'SUPER', 'act.SpawnWindow'),
+    KeyBinding('n', 'CTRL|SHIFT', 'act.SpawnWindow'),
+    KeyBinding('k', 'SUPER', "act.ClearScrollback 'ScrollbackOnly'"),
+    KeyBinding('k', 'CTRL|SHIFT', "act.ClearScrollback 'ScrollbackOnly'"),
+    KeyBinding('f', 'SUPER', "act.Search 'CurrentSelectionOrEmptyString'"),
+    KeyBinding('f', 'CTRL|SHIFT', "act.Search 'CurrentSelectionOrEmptyString'"),
+    KeyBinding('l', 'CTRL|SHIFT', 'act.ShowDebugOverlay'),
+    KeyBinding('p', 'CTRL|SHIFT', 'act.ActivateCommandPalette'),
+    KeyBinding('u', 'CTRL|SHIFT', 'act.CharSelect'),
+    KeyBinding('x', 'CTRL|SHIFT', 'act.ActivateCopyMode'),
+    KeyBinding(' ', 'CTRL|SHIFT', 'act.QuickSelect'),
+    KeyBinding('z', 'CTRL|SHIFT', 'act.TogglePaneZoomState'),
+    KeyBinding('r', 'CTRL|SHIFT', 'act.ReloadConfiguration'),
+    KeyBinding('r', 'SUPER', 'act.ReloadConfiguration'),
+    KeyBinding('t', 'SUPER', "act.SpawnTab 'CurrentPaneDomain'"),
+    KeyBinding('t', 'CTRL|SHIFT', "act.SpawnTab 'CurrentPaneDomain'"),
+    KeyBinding('w', 'SUPER', 'act.CloseCurrentTab { confirm = true }'),
+    KeyBinding('w', 'CTRL|SHIFT', 'act.CloseCurrentTab { confirm = true }'),
+    KeyBinding('=', 'CTRL', 'act.IncreaseFontSize'),
+    KeyBinding('=', 'SUPER', 'act.IncreaseFontSize'),
+    KeyBinding('-', 'CTRL', 'act.DecreaseFontSize'),
+    KeyBinding('-', 'SUPER', 'act.DecreaseFontSize'),
+    KeyBinding('0', 'CTRL', 'act.ResetFontSize'),
+    KeyBinding('0', 'SUPER', 'act.ResetFontSize'),
+    KeyBinding('PageUp', 'SHIFT', 'act.ScrollByPage(-1)'),
+    KeyBinding('PageDown', 'SHIFT', 'act.ScrollByPage(1)'),
+    KeyBinding('PageUp', 'CTRL', 'act.ActivateTabRelative(-1)'),
+    KeyBinding('PageDown', 'CTRL', 'act.ActivateTabRelative(1)'),
+    KeyBinding('PageUp', 'CTRL|SHIFT', 'act.MoveTabRelative(-1)'),
+    KeyBinding('PageDown', 'CTRL|SHIFT', 'act.MoveTabRelative(1)'),
+    KeyBinding('[', 'SUPER|SHIFT', 'act.ActivateTabRelative(-1)'),
+    KeyBinding(']', 'SUPER|SHIFT', 'act.ActivateTabRelative(1)'),
+    KeyBinding('LeftArrow', 'CTRL|SHIFT', "act.ActivatePaneDirection 'Left'"),
+    KeyBinding('RightArrow', 'CTRL|SHIFT', "act.ActivatePaneDirection 'Right'"),
+    KeyBinding('UpArrow', 'CTRL|SHIFT', "act.ActivatePaneDirection 'Up'"),
+    KeyBinding('DownArrow', 'CTRL|SHIFT', "act.ActivatePaneDirection 'Down'"),
+    KeyBinding('LeftArrow', 'CTRL|SHIFT|ALT', "act.AdjustPaneSize { 'Left', 1 }"),
+    KeyBinding('RightArrow', 'CTRL|SHIFT|ALT', "act.AdjustPaneSize { 'Right', 1 }"),
+    KeyBinding('UpArrow', 'CTRL|SHIFT|ALT', "act.AdjustPaneSize { 'Up', 1 }"),
+    KeyBinding('DownArrow', 'CTRL|SHIFT|ALT', "act.AdjustPaneSize { 'Down', 1 }"),
+    KeyBinding("'", 'CTRL|SHIFT|ALT', "act.SplitVertical { domain = 'CurrentPaneDomain' }"),
+    KeyBinding('5', 'CTRL|SHIFT|ALT', "act.SplitHorizontal { domain = 'CurrentPaneDomain' }"),
+] + [
+    KeyBinding(str(n), 'SUPER', f'act.ActivateTab({n - 1})') for n in range(1, 10)
+] + [
+    KeyBinding(str(n), 'CTRL|SHIFT', f'act.ActivateTab({n - 1})') for n in range(1, 10)
+]
+
+
+class KeyBindingIndex:
+    """Tuş atamalarını (mods, key, key_table) ile indeksleyen çakışma dedektörü
+
+    Bindings are hashed on their normalized chord, so an edit costs one dict
+    lookup no matter how many bindings exist. The set of conflicting chords is
+    maintained incrementally, so listing conflicts costs O(conflicts), not
+    O(bindings).
+    """
+
+    def __init__(self, defaults=WEZTERM_DEFAULT_BINDINGS):
+        self._defaults = {}
+        for binding in defaults:
+            self._defaults.setdefault(binding_key(binding), binding)
+        self._bindings = {}
+        self._conflicted = set()
+        self._leader = None
+        self._synced = Counter()
+
+    def set_leader(self, key, mods):
+        """Register the leader chord; a plain binding on it shadows the leader"""
+        previous = self._leader
+        self._leader = binding_key(KeyBinding(key, mods, None)) if key else None
+        for index_key in (previous, self._leader):
+            if index_key is not None:
+                self._refresh(index_key)
+
+    def add(self, binding):
+        """Index a binding and return the conflicts it introduces"""
+        index_key = binding_key(binding)
+        conflicts = self.check(binding, index_key)
+        self._bindings.setdefault(index_key, []).append(binding)
+        self._refresh(index_key)
+        return conflicts
+
+    def remove(self, binding):
+        """Remove one occurrence of a binding"""
+        index_key = binding_key(binding)
+        entries = self._bindings.get(index_key)
+        if entries and binding in entries:
+            entries.remove(binding)
+            if not entries:
+                del self._bindings[index_key]
+            self._refresh(index_key)
+
+    def sync(self, bindings):
+        """Bring the index in line with a full binding list, touching only what changed"""
+        wanted = Counter(bindings)
+        for binding, count in (self._synced - wanted).items():
+            for _ in range(count):
+                self.remove(binding)
+        for binding, count in (wanted - self._synced).items():
+            for _ in range(count):
+                self.add(binding)
+        self._synced = wanted
+
+    def check(self, binding, index_key=None):
+        """Conflicts a binding would have, without indexing it"""
+        index_key = index_key or binding_key(binding)
+        conflicts = [Conflict(binding, existing, 'duplicate') for existing in self._bindings.get(index_key, ())]
+        if index_key in self._defaults:
+            conflicts.append(Conflict(binding, self._defaults[index_key], 'shadows_default'))
+        if index_key == self._leader:
+            conflicts.append(Conflict(binding, None, 'shadows_leader'))
+        return conflicts
+
+    def _refresh(self, index_key):
+        entries = self._bindings.get(index_key)
+        if entries and (len(entries) > 1 or index_key in self._defaults or index_key == self._leader):
+            self._conflicted.add(index_key)
+        else:
+            self._conflicted.discard(index_key)
+
+    def conflicts(self):
+        """Every current conflict: duplicates, shadowed defaults and the shadowed leader"""
+        found = []
+        for index_key in self._conflicted:
+            entries = self._bindings[index_key]
+            for later in entries[1:]:
+                found.append(Conflict(later, entries[0], 'duplicate'))
+            if index_key in self._defaults:
+                found.append(Conflict(entries[0], self._defaults[index_key], 'shadows_default'))
+            if index_key == self._leader:
+                found.append(Conflict(entries[0], None, 'shadows_leader'))
+        return found
+
+    def shadowed_defaults(self):
+        """Default bindings replaced by indexed bindings"""
+        return [self._defaults[key] for key in self._conflicted if key in self._defaults]
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._bindings.values())
+
+
+def find_conflicts(bindings, leader=None):
+    """Index bindings in order and return every conflict found along the way"""
+    index = KeyBindingIndex()
+    if leader:
+        index.set_leader(*leader)
+    for binding in bindings:
+        index.add(binding)
+    return index.conflicts()
+
+
+def parse_binding_line(line):
+    """Parse 'CTRL|SHIFT + t -> act.SpawnTab 'DefaultDomain'' into a KeyBinding"""
+    chord, separator, action = line.partition('->')
+    if not separator or not action.strip():
+        raise ValueError(f"Satır 'MOD + TUŞ -> aksiyon' biçiminde olmalıdır: {line}")
+    chord = chord.strip()
+    if chord.endswith('+') and chord.rstrip('+ ') != chord.rstrip(' '):
+        # The key itself is '+', e.g. 'CTRL + +'
+        mods, key = chord[:-1].rstrip().rstrip('+'), '+'
+    else:
+        mods, _, key = chord.rpartition('+')
+    key, mods = key.strip(), mods.strip()
+    if not key:
+        raise ValueError(f"Tuş eksik: {line}")
+    normalize_mods(mods)
+    return KeyBinding(key, mods.replace(' ', '').replace('+', '|'), action.strip())
+
+
+def format_binding_line(binding):
+    """Inverse of parse_binding_line, used to put bindings back into the editor"""
+    chord = f"{binding.mods} + {binding.key}" if binding.mods else binding.key
+    return f"{chord} -> {binding.action}"
+
+
+def format_conflict(conflict):
+    """Human-readable (Turkish) description of a conflict"""
+    chord = describe(conflict.binding)
+    if conflict.kind == 'duplicate':
+        return f"{chord} birden fazla kez atanmış: {conflict.existing.action} / {conflict.binding.action}"
+    if conflict.kind == 'shadows_default':
+        return f"{chord} WezTerm'in varsayılan atamasını geçersiz kılıyor ({conflict.existing.action})"
+    return f"{chord} lider tuşu ile aynı, lider tuşunu gölgeliyor"
@@ -0,0 +1,186 @@
+"""Paginated table editor for list-valued options (SSH domains, launch menu).
+
+One Streamlit widget per entry would make every rerun build and send as many
+widgets as there are entries. This component is sent a single page of rows
+(``page_size``, default 50) and keeps only the rows scrolled into view in the
+DOM. Edits go back as row-level operations (update, insert or delete at an
+absolute index), batched and debounced like the live slider, and are applied
+in an ``on_change`` callback to the immutable tuple of entries held in the
+session, before the script runs. A rerun therefore costs the same for ten
+entries as for ten thousand; an edit costs one tuple copy.
+"""
+import os
+import shlex
+from functools import partial
+from collections import namedtuple
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from src.config import SSH_MULTIPLEXING, LaunchMenuEntry, SshDomain
+from src.model import FIELD_COERCIONS
+
+LIST_EDITOR_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "components", "list_editor")
+DEFAULT_PAGE_SIZE = int(os.environ.get("WEZTERM_GUI_LIST_PAGE_SIZE", 50))
+DEFAULT_DEBOUNCE_MS = 600
+
+# options turns the cell into a select; required cells must be filled before a row is sent
+ListColumn = namedtuple('ListColumn', ['field', 'label', 'required', 'options', 'placeholder'],
+                        defaults=[False, None, ''])
+
+
+class ListOption:
+    """Bir liste seçeneğinin sütunları ve satır hücreleri ile girdiler arasındaki dönüşümü"""
+
+    def __init__(self, entry_type, columns, unique=None):
+        self.entry_type = entry_type
+        self.columns = columns
+        # Field whose value may appear only once in the list, e.g. the SSH domain name
+        self.unique = unique
+
+    def cells(self, entry):
+        """Cell texts of an entry, in column order"""
+        return [self.format_cell(column, getattr(entry, column.field)) for column in self.columns]
+
+    def parse(self, cells):
+        """Entry from cell texts; raises ValueError with a Turkish message"""
+        if not isinstance(cells, list) or len(cells) != len(self.columns):
+            raise ValueError("Satır sütunlarla uyuşmuyor")
+        values = {}
+        for column, cell in zip(self.columns, cells):
+            text = str(cell).strip()
+            if column.required and not text:
+                raise ValueError(f"'{column.label}' boş olamaz")
+            if column.options and text not in column.options:
+                raise ValueError(f"'{column.label}' için geçersiz değer: {text}")
+            values[column.field] = self.parse_cell(column, text)
+        return self.entry_type(**values)
+
+    def format_cell(self, column, value):
+        return value
+
+    def parse_cell(self, column, text):
+        return text
+
+
+class LaunchMenuOption(ListOption):
+    """Argümanları kabuk sözdizimiyle tek hücrede düzenlenen başlatma menüsü seçeneği"""
+
+    def format_cell(self, column, value):
+        return shlex.join(value) if column.field == 'args' else value
+
+    def parse_cell(self, column, text):
+        if column.field != 'args':
+            return text
+        try:
+            return tuple(shlex.split(text))
+        except ValueError as e:
+            raise ValueError(f"Komut ayrıştırılamadı: {e}") from e
+
+
+SSH_DOMAINS = ListOption(SshDomain, [
+    ListColumn('name', 'Ad', required=True, placeholder='sunucu'),
+    ListColumn('remote_address', 'Adres', required=True, placeholder='sunucu.example.com:22'),
+    ListColumn('username', 'Kullanıcı'),
+    ListColumn('multiplexing', 'Çoklama', options=SSH_MULTIPLEXING),
+], unique='name')
+
+LAUNCH_MENU = LaunchMenuOption(LaunchMenuEntry, [
+    ListColumn('label', 'Etiket', required=True, placeholder='htop'),
+    ListColumn('args', 'Komut', required=True, placeholder='htop -d 10'),
+    ListColumn('cwd', 'Çalışma Dizini', placeholder='~/projeler'),
+])
+
+
+def apply_row_ops(entries, ops, option):
+    """Apply the component's row operations in order; returns (entries, warnings, last touched index)
+
+    An operation that does not parse or would break uniqueness is skipped with
+    a warning, so the list only ever holds valid entries.
+    """
+    entries = list(entries)
+    warnings = []
+    touched = None
+    for op in ops:
+        kind, index = op.get('op'), op.get('index')
+        limit = len(entries) if kind == 'insert' else len(entries) - 1
+        if not isinstance(index, int) or not 0 <= index <= limit:
+            warnings.append(f"Geçersiz satır: {index}")
+            continue
+        if kind == 'delete':
+            del entries[index]
+            touched = min(index, len(entries) - 1) if entries else None
+            continue
+        if kind not in ('update', 'insert'):
+            warnings.append(f"Bilinmeyen işlem: {kind}")
+            continue
+        try:
+            entry = option.parse(op.get('cells'))
+            if option.unique:
+                value = getattr(entry, option.unique)
+                others = entries if kind == 'insert' else entries[:index] + entries[index + 1:]
+                if any(getattr(other, option.unique) == value for other in others):
+                    raise ValueError(f"'{value}' zaten listede")
+        except ValueError as e:
+            warnings.append(f"Satır {index + 1}: {e}; değişiklik uygulanmadı")
+            continue
+        if kind == 'insert':
+            entries.insert(index, entry)
+        else:
+            entries[index] = entry
+        touched = index
+    return tuple(entries), warnings, touched
+
+
+def page_count(total, page_size=DEFAULT_PAGE_SIZE):
+    return max(1, -(-total // page_size))
+
+
+_list_editor = components.declare_component("list_editor", path=LIST_EDITOR_DIR)
+
+
+def _state(field):
+    # Page, last applied batch and pending warnings; kept apart from the widget key so undo keeps the page
+    return st.session_state.setdefault(f"list_editor_{field}", {'page': 0, 'applied': 0, 'warnings': []})
+
+
+def _on_edit(key, field, option, page_size):
+    value = st.session_state.get(key)
+    state = _state(field)
+    if not value or value.get('seq', 0) <= state['applied']:
+        return
+    state['applied'] = value['seq']
+    entries = st.session_state[field]
+    touched = None
+    if value.get('ops'):
+        entries, warnings, touched = apply_row_ops(entries, value['ops'], option)
+        st.session_state[field] = entries
+        state['warnings'] = warnings
+    # After an edit the page follows the row it touched, otherwise the pager
+    page = touched // page_size if touched is not None else value.get('page', state['page'])
+    state['page'] = min(max(int(page), 0), page_count(len(entries), page_size) - 1)
+
+
+def list_editor(label, field, option, key, page_size=DEFAULT_PAGE_SIZE, height=8, container=None):
+    """Edit the tuple of entries at st.session_state[field] and return it
+
+    Only the current page is serialized to the browser; height is the number of
+    rows visible before the table scrolls.
+    """
+    container = container or st.sidebar
+    # Restored or shared configs put dicts here; the editor works on the model's tuple of entries
+    entries = st.session_state[field] = FIELD_COERCIONS[field](st.session_state.get(field))
+    state = _state(field)
+    state['page'] = min(state['page'], page_count(len(entries), page_size) - 1)
+    offset = state['page'] * page_size
+    rows = [option.cells(entry) for entry in entries[offset:offset + page_size]]
+    columns = [column._asdict() for column in option.columns]
+    with container:
+        _list_editor(label=label, columns=columns, rows=rows, offset=offset, total=len(entries),
+                     page_size=page_size, applied=state['applied'], height=height,
+                     debounce_ms=DEFAULT_DEBOUNCE_MS, key=key, default=None,
+                     on_change=partial(_on_edit, key, field, option, page_size))
+    for warning in state['warnings']:
+        container.warning(warning)
+    state['warnings'] = []
+    return entries
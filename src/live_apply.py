@@ -0,0 +1,197 @@
+"""Write generated Lua straight into the live WezTerm config.
+
+WezTerm reloads its config whenever the file changes, so writing on every
+Streamlit rerun would reload it once per slider tick. ``LiveApplier`` instead
+keeps only the latest submitted config and writes it once no new one has
+arrived for ``debounce_seconds``; a write whose content hash matches the last
+one is skipped altogether. Each write goes to a temporary file next to the
+target and is renamed over it, so WezTerm never reads a half-written config.
+
+A config can also be submitted in the split layout (``SplitLua`` from
+src/config.py): an entry file plus modules it loads with ``require``. Each
+file is then compared on its own and only the ones whose hash changed are
+rewritten, modules before the entry so the entry never requires a module that
+is not there yet. WezTerm watches required files too, so leaving unchanged
+modules alone keeps their reload triggers quiet.
+"""
+import os
+import sys
+import time
+import atexit
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+import traceback
+
+logger = logging.getLogger("wezterm_gui")
+
+DEFAULT_DEBOUNCE_SECONDS = 0.75
+BACKUP_SUFFIX = ".bak"
+
+
+def default_config_path():
+    """Where WezTerm looks for its config on this platform"""
+    if sys.platform == 'win32':
+        return os.path.join(os.path.expanduser("~"), ".wezterm.lua")
+    config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    return os.path.join(config_home, "wezterm", "wezterm.lua")
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def atomic_write(path, text):
+    """Replace path with text in one rename, keeping the existing file's permissions"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, temp_path = tempfile.mkstemp(prefix=".wezterm-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class LiveApplier:
+    """Üretilen Lua kodunu gecikmeli ve atomik olarak WezTerm yapılandırma dosyasına yazan sınıf"""
+
+    def __init__(self, path, debounce_seconds=DEFAULT_DEBOUNCE_SECONDS):
+        # Write through symlinks (dotfile managers) instead of replacing the link itself
+        self.path = os.path.realpath(os.path.expanduser(path))
+        self.debounce_seconds = debounce_seconds
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending = None
+        self._deadline = None
+        # path -> content hash of what is on disk; filled from disk on first use
+        self._hashes = {}
+        self._module_paths = set()
+        self._backed_up = False
+        self._stats = {'submitted': 0, 'writes': 0, 'unchanged': 0, 'coalesced': 0,
+                       'files_written': 0, 'files_unchanged': 0, 'last_write': None, 'last_error': None}
+        self._thread = threading.Thread(target=self._run, name="wezterm-live-apply", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _hash_on_disk(path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                return content_hash(f.read())
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def submit(self, lua_code):
+        """Queue a config (Lua source or SplitLua); only the latest one within the debounce window is written"""
+        with self._condition:
+            self._stats['submitted'] += 1
+            if self._pending is not None:
+                self._stats['coalesced'] += 1
+            self._pending = lua_code
+            self._deadline = time.monotonic() + self.debounce_seconds
+            self._condition.notify()
+
+    def flush(self):
+        """Write a pending config now instead of waiting for the window to settle"""
+        with self._condition:
+            lua_code, self._pending = self._pending, None
+        if lua_code is not None:
+            self._write(lua_code)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                # Every submit pushes the deadline back; write once it has settled
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                lua_code, self._pending = self._pending, None
+            self._write(lua_code)
+
+    def _write(self, lua_code):
+        # flush() can run on the caller's thread while the worker is writing
+        with self._write_lock:
+            self._write_locked(lua_code)
+
+    def _write_locked(self, lua_code):
+        files = self._target_files(lua_code)
+        changed = {}
+        for path, text in files.items():
+            if path not in self._hashes:
+                self._hashes[path] = self._hash_on_disk(path)
+            digest = content_hash(text)
+            if digest != self._hashes[path]:
+                changed[path] = (text, digest)
+        # Modules written by an earlier split submit that this config no longer requires
+        stale = self._module_paths - set(files)
+        with self._condition:
+            self._stats['files_unchanged'] += len(files) - len(changed)
+        if not changed and not stale:
+            with self._condition:
+                self._stats['unchanged'] += 1
+            return
+        try:
+            if self.path in changed:
+                self._backup_once()
+            # The entry goes last: it must not require a module that is not written yet
+            for path in sorted(changed, key=lambda path: path == self.path):
+                text, digest = changed[path]
+                atomic_write(path, text)
+                self._hashes[path] = digest
+            for path in stale:
+                if os.path.exists(path):
+                    os.remove(path)
+                self._hashes.pop(path, None)
+        except Exception as e:
+            logger.error(f"Yapılandırma dosyası yazılamadı: {self.path}: {e}\n{traceback.format_exc()}")
+            with self._condition:
+                self._stats['last_error'] = str(e)
+            return
+        self._module_paths = set(files) - {self.path}
+        with self._condition:
+            self._stats['writes'] += 1
+            self._stats['files_written'] += len(changed)
+            self._stats['last_write'] = time.time()
+            self._stats['last_error'] = None
+        logger.info(f"Yapılandırma canlı olarak uygulandı: {self.path} ({len(changed)} dosya yazıldı)")
+
+    def _target_files(self, lua_code):
+        """Absolute path -> source for a submitted config"""
+        if isinstance(lua_code, str):
+            return {self.path: lua_code}
+        entry, modules = lua_code
+        directory = os.path.dirname(self.path)
+        files = {os.path.join(directory, *relative.split('/')): text for relative, text in modules.items()}
+        files[self.path] = entry
+        return files
+
+    def _backup_once(self):
+        # The first write may replace a hand-written config; keep a copy of it
+        if self._backed_up:
+            return
+        backup_path = self.path + BACKUP_SUFFIX
+        if os.path.exists(self.path) and not os.path.exists(backup_path):
+            shutil.copy2(self.path, backup_path)
+            logger.info(f"Mevcut yapılandırma yedeklendi: {backup_path}")
+        self._backed_up = True
+
+    def stats(self):
+        """Submit/write/skip counters, the last write time and the last error"""
+        with self._condition:
+            return dict(self._stats, pending=self._pending is not None)
@@ -0,0 +1,30 @@
+"""Sidebar slider that previews instantly and reruns only once the drag settles.
+
+``st.slider`` reruns the whole script for intermediate values while it is
+dragged, and every rerun regenerates the preview and the Lua code. This
+component instead posts each value to the preview iframe over a
+BroadcastChannel (terminal.js restyles it on the spot) and sends the value to
+the server only after it has not changed for ``debounce_ms``, so a drag costs
+a single rerun.
+"""
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+LIVE_SLIDER_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "components", "live_slider")
+DEFAULT_DEBOUNCE_MS = int(os.environ.get("WEZTERM_GUI_SLIDER_DEBOUNCE_MS", 400))
+
+_live_slider = components.declare_component("live_slider", path=LIVE_SLIDER_DIR)
+
+
+def live_slider(label, min_value, max_value, value, step=1, preview_field=None, channel=None,
+                debounce_ms=DEFAULT_DEBOUNCE_MS, key=None, container=None):
+    """Drop-in replacement for container.slider; preview_field names the termConfig key to restyle live"""
+    container = container or st.sidebar
+    with container:
+        result = _live_slider(label=label, min_value=min_value, max_value=max_value, value=value, step=step,
+                              preview_field=preview_field, channel=channel, debounce_ms=debounce_ms,
+                              key=key or f"live_slider_{label}", default=value)
+    # JSON turns whole floats into ints and vice versa; keep the type of the declared value
+    return type(value)(result)
@@ -0,0 +1,212 @@
+import re
+from contextlib import contextmanager
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+_LUA_KEYWORDS = frozenset({
+    'and', 'break', 'do', 'else', 'elseif', 'end', 'false', 'for', 'function', 'goto', 'if',
+    'in', 'local', 'nil', 'not', 'or', 'repeat', 'return', 'then', 'true', 'until', 'while',
+})
+_ESCAPES = {'\\': '\\\\', "'": "\\'", '\n': '\\n', '\r': '\\r', '\t': '\\t', '\0': '\\0'}
+_NEEDS_ESCAPE = re.compile(r"[\\'\n\r\t\x00-\x1f\x7f]")
+
+# Tables with only scalar values are written on one line up to this width
+INLINE_TABLE_WIDTH = 100
+
+
+class LuaExpr:
+    """Olduğu gibi yazılan ham Lua ifadesi"""
+    __slots__ = ('code',)
+
+    def __init__(self, code):
+        self.code = code
+
+    def __repr__(self):
+        return f"LuaExpr({self.code!r})"
+
+
+class LuaCall:
+    """Lua fonksiyon/aksiyon çağrısı, örn. act.SplitHorizontal { domain = 'CurrentPaneDomain' }"""
+    __slots__ = ('callee', 'args')
+
+    def __init__(self, callee, *args):
+        self.callee = callee
+        self.args = args
+
+    def __repr__(self):
+        return f"LuaCall({self.callee!r}, {', '.join(repr(arg) for arg in self.args)})"
+
+
+def lua_string(value):
+    """Quote a Python string as a single-quoted Lua string literal"""
+    escaped = _NEEDS_ESCAPE.sub(lambda m: _ESCAPES.get(m.group(), f"\\{ord(m.group()):03d}"), value)
+    return f"'{escaped}'"
+
+
+def lua_key(key):
+    """Table key syntax: bare identifier when possible, bracketed otherwise"""
+    if isinstance(key, str) and _IDENTIFIER.match(key) and key not in _LUA_KEYWORDS:
+        return key
+    return f"[{lua_scalar(key)}]"
+
+
+def lua_scalar(value):
+    """Render a non-table value"""
+    if value is None:
+        return 'nil'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        return lua_string(value)
+    if isinstance(value, LuaExpr):
+        return value.code
+    if isinstance(value, LuaCall):
+        return lua_call(value)
+    raise TypeError(f"Lua'ya dönüştürülemeyen değer: {value!r}")
+
+
+def lua_call(call):
+    """Render a call; a single string/table argument uses Lua's paren-less call syntax"""
+    if len(call.args) == 1 and (isinstance(call.args[0], str) or is_table(call.args[0])):
+        return f"{call.callee} {lua_inline(call.args[0])}"
+    return f"{call.callee}({', '.join(lua_inline(arg) for arg in call.args)})"
+
+
+def is_table(value):
+    return isinstance(value, (dict, list, tuple))
+
+
+def lua_inline(value):
+    """Render any value on a single line"""
+    if isinstance(value, dict):
+        if not value:
+            return '{}'
+        return '{ ' + ', '.join(f"{lua_key(k)} = {lua_inline(v)}" for k, v in value.items()) + ' }'
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return '{}'
+        return '{ ' + ', '.join(lua_inline(v) for v in value) + ' }'
+    return lua_scalar(value)
+
+
+def _is_flat(value):
+    items = value.values() if isinstance(value, dict) else value
+    return all(not is_table(item) and not isinstance(item, LuaCall) for item in items)
+
+
+class LuaEmitter:
+    """Lua kaynağını bir metin akışına parça parça yazan sınıf
+
+    Nothing is accumulated: every statement, table entry and comment goes to the
+    stream as soon as it is emitted, so arbitrarily large configs (hundreds of
+    key bindings, long rule lists) never exist as one big string or list.
+    """
+
+    def __init__(self, stream, indent='  '):
+        self.stream = stream
+        self.indent = indent
+        self.level = 0
+
+    def _write_line(self, text=''):
+        self.stream.write(f"{self.indent * self.level}{text}\n" if text else "\n")
+
+    def blank(self):
+        self._write_line()
+
+    def comment(self, text):
+        self._write_line(f"-- {text}")
+
+    def raw(self, code):
+        """Write a line of hand-written Lua"""
+        self._write_line(code)
+
+    def local(self, name, value):
+        self._write_line(f"local {name} = {self._render(value)}")
+
+    def assign(self, target, value, comment=None):
+        """target = value, streaming the value when it is a large table"""
+        suffix = f"  -- {comment}" if comment else ''
+        if is_table(value) and not self._fits_inline(value):
+            self._write_line(f"{target} = {{")
+            self._write_table_body(value)
+            self._write_line(f"}}{suffix}")
+        else:
+            self._write_line(f"{target} = {self._render(value)}{suffix}")
+
+    def ret(self, value):
+        self._write_line(f"return {self._render(value)}")
+
+    @contextmanager
+    def table(self, target=None):
+        """Open a table and yield a writer for its entries: `with e.table('config.keys') as t:`"""
+        self._write_line(f"{target} = {{" if target else "{")
+        self.level += 1
+        try:
+            yield _TableWriter(self)
+        finally:
+            self.level -= 1
+            self._write_line("}")
+
+    def _render(self, value):
+        return lua_inline(value)
+
+    def _fits_inline(self, value):
+        if not value:
+            return True
+        if not _is_flat(value):
+            return False
+        return len(lua_inline(value)) + self.level * len(self.indent) <= INLINE_TABLE_WIDTH
+
+    def _write_table_body(self, value):
+        self.level += 1
+        try:
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    self._write_entry(f"{lua_key(key)} = ", item)
+            else:
+                for item in value:
+                    self._write_entry('', item)
+        finally:
+            self.level -= 1
+
+    def _write_entry(self, prefix, value):
+        if is_table(value) and not self._fits_inline(value):
+            self._write_line(f"{prefix}{{")
+            self._write_table_body(value)
+            self._write_line("},")
+        else:
+            self._write_line(f"{prefix}{self._render(value)},")
+
+
+class _TableWriter:
+    """LuaEmitter.table içinde tablo girdilerini yazan yardımcı"""
+
+    def __init__(self, emitter):
+        self._emitter = emitter
+
+    def item(self, value):
+        """Append an array entry"""
+        self._emitter._write_entry('', value)
+
+    def field(self, key, value):
+        """Append a key = value entry"""
+        self._emitter._write_entry(f"{lua_key(key)} = ", value)
+
+    def comment(self, text):
+        self._emitter.comment(text)
+
+    def blank(self):
+        self._emitter.blank()
+
+    @contextmanager
+    def table(self, key=None):
+        """Open a nested table entry"""
+        emitter = self._emitter
+        emitter._write_line(f"{lua_key(key)} = {{" if key is not None else "{")
+        emitter.level += 1
+        try:
+            yield _TableWriter(emitter)
+        finally:
+            emitter.level -= 1
+            emitter._write_line("},")
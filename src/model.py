@@ -0,0 +1,298 @@
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from src.config import DEFAULT_CONFIG, KeyBinding, LaunchMenuEntry, SshDomain
+from src.option_schema import load_option_schema
+
+
+class WindowPosition(NamedTuple):
+    """Pencerenin başlangıç konumu"""
+    x: int
+    y: int
+
+
+class WindowDecorations(tuple):
+    """Pencere dekorasyonlarının değişmez listesi"""
+    __slots__ = ()
+
+
+class CustomColors(Mapping):
+    """Özel tema renkleri için değişmez değer tipi"""
+
+    __slots__ = ('bg', 'fg', 'prompt', '_hash')
+    KEYS = ('bg', 'fg', 'prompt')
+
+    def __init__(self, bg, fg, prompt):
+        object.__setattr__(self, 'bg', bg)
+        object.__setattr__(self, 'fg', fg)
+        object.__setattr__(self, 'prompt', prompt)
+        object.__setattr__(self, '_hash', hash((bg, fg, prompt)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} değiştirilemez")
+
+    __delattr__ = __setattr__
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, CustomColors):
+            return self._hash == other._hash and (self.bg, self.fg, self.prompt) == (other.bg, other.fg, other.prompt)
+        return Mapping.__eq__(self, other)
+
+    def __reduce__(self):
+        return (CustomColors, (self.bg, self.fg, self.prompt))
+
+    def __repr__(self):
+        return f"CustomColors(bg={self.bg!r}, fg={self.fg!r}, prompt={self.prompt!r})"
+
+
+class OptionValues(Mapping):
+    """Şemadaki ek seçeneklerin varsayılandan farklı değerleri için değişmez eşleme"""
+
+    __slots__ = ('_items', '_index', '_hash')
+
+    def __init__(self, values=()):
+        items = tuple(sorted(dict(values).items()))
+        object.__setattr__(self, '_items', items)
+        object.__setattr__(self, '_index', dict(items))
+        object.__setattr__(self, '_hash', hash(items))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} değiştirilemez")
+
+    __delattr__ = __setattr__
+
+    def __getitem__(self, key):
+        return self._index[key]
+
+    def __iter__(self):
+        return (name for name, _ in self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, OptionValues):
+            return self._hash == other._hash and self._items == other._items
+        return Mapping.__eq__(self, other)
+
+    def __reduce__(self):
+        return (OptionValues, (self._items,))
+
+    def __repr__(self):
+        return f"OptionValues({dict(self._items)!r})"
+
+
+def _coerce_option_values(value):
+    if isinstance(value, OptionValues):
+        return value
+    # Checked against the schema; defaults are dropped so equal configs compare equal
+    return OptionValues(load_option_schema().non_default(value or {}))
+
+
+def _coerce_custom_colors(value):
+    if not value:
+        return None
+    if isinstance(value, CustomColors):
+        return value
+    return CustomColors(value['bg'], value['fg'], value['prompt'])
+
+
+def _coerce_decorations(value):
+    if isinstance(value, WindowDecorations):
+        return value
+    return WindowDecorations(value or ())
+
+
+def _coerce_position(value):
+    if value is None or isinstance(value, WindowPosition):
+        return value
+    return WindowPosition(*value)
+
+
+def _coerce_tuple(value):
+    if value is None or isinstance(value, tuple):
+        return value
+    return tuple(value)
+
+
+def _coerce_entries(entry_type):
+    # Dict entries (JSON, share links, to_dict) become entry_type with their list values as tuples
+    def coerce(value):
+        if isinstance(value, tuple) and all(isinstance(entry, entry_type) for entry in value):
+            return value
+        return tuple(entry if isinstance(entry, entry_type) else
+                     entry_type(**{name: tuple(item) if isinstance(item, list) else item
+                                   for name, item in entry.items()})
+                     for entry in value or ())
+    return coerce
+
+
+# Nested or list-valued fields are stored as frozen value types
+FIELD_COERCIONS = {
+    'custom_colors': _coerce_custom_colors,
+    'hyperlinkRules': _coerce_tuple,
+    'window_decorations': _coerce_decorations,
+    'window_position': _coerce_position,
+    'keys': _coerce_entries(KeyBinding),
+    'extra_options': _coerce_option_values,
+    'ssh_domains': _coerce_entries(SshDomain),
+    'launch_menu': _coerce_entries(LaunchMenuEntry),
+}
+# Entries of the list-valued fields; to_dict turns them into dicts
+ENTRY_TYPES = (KeyBinding, SshDomain, LaunchMenuEntry)
+
+
+def _thaw(value):
+    if isinstance(value, OptionValues):
+        return {name: list(item) if isinstance(item, tuple) else item for name, item in value.items()}
+    if isinstance(value, ENTRY_TYPES):
+        return {name: _thaw(item) for name, item in value._asdict().items()}
+    if isinstance(value, CustomColors):
+        return dict(value)
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class WezTermConfig(Mapping):
+    """Kullanıcı seçimlerini tutan değişmez, slot tabanlı yapılandırma modeli
+
+    Behaves as a read-only mapping so it can be passed anywhere the config dict
+    was used. Values live in a single tuple ordered like FIELDS and the hash is
+    computed once at construction, so instances work directly as cache keys.
+    ``replace`` builds a new tuple that shares every unchanged value.
+    """
+
+    FIELDS = tuple(DEFAULT_CONFIG.keys())
+    __slots__ = ('_values', '_hash')
+    _INDEX = {name: index for index, name in enumerate(FIELDS)}
+
+    def __init__(self, **values):
+        unknown = set(values) - self._INDEX.keys()
+        if unknown:
+            raise TypeError(f"Bilinmeyen yapılandırma alanları: {', '.join(sorted(unknown))}")
+
+        coerced = []
+        for name in self.FIELDS:
+            value = values[name] if name in values else DEFAULT_CONFIG[name]
+            coerce = FIELD_COERCIONS.get(name)
+            coerced.append(coerce(value) if coerce else value)
+        _init(self, tuple(coerced))
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """Build a config from a dict (or another config), ignoring unknown keys"""
+        if isinstance(mapping, cls):
+            return mapping
+        return cls(**{key: value for key, value in mapping.items() if key in cls._INDEX})
+
+    @classmethod
+    def _from_values(cls, values):
+        # values are already coerced and ordered like FIELDS
+        config = object.__new__(cls)
+        _init(config, values)
+        return config
+
+    def replace(self, **changes):
+        """Return a new config with changes applied; unchanged values are shared"""
+        if not changes:
+            return self
+        values = list(self._values)
+        for name, value in changes.items():
+            index = self._INDEX.get(name)
+            if index is None:
+                raise TypeError(f"Bilinmeyen yapılandırma alanı: {name}")
+            coerce = FIELD_COERCIONS.get(name)
+            values[index] = coerce(value) if coerce else value
+        return self._from_values(tuple(values))
+
+    def changed_fields(self, other):
+        """Names of the fields whose values differ from another config"""
+        if other is self:
+            return []
+        return [name for name, mine, theirs in zip(self.FIELDS, self._values, other._values)
+                if mine is not theirs and mine != theirs]
+
+    def to_dict(self):
+        """Plain dict/list copy, e.g. for JSON serialization"""
+        return {name: _thaw(value) for name, value in zip(self.FIELDS, self._values)}
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} değiştirilemez")
+
+    __delattr__ = __setattr__
+
+    def __getattr__(self, name):
+        # Only reached for names that are not slots: expose fields as attributes
+        index = type(self)._INDEX.get(name)
+        if index is None:
+            raise AttributeError(name)
+        return self._values[index]
+
+    def __getitem__(self, key):
+        return self._values[self._INDEX[key]]
+
+    def get(self, key, default=None):
+        index = self._INDEX.get(key)
+        return default if index is None else self._values[index]
+
+    def __contains__(self, key):
+        return key in self._INDEX
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        if isinstance(other, WezTermConfig):
+            return self._hash == other._hash and self._values == other._values
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __reduce__(self):
+        return (WezTermConfig._from_values, (self._values,))
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={value!r}" for name, value in zip(self.FIELDS, self._values))
+        return f"WezTermConfig({fields})"
+
+
+_set_values = WezTermConfig.__dict__['_values'].__set__
+_set_hash = WezTermConfig.__dict__['_hash'].__set__
+
+
+def _init(config, values):
+    _set_values(config, values)
+    _set_hash(config, hash(values))
+
+
+DEFAULT_WEZTERM_CONFIG = WezTermConfig()
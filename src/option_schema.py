@@ -0,0 +1,197 @@
+"""WezTerm option schema: types, ranges, choices and defaults of every option.
+
+The schema lives in ``src/data/wezterm_options.json`` (override the path with
+``WEZTERM_GUI_OPTION_SCHEMA``) as categories of options:
+
+    {"name": "scrollback_lines", "type": "int", "default": 3500, "min": 0, "max": 1000000,
+     "step": 500, "description": "...", "depends_on": {...}}
+
+Types are bool, int, float, string, enum, color ('#rrggbb'), string_list and
+enum_list. A dotted name such as ``inactive_pane_hsb.hue`` is a field of a
+Lua table option. Options marked ``"builtin"`` already have a dedicated
+sidebar widget and emitter (the value is the WezTermConfig field behind it),
+so they are listed for completeness but not rendered or emitted here.
+
+The same schema drives the sidebar (through FeatureRegistry) and the Lua
+emitter, which writes only options whose value differs from the default.
+"""
+import os
+import json
+import logging
+from collections import namedtuple
+from functools import lru_cache
+
+logger = logging.getLogger("wezterm_gui")
+
+OPTION_SCHEMA_PATH = os.environ.get("WEZTERM_GUI_OPTION_SCHEMA",
+                                    os.path.join(os.path.dirname(__file__), "data", "wezterm_options.json"))
+
+# Option type -> FeatureRegistry widget type
+WIDGET_TYPES = {
+    'bool': 'checkbox',
+    'int': 'number_input',
+    'float': 'slider',
+    'string': 'text_input',
+    'enum': 'selectbox',
+    'color': 'color_picker',
+    'string_list': 'text_list',
+    'enum_list': 'multiselect',
+}
+
+OptionSpec = namedtuple('OptionSpec', ['name', 'category', 'type', 'default', 'min_value', 'max_value', 'step',
+                                       'options', 'description', 'depends_on', 'builtin'])
+
+
+class OptionSchemaError(ValueError):
+    """Geçersiz seçenek şeması ya da şemaya uymayan değer hatası"""
+
+
+def _is_color(value):
+    if not isinstance(value, str) or len(value) != 7 or value[0] != '#':
+        return False
+    try:
+        int(value[1:], 16)
+    except ValueError:
+        return False
+    return True
+
+
+def check_value(spec, value):
+    """Return value in its canonical form, or raise OptionSchemaError if it does not fit spec"""
+    kind = spec.type
+    if kind == 'bool':
+        if isinstance(value, bool):
+            return value
+    elif kind == 'int':
+        if isinstance(value, int) and not isinstance(value, bool):
+            if ((spec.min_value is None or value >= spec.min_value)
+                    and (spec.max_value is None or value <= spec.max_value)):
+                return value
+    elif kind == 'float':
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if ((spec.min_value is None or value >= spec.min_value)
+                    and (spec.max_value is None or value <= spec.max_value)):
+                return float(value)
+    elif kind == 'string':
+        if isinstance(value, str):
+            return value
+    elif kind == 'enum':
+        if value in spec.options:
+            return value
+    elif kind == 'color':
+        if _is_color(value):
+            return value.lower()
+    elif kind in ('string_list', 'enum_list'):
+        if isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value):
+            if kind == 'string_list' or all(item in spec.options for item in value):
+                return tuple(value)
+    raise OptionSchemaError(f"'{spec.name}' için geçersiz değer: {value!r}")
+
+
+def _parse_option(raw, category):
+    try:
+        name, kind = raw['name'], raw['type']
+    except (KeyError, TypeError):
+        raise OptionSchemaError(f"Seçenekte 'name' ya da 'type' eksik: {raw!r}") from None
+    if kind not in WIDGET_TYPES:
+        raise OptionSchemaError(f"'{name}' için bilinmeyen tür: {kind}")
+    if kind in ('enum', 'enum_list') and not raw.get('options'):
+        raise OptionSchemaError(f"'{name}' için seçenek listesi eksik")
+    bounds = [raw.get('min'), raw.get('max'), raw.get('step')]
+    if kind == 'float':
+        # Streamlit rejects sliders that mix int and float arguments
+        bounds = [None if bound is None else float(bound) for bound in bounds]
+    spec = OptionSpec(name, category, kind, None, *bounds, list(raw.get('options', ())),
+                      raw.get('description', ''), raw.get('depends_on'), raw.get('builtin'))
+    return spec._replace(default=check_value(spec, raw.get('default')))
+
+
+class OptionSchema:
+    """WezTerm seçenek şeması: kategoriler, seçenekler ve varsayılanlar"""
+
+    def __init__(self, specs, version=1):
+        self.version = version
+        self.specs = tuple(specs)
+        self.by_name = {}
+        for spec in self.specs:
+            if spec.name in self.by_name:
+                raise OptionSchemaError(f"Seçenek iki kez tanımlanmış: {spec.name}")
+            self.by_name[spec.name] = spec
+        self.index = {spec.name: position for position, spec in enumerate(self.specs)}
+        # Category -> options without a dedicated widget, in schema order
+        self.categories = {}
+        for spec in self.specs:
+            if not spec.builtin:
+                self.categories.setdefault(spec.category, []).append(spec)
+        for spec in self.specs:
+            for key in spec.depends_on or {}:
+                if key not in self.by_name:
+                    raise OptionSchemaError(f"'{spec.name}' bilinmeyen bir seçeneğe bağlı: {key}")
+
+    @classmethod
+    def from_dict(cls, data):
+        specs = [_parse_option(raw, category['name'])
+                 for category in data.get('categories', ()) for raw in category.get('options', ())]
+        return cls(specs, data.get('version', 1))
+
+    def editable(self):
+        """Options rendered and emitted through the schema, in schema order"""
+        return [spec for spec in self.specs if not spec.builtin]
+
+    def features(self):
+        """FeatureRegistry features for the editable options"""
+        # Imported here so Lua generation (API workers) does not pull in Streamlit
+        from src.feature_registry import Feature
+        return [Feature(name=spec.name, category=spec.category,
+                        default_value=list(spec.default) if isinstance(spec.default, tuple) else spec.default,
+                        description=spec.description, options=spec.options, min_value=spec.min_value,
+                        max_value=spec.max_value, step=spec.step, widget_type=WIDGET_TYPES[spec.type],
+                        depends_on=spec.depends_on)
+                for spec in self.editable()]
+
+    def non_default(self, values):
+        """Checked {name: value} for the given values that differ from their defaults"""
+        changed = {}
+        for name, value in values.items():
+            spec = self.by_name.get(name)
+            if spec is None or spec.builtin:
+                raise OptionSchemaError(f"Bilinmeyen seçenek: {name}")
+            value = check_value(spec, value)
+            if value != spec.default:
+                changed[name] = value
+        return changed
+
+    def __len__(self):
+        return len(self.specs)
+
+
+@lru_cache(maxsize=None)
+def load_option_schema(path=OPTION_SCHEMA_PATH):
+    """Parse and check the schema file once per process"""
+    with open(path, encoding='utf-8') as f:
+        schema = OptionSchema.from_dict(json.load(f))
+    logger.info(f"Seçenek şeması yüklendi: {len(schema)} seçenek, {len(schema.categories)} kategori")
+    return schema
+
+
+def write_options(lua, schema, values):
+    """Emit config.<name> assignments for non-default option values, in schema order
+
+    Cost depends on the number of values, not on the size of the schema.
+    """
+    if not values:
+        return
+    assignments = {}
+    for name in sorted(values, key=schema.index.__getitem__):
+        value = values[name]
+        value = list(value) if isinstance(value, tuple) else value
+        table, _, field = name.partition('.')
+        if field:
+            # Fields of one table option are written together as a single table
+            assignments.setdefault(table, {})[field] = value
+        else:
+            assignments[name] = value
+    lua.comment("Additional options")
+    for name, value in assignments.items():
+        lua.assign(f'config.{name}', value)
+    lua.blank()
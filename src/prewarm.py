@@ -0,0 +1,181 @@
+import time
+import itertools
+import logging
+import threading
+import traceback
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config import ConfigGenerator
+from src.terminal import TerminalPreviewGenerator
+from src.model import WezTermConfig
+from src.themes import COLOR_MAPPINGS, imported_scheme
+from src.artifact_cache import artifact_key
+
+logger = logging.getLogger("wezterm_gui")
+
+CURSOR_STYLES = ['Block', 'Bar', 'Underline']
+
+PrewarmedArtifacts = namedtuple('PrewarmedArtifacts', ['preview_html', 'lua_code'])
+
+
+def config_cache_key(config):
+    """Build a hashable cache key from a (possibly nested) config dict"""
+    if isinstance(config, WezTermConfig):
+        return config
+    if isinstance(config, dict):
+        return tuple(sorted((key, config_cache_key(value)) for key, value in config.items()))
+    if isinstance(config, (list, tuple)):
+        return tuple(config_cache_key(value) for value in config)
+    return config
+
+
+def artifacts_key(config):
+    """In-memory cache key: the config plus the palette hash of an imported scheme it names
+
+    Imported schemes live outside the config, so re-importing one under the
+    same name must not hit the entries rendered from its old colors.
+    """
+    scheme = imported_scheme(config['color_scheme'])
+    return config_cache_key(config), scheme['hash'] if scheme else None
+
+
+def render_artifacts(config):
+    """Render the preview HTML and Lua code for a config, the way the app does"""
+    colors = config['custom_colors'] if config['theme'] == 'Custom' else None
+    preview_html = TerminalPreviewGenerator.generate_dynamic_terminal_preview(
+        config['theme'], config['font'], config['font_size'], config['color_scheme'],
+        colors, config['opacity'], config['enable_tab_bar'], config['enable_scroll_bar'],
+        config['default_cursor_style'], config['padding'], config['line_height'],
+        config['use_fancy_tab_bar'], config['hyperlinkRules'], config['leader_key']
+    )
+    return PrewarmedArtifacts(preview_html, ConfigGenerator.generate_wezterm_lua(config))
+
+
+def config_digest(config):
+    """Content address of a config, stable across processes and restarts"""
+    inputs = WezTermConfig.from_mapping(config).to_dict()
+    scheme = imported_scheme(config['color_scheme'])
+    return artifact_key('config', [inputs, scheme['hash']] if scheme else inputs)
+
+
+def neighbouring_configs(config):
+    """Configs one selectbox/checkbox change away: schemes x cursor styles x tab bar"""
+    schemes = [config['color_scheme']] if config['theme'] == 'Custom' else list(COLOR_MAPPINGS.keys())
+    for scheme in schemes:
+        for cursor_style in CURSOR_STYLES:
+            for enable_tab_bar in (True, False):
+                changes = {'color_scheme': scheme, 'default_cursor_style': cursor_style,
+                           'enable_tab_bar': enable_tab_bar}
+                if isinstance(config, WezTermConfig):
+                    yield config.replace(**changes)
+                else:
+                    yield dict(config, **changes)
+
+
+class PreviewPrewarmer:
+    """Komşu yapılandırmaların önizleme ve Lua çıktısını arka planda hazırlayan sınıf"""
+
+    def __init__(self, max_entries=512, max_workers=1, cpu_share=0.25, disk_cache=None):
+        self.max_entries = max_entries
+        self.disk_cache = disk_cache
+        self.cpu_share = cpu_share
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        # Session id -> generation of its current batch; only sessions with a batch in flight have an entry
+        self._generations = {}
+        self._next_generation = itertools.count(1)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wezterm-prewarm")
+
+    def get(self, config):
+        """Return cached artifacts for a config, or None"""
+        key = artifacts_key(config)
+        with self._lock:
+            artifacts = self._cache.get(key)
+            if artifacts is not None:
+                self._cache.move_to_end(key)
+            return artifacts
+
+    def put(self, config, artifacts):
+        """Store artifacts, evicting the least recently used entries past the bound"""
+        key = artifacts_key(config)
+        with self._lock:
+            self._cache[key] = artifacts
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def get_or_render(self, config):
+        """Return cached artifacts, rendering and storing them on a miss"""
+        artifacts = self.get(config)
+        if artifacts is None:
+            artifacts = self._load_or_render(config)
+            self.put(config, artifacts)
+        return artifacts
+
+    def _load_or_render(self, config):
+        # The disk cache is shared with the other worker processes and survives restarts
+        if self.disk_cache is None:
+            return render_artifacts(config)
+        digest = config_digest(config)
+        preview_html = self.disk_cache.get('preview', digest)
+        lua_code = self.disk_cache.get('lua', digest)
+        if preview_html is not None and lua_code is not None:
+            return PrewarmedArtifacts(preview_html, lua_code)
+        artifacts = render_artifacts(config)
+        self.disk_cache.put('preview', digest, artifacts.preview_html)
+        if artifacts.lua_code is not None:
+            self.disk_cache.put('lua', digest, artifacts.lua_code)
+        return artifacts
+
+    def schedule(self, session_id, config):
+        """Prewarm the neighbours of config, cancelling the session's previous batch"""
+        with self._lock:
+            # Generations are unique across sessions, so a stale batch never becomes current again
+            generation = next(self._next_generation)
+            self._generations[session_id] = generation
+        snapshot = config if isinstance(config, WezTermConfig) else dict(config)
+        return self._executor.submit(self._prewarm, session_id, generation, snapshot)
+
+    def cancel(self, session_id):
+        """Cancel any pending prewarm work for a session"""
+        with self._lock:
+            self._generations.pop(session_id, None)
+
+    def _is_current(self, session_id, generation):
+        with self._lock:
+            return self._generations.get(session_id) == generation
+
+    def _prewarm(self, session_id, generation, config):
+        rendered = 0
+        try:
+            for neighbour in neighbouring_configs(config):
+                if not self._is_current(session_id, generation):
+                    logger.debug(f"Ön ısıtma iptal edildi: {session_id}")
+                    break
+                if self.get(neighbour) is not None:
+                    continue
+
+                started = time.perf_counter()
+                self.put(neighbour, self._load_or_render(neighbour))
+                rendered += 1
+
+                # Keep the background share of CPU time at or below cpu_share
+                elapsed = time.perf_counter() - started
+                time.sleep(elapsed * (1 - self.cpu_share) / self.cpu_share)
+        except Exception as e:
+            logger.error(f"Önizleme ön ısıtma hatası: {e}\n{traceback.format_exc()}")
+        finally:
+            # Sessions come and go on a long-running server; drop the entry once its batch is done
+            with self._lock:
+                if self._generations.get(session_id) == generation:
+                    del self._generations[session_id]
+        return rendered
+
+    def stats(self):
+        """Return cache size information"""
+        with self._lock:
+            stats = {'entries': len(self._cache), 'max_entries': self.max_entries}
+        if self.disk_cache is not None:
+            stats['disk'] = self.disk_cache.stats()
+        return stats
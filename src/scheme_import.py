@@ -0,0 +1,266 @@
+"""Bulk import of color schemes from other terminals.
+
+Reads iTerm2 (``.itermcolors`` plist), base16 (YAML with ``base00`` ..
+``base0F``) and Alacritty (TOML, or the older YAML format) files, normalizes
+each into the scheme catalog format (``{'bg', 'fg', 'prompt'}`` plus the 16
+ANSI colors, like ``COLOR_MAPPINGS`` and ``ANSI_PALETTES``) and writes them to
+the index ``src.themes`` reads (``IMPORTED_SCHEMES_PATH``). Files are parsed in
+a process pool once there are enough of them; schemes whose colors match a
+built-in or already imported one are dropped by palette hash.
+
+    python -m src.scheme_import ~/iTerm2-Color-Schemes/schemes ~/base16-schemes
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import logging
+import argparse
+import plistlib
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+from src.live_apply import atomic_write
+from src.themes import (ANSI_PALETTES, COLOR_MAPPINGS, IMPORTED_SCHEMES_PATH, IMPORTED_SCHEMES_VERSION,
+                        imported_schemes)
+
+logger = logging.getLogger("wezterm_gui")
+
+SCHEME_EXTENSIONS = ('.itermcolors', '.yaml', '.yml', '.toml')
+# Below this many files, starting worker processes costs more than it saves
+MIN_POOL_FILES = 64
+# The preview's prompt color; WezTerm schemes have no such slot, so it is taken from ANSI blue
+PROMPT_ANSI_INDEX = 4
+
+# base16 slot for each ANSI color, the way base16-shell maps them
+BASE16_ANSI = ['base00', 'base08', 'base0B', 'base0A', 'base0D', 'base0E', 'base0C', 'base05',
+               'base03', 'base08', 'base0B', 'base0A', 'base0D', 'base0E', 'base0C', 'base07']
+ALACRITTY_COLOR_NAMES = ['black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white']
+# libyaml's loader is several times faster than the pure Python one when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class SchemeImportError(ValueError):
+    """Bir renk şeması dosyası okunamadığında ya da geçersiz olduğunda fırlatılan hata"""
+
+
+def normalize_color(value):
+    """'#RGB', '#RRGGBB', 'RRGGBB' or '0xRRGGBB' as lowercase '#rrggbb'
+
+    Unquoted 0xRRGGBB in Alacritty YAML loads as an int and is accepted as such.
+    """
+    if isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= 0xffffff:
+        return f"#{value:06x}"
+    if not isinstance(value, str):
+        raise SchemeImportError(f"Renk metin değil: {value!r}")
+    text = value.strip().lower()
+    if text.startswith('0x'):
+        text = text[2:]
+    text = text.lstrip('#')
+    if len(text) == 3:
+        text = ''.join(digit * 2 for digit in text)
+    if len(text) != 6 or any(digit not in '0123456789abcdef' for digit in text):
+        raise SchemeImportError(f"Geçersiz renk: {value!r}")
+    return f"#{text}"
+
+
+def _scheme(name, scheme_format, bg, fg, palette):
+    bg, fg = normalize_color(bg), normalize_color(fg)
+    palette = [normalize_color(color) for color in palette]
+    if len(palette) != 16:
+        raise SchemeImportError(f"16 ANSI rengi yerine {len(palette)} renk var")
+    if bg == fg:
+        raise SchemeImportError("Arka plan ve ön plan rengi aynı")
+    return {'name': name, 'format': scheme_format,
+            'colors': {'bg': bg, 'fg': fg, 'prompt': palette[PROMPT_ANSI_INDEX]}, 'palette': palette}
+
+
+def parse_itermcolors(data, name):
+    """iTerm2 plist: 'Ansi 0 Color' .. 'Ansi 15 Color' with 0-1 float components"""
+    try:
+        plist = plistlib.loads(data)
+    except Exception as e:
+        raise SchemeImportError(f"Plist okunamadı: {e}") from e
+    if not isinstance(plist, dict):
+        raise SchemeImportError("Plist kökü bir sözlük değil")
+
+    def color(key):
+        entry = plist.get(key)
+        if not isinstance(entry, dict):
+            raise SchemeImportError(f"Eksik renk: {key}")
+        try:
+            return '#' + ''.join(f"{round(min(max(float(entry[f'{channel} Component']), 0.0), 1.0) * 255):02x}"
+                                 for channel in ('Red', 'Green', 'Blue'))
+        except (KeyError, TypeError, ValueError) as e:
+            raise SchemeImportError(f"Geçersiz renk: {key}") from e
+    return _scheme(name, 'iterm2', color('Background Color'), color('Foreground Color'),
+                   [color(f"Ansi {index} Color") for index in range(16)])
+
+
+def parse_base16(document, name):
+    """base16/tinted-theming YAML: base00 .. base0F at the top level or under 'palette'"""
+    slots = document.get('palette', document)
+    if not isinstance(slots, dict):
+        raise SchemeImportError("base16 paleti bir eşleme değil")
+    slots = {str(key): value for key, value in slots.items()}
+    missing = sorted(set(BASE16_ANSI) - set(slots))
+    if missing:
+        raise SchemeImportError(f"Eksik base16 renkleri: {', '.join(missing)}")
+    name = document.get('scheme') or document.get('name') or name
+    return _scheme(str(name), 'base16', slots['base00'], slots['base05'], [slots[slot] for slot in BASE16_ANSI])
+
+
+def parse_alacritty(document, name):
+    """Alacritty colors.primary / colors.normal / colors.bright; missing brights repeat the normal colors"""
+    colors = document.get('colors')
+    if not isinstance(colors, dict):
+        raise SchemeImportError("Alacritty 'colors' tablosu yok")
+    primary, normal = colors.get('primary') or {}, colors.get('normal') or {}
+    bright = colors.get('bright') or normal
+    try:
+        palette = [normal[color] for color in ALACRITTY_COLOR_NAMES]
+        palette += [bright[color] for color in ALACRITTY_COLOR_NAMES]
+        return _scheme(name, 'alacritty', primary['background'], primary['foreground'], palette)
+    except (KeyError, TypeError) as e:
+        raise SchemeImportError(f"Eksik Alacritty rengi: {e}") from e
+
+
+def parse_scheme_file(path):
+    """Read one file into {'name', 'format', 'colors', 'palette'}; raises SchemeImportError"""
+    name, extension = os.path.splitext(os.path.basename(path))
+    extension = extension.lower()
+    with open(path, 'rb') as f:
+        data = f.read()
+    if extension == '.itermcolors':
+        return parse_itermcolors(data, name)
+    try:
+        if extension == '.toml':
+            document = tomllib.loads(data.decode('utf-8'))
+        else:
+            document = yaml.load(data, Loader=YAML_LOADER)
+    except (UnicodeDecodeError, tomllib.TOMLDecodeError, yaml.YAMLError) as e:
+        raise SchemeImportError(f"Dosya ayrıştırılamadı: {e}") from e
+    if not isinstance(document, dict):
+        raise SchemeImportError("Dosya bir eşleme içermiyor")
+    if 'colors' in document:
+        return parse_alacritty(document, name)
+    return parse_base16(document, name)
+
+
+def _parse_worker(path):
+    # Worker entry point: errors travel back as text so one bad file does not stop the batch
+    try:
+        return path, parse_scheme_file(path), None
+    except (OSError, SchemeImportError) as e:
+        return path, None, str(e)
+    except Exception as e:
+        # A parser bug on an unusual file is reported like any other failure instead of ending pool.map
+        return path, None, f"Beklenmeyen hata: {type(e).__name__}: {e}"
+
+
+def palette_hash(colors, palette):
+    """Identity of a scheme's colors, independent of its name and source format"""
+    text = '|'.join([colors['bg'].lower(), colors['fg'].lower(), *(color.lower() for color in palette)])
+    return hashlib.sha256(text.encode('ascii')).hexdigest()[:16]
+
+
+def find_scheme_files(paths):
+    """Scheme files under the given files and directories, sorted so imports are deterministic"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, names in os.walk(path):
+                files.extend(os.path.join(directory, name) for name in names
+                             if name.lower().endswith(SCHEME_EXTENSIONS))
+        else:
+            files.append(path)
+    return sorted(files)
+
+
+def _unique_name(name, scheme_format, taken):
+    if name not in taken:
+        return name
+    candidate = f"{name} ({scheme_format})"
+    number = 2
+    while candidate in taken:
+        candidate = f"{name} ({scheme_format} {number})"
+        number += 1
+    return candidate
+
+
+def import_schemes(paths, index_path=None, workers=None):
+    """Parse every scheme file under paths, merge the new ones into the index and return a report
+
+    Re-importing a file replaces the scheme it produced before. workers=0 parses in this process.
+    """
+    started = time.perf_counter()
+    index_path = index_path or IMPORTED_SCHEMES_PATH
+    files = find_scheme_files(paths)
+    if len(files) >= MIN_POOL_FILES and workers != 0:
+        workers = min(workers or os.cpu_count() or 1, len(files))
+        chunksize = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_parse_worker, files, chunksize=chunksize))
+    else:
+        results = [_parse_worker(path) for path in files]
+    parsed_seconds = time.perf_counter() - started
+
+    existing = dict(imported_schemes(index_path))
+    sources = {os.path.abspath(path) for path in files}
+    schemes = {name: scheme for name, scheme in existing.items() if scheme.get('source') not in sources}
+    known = {palette_hash(colors, ANSI_PALETTES.get(name, ANSI_PALETTES['Builtin Dark']))
+             for name, colors in COLOR_MAPPINGS.items()}
+    known.update(scheme['hash'] for scheme in schemes.values())
+
+    report = {'files': len(files), 'imported': 0, 'duplicates': 0, 'failed': []}
+    for path, scheme, error in results:
+        if error is not None:
+            report['failed'].append((path, error))
+            continue
+        digest = palette_hash(scheme['colors'], scheme['palette'])
+        if digest in known:
+            report['duplicates'] += 1
+            continue
+        known.add(digest)
+        name = _unique_name(scheme['name'], scheme['format'], set(COLOR_MAPPINGS) | set(schemes))
+        schemes[name] = {'colors': scheme['colors'], 'palette': scheme['palette'], 'format': scheme['format'],
+                         'source': os.path.abspath(path), 'hash': digest}
+        report['imported'] += 1
+
+    if schemes != existing:
+        atomic_write(index_path, json.dumps({'version': IMPORTED_SCHEMES_VERSION, 'schemes': schemes},
+                                            ensure_ascii=False))
+    report['schemes'] = len(schemes)
+    report['seconds'] = time.perf_counter() - started
+    report['parse_seconds'] = parsed_seconds
+    report['files_per_second'] = len(files) / report['seconds'] if report['seconds'] else 0.0
+    logger.info(f"Şema içe aktarımı: {report['files']} dosya, {report['imported']} içe aktarıldı, "
+                f"{report['duplicates']} yinelenen, {len(report['failed'])} hatalı "
+                f"({report['seconds']:.2f} sn, {report['files_per_second']:.0f} dosya/sn)")
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="iTerm2, base16 ve Alacritty renk şemalarını içe aktar")
+    parser.add_argument('paths', nargs='+', help="Şema dosyaları ya da klasörleri")
+    parser.add_argument('--index', default=IMPORTED_SCHEMES_PATH, help="İçe aktarılan şemaların dizin dosyası")
+    parser.add_argument('--workers', type=int, help="İşçi süreç sayısı (0: süreç havuzu kullanma)")
+    args = parser.parse_args(argv)
+    report = import_schemes(args.paths, args.index, args.workers)
+    for path, error in report['failed']:
+        print(f"{path}: {error}", file=sys.stderr)
+    print(f"{report['files']} dosya: {report['imported']} içe aktarıldı, {report['duplicates']} yinelenen, "
+          f"{len(report['failed'])} hatalı; dizinde {report['schemes']} şema")
+    print(f"{report['seconds']:.2f} sn (ayrıştırma {report['parse_seconds']:.2f} sn), "
+          f"{report['files_per_second']:.0f} dosya/sn")
+
+
+if __name__ == '__main__':
+    main()
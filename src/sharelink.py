@@ -0,0 +1,393 @@
+"""Compact binary share links for configs.
+
+A link carries ``?c=<code>``, where code is the base64url (unpadded) form of:
+
+    version byte
+    varint bit mask of the fields that differ from DEFAULT_CONFIG
+    the differing fields, in WezTermConfig.FIELDS order
+
+Booleans cost nothing beyond their mask bit (a set bit means "flipped").
+Choice fields are varint indices into their option lists (an index one past
+the end is followed by the value as a string), sizes are varints, opacity and
+line height are stored in hundredths, rule and decoration lists are bit sets
+custom colors are three packed RGB triples, list options (key bindings, SSH
+domains, launch menu entries) are a count followed by their entries' strings and
+schema options are written as name plus a value whose encoding follows the option type. The default config encodes
+to three characters and a typical edited one to a dozen or two.
+"""
+import base64
+from functools import lru_cache
+
+from src.config import (DEFAULT_CONFIG, FIELD_RANGES, FONT_OPTIONS, HYPERLINK_RULES, SSH_MULTIPLEXING, KeyBinding, LaunchMenuEntry,
+                        SshDomain)
+from src.model import WezTermConfig, DEFAULT_WEZTERM_CONFIG
+from src.option_schema import OptionSchemaError, check_value, load_option_schema
+from src.themes import COLOR_MAPPINGS
+
+SHARE_LINK_VERSION = 1
+SHARE_PARAM = 'c'
+# Longer codes are not put into the address bar; browsers and proxies start rejecting URLs around 8 KB
+MAX_URL_CODE_LENGTH = 4000
+
+THEMES = ['Dark', 'Light', 'Custom']
+COLOR_SCHEMES = list(COLOR_MAPPINGS) + ['Custom']
+CURSOR_STYLES = ['Block', 'Bar', 'Underline']
+CLOSE_CONFIRMATIONS = ['Never', 'AlwaysPrompt', 'OnlyIfMultipleTabs']
+WINDOW_DECORATIONS = ['TITLE', 'RESIZE', 'MACOS_FORCE_ENABLE_SHADOW', 'INTEGRATED_BUTTONS']
+HYPERLINK_RULE_LABELS = list(HYPERLINK_RULES)
+
+
+class ShareLinkError(ValueError):
+    """Çözülemeyen ya da kodlanamayan paylaşım bağlantısı hatası"""
+
+
+class _Writer:
+    def __init__(self):
+        self.data = bytearray()
+
+    def uvarint(self, value):
+        if value < 0:
+            raise ShareLinkError(f"Negatif değer kodlanamaz: {value}")
+        while value >= 0x80:
+            self.data.append(value & 0x7f | 0x80)
+            value >>= 7
+        self.data.append(value)
+
+    def svarint(self, value):
+        # Zigzag: small negative numbers stay short
+        self.uvarint(value * 2 if value >= 0 else -value * 2 - 1)
+
+    def string(self, value):
+        encoded = value.encode('utf-8')
+        self.uvarint(len(encoded))
+        self.data += encoded
+
+    def optional_string(self, value):
+        if value is None:
+            self.uvarint(0)
+        else:
+            encoded = value.encode('utf-8')
+            self.uvarint(len(encoded) + 1)
+            self.data += encoded
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.position = 0
+
+    def byte(self):
+        if self.position >= len(self.data):
+            raise ShareLinkError("Paylaşım bağlantısı eksik")
+        value = self.data[self.position]
+        self.position += 1
+        return value
+
+    def take(self, count):
+        if self.position + count > len(self.data):
+            raise ShareLinkError("Paylaşım bağlantısı eksik")
+        chunk = self.data[self.position:self.position + count]
+        self.position += count
+        return bytes(chunk)
+
+    def uvarint(self):
+        value = shift = 0
+        while True:
+            byte = self.byte()
+            value |= (byte & 0x7f) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
+            if shift > 63:
+                raise ShareLinkError("Geçersiz sayı")
+
+    def svarint(self):
+        value = self.uvarint()
+        return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+    def string(self):
+        try:
+            return self.take(self.uvarint()).decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise ShareLinkError(f"Geçersiz metin: {e}") from e
+
+    def optional_string(self):
+        length = self.uvarint()
+        if length == 0:
+            return None
+        try:
+            return self.take(length - 1).decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise ShareLinkError(f"Geçersiz metin: {e}") from e
+
+
+def _choice(options):
+    def write(writer, value):
+        if value in options:
+            writer.uvarint(options.index(value))
+        else:
+            writer.uvarint(len(options))
+            writer.string(value)
+
+    def read(reader):
+        index = reader.uvarint()
+        if index == len(options):
+            return reader.string()
+        if index > len(options):
+            raise ShareLinkError(f"Geçersiz seçenek: {index}")
+        return options[index]
+    return write, read
+
+
+def _bit_set(options):
+    def write(writer, values):
+        unknown = set(values) - set(options)
+        if unknown:
+            raise ShareLinkError(f"Kodlanamayan değerler: {', '.join(sorted(unknown))}")
+        writer.uvarint(sum(1 << options.index(value) for value in set(values)))
+
+    def read(reader):
+        mask = reader.uvarint()
+        if mask >> len(options):
+            raise ShareLinkError(f"Geçersiz bit kümesi: {mask}")
+        # Decoded in option order: the generated Lua does not depend on selection order
+        return [value for index, value in enumerate(options) if mask >> index & 1]
+    return write, read
+
+
+def _hundredths():
+    def write(writer, value):
+        writer.uvarint(round(value * 100))
+
+    def read(reader):
+        return reader.uvarint() / 100
+    return write, read
+
+
+def _unsigned():
+    return (lambda writer, value: writer.uvarint(value)), (lambda reader: reader.uvarint())
+
+
+def _optional_string():
+    return (lambda writer, value: writer.optional_string(value)), (lambda reader: reader.optional_string())
+
+
+def _custom_colors():
+    def write(writer, colors):
+        if not colors:
+            writer.uvarint(0)
+            return
+        writer.uvarint(1)
+        for name in ('bg', 'fg', 'prompt'):
+            color = colors[name]
+            try:
+                if len(color) != 7 or color[0] != '#':
+                    raise ValueError(color)
+                writer.data += bytes.fromhex(color[1:])
+            except ValueError:
+                raise ShareLinkError(f"Renk '#rrggbb' biçiminde olmalıdır: {color}") from None
+
+    def read(reader):
+        if reader.uvarint() == 0:
+            return None
+        packed = reader.take(9)
+        return {name: '#' + packed[index * 3:index * 3 + 3].hex()
+                for index, name in enumerate(('bg', 'fg', 'prompt'))}
+    return write, read
+
+
+def _window_position():
+    def write(writer, position):
+        if position is None:
+            writer.uvarint(0)
+            return
+        writer.uvarint(1)
+        writer.svarint(position[0])
+        writer.svarint(position[1])
+
+    def read(reader):
+        if reader.uvarint() == 0:
+            return None
+        return [reader.svarint(), reader.svarint()]
+    return write, read
+
+
+def _key_bindings():
+    def write(writer, bindings):
+        writer.uvarint(len(bindings))
+        for binding in bindings:
+            writer.string(binding.key)
+            writer.string(binding.mods)
+            writer.string(binding.action)
+            writer.optional_string(binding.key_table)
+
+    def read(reader):
+        return [KeyBinding(reader.string(), reader.string(), reader.string(), reader.optional_string())
+                for _ in range(reader.uvarint())]
+    return write, read
+
+
+def _ssh_domains():
+    multiplexing_write, multiplexing_read = _choice(SSH_MULTIPLEXING)
+
+    def write(writer, domains):
+        writer.uvarint(len(domains))
+        for domain in domains:
+            writer.string(domain.name)
+            writer.string(domain.remote_address)
+            writer.string(domain.username)
+            multiplexing_write(writer, domain.multiplexing)
+
+    def read(reader):
+        return [SshDomain(reader.string(), reader.string(), reader.string(), multiplexing_read(reader))
+                for _ in range(reader.uvarint())]
+    return write, read
+
+
+def _launch_menu():
+    def write(writer, entries):
+        writer.uvarint(len(entries))
+        for entry in entries:
+            writer.string(entry.label)
+            writer.uvarint(len(entry.args))
+            for arg in entry.args:
+                writer.string(arg)
+            writer.string(entry.cwd)
+
+    def read(reader):
+        entries = []
+        for _ in range(reader.uvarint()):
+            label = reader.string()
+            args = tuple(reader.string() for _ in range(reader.uvarint()))
+            entries.append(LaunchMenuEntry(label, args, reader.string()))
+        return entries
+    return write, read
+
+
+def _extra_options():
+    # Names rather than schema positions, so links survive options being added to the schema
+    def write(writer, values):
+        schema = load_option_schema()
+        writer.uvarint(len(values))
+        for name, value in values.items():
+            kind = schema.by_name[name].type
+            writer.string(name)
+            if kind == 'bool':
+                writer.uvarint(int(value))
+            elif kind == 'int':
+                writer.svarint(value)
+            elif kind == 'float':
+                writer.string(repr(value))
+            elif kind == 'color':
+                writer.data += bytes.fromhex(value[1:])
+            elif kind in ('string_list', 'enum_list'):
+                writer.uvarint(len(value))
+                for item in value:
+                    writer.string(item)
+            else:
+                writer.string(value)
+
+    def read(reader):
+        schema = load_option_schema()
+        values = {}
+        for _ in range(reader.uvarint()):
+            name = reader.string()
+            spec = schema.by_name.get(name)
+            if spec is None or spec.builtin:
+                raise ShareLinkError(f"Bilinmeyen seçenek: {name}")
+            if spec.type == 'bool':
+                value = bool(reader.uvarint())
+            elif spec.type == 'int':
+                value = reader.svarint()
+            elif spec.type == 'float':
+                try:
+                    value = float(reader.string())
+                except ValueError as e:
+                    raise ShareLinkError(f"Geçersiz sayı: {e}") from e
+            elif spec.type == 'color':
+                value = '#' + reader.take(3).hex()
+            elif spec.type in ('string_list', 'enum_list'):
+                value = [reader.string() for _ in range(reader.uvarint())]
+            else:
+                value = reader.string()
+            try:
+                values[name] = check_value(spec, value)
+            except OptionSchemaError as e:
+                raise ShareLinkError(str(e)) from e
+        return values
+    return write, read
+
+
+# Field -> (write, read); booleans are absent, their mask bit is the whole encoding
+FIELD_CODECS = {
+    'theme': _choice(THEMES),
+    'font': _choice(FONT_OPTIONS),
+    'font_size': _unsigned(),
+    'color_scheme': _choice(COLOR_SCHEMES),
+    'custom_colors': _custom_colors(),
+    'opacity': _hundredths(),
+    'default_cursor_style': _choice(CURSOR_STYLES),
+    'padding': _unsigned(),
+    'line_height': _hundredths(),
+    'hyperlinkRules': _bit_set(HYPERLINK_RULE_LABELS),
+    'leader_key': _optional_string(),
+    'window_width': _unsigned(),
+    'window_height': _unsigned(),
+    'window_decorations': _bit_set(WINDOW_DECORATIONS),
+    'window_position': _window_position(),
+    'window_close_confirmation': _choice(CLOSE_CONFIRMATIONS),
+    'keys': _key_bindings(),
+    'extra_options': _extra_options(),
+    'ssh_domains': _ssh_domains(),
+    'launch_menu': _launch_menu(),
+}
+BOOLEAN_FIELDS = frozenset(name for name, value in DEFAULT_CONFIG.items() if isinstance(value, bool))
+
+
+def encode_config(config):
+    """Share code (base64url, no padding) for a config"""
+    return _encode_config(WezTermConfig.from_mapping(config))
+
+
+# The app encodes the current config on every rerun; with long list options that would be O(entries) each time
+@lru_cache(maxsize=32)
+def _encode_config(config):
+    writer = _Writer()
+    writer.uvarint(SHARE_LINK_VERSION)
+    changed = set(config.changed_fields(DEFAULT_WEZTERM_CONFIG))
+    writer.uvarint(sum(1 << index for index, name in enumerate(WezTermConfig.FIELDS) if name in changed))
+    for name in WezTermConfig.FIELDS:
+        if name in changed and name not in BOOLEAN_FIELDS:
+            FIELD_CODECS[name][0](writer, config[name])
+    return base64.urlsafe_b64encode(bytes(writer.data)).rstrip(b'=').decode('ascii')
+
+
+def decode_config(code):
+    """Config from a share code; raises ShareLinkError for anything malformed"""
+    code = code.strip()
+    try:
+        data = base64.urlsafe_b64decode(code + '=' * (-len(code) % 4))
+    except (ValueError, TypeError) as e:
+        raise ShareLinkError(f"Geçersiz paylaşım bağlantısı: {e}") from e
+    reader = _Reader(data)
+    version = reader.uvarint()
+    if version != SHARE_LINK_VERSION:
+        raise ShareLinkError(f"Desteklenmeyen paylaşım bağlantısı sürümü: {version}")
+    mask = reader.uvarint()
+    if mask >> len(WezTermConfig.FIELDS):
+        raise ShareLinkError("Geçersiz alan maskesi")
+    changes = {}
+    for index, name in enumerate(WezTermConfig.FIELDS):
+        if not mask >> index & 1:
+            continue
+        if name in BOOLEAN_FIELDS:
+            changes[name] = not DEFAULT_CONFIG[name]
+        else:
+            changes[name] = FIELD_CODECS[name][1](reader)
+    if reader.position != len(data):
+        raise ShareLinkError("Paylaşım bağlantısının sonunda fazladan veri var")
+    # A link can carry any number; it must not get past the bounds the sidebar enforces
+    for name, (low, high) in FIELD_RANGES.items():
+        if name in changes and not low <= changes[name] <= high:
+            raise ShareLinkError(f"'{name}' aralık dışında: {changes[name]} ({low}–{high})")
+    return DEFAULT_WEZTERM_CONFIG.replace(**changes)
@@ -0,0 +1,118 @@
+"""Static export: the configurator as plain HTML/JS, with no Python server behind it.
+
+``python -m src.static_export --output dist`` writes a directory that any
+static file server can host:
+
+    index.html          page shell with the export data embedded
+    wezterm_config.js   Lua and preview generation (static/export/)
+    static_app.js       form controls and wiring (static/export/)
+    terminal.js         the preview runtime the app already serves
+    styles.css          the app's stylesheet
+
+Generation runs in the browser. Everything the JavaScript needs besides its
+logic (defaults, fonts, schemes and palettes, hyperlink rules, leader
+bindings, the option schema, the color math constants and the preview HTML
+templates) is read from the Python modules here, so both sides render from
+one source; tests/test_basic.py checks them against each other under Node.
+"""
+import os
+import json
+import shutil
+import logging
+import argparse
+
+from src.colormath import (ANSI_HUES, BRIGHT_BLACK_CONTRAST, CONTRAST_MARGIN, HUE_PULL, MAX_CHROMA, MIN_CHROMA,
+                           NEUTRAL_CHROMA, NORMAL_CONTRAST, SELECTION_MIX, _LINEAR_FROM_LMS, _LMS_FROM_LINEAR,
+                           _LMS_FROM_OKLAB, _LUMINANCE, _OKLAB_FROM_LMS)
+from src.config import (DEFAULT_CONFIG, DEFAULT_CURSOR_STYLE_MAP, FONT_OPTIONS, HYPERLINK_RULES,
+                        LEADER_KEY_BINDINGS)
+from src.keybindings import MODIFIER_BITS
+from src.lua import INLINE_TABLE_WIDTH
+from src.ansi import ansi_css
+from src.option_schema import load_option_schema
+from src.themes import ANSI_PALETTES, COLOR_MAPPINGS
+from src.terminal import (CONFIG_TAG_TEMPLATE, CURSOR_STYLE_TEMPLATES, PREVIEW_TEMPLATE, RUNTIME_TAG_TEMPLATE,
+                          SCROLLBAR_TEMPLATE, TAB_BAR_TEMPLATE, TAB_CLOSE_BUTTON, TERMINAL_RUNTIME_PATH,
+                          generate_banner, get_terminal_runtime_version)
+
+logger = logging.getLogger("wezterm_gui")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXPORT_SOURCE_DIR = os.path.join(ROOT_DIR, "static", "export")
+STYLES_PATH = os.path.join(ROOT_DIR, "assets", "styles.css")
+EXPORT_DATA_MARKER = "__WEZTERM_EXPORT_DATA__"
+
+# Config fields Python holds as floats; JavaScript numbers need the hint to print 1.0 rather than 1
+FLOAT_FIELDS = ['opacity', 'line_height']
+
+
+def export_data(runtime_src=None):
+    """Everything wezterm_config.js and static_app.js read besides their own code"""
+    schema = load_option_schema()
+    return {
+        'defaultConfig': DEFAULT_CONFIG,
+        'fontOptions': FONT_OPTIONS,
+        'floatFields': FLOAT_FIELDS,
+        'cursorStyleMap': DEFAULT_CURSOR_STYLE_MAP,
+        'hyperlinkRules': [[label, *rule] for label, rule in HYPERLINK_RULES.items()],
+        'leaderKeyBindings': [binding._asdict() for binding in LEADER_KEY_BINDINGS],
+        'modifiers': sorted(name for name in MODIFIER_BITS if name),
+        'inlineTableWidth': INLINE_TABLE_WIDTH,
+        'options': [{'name': spec.name, 'category': spec.category, 'type': spec.type,
+                     'default': list(spec.default) if isinstance(spec.default, tuple) else spec.default,
+                     'min': spec.min_value, 'max': spec.max_value, 'step': spec.step, 'options': spec.options,
+                     'description': spec.description, 'depends_on': spec.depends_on}
+                    for spec in schema.editable()],
+        'colorMappings': COLOR_MAPPINGS,
+        'ansiPalettes': ANSI_PALETTES,
+        'colormath': {
+            'ansiHues': ANSI_HUES.tolist(), 'huePull': HUE_PULL, 'minChroma': MIN_CHROMA, 'maxChroma': MAX_CHROMA,
+            'normalContrast': NORMAL_CONTRAST, 'brightBlackContrast': BRIGHT_BLACK_CONTRAST,
+            'contrastMargin': CONTRAST_MARGIN, 'neutralChroma': NEUTRAL_CHROMA, 'selectionMix': SELECTION_MIX,
+            'luminance': _LUMINANCE.tolist(),
+            'matrices': {'lmsFromLinear': _LMS_FROM_LINEAR.tolist(), 'oklabFromLms': _OKLAB_FROM_LMS.tolist(),
+                         'lmsFromOklab': _LMS_FROM_OKLAB.tolist(), 'linearFromLms': _LINEAR_FROM_LMS.tolist()},
+        },
+        'templates': {
+            'preview': PREVIEW_TEMPLATE, 'tabBar': TAB_BAR_TEMPLATE, 'tabCloseButton': TAB_CLOSE_BUTTON,
+            'scrollbar': SCROLLBAR_TEMPLATE, 'cursorStyles': CURSOR_STYLE_TEMPLATES,
+            'configTag': CONFIG_TAG_TEMPLATE, 'runtimeTag': RUNTIME_TAG_TEMPLATE,
+        },
+        'ansiCss': ansi_css(),
+        'banner': generate_banner(),
+        'runtimeSrc': runtime_src or f"terminal.js?v={get_terminal_runtime_version()}",
+    }
+
+
+def export_static_site(output_dir):
+    """Write the static bundle into output_dir; returns the written file names"""
+    os.makedirs(output_dir, exist_ok=True)
+    # "</" would close the embedding script element early
+    data_json = json.dumps(export_data(), ensure_ascii=False).replace('</', '<\\/')
+    with open(os.path.join(EXPORT_SOURCE_DIR, "index.html"), encoding='utf-8') as f:
+        page = f.read()
+    if EXPORT_DATA_MARKER not in page:
+        raise ValueError(f"index.html şablonunda {EXPORT_DATA_MARKER} işareti yok")
+    with open(os.path.join(output_dir, "index.html"), 'w', encoding='utf-8') as f:
+        f.write(page.replace(EXPORT_DATA_MARKER, data_json))
+
+    written = ["index.html"]
+    for source in (os.path.join(EXPORT_SOURCE_DIR, "wezterm_config.js"),
+                   os.path.join(EXPORT_SOURCE_DIR, "static_app.js"), TERMINAL_RUNTIME_PATH, STYLES_PATH):
+        shutil.copyfile(source, os.path.join(output_dir, os.path.basename(source)))
+        written.append(os.path.basename(source))
+    logger.info(f"Statik dışa aktarım yazıldı: {output_dir} ({len(written)} dosya)")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the configurator as a static HTML/JS site")
+    parser.add_argument('--output', default='dist', help="output directory (default: dist)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    for name in export_static_site(args.output):
+        print(os.path.join(args.output, name))
+
+
+if __name__ == '__main__':
+    main()
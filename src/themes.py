@@ -1,3 +1,17 @@
+import os
+import json
+import logging
+
+from src.colormath import derive_palette
+
+logger = logging.getLogger("wezterm_gui")
+
+# Written by src/scheme_import.py; schemes there are used wherever a built-in name is not found
+IMPORTED_SCHEMES_PATH = os.environ.get("WEZTERM_GUI_SCHEMES", os.path.join(
+    os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config"), "wezterm-gui",
+    "schemes.json"))
+IMPORTED_SCHEMES_VERSION = 1
+
 COLOR_MAPPINGS = {
     'Builtin Dark': {'bg': '#121212', 'fg': '#d0d0d0', 'prompt': '#5fafff'},
     'Builtin Light': {'bg': '#f0f0f0', 'fg': '#333333', 'prompt': '#0087af'},
@@ -9,14 +23,99 @@ COLOR_MAPPINGS = {
     'Nord': {'bg': '#2e3440', 'fg': '#d8dee9', 'prompt': '#88c0d0'}
 }
 
+# ANSI colors 0-15 (normal then bright) for each scheme
+_WEZTERM_DEFAULT_ANSI = [
+    '#000000', '#cc5555', '#55cc55', '#cdcd55', '#5455cb', '#cc55cc', '#7acaca', '#cccccc',
+    '#555555', '#ff5555', '#55ff55', '#ffff55', '#5555ff', '#ff55ff', '#55ffff', '#ffffff',
+]
+_SOLARIZED_ANSI = [
+    '#073642', '#dc322f', '#859900', '#b58900', '#268bd2', '#d33682', '#2aa198', '#eee8d5',
+    '#002b36', '#cb4b16', '#586e75', '#657b83', '#839496', '#6c71c4', '#93a1a1', '#fdf6e3',
+]
+
+ANSI_PALETTES = {
+    'Builtin Dark': _WEZTERM_DEFAULT_ANSI,
+    'Builtin Light': _WEZTERM_DEFAULT_ANSI,
+    'Gruvbox': [
+        '#282828', '#cc241d', '#98971a', '#d79921', '#458588', '#b16286', '#689d6a', '#a89984',
+        '#928374', '#fb4934', '#b8bb26', '#fabd2f', '#83a598', '#d3869b', '#8ec07c', '#ebdbb2',
+    ],
+    'Dracula': [
+        '#21222c', '#ff5555', '#50fa7b', '#f1fa8c', '#bd93f9', '#ff79c6', '#8be9fd', '#f8f8f2',
+        '#6272a4', '#ff6e6e', '#69ff94', '#ffffa5', '#d6acff', '#ff92df', '#a4ffff', '#ffffff',
+    ],
+    'Monokai': [
+        '#272822', '#f92672', '#a6e22e', '#f4bf75', '#66d9ef', '#ae81ff', '#a1efe4', '#f8f8f2',
+        '#75715e', '#f92672', '#a6e22e', '#f4bf75', '#66d9ef', '#ae81ff', '#a1efe4', '#f9f8f5',
+    ],
+    'Solarized Dark': _SOLARIZED_ANSI,
+    'Solarized Light': _SOLARIZED_ANSI,
+    'Nord': [
+        '#3b4252', '#bf616a', '#a3be8c', '#ebcb8b', '#81a1c1', '#b48ead', '#88c0d0', '#e5e9f0',
+        '#4c566a', '#bf616a', '#a3be8c', '#ebcb8b', '#81a1c1', '#b48ead', '#8fbcbb', '#eceff4',
+    ],
+}
+
 THEME_COLOR_SCHEME_MAPPING = {
     'Dark': 'Builtin Dark',
     'Light': 'Builtin Light',
     'Custom': 'Custom'
 }
 
+_imported_cache = {}
+
+
+def imported_schemes(path=None):
+    """{name: {'colors', 'palette', 'format', 'source', 'hash'}} from the import index, reread only when it changes"""
+    path = path or IMPORTED_SCHEMES_PATH
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    cached = _imported_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"İçe aktarılan şemalar okunamadı: {path}: {e}")
+        data = {}
+    schemes = data.get('schemes', {}) if data.get('version') == IMPORTED_SCHEMES_VERSION else {}
+    _imported_cache[path] = (mtime, schemes)
+    return schemes
+
+
+def imported_scheme(color_scheme):
+    """The imported scheme behind a name that is not built in, or None"""
+    if color_scheme in COLOR_MAPPINGS:
+        return None
+    return imported_schemes().get(color_scheme)
+
+
+def scheme_names():
+    """Built-in scheme names followed by the imported ones in alphabetical order"""
+    imported = sorted((name for name in imported_schemes() if name not in COLOR_MAPPINGS), key=str.lower)
+    return list(COLOR_MAPPINGS) + imported
+
+
 def get_colors_for_theme(theme, color_scheme, custom_colors=None):
     """Get color values based on theme and color scheme"""
     if theme == "Custom" and custom_colors:
         return custom_colors
-    return COLOR_MAPPINGS.get(color_scheme, COLOR_MAPPINGS['Builtin Dark'])
+    if color_scheme in COLOR_MAPPINGS:
+        return COLOR_MAPPINGS[color_scheme]
+    scheme = imported_scheme(color_scheme)
+    return scheme['colors'] if scheme else COLOR_MAPPINGS['Builtin Dark']
+
+def get_ansi_palette(theme, color_scheme, custom_colors=None):
+    """Get the 16 ANSI colors for a theme and color scheme"""
+    if theme == "Custom":
+        if custom_colors:
+            palette = derive_palette(custom_colors)
+            return palette['ansi'] + palette['brights']
+        return ANSI_PALETTES['Builtin Dark']
+    if color_scheme in ANSI_PALETTES:
+        return ANSI_PALETTES[color_scheme]
+    scheme = imported_scheme(color_scheme)
+    return scheme['palette'] if scheme else ANSI_PALETTES['Builtin Dark']
@@ -1,24 +1,37 @@
 import os
 import json
 import logging
+from functools import lru_cache
 import streamlit as st
 import streamlit.components.v1 as components
 
+from src.model import WezTermConfig
+from src.themes import get_ansi_palette
+
 logger = logging.getLogger("wezterm_gui")
 
+@lru_cache(maxsize=1)
+def css_markup():
+    """The stylesheet as a <style> element, read from disk once per process"""
+    project_root = os.path.dirname(os.path.dirname(__file__))
+    css_path = os.path.join(project_root, "assets", "styles.css")
+    with open(css_path) as f:
+        return f"<style>{f.read()}</style>"
+
 def load_css():
     """Load custom CSS"""
     try:
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        css_path = os.path.join(project_root, "assets", "styles.css")
-        with open(css_path) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+        st.markdown(css_markup(), unsafe_allow_html=True)
     except Exception as e:
         logger.error(f"CSS yüklenirken hata: {e}")
         st.warning("Arayüz stilleri yüklenemedi.")
 
 def config_has_changed(new_config, current_config):
     """Check if config has changed significantly from current state"""
+    if isinstance(new_config, WezTermConfig) and isinstance(current_config, WezTermConfig):
+        # Precomputed hashes make the common "changed" case O(1)
+        return new_config != current_config
+
     if isinstance(new_config.get('custom_colors'), dict) and isinstance(current_config.get('custom_colors'), dict):
         if str(new_config['custom_colors']) != str(current_config['custom_colors']):
             return True
@@ -53,7 +66,8 @@ def update_terminal_js(config, theme_colors):
         'padding': config['padding'],
         'opacity': config['opacity'],
         'enableTabBar': config['enable_tab_bar'],
-        'enableScrollBar': config['enable_scroll_bar']
+        'enableScrollBar': config['enable_scroll_bar'],
+        'palette': get_ansi_palette(config['theme'], config['color_scheme'], config.get('custom_colors'))
     }
     
     js_code = f"if (window.updateTerminalConfig) {{ window.updateTerminalConfig('{json.dumps(js_update)}'); }}"
@@ -0,0 +1,91 @@
+"""Process-wide warm start for new sessions.
+
+Everything a new browser session reads but never changes is built once per
+process and shared: the session state defaults, the stylesheet markup and the
+preview and Lua code of the default config, which go into the prewarmer so
+that a new session's first preview is a memory hit, and the hyperlink rule
+warnings of the default rules, whose profiling spawns a backtracking probe
+process and is by far the slowest part of a cold first run. A session then only
+allocates its own small mutable state (copies of the few dict/list defaults,
+its history and its ids).
+
+``python -m src.warm_start`` renders the default artifacts and rule warnings
+into the shared on-disk artifact cache ahead of time (e.g. in a deploy step), so even the
+first session of a freshly started process does not render them.
+"""
+import copy
+import json
+import time
+import logging
+import argparse
+from types import MappingProxyType
+from collections import namedtuple
+
+from src.artifact_cache import ArtifactCache, ARTIFACT_CACHE_DIR, artifact_key
+from src.config import DEFAULT_CONFIG
+from src.hyperlink_profiler import builtin_rules, check_rules
+from src.model import DEFAULT_WEZTERM_CONFIG
+from src.prewarm import PreviewPrewarmer
+from src.utils import css_markup
+
+logger = logging.getLogger("wezterm_gui")
+
+# Session keys besides the config fields, with the value a new session starts from
+SESSION_EXTRAS = {
+    'selected_color_scheme': 'Builtin Dark',
+    'widget_revision': 0,
+    'terminal_key': 0,
+    'current_config': DEFAULT_WEZTERM_CONFIG,
+}
+
+WarmStart = namedtuple('WarmStart', ['session_defaults', 'default_artifacts', 'build_seconds'])
+
+
+def hyperlink_rule_warnings(labels, disk_cache=None):
+    """Warnings for the built-in rules with these labels, kept in the disk cache when one is given
+
+    The slowdown warnings depend on this machine's timings, which is fine for
+    a cache that lives on this machine and is keyed by the code fingerprint.
+    """
+    key = artifact_key('warnings', sorted(labels))
+    if disk_cache is not None:
+        cached = disk_cache.get('warnings', key)
+        if cached is not None:
+            return json.loads(cached)
+    warnings = check_rules(builtin_rules(labels))
+    if disk_cache is not None:
+        disk_cache.put('warnings', key, json.dumps(warnings, ensure_ascii=False))
+    return warnings
+
+
+def build_warm_start(prewarmer):
+    """Build the shared start state, rendering the default config's artifacts into prewarmer"""
+    started = time.perf_counter()
+    session_defaults = MappingProxyType({**copy.deepcopy(DEFAULT_CONFIG), **SESSION_EXTRAS})
+    css_markup()
+    hyperlink_rule_warnings(tuple(DEFAULT_CONFIG['hyperlinkRules']), prewarmer.disk_cache)
+    default_artifacts = prewarmer.get_or_render(DEFAULT_WEZTERM_CONFIG)
+    build_seconds = time.perf_counter() - started
+    logger.info(f"Süreç geneli hazırlık tamamlandı ({build_seconds * 1e3:.0f} ms)")
+    return WarmStart(session_defaults, default_artifacts, build_seconds)
+
+
+def session_value(value):
+    """A session's own copy of a default: mutable containers are copied, everything else is shared"""
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the default config's artifacts into the artifact cache")
+    parser.add_argument('--dir', default=ARTIFACT_CACHE_DIR)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    cache = ArtifactCache(args.dir)
+    warm_start = build_warm_start(PreviewPrewarmer(disk_cache=cache))
+    total = cache.stats()['total']
+    print(f"{args.dir}: {total['writes']} yazıldı, {total['hits']} zaten vardı "
+          f"({warm_start.build_seconds * 1e3:.0f} ms)")
+
+
+if __name__ == '__main__':
+    main()
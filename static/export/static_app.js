@@ -0,0 +1,332 @@
+// WezTerm Configurator - form controls of the static export.
+// Mirrors the Streamlit sidebar in app.py; every change regenerates the Lua
+// code and the preview in the browser through wezterm_config.js.
+(function () {
+    "use strict";
+
+    const data = JSON.parse(document.getElementById("wezterm-export-data").textContent);
+    const generator = WezTermConfig.create(data);
+    const state = JSON.parse(JSON.stringify(data.defaultConfig));
+    const controls = document.getElementById("controls");
+
+    // The preview iframe is rebuilt at most this often while a slider is dragged
+    const PREVIEW_DEBOUNCE_MS = 150;
+    const THEMES = ["Dark", "Light", "Custom"];
+    const THEME_COLOR_SCHEMES = { Dark: "Builtin Dark", Light: "Builtin Light" };
+    const CURSOR_STYLES = ["Block", "Bar", "Underline"];
+    const WINDOW_DECORATIONS = ["TITLE", "RESIZE", "MACOS_FORCE_ENABLE_SHADOW", "INTEGRATED_BUTTONS"];
+    const CLOSE_CONFIRMATIONS = ["Never", "AlwaysPrompt", "OnlyIfMultipleTabs"];
+
+    // --- Small DOM helpers ---
+
+    function element(tag, attributes = {}, children = []) {
+        const node = document.createElement(tag);
+        for (const [name, value] of Object.entries(attributes)) {
+            if (name === "text") node.textContent = value;
+            else if (value !== null && value !== undefined && value !== false) node.setAttribute(name, value === true ? "" : value);
+        }
+        for (const child of children) node.append(child);
+        return node;
+    }
+
+    function field(container, label, input, help) {
+        const row = element("label", { class: "field" }, [element("span", { text: label }), input]);
+        if (help) row.title = help;
+        container.append(row);
+        return row;
+    }
+
+    function select(container, label, options, value, onChange, help) {
+        const input = element("select", {}, options.map(option => element("option", { value: option, text: option, selected: option === value })));
+        input.addEventListener("change", () => onChange(input.value));
+        return field(container, label, input, help);
+    }
+
+    function checkbox(container, label, value, onChange, help) {
+        const input = element("input", { type: "checkbox", checked: Boolean(value) });
+        input.addEventListener("change", () => onChange(input.checked));
+        const row = field(container, label, input, help);
+        row.classList.add("field-checkbox");
+        return row;
+    }
+
+    function range(container, label, min, max, step, value, onChange) {
+        const input = element("input", { type: "range", min, max, step, value });
+        const output = element("output", { text: String(value) });
+        input.addEventListener("input", () => {
+            output.textContent = input.value;
+            onChange(parseFloat(input.value));
+        });
+        const row = field(container, label, input);
+        row.append(output);
+        return row;
+    }
+
+    function number(container, label, value, onChange, { min, max, step, integer = true, help } = {}) {
+        const input = element("input", { type: "number", min, max, step: step ?? (integer ? 1 : "any"), value });
+        input.addEventListener("input", () => {
+            const parsed = integer ? parseInt(input.value, 10) : parseFloat(input.value);
+            if (!Number.isNaN(parsed)) onChange(parsed);
+        });
+        return field(container, label, input, help);
+    }
+
+    function text(container, label, value, onChange, help) {
+        const input = element("input", { type: "text", value: value ?? "" });
+        input.addEventListener("input", () => onChange(input.value));
+        return field(container, label, input, help);
+    }
+
+    function color(container, label, value, onChange, help) {
+        const input = element("input", { type: "color", value });
+        input.addEventListener("input", () => onChange(input.value));
+        return field(container, label, input, help);
+    }
+
+    function checklist(container, label, options, values, onChange, help) {
+        const group = element("fieldset", { class: "checklist" }, [element("legend", { text: label })]);
+        if (help) group.title = help;
+        const selected = new Set(values);
+        for (const option of options) {
+            const input = element("input", { type: "checkbox", checked: selected.has(option) });
+            input.addEventListener("change", () => {
+                if (input.checked) selected.add(option); else selected.delete(option);
+                // Kept in option order, like the app
+                onChange(options.filter(item => selected.has(item)));
+            });
+            group.append(element("label", {}, [input, element("span", { text: option })]));
+        }
+        container.append(group);
+        return group;
+    }
+
+    function section(title) {
+        const container = element("section", {}, [element("h2", { text: title })]);
+        controls.append(container);
+        return container;
+    }
+
+    const show = (node, visible) => { node.hidden = !visible; };
+
+    // --- Key bindings editor (parse_binding_line in src/keybindings.py) ---
+
+    const MODIFIERS = new Set(["", ...data.modifiers]);
+
+    function parseBindingLine(line) {
+        const arrow = line.indexOf("->");
+        const action = arrow >= 0 ? line.slice(arrow + 2).trim() : "";
+        if (arrow < 0 || !action) throw new Error(`Satır 'MOD + TUŞ -> aksiyon' biçiminde olmalıdır: ${line}`);
+        let chord = line.slice(0, arrow).trim();
+        let mods, key;
+        if (chord.endsWith("+") && chord.replace(/[+ ]+$/, "") !== chord.replace(/ +$/, "")) {
+            // The key itself is '+', e.g. 'CTRL + +'
+            mods = chord.slice(0, -1).trimEnd().replace(/\++$/, "");
+            key = "+";
+        } else {
+            const plus = chord.lastIndexOf("+");
+            [mods, key] = plus >= 0 ? [chord.slice(0, plus), chord.slice(plus + 1)] : ["", chord];
+        }
+        key = key.trim();
+        mods = mods.trim();
+        if (!key) throw new Error(`Tuş eksik: ${line}`);
+        for (const mod of mods.replaceAll("+", "|").split("|")) {
+            if (!MODIFIERS.has(mod.trim().toUpperCase())) throw new Error(`Bilinmeyen değiştirici tuş: ${mod}`);
+        }
+        return { key, mods: mods.replaceAll(" ", "").replaceAll("+", "|"), action, key_table: null };
+    }
+
+    // --- Sections ---
+
+    function renderThemeSettings() {
+        const container = section("Tema Ayarları");
+        const colors = { ...data.defaultConfig.custom_colors };
+        let scheme, customColors;
+        select(container, "Tema", THEMES, state.theme, value => {
+            state.theme = value;
+            state.color_scheme = value === "Custom" ? "Custom" : THEME_COLOR_SCHEMES[value];
+            state.custom_colors = value === "Custom" ? { ...colors } : null;
+            scheme.querySelector("select").value = state.color_scheme;
+            show(scheme, value !== "Custom");
+            show(customColors, value === "Custom");
+            update();
+        });
+        select(container, "Yazı Tipi", data.fontOptions, state.font, value => { state.font = value; update(); });
+        range(container, "Yazı Boyutu", 8, 32, 1, state.font_size, value => { state.font_size = value; update(); });
+        scheme = select(container, "Renk Şeması", Object.keys(data.colorMappings), state.color_scheme,
+            value => { state.color_scheme = value; update(); });
+        range(container, "Pencere Opaklığı", 0.5, 1.0, 0.01, state.opacity, value => { state.opacity = value; update(); });
+
+        customColors = element("div", {}, [element("h3", { text: "Özel Renk Ayarları" })]);
+        for (const [key, label] of [["bg", "Arka Plan Rengi"], ["fg", "Yazı Rengi"], ["prompt", "Prompt Rengi"]]) {
+            color(customColors, label, colors[key], value => {
+                colors[key] = value;
+                state.custom_colors = { ...colors };
+                update();
+            });
+        }
+        container.append(customColors);
+        show(customColors, state.theme === "Custom");
+        if (state.theme !== "Custom") state.custom_colors = null;
+    }
+
+    function renderTerminalOptions() {
+        const container = section("Terminal Seçenekleri");
+        checkbox(container, "Sekme Çubuğunu Etkinleştir", state.enable_tab_bar, value => { state.enable_tab_bar = value; update(); });
+        checkbox(container, "Kaydırma Çubuğunu Etkinleştir", state.enable_scroll_bar, value => { state.enable_scroll_bar = value; update(); });
+        select(container, "İmleç Stili", CURSOR_STYLES, state.default_cursor_style, value => { state.default_cursor_style = value; update(); });
+
+        const advanced = element("details", {}, [element("summary", { text: "Gelişmiş Seçenekler" })]);
+        container.append(advanced);
+        range(advanced, "Dolgu", 0, 20, 1, state.padding, value => { state.padding = value; update(); });
+        range(advanced, "Satır Yüksekliği", 0.8, 2.0, 0.1, state.line_height, value => { state.line_height = value; update(); });
+        checkbox(advanced, "Süslü Sekme Çubuğunu Kullan", state.use_fancy_tab_bar, value => { state.use_fancy_tab_bar = value; update(); });
+        checklist(advanced, "Bağlantı Kuralları", data.hyperlinkRules.map(rule => rule[0]), state.hyperlinkRules,
+            value => { state.hyperlinkRules = value; update(); });
+        const leaderWarning = element("p", { class: "warning", hidden: true });
+        text(advanced, "Lider Tuşu", state.leader_key, value => {
+            state.leader_key = value || null;
+            leaderWarning.textContent = "Lider tuşu formatı 'MOD + TUŞ' şeklinde olmalıdır, örneğin 'CTRL + a'";
+            show(leaderWarning, Boolean(value) && !value.includes("+"));
+            update();
+        });
+        advanced.append(leaderWarning);
+
+        const bindingsInput = element("textarea", { rows: 4, placeholder: "CTRL|SHIFT + t -> act.SpawnTab 'DefaultDomain'" });
+        const bindingWarnings = element("div", { class: "warning" });
+        bindingsInput.addEventListener("input", () => {
+            const bindings = [], warnings = [];
+            bindingsInput.value.split("\n").forEach((line, index) => {
+                if (!line.trim() || line.trimStart().startsWith("--")) return;
+                try {
+                    bindings.push(parseBindingLine(line));
+                } catch (error) {
+                    warnings.push(`Satır ${index + 1}: ${error.message}`);
+                }
+            });
+            bindingWarnings.replaceChildren(...warnings.map(warning => element("p", { text: warning })));
+            state.keys = bindings;
+            update();
+        });
+        field(advanced, "Tuş Atamaları", bindingsInput, "Her satıra bir atama: MOD + TUŞ -> aksiyon");
+        advanced.append(bindingWarnings);
+    }
+
+    function renderWindowOptions() {
+        const container = section("Pencere Özellikleri");
+        number(container, "Pencere Genişliği (pixel)", state.window_width, value => { state.window_width = value; update(); },
+            { min: 400, max: 3840, step: 50 });
+        number(container, "Pencere Yüksekliği (pixel)", state.window_height, value => { state.window_height = value; update(); },
+            { min: 300, max: 2160, step: 50 });
+        checklist(container, "Pencere Dekorasyonları", WINDOW_DECORATIONS, state.window_decorations,
+            value => { state.window_decorations = value; update(); });
+
+        const position = [0, 0];
+        const positionFields = element("div", { class: "columns" });
+        number(positionFields, "X Pozisyonu", 0, value => { position[0] = value; state.window_position = [...position]; update(); }, { step: 10 });
+        number(positionFields, "Y Pozisyonu", 0, value => { position[1] = value; state.window_position = [...position]; update(); }, { step: 10 });
+        checkbox(container, "Başlangıç Pozisyonu Belirle", state.window_position !== null, value => {
+            state.window_position = value ? [...position] : null;
+            show(positionFields, value);
+            update();
+        });
+        container.append(positionFields);
+        show(positionFields, state.window_position !== null);
+
+        checkbox(container, "Pencere Başlangıçta Maksimize", state.window_maximized, value => { state.window_maximized = value; update(); });
+        checkbox(container, "Pencere Başlangıçta Tam Ekran", state.window_fullscreen, value => { state.window_fullscreen = value; update(); });
+        checkbox(container, "Her Zaman Üstte", state.window_always_on_top, value => { state.window_always_on_top = value; update(); });
+        select(container, "Kapatma Onayı", CLOSE_CONFIRMATIONS, state.window_close_confirmation,
+            value => { state.window_close_confirmation = value; update(); });
+        checkbox(container, "Tek Sekme Varsa Sekme Çubuğunu Gizle", state.window_hide_tab_bar_if_only_one_tab,
+            value => { state.window_hide_tab_bar_if_only_one_tab = value; update(); });
+    }
+
+    // Schema options: values[name] holds what the widget shows, state.extra_options only non-defaults
+    function renderSchemaOptions() {
+        const container = section("Diğer Seçenekler");
+        const values = Object.fromEntries(data.options.map(spec => [spec.name, spec.default]));
+        const rows = new Map();
+        const categories = new Map();
+        for (const spec of data.options) {
+            if (!categories.has(spec.category)) categories.set(spec.category, []);
+            categories.get(spec.category).push(spec);
+        }
+
+        const isVisible = spec => Object.entries(spec.depends_on || {})
+            .every(([key, value]) => JSON.stringify(values[key]) === JSON.stringify(value));
+
+        function refresh() {
+            const extra = {};
+            for (const spec of data.options) {
+                const visible = isVisible(spec);
+                if (rows.has(spec.name)) show(rows.get(spec.name), visible);
+                if (visible && JSON.stringify(values[spec.name]) !== JSON.stringify(spec.default)) extra[spec.name] = values[spec.name];
+            }
+            state.extra_options = extra;
+            update();
+        }
+
+        function widget(target, spec) {
+            const set = value => { values[spec.name] = value; refresh(); };
+            const value = values[spec.name];
+            switch (spec.type) {
+                case "bool": return checkbox(target, spec.name, value, set, spec.description);
+                case "int": return number(target, spec.name, value, set, { min: spec.min, max: spec.max, step: spec.step, help: spec.description });
+                case "float": return number(target, spec.name, value, set, { min: spec.min, max: spec.max, step: spec.step ?? "any", integer: false, help: spec.description });
+                case "enum": return select(target, spec.name, spec.options, value, set, spec.description);
+                case "color": return color(target, spec.name, value, set, spec.description);
+                case "enum_list": return checklist(target, spec.name, spec.options, value, set, spec.description);
+                case "string_list": {
+                    const input = element("textarea", { rows: 3 });
+                    input.value = value.join("\n");
+                    input.addEventListener("input", () => set(input.value.split("\n").map(line => line.trim()).filter(Boolean)));
+                    return field(target, spec.name, input, spec.description);
+                }
+                default: return text(target, spec.name, value, set, spec.description);
+            }
+        }
+
+        for (const [category, specs] of categories) {
+            const details = element("details", {}, [element("summary", { text: `${category} (${specs.length})` })]);
+            // Widgets are only built the first time a category is opened
+            details.addEventListener("toggle", () => {
+                if (!details.open || details.dataset.rendered) return;
+                details.dataset.rendered = "1";
+                for (const spec of specs) {
+                    rows.set(spec.name, widget(details, spec));
+                    show(rows.get(spec.name), isVisible(spec));
+                }
+            });
+            container.append(details);
+        }
+    }
+
+    // --- Output ---
+
+    const preview = document.getElementById("preview");
+    const luaCode = document.getElementById("lua-code");
+    let previewTimer = null;
+
+    function renderPreview() {
+        previewTimer = null;
+        preview.srcdoc = generator.generatePreview(state);
+    }
+
+    function update() {
+        luaCode.textContent = generator.generateLua(state);
+        if (previewTimer === null) previewTimer = setTimeout(renderPreview, PREVIEW_DEBOUNCE_MS);
+    }
+
+    document.getElementById("download").addEventListener("click", () => {
+        const link = element("a", { href: URL.createObjectURL(new Blob([luaCode.textContent], { type: "text/x-lua" })), download: "wezterm.lua" });
+        link.click();
+        URL.revokeObjectURL(link.href);
+    });
+    document.getElementById("copy").addEventListener("click", () => navigator.clipboard.writeText(luaCode.textContent));
+
+    renderThemeSettings();
+    renderTerminalOptions();
+    renderWindowOptions();
+    renderSchemaOptions();
+    update();
+})();
@@ -0,0 +1,652 @@
+// WezTerm Configurator - client-side Lua and preview generation for the static export.
+// A port of src/lua.py, ConfigGenerator (src/config.py), derive_palette
+// (src/colormath.py) and TerminalPreviewGenerator (src/terminal.py). Tables,
+// the option schema and the HTML templates are not duplicated here: they come
+// from the data blob that `python -m src.static_export` writes from the Python
+// modules, so both sides render from the same source. tests/test_basic.py
+// (TestStaticExport) runs this file under Node and checks the output against
+// Python byte for byte.
+(function (root, factory) {
+    if (typeof module === "object" && module.exports) module.exports = factory();
+    else root.WezTermConfig = factory();
+})(typeof self !== "undefined" ? self : this, function () {
+    "use strict";
+
+    // --- Python formatting rules, so numbers and strings print the same way ---
+
+    // A number Python holds as a float: repr() prints 1.0, not 1
+    class PyFloat {
+        constructor(value) {
+            this.value = value;
+        }
+    }
+
+    function floatRepr(value) {
+        if (Number.isNaN(value)) return "nan";
+        if (!Number.isFinite(value)) return value > 0 ? "inf" : "-inf";
+        const sign = value < 0 || Object.is(value, -0) ? "-" : "";
+        // Shortest round-tripping digits, like Python's repr
+        const [mantissa, exponentText] = Math.abs(value).toExponential().split("e");
+        const digits = mantissa.replace(".", "");
+        const exponent = parseInt(exponentText, 10);
+        if (exponent < -4 || exponent >= 16) {
+            const fraction = digits.length > 1 ? "." + digits.slice(1) : "";
+            const magnitude = String(Math.abs(exponent)).padStart(2, "0");
+            return `${sign}${digits[0]}${fraction}e${exponent < 0 ? "-" : "+"}${magnitude}`;
+        }
+        if (exponent < 0) return `${sign}0.${"0".repeat(-exponent - 1)}${digits}`;
+        if (digits.length <= exponent + 1) return `${sign}${digits}${"0".repeat(exponent + 1 - digits.length)}.0`;
+        return `${sign}${digits.slice(0, exponent + 1)}.${digits.slice(exponent + 1)}`;
+    }
+
+    function pyStr(value) {
+        if (value instanceof PyFloat) return floatRepr(value.value);
+        if (value === true) return "True";
+        if (value === false) return "False";
+        if (value === null || value === undefined) return "None";
+        return String(value);
+    }
+
+    const JSON_ESCAPES = { "\"": "\\\"", "\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f" };
+
+    // json.dumps with its defaults: ", " / ": " separators and ensure_ascii
+    function pyJsonDumps(value) {
+        if (value instanceof PyFloat) return floatRepr(value.value);
+        if (value === null || value === undefined) return "null";
+        if (typeof value === "boolean") return value ? "true" : "false";
+        if (typeof value === "number") return String(value);
+        if (typeof value === "string") {
+            return "\"" + value.replace(/[^ -~]|["\\]/g, char =>
+                JSON_ESCAPES[char] || "\\u" + char.charCodeAt(0).toString(16).padStart(4, "0")) + "\"";
+        }
+        if (Array.isArray(value)) return "[" + value.map(pyJsonDumps).join(", ") + "]";
+        return "{" + Object.entries(value).map(([key, item]) => `${pyJsonDumps(key)}: ${pyJsonDumps(item)}`).join(", ") + "}";
+    }
+
+    // str.format with named fields and doubled braces, the only syntax the templates use
+    function formatTemplate(template, fields) {
+        return template.replace(/\{\{|\}\}|\{(\w+)\}/g, (match, name) => {
+            if (!name) return match[0];
+            if (!(name in fields)) throw new Error(`Şablon alanı eksik: ${name}`);
+            return pyStr(fields[name]);
+        });
+    }
+
+    // Python's % on floats: the result takes the sign of the divisor
+    function pyMod(value, divisor) {
+        const remainder = value % divisor;
+        return remainder !== 0 && (remainder < 0) !== (divisor < 0) ? remainder + divisor : remainder;
+    }
+
+    // numpy.rint: halves go to the even neighbour
+    function roundHalfEven(value) {
+        const floor = Math.floor(value);
+        const difference = value - floor;
+        if (difference > 0.5) return floor + 1;
+        if (difference < 0.5) return floor;
+        return floor % 2 === 0 ? floor : floor + 1;
+    }
+
+    const codePointLength = text => [...text].length;
+
+    // --- Lua source (src/lua.py) ---
+
+    const IDENTIFIER = /^[A-Za-z_][A-Za-z0-9_]*\n?$/;
+    const LUA_KEYWORDS = new Set(["and", "break", "do", "else", "elseif", "end", "false", "for", "function", "goto",
+        "if", "in", "local", "nil", "not", "or", "repeat", "return", "then", "true", "until", "while"]);
+    const LUA_ESCAPES = { "\\": "\\\\", "'": "\\'", "\n": "\\n", "\r": "\\r", "\t": "\\t", "\0": "\\0" };
+    const LUA_NEEDS_ESCAPE = /[\\'\n\r\t\x00-\x1f\x7f]/g;
+
+    class LuaExpr {
+        constructor(code) {
+            this.code = code;
+        }
+    }
+
+    class LuaCall {
+        constructor(callee, ...args) {
+            this.callee = callee;
+            this.args = args;
+        }
+    }
+
+    const isTable = value => value !== null && typeof value === "object" && !(value instanceof LuaExpr)
+        && !(value instanceof LuaCall) && !(value instanceof PyFloat);
+
+    function luaString(value) {
+        return "'" + value.replace(LUA_NEEDS_ESCAPE, char =>
+            LUA_ESCAPES[char] || "\\" + String(char.charCodeAt(0)).padStart(3, "0")) + "'";
+    }
+
+    function luaKey(key) {
+        if (typeof key === "string" && IDENTIFIER.test(key) && !LUA_KEYWORDS.has(key)) return key;
+        return `[${luaScalar(key)}]`;
+    }
+
+    function luaScalar(value) {
+        if (value === null || value === undefined) return "nil";
+        if (typeof value === "boolean") return value ? "true" : "false";
+        if (typeof value === "number") return String(value);
+        if (value instanceof PyFloat) return floatRepr(value.value);
+        if (typeof value === "string") return luaString(value);
+        if (value instanceof LuaExpr) return value.code;
+        if (value instanceof LuaCall) return luaCall(value);
+        throw new TypeError(`Lua'ya dönüştürülemeyen değer: ${value}`);
+    }
+
+    function luaCall(call) {
+        if (call.args.length === 1 && (typeof call.args[0] === "string" || isTable(call.args[0]))) {
+            return `${call.callee} ${luaInline(call.args[0])}`;
+        }
+        return `${call.callee}(${call.args.map(luaInline).join(", ")})`;
+    }
+
+    function luaInline(value) {
+        if (Array.isArray(value)) {
+            return value.length ? "{ " + value.map(luaInline).join(", ") + " }" : "{}";
+        }
+        if (isTable(value)) {
+            const entries = Object.entries(value);
+            return entries.length ? "{ " + entries.map(([key, item]) => `${luaKey(key)} = ${luaInline(item)}`).join(", ") + " }" : "{}";
+        }
+        return luaScalar(value);
+    }
+
+    const tableItems = value => Array.isArray(value) ? value : Object.values(value);
+    const isEmptyTable = value => tableItems(value).length === 0;
+
+    class LuaEmitter {
+        constructor(indent = "  ", inlineWidth = 100) {
+            this.lines = [];
+            this.indent = indent;
+            this.inlineWidth = inlineWidth;
+            this.level = 0;
+        }
+
+        writeLine(text = "") {
+            this.lines.push(text ? `${this.indent.repeat(this.level)}${text}\n` : "\n");
+        }
+
+        blank() {
+            this.writeLine();
+        }
+
+        comment(text) {
+            this.writeLine(`-- ${text}`);
+        }
+
+        local(name, value) {
+            this.writeLine(`local ${name} = ${luaInline(value)}`);
+        }
+
+        assign(target, value, comment = null) {
+            const suffix = comment ? `  -- ${comment}` : "";
+            if (isTable(value) && !this.fitsInline(value)) {
+                this.writeLine(`${target} = {`);
+                this.writeTableBody(value);
+                this.writeLine(`}${suffix}`);
+            } else {
+                this.writeLine(`${target} = ${luaInline(value)}${suffix}`);
+            }
+        }
+
+        ret(value) {
+            this.writeLine(`return ${luaInline(value)}`);
+        }
+
+        table(target, body) {
+            this.writeLine(target ? `${target} = {` : "{");
+            this.level += 1;
+            try {
+                body();
+            } finally {
+                this.level -= 1;
+                this.writeLine("}");
+            }
+        }
+
+        nestedTable(key, body) {
+            this.writeLine(key !== null ? `${luaKey(key)} = {` : "{");
+            this.level += 1;
+            try {
+                body();
+            } finally {
+                this.level -= 1;
+                this.writeLine("},");
+            }
+        }
+
+        fitsInline(value) {
+            if (isEmptyTable(value)) return true;
+            if (tableItems(value).some(item => isTable(item) || item instanceof LuaCall)) return false;
+            return codePointLength(luaInline(value)) + this.level * this.indent.length <= this.inlineWidth;
+        }
+
+        writeTableBody(value) {
+            this.level += 1;
+            try {
+                if (Array.isArray(value)) {
+                    for (const item of value) this.writeEntry("", item);
+                } else {
+                    for (const [key, item] of Object.entries(value)) this.writeEntry(`${luaKey(key)} = `, item);
+                }
+            } finally {
+                this.level -= 1;
+            }
+        }
+
+        writeEntry(prefix, value) {
+            if (isTable(value) && !this.fitsInline(value)) {
+                this.writeLine(`${prefix}{`);
+                this.writeTableBody(value);
+                this.writeLine("},");
+            } else {
+                this.writeLine(`${prefix}${luaInline(value)},`);
+            }
+        }
+
+        toString() {
+            return this.lines.join("");
+        }
+    }
+
+    // --- Custom palettes (src/colormath.py), one color set at a time ---
+
+    function matVec(matrix, vector) {
+        return matrix.map(row => row[0] * vector[0] + row[1] * vector[1] + row[2] * vector[2]);
+    }
+
+    const clip = (value, low, high) => Math.min(Math.max(value, low), high);
+
+    function hexToSrgb(color) {
+        const value = parseInt(color.replace(/^#/, ""), 16);
+        return [(value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff].map(channel => channel / 255.0);
+    }
+
+    function srgbToHex(srgb) {
+        return "#" + srgb.map(channel => roundHalfEven(clip(channel, 0.0, 1.0) * 255).toString(16).padStart(2, "0")).join("");
+    }
+
+    const srgbToLinear = srgb => srgb.map(c => c <= 0.04045 ? c / 12.92 : ((c + 0.055) / 1.055) ** 2.4);
+    const linearToSrgb = linear => linear.map(c => c <= 0.0031308 ? c * 12.92
+        : 1.055 * Math.abs(c) ** (1 / 2.4) * Math.sign(c) - 0.055);
+
+    function createColorMath(spec) {
+        const m = spec.matrices;
+        const linearToOklab = linear => matVec(m.oklabFromLms, matVec(m.lmsFromLinear, linear).map(Math.cbrt));
+        const oklabToLinear = lab => matVec(m.linearFromLms, matVec(m.lmsFromOklab, lab).map(c => c * c * c));
+
+        function srgbToOklch(srgb) {
+            const lab = linearToOklab(srgbToLinear(srgb));
+            return [lab[0], Math.hypot(lab[1], lab[2]), pyMod(Math.atan2(lab[2], lab[1]) * (180 / Math.PI), 360)];
+        }
+
+        const relativeLuminance = srgb => {
+            const linear = srgbToLinear(srgb.map(c => clip(c, 0.0, 1.0)));
+            return linear[0] * spec.luminance[0] + linear[1] * spec.luminance[1] + linear[2] * spec.luminance[2];
+        };
+
+        function contrastRatio(a, b) {
+            const luminanceA = relativeLuminance(a), luminanceB = relativeLuminance(b);
+            return (Math.max(luminanceA, luminanceB) + 0.05) / (Math.min(luminanceA, luminanceB) + 0.05);
+        }
+
+        const inGamut = linear => linear.every(c => c >= -1e-6 && c <= 1 + 1e-6);
+        const lchToLinear = (lightness, chroma, hue) => oklabToLinear([lightness, chroma * Math.cos(hue), chroma * Math.sin(hue)]);
+
+        function oklchToSrgb([lightness, chroma, hueDegrees], steps = 12) {
+            const hue = hueDegrees * (Math.PI / 180);
+            let linear = lchToLinear(lightness, chroma, hue);
+            if (!inGamut(linear)) {
+                let low = 0, high = chroma;
+                for (let step = 0; step < steps; step++) {
+                    const middle = (low + high) / 2;
+                    if (inGamut(lchToLinear(lightness, middle, hue))) low = middle; else high = middle;
+                }
+                linear = lchToLinear(lightness, low, hue);
+            }
+            return linearToSrgb(linear).map(c => clip(c, 0.0, 1.0));
+        }
+
+        function meetContrast(lch, background, minimum, direction, steps = 12) {
+            if (contrastRatio(oklchToSrgb(lch), background) >= minimum) return lch;
+            let low = lch[0], high = direction > 0 ? 1.0 : 0.0;
+            for (let step = 0; step < steps; step++) {
+                const middle = (low + high) / 2;
+                if (contrastRatio(oklchToSrgb([middle, lch[1], lch[2]]), background) >= minimum) high = middle; else low = middle;
+            }
+            return [high, lch[1], lch[2]];
+        }
+
+        function derivePalette(colors) {
+            const background = hexToSrgb(colors.bg.toLowerCase());
+            const foreground = hexToSrgb(colors.fg.toLowerCase());
+            const prompt = hexToSrgb(colors.prompt.toLowerCase());
+            const backgroundLch = srgbToOklch(background);
+            const foregroundLch = srgbToOklch(foreground);
+            const promptLch = srgbToOklch(prompt);
+            const dark = contrastRatio(background, [1, 1, 1]) >= contrastRatio(background, [0, 0, 0]);
+            const direction = dark ? 1.0 : -1.0;
+            const target = spec.normalContrast + spec.contrastMargin;
+
+            const chroma = clip(promptLch[1], spec.minChroma, spec.maxChroma);
+            const normalLightness = dark ? 0.70 : 0.52;
+            const brightLightness = normalLightness + 0.08 * direction;
+            const normal = [], bright = [];
+            for (const anchor of spec.ansiHues) {
+                const offset = pyMod(promptLch[2] - anchor + 180, 360) - 180;
+                const hue = pyMod(anchor + spec.huePull * offset, 360);
+                const normalLch = meetContrast([normalLightness, chroma, hue], background, target, direction);
+                const brightLch = meetContrast([brightLightness, chroma * 1.1, hue], background, target, direction);
+                brightLch[0] = dark ? Math.max(brightLch[0], normalLch[0] + 0.04) : Math.min(brightLch[0], normalLch[0] - 0.04);
+                normal.push(normalLch);
+                bright.push(brightLch);
+            }
+
+            const neutralChroma = Math.min(backgroundLch[1], spec.neutralChroma);
+            const neutral = lightness => [clip(lightness, 0.0, 1.0), neutralChroma, backgroundLch[2]];
+            const black = neutral(dark ? backgroundLch[0] + 0.08 : 0.25);
+            const white = neutral(dark ? foregroundLch[0] - 0.05 : backgroundLch[0] - 0.08);
+            const brightBlack = meetContrast(neutral(backgroundLch[0] + 0.25 * direction), background,
+                spec.brightBlackContrast + spec.contrastMargin, direction);
+            const brightWhite = neutral(dark ? Math.max(foregroundLch[0] + 0.05, 0.95) : 0.97);
+
+            const backgroundLab = linearToOklab(srgbToLinear(background));
+            const promptLab = linearToOklab(srgbToLinear(prompt));
+            const selection = backgroundLab.map((c, index) => (1 - spec.selectionMix) * c + spec.selectionMix * promptLab[index]);
+            const toHex = lch => srgbToHex(oklchToSrgb(lch));
+            return {
+                ansi: [black, ...normal, white].map(toHex),
+                brights: [brightBlack, ...bright, brightWhite].map(toHex),
+                selection_bg: srgbToHex(linearToSrgb(oklabToLinear(selection)).map(c => clip(c, 0.0, 1.0))),
+                selection_fg: srgbToHex(foreground),
+                cursor_bg: srgbToHex(prompt),
+                cursor_fg: srgbToHex(background),
+                cursor_border: srgbToHex(prompt),
+            };
+        }
+
+        return { derivePalette };
+    }
+
+    // --- Generator bound to one data blob ---
+
+    function create(data) {
+        const colorMath = createColorMath(data.colormath);
+        const paletteCache = new Map();
+        const optionIndex = new Map(data.options.map((spec, index) => [spec.name, index]));
+        const optionTypes = new Map(data.options.map(spec => [spec.name, spec.type]));
+        const floatFields = new Set(data.floatFields);
+
+        // Config values Python holds as floats (opacity, line_height, float options)
+        const asPython = (name, value) => floatFields.has(name) && typeof value === "number" ? new PyFloat(value) : value;
+        const optionValue = (name, value) => optionTypes.get(name) === "float" ? new PyFloat(value) : value;
+
+        function derivePalette(colors) {
+            const key = `${colors.bg}|${colors.fg}|${colors.prompt}`.toLowerCase();
+            if (!paletteCache.has(key)) paletteCache.set(key, colorMath.derivePalette(colors));
+            return paletteCache.get(key);
+        }
+
+        function parseLeaderKey(leaderKey) {
+            const parts = leaderKey.split("+").map(part => part.trim());
+            if (parts.length >= 2) {
+                return [parts[parts.length - 1].toLowerCase(), parts.slice(0, -1).map(part => part.toUpperCase()).join("|")];
+            }
+            return [leaderKey.trim().toLowerCase(), "CTRL"];
+        }
+
+        function collectKeyBindings(leader, userBindings) {
+            const bindings = [];
+            if (leader) {
+                const [key, mods] = leader;
+                bindings.push(...data.leaderKeyBindings);
+                bindings.push({ key, mods: `LEADER|${mods}`, action: `act.SendKey { key = ${luaString(key)}, mods = ${luaString(mods)} }`, key_table: null });
+            }
+            for (const binding of userBindings || []) bindings.push({ key_table: null, ...binding });
+            return bindings;
+        }
+
+        function bindingEntry(binding) {
+            const entry = { key: binding.key };
+            if (binding.mods) entry.mods = binding.mods;
+            entry.action = new LuaExpr(binding.action);
+            return entry;
+        }
+
+        function writeKeyBindings(lua, bindings) {
+            const tables = new Map([[null, []]]);
+            for (const binding of bindings) {
+                const name = binding.key_table ?? null;
+                if (!tables.has(name)) tables.set(name, []);
+                tables.get(name).push(binding);
+            }
+            lua.comment("Key bindings");
+            lua.table("config.keys", () => {
+                for (const binding of tables.get(null)) lua.writeEntry("", bindingEntry(binding));
+            });
+            lua.blank();
+            tables.delete(null);
+            if (tables.size) {
+                lua.table("config.key_tables", () => {
+                    for (const [name, tableBindings] of tables) {
+                        lua.nestedTable(name, () => {
+                            for (const binding of tableBindings) lua.writeEntry("", bindingEntry(binding));
+                        });
+                    }
+                });
+                lua.blank();
+            }
+        }
+
+        function writeOptions(lua, values) {
+            const names = Object.keys(values || {});
+            if (!names.length) return;
+            names.sort((a, b) => optionIndex.get(a) - optionIndex.get(b));
+            const assignments = new Map();
+            for (const name of names) {
+                const value = optionValue(name, values[name]);
+                const dot = name.indexOf(".");
+                if (dot >= 0) {
+                    const table = name.slice(0, dot);
+                    if (!assignments.has(table)) assignments.set(table, {});
+                    assignments.get(table)[name.slice(dot + 1)] = value;
+                } else {
+                    assignments.set(name, value);
+                }
+            }
+            lua.comment("Additional options");
+            for (const [name, value] of assignments) lua.assign(`config.${name}`, value);
+            lua.blank();
+        }
+
+        function generateLua(config) {
+            const lua = new LuaEmitter("  ", data.inlineTableWidth);
+            const value = name => asPython(name, config[name]);
+            lua.local("wezterm", new LuaExpr("require 'wezterm'"));
+            lua.local("act", new LuaExpr("wezterm.action"));
+            lua.blank();
+            lua.comment("This is where you actually apply your config choices");
+            lua.local("config", new LuaExpr("wezterm.config_builder()"));
+            lua.blank();
+
+            lua.comment("Basic configuration");
+            lua.assign("config.font", new LuaCall("wezterm.font", config.font));
+            lua.assign("config.font_size", value("font_size"));
+            lua.assign("config.line_height", value("line_height"));
+            lua.blank();
+            lua.assign("config.enable_tab_bar", Boolean(config.enable_tab_bar));
+            lua.assign("config.use_fancy_tab_bar", Boolean(config.use_fancy_tab_bar));
+            lua.assign("config.enable_scroll_bar", Boolean(config.enable_scroll_bar));
+            lua.assign("config.window_background_opacity", value("opacity"));
+            lua.assign("config.default_cursor_style", data.cursorStyleMap[config.default_cursor_style] || "SteadyBlock");
+            const padding = value("padding");
+            lua.assign("config.window_padding", { left: padding, right: padding, top: padding, bottom: padding });
+            lua.blank();
+
+            lua.comment("Window dimensions and position");
+            lua.assign("config.initial_cols", Math.floor(config.window_width / 8), "Approximate conversion from pixels to columns");
+            lua.assign("config.initial_rows", Math.floor(config.window_height / 16), "Approximate conversion from pixels to rows");
+            lua.blank();
+            if (config.window_decorations && config.window_decorations.length) {
+                lua.assign("config.window_decorations", config.window_decorations.join(" | "));
+                lua.blank();
+            }
+            if (config.window_position && config.window_position.length) {
+                lua.assign("config.initial_position", { x: config.window_position[0], y: config.window_position[1] });
+                lua.blank();
+            }
+            if (config.window_maximized) {
+                lua.assign("config.default_gui_startup_args", ["start", "--maximized"]);
+            } else if (config.window_fullscreen) {
+                lua.assign("config.default_gui_startup_args", ["start", "--fullscreen"]);
+            }
+            lua.assign("config.window_close_confirmation", config.window_close_confirmation ?? "AlwaysPrompt");
+            lua.assign("config.hide_tab_bar_if_only_one_tab", Boolean(config.window_hide_tab_bar_if_only_one_tab ?? true));
+            lua.assign("config.window_is_always_on_top", Boolean(config.window_always_on_top ?? false));
+            lua.blank();
+
+            if (config.hyperlinkRules && config.hyperlinkRules.length) {
+                lua.comment("Hyperlink settings");
+                lua.table("config.hyperlink_rules", () => {
+                    for (const [label, comment, regex, format] of data.hyperlinkRules) {
+                        if (config.hyperlinkRules.includes(label)) {
+                            lua.comment(comment);
+                            lua.writeEntry("", { regex, format });
+                        }
+                    }
+                });
+                lua.blank();
+            }
+
+            let leader = null;
+            if (config.leader_key && config.leader_key.trim()) {
+                leader = parseLeaderKey(config.leader_key);
+                lua.comment("Leader key configuration");
+                lua.assign("config.leader", { key: leader[0], mods: leader[1], timeout_milliseconds: 1000 });
+                lua.blank();
+            }
+            const bindings = collectKeyBindings(leader, config.keys);
+            if (bindings.length) writeKeyBindings(lua, bindings);
+
+            if (config.ssh_domains && config.ssh_domains.length) {
+                lua.comment("SSH domains");
+                lua.table("config.ssh_domains", () => {
+                    for (const domain of config.ssh_domains) {
+                        const entry = { name: domain.name, remote_address: domain.remote_address };
+                        if (domain.username) entry.username = domain.username;
+                        if ((domain.multiplexing ?? "WezTerm") !== "WezTerm") entry.multiplexing = domain.multiplexing;
+                        lua.writeEntry("", entry);
+                    }
+                });
+                lua.blank();
+            }
+            if (config.launch_menu && config.launch_menu.length) {
+                lua.comment("Launch menu");
+                lua.table("config.launch_menu", () => {
+                    for (const item of config.launch_menu) {
+                        const entry = { label: item.label, args: [...item.args] };
+                        if (item.cwd) entry.cwd = item.cwd;
+                        lua.writeEntry("", entry);
+                    }
+                });
+                lua.blank();
+            }
+
+            writeOptions(lua, config.extra_options);
+
+            if (config.theme === "Custom" && config.custom_colors) {
+                const palette = derivePalette(config.custom_colors);
+                lua.comment("Custom colors (ANSI, selection and cursor colors derived from the three picks)");
+                lua.assign("config.colors", {
+                    background: config.custom_colors.bg,
+                    foreground: config.custom_colors.fg,
+                    cursor_bg: palette.cursor_bg,
+                    cursor_fg: palette.cursor_fg,
+                    cursor_border: palette.cursor_border,
+                    selection_bg: palette.selection_bg,
+                    selection_fg: palette.selection_fg,
+                    ansi: palette.ansi,
+                    brights: palette.brights,
+                });
+            } else {
+                lua.comment("Theme color scheme");
+                lua.assign("config.color_scheme", config.color_scheme);
+            }
+            lua.blank();
+            lua.ret(new LuaExpr("config"));
+            return lua.toString();
+        }
+
+        // --- Preview (src/terminal.py) ---
+
+        function themeColors(config) {
+            if (config.theme === "Custom" && config.custom_colors) return config.custom_colors;
+            return data.colorMappings[config.color_scheme] || data.colorMappings["Builtin Dark"];
+        }
+
+        function ansiPalette(config) {
+            if (config.theme === "Custom") {
+                if (config.custom_colors) {
+                    const palette = derivePalette(config.custom_colors);
+                    return [...palette.ansi, ...palette.brights];
+                }
+                return data.ansiPalettes["Builtin Dark"];
+            }
+            return data.ansiPalettes[config.color_scheme] || data.ansiPalettes["Builtin Dark"];
+        }
+
+        function tabBar(config, colors) {
+            if (!config.enable_tab_bar) return "";
+            const [tabBarBg, activeTabBg, inactiveTabColor] = config.use_fancy_tab_bar
+                ? ["rgba(0,0,0,0.3)", colors.prompt, colors.fg]
+                : [colors.bg, "rgba(255,255,255,0.1)", "rgba(255,255,255,0.6)"];
+            return formatTemplate(data.templates.tabBar, {
+                tab_bar_bg: tabBarBg, fg: colors.fg, active_tab_bg: activeTabBg, inactive_tab_color: inactiveTabColor,
+                tab_x: config.use_fancy_tab_bar ? data.templates.tabCloseButton : "",
+            });
+        }
+
+        function paletteCss(palette, colors) {
+            return [...palette.map((color, index) => `--ansi-${index}:${color}`), `--term-fg:${colors.fg}`, `--term-bg:${colors.bg}`].join(";");
+        }
+
+        function generatePreview(config, runtimeSrc) {
+            const colors = themeColors(config);
+            const palette = ansiPalette(config);
+            const cursorTemplate = data.templates.cursorStyles[config.default_cursor_style] || data.templates.cursorStyles.Block;
+            const cursorCss = formatTemplate(cursorTemplate, { prompt: colors.prompt });
+            const termConfig = {
+                bg: colors.bg,
+                fg: colors.fg,
+                promptColor: colors.prompt,
+                cursorStyle: cursorCss,
+                fontSize: config.font_size,
+                lineHeight: asPython("line_height", config.line_height),
+                padding: config.padding,
+                opacity: asPython("opacity", config.opacity),
+                enableTabBar: config.enable_tab_bar,
+                enableScrollBar: config.enable_scroll_bar,
+            };
+            if (config.font) termConfig.font = config.font;
+            if (palette && palette.length) termConfig.palette = [...palette];
+            const configTag = formatTemplate(data.templates.configTag, { config_json: pyJsonDumps(termConfig).replaceAll("</", "<\\/") });
+            const jsCode = `${configTag}\n` + formatTemplate(data.templates.runtimeTag, { src: runtimeSrc ?? data.runtimeSrc });
+
+            return formatTemplate(data.templates.preview, {
+                font: config.font, font_size: config.font_size, line_height: asPython("line_height", config.line_height),
+                ansi_css: data.ansiCss, cursor_css: cursorCss, tab_bar_display: config.enable_tab_bar ? "" : "none",
+                tab_bar: tabBar(config, colors), content_height: 350 - (config.enable_tab_bar ? 30 : 0),
+                bg: colors.bg, fg: colors.fg, padding: config.padding, opacity: asPython("opacity", config.opacity),
+                palette_css: paletteCss(palette, colors), banner: data.banner,
+                scrollbar_display: config.enable_scroll_bar ? "" : "none",
+                scrollbar: config.enable_scroll_bar ? formatTemplate(data.templates.scrollbar, { bg: colors.bg }) : "",
+                js_code: jsCode,
+            });
+        }
+
+        return { generateLua, generatePreview, derivePalette, parseLeaderKey };
+    }
+
+    return { create, PyFloat, floatRepr, pyJsonDumps, formatTemplate, luaString, luaInline, LuaEmitter };
+});
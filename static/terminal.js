@@ -0,0 +1,734 @@
+// WezTerm Configurator - terminal preview runtime.
+// Served once as a static asset; per-render values arrive through the
+// JSON blob in <script id="wezterm-term-config">.
+let termConfig = JSON.parse(document.getElementById("wezterm-term-config").textContent);
+
+// Per-session blobs (asciinema replay, live slider channel) are appended after
+// this script's tag, so they can only be read once the document is parsed
+function readJsonTag(id) {
+    const element = document.getElementById(id);
+    return element ? JSON.parse(element.textContent) : null;
+}
+
+// termConfig keys that sidebar sliders may set ahead of a rerun
+const LIVE_FIELDS = new Set(["fontSize", "lineHeight", "padding", "opacity"]);
+
+// Replay bounds: DOM lines kept, parsed chunks buffered ahead of playback,
+// and characters written per animation frame before the rest spills over
+const REPLAY_MAX_LINES = 2000;
+const REPLAY_MAX_QUEUE = 4096;
+const REPLAY_MAX_FRAME_CHARS = 256 * 1024;
+
+// CSI, OSC, charset designation and two-byte escapes
+const ESCAPE_PATTERN = /\x1b(?:\[([0-?]*)[ -\/]*([@-~])|\][^\x07\x1b]*(?:\x07|\x1b\\)|[()][0-9A-Za-z]|[@-Z\\^_=>])/y;
+const PARTIAL_ESCAPE_PATTERN = /^\x1b(?:\[[0-?]*[ -\/]*|\][^\x07\x1b]*\x1b?|[()])?$/;
+
+// --- ANSI SGR rendering; mirrors src/ansi.py so both sides emit the same markup ---
+const SGR_BOLD = 1, SGR_DIM = 2, SGR_ITALIC = 4, SGR_UNDERLINE = 8, SGR_INVERSE = 16, SGR_STRIKE = 32;
+const SGR_SET_FLAGS = { 1: SGR_BOLD, 2: SGR_DIM, 3: SGR_ITALIC, 4: SGR_UNDERLINE, 7: SGR_INVERSE, 9: SGR_STRIKE };
+const SGR_CLEAR_FLAGS = { 21: SGR_BOLD, 22: SGR_BOLD | SGR_DIM, 23: SGR_ITALIC, 24: SGR_UNDERLINE, 27: SGR_INVERSE, 29: SGR_STRIKE };
+const SGR_FLAG_CLASSES = [[SGR_BOLD, "b"], [SGR_DIM, "d"], [SGR_ITALIC, "i"], [SGR_UNDERLINE, "u"], [SGR_STRIKE, "s"]];
+const CUBE_LEVELS = [0, 95, 135, 175, 215, 255];
+const CONTROL_CHARS = /[\x00-\x08\x0b-\x1f\x7f]/g;
+
+// Styles are interned, so cells and runs with equal attributes share one object
+// and can be compared by identity
+const styleTable = new Map();
+
+function internStyle(fg, bg, flags) {
+    const key = `${fg}|${bg}|${flags}`;
+    let style = styleTable.get(key);
+    if (!style) {
+        style = { fg, bg, flags, attributes: null, transitions: new Map() };
+        styleTable.set(key, style);
+    }
+    return style;
+}
+
+const DEFAULT_STYLE = internStyle(null, null, 0);
+
+function extendedColor(values) {
+    if (values[0] === "5") {
+        const index = parseInt(values[1], 10);
+        if (isNaN(index)) return null;
+        return [index % 256, 2];
+    }
+    if (values[0] === "2") {
+        if (values.length < 4) return null;
+        const hex = values.slice(1, 4).map(value => ((parseInt(value || "0", 10) % 256) || 0).toString(16).padStart(2, "0"));
+        return ["#" + hex.join(""), 4];
+    }
+    return null;
+}
+
+function applySgr(style, params) {
+    const cached = style.transitions.get(params);
+    if (cached) return cached;
+    let { fg, bg, flags } = style;
+    if (!/^[<=>?]/.test(params)) {
+        const codes = params ? params.split(";") : [""];
+        for (let index = 0; index < codes.length;) {
+            const code = codes[index++];
+            if (code.includes(":")) {
+                // ITU sub-parameters: 38:5:n, 38:2::r:g:b, 4:3 curly underline
+                const [head, ...subparams] = code.split(":");
+                if (head === "38" || head === "48") {
+                    if (subparams[0] === "2" && subparams.length === 5) subparams.splice(1, 1);
+                    const color = extendedColor(subparams);
+                    if (!color) break;
+                    if (head === "38") fg = color[0]; else bg = color[0];
+                } else if (head === "4") {
+                    flags = subparams[0] === "0" ? flags & ~SGR_UNDERLINE : flags | SGR_UNDERLINE;
+                }
+                continue;
+            }
+            const number = code ? parseInt(code, 10) : 0;
+            if (isNaN(number)) break;
+            if (number === 0) {
+                fg = null; bg = null; flags = 0;
+            } else if (number in SGR_SET_FLAGS) {
+                flags |= SGR_SET_FLAGS[number];
+            } else if (number in SGR_CLEAR_FLAGS) {
+                flags &= ~SGR_CLEAR_FLAGS[number];
+            } else if (number >= 30 && number <= 37) {
+                fg = number - 30;
+            } else if (number >= 90 && number <= 97) {
+                fg = number - 90 + 8;
+            } else if (number >= 40 && number <= 47) {
+                bg = number - 40;
+            } else if (number >= 100 && number <= 107) {
+                bg = number - 100 + 8;
+            } else if (number === 39) {
+                fg = null;
+            } else if (number === 49) {
+                bg = null;
+            } else if (number === 38 || number === 48) {
+                const color = extendedColor(codes.slice(index));
+                if (!color) break;
+                index += color[1];
+                if (number === 38) fg = color[0]; else bg = color[0];
+            }
+        }
+    }
+    const next = internStyle(fg, bg, flags);
+    style.transitions.set(params, next);
+    return next;
+}
+
+function colorHex(index) {
+    if (index < 232) {
+        index -= 16;
+        return "#" + [Math.floor(index / 36), Math.floor(index / 6) % 6, index % 6]
+            .map(component => CUBE_LEVELS[component].toString(16).padStart(2, "0")).join("");
+    }
+    const level = (8 + 10 * (index - 232)).toString(16).padStart(2, "0");
+    return "#" + level + level + level;
+}
+
+function spanAttributes(style) {
+    if (style.attributes) return style.attributes;
+    let { fg, bg, flags } = style;
+    // WezTerm's bold_brightens_ansi_colors
+    if (flags & SGR_BOLD && typeof fg === "number" && fg < 8) fg += 8;
+    if (flags & SGR_INVERSE) [fg, bg] = [bg === null ? "bg" : bg, fg === null ? "fg" : fg];
+
+    const classes = [];
+    const declarations = [];
+    for (const [prefix, property, color] of [["f", "color", fg], ["g", "background", bg]]) {
+        if (color === null) continue;
+        if (color === "fg" || color === "bg" || (typeof color === "number" && color < 16)) {
+            classes.push(`a-${prefix}${color}`);
+        } else {
+            declarations.push(`${property}:${typeof color === "string" ? color : colorHex(color)}`);
+        }
+    }
+    for (const [flag, name] of SGR_FLAG_CLASSES) {
+        if (flags & flag) classes.push(`a-${name}`);
+    }
+    style.attributes = [classes.join(" "), declarations.join(";")];
+    return style.attributes;
+}
+
+function escapeHtml(text) {
+    return text.replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+}
+
+function runHtml(style, text) {
+    if (!text) return "";
+    const [className, css] = spanAttributes(style);
+    if (!className && !css) return escapeHtml(text);
+    return `<span${className ? ` class="${className}"` : ""}${css ? ` style="${css}"` : ""}>${escapeHtml(text)}</span>`;
+}
+
+function ansiToHtml(text) {
+    // One span per run of identical attributes, bare text for the default style
+    const html = [];
+    let style = DEFAULT_STYLE;
+    let runStyle = style;
+    let parts = [];
+    let position = 0;
+    const pattern = new RegExp(ESCAPE_PATTERN.source, "g");
+    let match;
+    while ((match = pattern.exec(text)) !== null) {
+        if (match.index > position) {
+            if (style !== runStyle && parts.length) {
+                html.push(runHtml(runStyle, parts.join("").replace(CONTROL_CHARS, "")));
+                parts = [];
+            }
+            runStyle = style;
+            parts.push(text.slice(position, match.index));
+        }
+        position = pattern.lastIndex;
+        if (match[2] === "m") style = applySgr(style, match[1]);
+    }
+    if (position < text.length) {
+        if (style !== runStyle && parts.length) {
+            html.push(runHtml(runStyle, parts.join("").replace(CONTROL_CHARS, "")));
+            parts = [];
+        }
+        runStyle = style;
+        parts.push(text.slice(position));
+    }
+    if (parts.length) html.push(runHtml(runStyle, parts.join("").replace(CONTROL_CHARS, "")));
+    return html.join("");
+}
+
+function renderCells(lineElem, chars, styles) {
+    // Merge the cells of one line into attribute runs
+    let html = "";
+    let start = 0;
+    for (let index = 1; index <= chars.length; index++) {
+        if (index === chars.length || styles[index] !== styles[start]) {
+            html += runHtml(styles[start], chars.slice(start, index).join(""));
+            start = index;
+        }
+    }
+    if (html.includes("<")) {
+        lineElem.innerHTML = html;
+    } else {
+        lineElem.textContent = chars.join("");
+    }
+}
+
+const commands = {
+    "clear": () => { return ""; },
+    "ls": () => {
+        const dir = name => `\x1b[1;34m${name}\x1b[0m`;
+        return `total 32\ndrwxr-xr-x  5 user group  4096 May 20 14:32 ${dir(".")}\ndrwxr-xr-x 18 user group  4096 May 19 10:15 ${dir("..")}\ndrwxr-xr-x  8 user group  4096 May 20 11:21 ${dir(".git")}\n-rw-r--r--  1 user group   129 May 18 09:43 .gitignore\n-rw-r--r--  1 user group  1523 May 18 09:43 README.md\n-rw-r--r--  1 user group   978 May 20 14:30 app.py\ndrwxr-xr-x  2 user group  4096 May 18 09:43 ${dir("assets")}`;
+    },
+    "pwd": () => { return "/home/user/projects"; },
+    "date": () => { return new Date().toString(); },
+    "echo": (args) => { return args.join(" "); },
+    "help": () => { return "Kullanılabilir Komutlar: clear, ls, pwd, date, echo, help, wezterm, config, whoami, uname, screenfetch, colors, replay"; },
+    "colors": () => {
+        // The 16 palette colors of the active scheme, normal row over bright row
+        const row = bright => Array.from({ length: 8 }, (_, i) =>
+            `\x1b[${(bright ? 100 : 40) + i};${(bright ? 90 : 30) + (i + 7) % 8}m ${String((bright ? 8 : 0) + i).padStart(2)} `
+        ).join("") + "\x1b[0m";
+        return row(false) + "\n" + row(true);
+    },
+    "wezterm": () => { return "WezTerm 20XX.XX.X (abcdef12) - https://wezfurlong.org/wezterm/"; },
+    "config": () => { return JSON.stringify(termConfig, null, 2); },
+    "whoami": () => { return "user"; },
+    "uname": () => { return "Linux wezterm-sim 6.2.0-32-generic x86_64 GNU/Linux"; },
+    "screenfetch": () => {
+        return `
+\x1b[94m
+             .-/+oossssoo+/-.                   OS: Linux
+         \`:+ssssssssssssssssss+:\`               WezTerm 20XX.XX.X
+       -+ssssssssssssssssssyyssss+-             Kernel: 6.2.0-32-generic
+     .ossssssssssssssssssdMMMNysssso.           Uptime: 1h 23m
+    /ssssssssssshdmmNNmmyNMMMMhssssss/          CPU: Intel i7-10700K
+   +ssssssssshmydMMMMMMMNddddyssssssss+         RAM: 16GB
+  /sssssssshNMMMyhhyyyyhmNMMMNhssssssss/        Disk: 500GB SSD
+ .ssssssssdMMMNhsssssssssshNMMMdssssssss.       GPU: NVIDIA GeForce GTX 1660
+ +sssshhhyNMMNyssssssssssssyNMMMysssssss+       Shell: bash   
+ ossyNMMMNyMMhsssssssssssssshmmmhssssssso       
+ ossyNMMMNyMMhsssssssssssssshmmmhssssssso   
+ +sssshhhyNMMNyssssssssssssyNMMMysssssss+   
+ .ssssssssdMMMNhsssssssssshNMMMdssssssss.   
+  /sssssssshNMMMyhhyyyyhmNMMMNhssssssss/    
+   +ssssssssshmydMMMMMMMNddddyssssssss+     
+    /ssssssssssshdmmNNmmyNMMMMhssssss/      
+     .ossssssssssssssssssdMMMNysssso.       
+       -+ssssssssssssssssssyyssss+-         
+         \`:+ssssssssssssssssss+:\`           
+             .-/+oossssoo+/-.               
+\x1b[0m`;
+    },
+};
+
+document.addEventListener("DOMContentLoaded", function() {
+    const castConfig = readJsonTag("wezterm-cast-config");
+    const liveChannel = readJsonTag("wezterm-live-channel");
+    const terminal = document.getElementById("dynamic-terminal");
+    const container = document.getElementById("terminal-container");
+    const tabBar = document.getElementById("terminal-tab-bar");
+    const scrollbar = document.getElementById("terminal-scrollbar");
+    
+    let commandHistory = [];
+    let commandHistoryIndex = -1;
+    
+    function updateTerminalStyling() {
+        terminal.style.fontFamily = termConfig.font + ", monospace";
+        terminal.style.fontSize = termConfig.fontSize + "px";
+        terminal.style.lineHeight = termConfig.lineHeight;
+        terminal.style.backgroundColor = termConfig.bg;
+        terminal.style.color = termConfig.fg;
+        terminal.style.padding = termConfig.padding + "px";
+        terminal.style.opacity = termConfig.opacity;
+        container.style.fontSize = termConfig.fontSize + "px";
+        container.style.lineHeight = termConfig.lineHeight;
+        // ANSI output references these variables, so it follows scheme changes without re-rendering
+        (termConfig.palette || []).forEach((color, index) => terminal.style.setProperty(`--ansi-${index}`, color));
+        terminal.style.setProperty("--term-fg", termConfig.fg);
+        terminal.style.setProperty("--term-bg", termConfig.bg);
+        
+        const cursors = document.querySelectorAll(".cursor");
+        cursors.forEach(cursor => {
+            cursor.style.backgroundColor = termConfig.promptColor;
+            if (termConfig.cursorStyle.includes("border-left")) {
+                cursor.style.backgroundColor = "transparent";
+                cursor.style.borderLeft = "2px solid " + termConfig.promptColor;
+            } else if (termConfig.cursorStyle.includes("border-bottom")) {
+                cursor.style.backgroundColor = "transparent";
+                cursor.style.borderBottom = "2px solid " + termConfig.promptColor;
+            }
+        });
+        
+        const prompts = document.querySelectorAll(".prompt");
+        prompts.forEach(prompt => {
+            const spans = prompt.querySelectorAll("span");
+            if (spans.length >= 3) {
+                spans[0].style.color = termConfig.promptColor; // user@machine
+                spans[1].style.color = termConfig.fg; // :
+                spans[3].style.color = termConfig.promptColor; // $
+            }
+        });
+        
+        if (tabBar) {
+            tabBar.style.display = termConfig.enableTabBar ? "flex" : "none";
+        }
+        
+        if (scrollbar) {
+            scrollbar.style.display = termConfig.enableScrollBar ? "block" : "none";
+        }
+        
+        const contentHeight = 350 - (termConfig.enableTabBar ? 30 : 0);
+        document.querySelector(".terminal-content-area").style.height = contentHeight + "px";
+    }
+
+    function createPrompt() {
+        const wrapper = document.createElement("div");
+        wrapper.className = "terminal-line";
+        
+        const promptSpan = document.createElement("span");
+        promptSpan.className = "prompt";
+        promptSpan.innerHTML = `<span style="color:${termConfig.promptColor};">user@machine</span><span style="color:${termConfig.fg};">:</span><span style="color:#5f87ff;">~/projects</span><span style="color:${termConfig.promptColor};">$</span> `;
+        
+        const inputSpan = document.createElement("span");
+        inputSpan.className = "input-area";
+        inputSpan.contentEditable = true;
+        
+        const cursorElement = document.createElement("span");
+        cursorElement.className = "cursor";
+        cursorElement.style = termConfig.cursorStyle;
+        cursorElement.innerHTML = "&nbsp;";
+        
+        inputSpan.addEventListener("focus", () => cursorElement.style.visibility = "visible");
+        inputSpan.addEventListener("blur", () => cursorElement.style.visibility = "hidden");
+        inputSpan.addEventListener("paste", handlePaste);
+        inputSpan.addEventListener("keydown", handleKeyDown);
+        
+        wrapper.appendChild(promptSpan);
+        wrapper.appendChild(inputSpan);
+        wrapper.appendChild(cursorElement);
+        
+        return wrapper;
+    }
+    
+    function handlePaste(e) {
+        e.preventDefault();
+        const text = (e.clipboardData || window.clipboardData).getData("text");
+        document.execCommand("insertText", false, text);
+    }
+    
+    function handleKeyDown(e) {
+        if (e.key === "Enter") {
+            e.preventDefault();
+            executeCommand(this);
+        } else if (e.key === "ArrowUp") {
+            e.preventDefault();
+            navigateHistory(-1, this);
+        } else if (e.key === "ArrowDown") {
+            e.preventDefault();
+            navigateHistory(1, this);
+        }
+    }
+    
+    function navigateHistory(direction, inputElement) {
+        const newIndex = commandHistoryIndex + direction;
+        
+        if (direction < 0 && newIndex >= 0) { // Up
+            commandHistoryIndex = newIndex;
+            inputElement.textContent = commandHistory[commandHistoryIndex];
+        } else if (direction > 0) { // Down
+            if (newIndex < commandHistory.length) {
+                commandHistoryIndex = newIndex;
+                inputElement.textContent = commandHistory[commandHistoryIndex];
+            } else {
+                commandHistoryIndex = commandHistory.length;
+                inputElement.textContent = "";
+            }
+        }
+        
+        placeCaretAtEnd(inputElement);
+    }
+    
+    function executeCommand(inputElement) {
+        const command = inputElement.textContent.trim();
+        
+        const commandLine = inputElement.parentNode;
+        commandLine.innerHTML = `<span class="prompt"><span style="color:${termConfig.promptColor};">user@machine</span><span style="color:${termConfig.fg};">:</span><span style="color:#5f87ff;">~/projects</span><span style="color:${termConfig.promptColor};">$</span> </span>${command}`;
+        
+        if (command) {
+            commandHistory.push(command);
+            commandHistoryIndex = commandHistory.length;
+            
+            const output = processCommand(command);
+            if (output) {
+                const outputElem = document.createElement("div");
+                outputElem.className = "command-output";
+                if (output.includes("\x1b")) {
+                    outputElem.innerHTML = ansiToHtml(output);
+                } else {
+                    outputElem.textContent = output;
+                }
+                container.appendChild(outputElem);
+            }
+        }
+        
+        container.appendChild(createPrompt());
+        
+        const newInput = container.querySelector(".terminal-line:last-child .input-area");
+        if (newInput) {
+            newInput.focus();
+            placeCaretAtEnd(newInput);
+        }
+        
+        container.scrollTop = container.scrollHeight;
+    }
+    
+    function processCommand(cmdString) {
+        if (!cmdString) return "";
+        
+        let [cmd, ...args] = cmdString.split(" ");
+        cmd = cmd.toLowerCase();
+        
+        return cmd in commands ? commands[cmd](args) : `bash: ${cmd}: command not found`;
+    }
+    
+    function placeCaretAtEnd(element) {
+        const range = document.createRange();
+        const selection = window.getSelection();
+        range.selectNodeContents(element);
+        range.collapse(false);
+        selection.removeAllRanges();
+        selection.addRange(range);
+    }
+    
+    function createScreenWriter(outputElem) {
+        // Minimal terminal model for replayed output: handles newlines, carriage
+        // returns, backspace, tabs, SGR attributes, erase-line and clear-screen;
+        // other escape sequences are consumed and ignored. Each cell keeps its
+        // interned style, completed lines are buffered and only reach the DOM in
+        // flush(), once per animation frame, as merged attribute runs.
+        let liveElem = null;
+        let chars = [];
+        let styles = [];
+        let col = 0;
+        let style = DEFAULT_STYLE;
+        let pending = [];
+        let dirty = false;
+        let carry = "";
+
+        function makeLine(cells) {
+            const lineElem = document.createElement("div");
+            lineElem.className = "replay-line";
+            if (cells) renderCells(lineElem, cells[0], cells[1]);
+            return lineElem;
+        }
+
+        function reset() {
+            outputElem.textContent = "";
+            liveElem = makeLine(null);
+            outputElem.appendChild(liveElem);
+            chars = [];
+            styles = [];
+            col = 0;
+            pending = [];
+        }
+
+        function put(ch) {
+            while (chars.length < col) {
+                chars.push(" ");
+                styles.push(DEFAULT_STYLE);
+            }
+            chars[col] = ch;
+            styles[col++] = style;
+            dirty = true;
+        }
+
+        function handleEscape(params, final) {
+            const n = parseInt(params, 10);
+            if (final === "m") {
+                style = applySgr(style, params);
+            } else if (final === "K") {
+                if (!params || params === "0") {
+                    chars.length = styles.length = Math.min(chars.length, col);
+                } else if (params === "2") {
+                    chars = [];
+                    styles = [];
+                }
+                dirty = true;
+            } else if (final === "J" && (params === "2" || params === "3")) {
+                reset();
+            } else if (final === "H" || final === "f") {
+                col = 0;
+            } else if (final === "C") {
+                col += n || 1;
+            } else if (final === "D") {
+                col = Math.max(0, col - (n || 1));
+            } else if (final === "G") {
+                col = Math.max(0, (n || 1) - 1);
+            }
+        }
+
+        function write(data) {
+            if (carry) {
+                data = carry + data;
+                carry = "";
+            }
+            let i = 0;
+            while (i < data.length) {
+                const ch = data[i];
+                if (ch === "\x1b") {
+                    ESCAPE_PATTERN.lastIndex = i;
+                    const match = ESCAPE_PATTERN.exec(data);
+                    if (match) {
+                        if (match[2]) handleEscape(match[1], match[2]);
+                        i = ESCAPE_PATTERN.lastIndex;
+                        continue;
+                    }
+                    // A sequence split across chunks is completed by the next write
+                    if (data.length - i <= 256 && PARTIAL_ESCAPE_PATTERN.test(data.slice(i))) {
+                        carry = data.slice(i);
+                        break;
+                    }
+                } else if (ch === "\n") {
+                    pending.push([chars, styles]);
+                    chars = [];
+                    styles = [];
+                    col = 0;
+                    dirty = true;
+                } else if (ch === "\r") {
+                    col = 0;
+                } else if (ch === "\b") {
+                    col = Math.max(0, col - 1);
+                } else if (ch === "\t") {
+                    do { put(" "); } while (col % 8);
+                } else if (ch >= " ") {
+                    put(ch);
+                }
+                i++;
+            }
+        }
+
+        function flush() {
+            if (pending.length) {
+                // The live line was completed first; lines that would be trimmed
+                // straight away are never turned into DOM nodes
+                renderCells(liveElem, pending[0][0], pending[0][1]);
+                const fragment = document.createDocumentFragment();
+                for (let k = Math.max(1, pending.length - REPLAY_MAX_LINES); k < pending.length; k++) {
+                    fragment.appendChild(makeLine(pending[k]));
+                }
+                liveElem = makeLine(null);
+                fragment.appendChild(liveElem);
+                outputElem.appendChild(fragment);
+                while (outputElem.childElementCount > REPLAY_MAX_LINES) {
+                    outputElem.firstChild.remove();
+                }
+                pending = [];
+            }
+            if (dirty) {
+                renderCells(liveElem, chars, styles);
+                dirty = false;
+            }
+        }
+
+        reset();
+        return { write, flush };
+    }
+
+    let activeReplay = null;
+
+    function replayCast(url, speed, beforeElem) {
+        if (activeReplay) activeReplay.cancel();
+
+        const outputElem = document.createElement("div");
+        outputElem.className = "command-output replay-output";
+        container.insertBefore(outputElem, beforeElem || null);
+        const writer = createScreenWriter(outputElem);
+
+        const queue = [];
+        let queueHead = 0;
+        let finished = false;
+        let cancelled = false;
+        let resumeReader = null;
+
+        const replay = {
+            cancel() {
+                cancelled = true;
+                if (resumeReader) resumeReader();
+            }
+        };
+        activeReplay = replay;
+
+        // Reader: parse NDJSON chunks as they arrive, pausing while far ahead of playback
+        (async () => {
+            const response = await fetch(url);
+            if (!response.ok || !response.body) throw new Error(`HTTP ${response.status}`);
+            const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+            let buffer = "";
+            let header = null;
+            while (!cancelled) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += value;
+                let start = 0;
+                let newline;
+                while ((newline = buffer.indexOf("\n", start)) !== -1) {
+                    const text = buffer.slice(start, newline);
+                    start = newline + 1;
+                    if (!text) continue;
+                    if (header === null) {
+                        header = JSON.parse(text);
+                    } else {
+                        queue.push(JSON.parse(text));
+                    }
+                }
+                buffer = buffer.slice(start);
+                while (!cancelled && queue.length - queueHead > REPLAY_MAX_QUEUE) {
+                    await new Promise(resolve => { resumeReader = resolve; });
+                }
+            }
+            if (cancelled) reader.cancel();
+        })().catch(error => {
+            writer.write(`\r\nreplay: ${error.message}\r\n`);
+        }).finally(() => {
+            finished = true;
+        });
+
+        // Player: everything due since the previous frame is written in one go
+        let clock = 0;
+        let lastFrame = null;
+        function frame(now) {
+            if (cancelled) return;
+            const delta = lastFrame === null ? 0 : (now - lastFrame) / 1000;
+            lastFrame = now;
+            // The clock stands still while waiting for the network
+            if (queueHead < queue.length || finished) clock += delta * speed;
+
+            let written = 0;
+            while (queueHead < queue.length && queue[queueHead][0] <= clock && written < REPLAY_MAX_FRAME_CHARS) {
+                const data = queue[queueHead++][1];
+                writer.write(data);
+                written += data.length;
+            }
+            if (queueHead > 1024 && queueHead * 2 > queue.length) {
+                queue.splice(0, queueHead);
+                queueHead = 0;
+            }
+            if (written) {
+                writer.flush();
+                container.scrollTop = container.scrollHeight;
+            }
+            if (resumeReader && queue.length - queueHead <= REPLAY_MAX_QUEUE / 2) {
+                const resume = resumeReader;
+                resumeReader = null;
+                resume();
+            }
+            if (finished && queueHead >= queue.length) {
+                writer.flush();
+                if (activeReplay === replay) activeReplay = null;
+                return;
+            }
+            requestAnimationFrame(frame);
+        }
+        requestAnimationFrame(frame);
+        return replay;
+    }
+
+    commands["replay"] = () => {
+        if (!castConfig) return "replay: oynatılacak kayıt yok";
+        replayCast(castConfig.url, castConfig.speed || 1);
+        return "";
+    };
+
+    window.updateTerminalConfig = function(configJson) {
+        const newConfig = JSON.parse(configJson);
+        Object.assign(termConfig, newConfig);
+        updateTerminalStyling();
+    };
+
+    if (liveChannel && "BroadcastChannel" in window) {
+        // Slider values mid-drag; the committed value arrives later with a rerun
+        let stylingQueued = false;
+        new BroadcastChannel(liveChannel).onmessage = event => {
+            const { field, value } = event.data || {};
+            if (!LIVE_FIELDS.has(field)) return;
+            termConfig[field] = value;
+            if (!stylingQueued) {
+                stylingQueued = true;
+                requestAnimationFrame(() => {
+                    stylingQueued = false;
+                    updateTerminalStyling();
+                });
+            }
+        };
+    }
+    
+    container.appendChild(createPrompt());
+    
+    if (castConfig && castConfig.autoplay) {
+        replayCast(castConfig.url, castConfig.speed || 1, container.lastChild);
+    }
+    
+    container.addEventListener("click", function() {
+        const activeInput = container.querySelector(".terminal-line:last-child .input-area");
+        if (activeInput) {
+            activeInput.focus();
+            placeCaretAtEnd(activeInput);
+        }
+    });
+    
+    let cursorVisible = true;
+    setInterval(() => {
+        const cursors = container.querySelectorAll(".cursor");
+        cursorVisible = !cursorVisible;
+        cursors.forEach(cursor => {
+            cursor.style.visibility = cursorVisible ? "visible" : "hidden";
+        });
+    }, 500);
+    
+    setTimeout(() => {
+        const firstInput = container.querySelector(".input-area");
+        if (firstInput) {
+            firstInput.focus();
+            placeCaretAtEnd(firstInput);
+        }
+    }, 100);
+    
+    updateTerminalStyling();
+});
@@ -1,6 +1,23 @@
 import unittest
+import asyncio
+import json
 import sys
 import os
+import io
+import tempfile
+import time
+import xml.dom.minidom
+import random
+import shutil
+import subprocess
+import plistlib
+import struct
+from unittest import mock
+from concurrent.futures import ProcessPoolExecutor
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+import yaml
 
 # Add the project root and src directory to the path
 project_root = os.path.dirname(os.path.dirname(__file__))
@@ -8,10 +25,42 @@ src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, project_root)
 sys.path.insert(0, src_path)
 
-from src.config import ConfigGenerator
-from src.terminal import TerminalPreviewGenerator
-from src.themes import get_colors_for_theme, COLOR_MAPPINGS
+from src.config import ConfigGenerator, KeyBinding, SplitLua, FONT_OPTIONS, LaunchMenuEntry, SshDomain
+from src.lua import LuaEmitter, LuaExpr, lua_string
+from src.terminal import (TerminalPreviewGenerator, generate_terminal_js, get_terminal_runtime_version,
+                          generate_cast_config, generate_live_channel_config, TERMINAL_RUNTIME_URL)
+from src.live_slider import LIVE_SLIDER_DIR, live_slider
+from src.themes import get_colors_for_theme, get_ansi_palette, COLOR_MAPPINGS, ANSI_PALETTES, scheme_names
+from src.ansi import BOLD, INVERSE, DEFAULT_STYLE, apply_sgr, ansi_to_html, iter_runs, span_attributes, strip_ansi
 from src.utils import config_has_changed
+from src.api import ConfigApiServer
+from src.keybindings import (KeyBindingIndex, binding_key, find_conflicts, parse_binding_line, format_binding_line,
+                             format_conflict)
+from src.history import ConfigHistory, snapshot_cost
+from src.feature_registry import Feature, FeatureDependencyError, FeatureRegistry
+from src.option_schema import OptionSchema, OptionSchemaError, check_value, load_option_schema
+from src.static_export import EXPORT_SOURCE_DIR, export_data, export_static_site
+from src.prewarm import render_artifacts, PreviewPrewarmer, PrewarmedArtifacts, neighbouring_configs
+from src.sharelink import (CLOSE_CONFIRMATIONS, COLOR_SCHEMES, CURSOR_STYLES, HYPERLINK_RULE_LABELS, THEMES,
+                           WINDOW_DECORATIONS, ShareLinkError, decode_config, encode_config, MAX_URL_CODE_LENGTH)
+from src.hyperlink_profiler import (HyperlinkRule, analyze_backtracking, builtin_rules, parse_rule_arg,
+                                     probe_backtracking, profile_rules, rule_warnings, synthetic_scrollback)
+from src.cast import (CastFormatError, MAX_PUBLISHED_CASTS, SAMPLE_CAST_PATH, chunk_events, prune_casts, publish_cast,
+                      read_cast, touch_cast)
+from src.gallery import gallery_specs, gallery_html, render_gallery, render_thumbnail, thumbnail_key
+from src.artifact_cache import ArtifactCache, artifact_key
+from src.colormath import (contrast_ratio, derive_palette, derive_palettes, hex_to_srgb, linear_to_oklab,
+                           oklab_to_linear, srgb_to_hex, srgb_to_linear, NORMAL_CONTRAST)
+from src.live_apply import LiveApplier, atomic_write
+from src.fonts import FontIndex, font_choices, read_font_faces
+from src.scheme_import import import_schemes, normalize_color, SchemeImportError
+from src.warm_start import build_warm_start, hyperlink_rule_warnings, session_value
+from src.list_editor import LAUNCH_MENU, SSH_DOMAINS, apply_row_ops
+from src.model import WezTermConfig, DEFAULT_WEZTERM_CONFIG
+try:
+    import lupa
+except ImportError:
+    lupa = None
 
 
 class TestBasicMath(unittest.TestCase):
@@ -163,6 +212,1314 @@ class TestUtils(unittest.TestCase):
         self.assertIsInstance(result, bool)
 
 
+class TestTerminalPreview(unittest.TestCase):
+    """Terminal önizlemesi için testler"""
+
+    def test_preview_references_static_runtime(self):
+        """Önizleme çalışma zamanını satır içine gömmeden referans verir"""
+        html = TerminalPreviewGenerator.generate_dynamic_terminal_preview('Dark', 'Hack', 14, 'Builtin Dark')
+        self.assertIn(f"terminal.js?v={get_terminal_runtime_version()}", html)
+        self.assertNotIn('const commands', html)
+        self.assertIn('id="wezterm-term-config"', html)
+
+    def test_inline_runtime(self):
+        """inline_runtime ile çalışma zamanı gömülür"""
+        colors = COLOR_MAPPINGS['Nord']
+        js = generate_terminal_js(colors, 14, 1.0, '', 8, 0.95, True, False, inline_runtime=True)
+        self.assertIn('const commands', js)
+
+
+class TestPreviewPrewarmer(unittest.TestCase):
+    """Önizleme ön ısıtıcısı için testler"""
+
+    def setUp(self):
+        self.config = {
+            'theme': 'Dark', 'font': 'Hack', 'font_size': 14, 'color_scheme': 'Builtin Dark',
+            'custom_colors': {}, 'opacity': 0.95, 'enable_tab_bar': True, 'enable_scroll_bar': False,
+            'default_cursor_style': 'Block', 'padding': 8, 'line_height': 1.0, 'use_fancy_tab_bar': True,
+            'hyperlinkRules': ['URL Algılama'], 'leader_key': 'CTRL + a', 'window_width': 800,
+            'window_height': 600
+        }
+
+    def test_neighbours_cover_schemes_cursors_and_tab_bar(self):
+        """Komşular tüm şema, imleç ve sekme çubuğu kombinasyonlarını kapsar"""
+        neighbours = list(neighbouring_configs(self.config))
+        self.assertEqual(len(neighbours), len(COLOR_MAPPINGS) * 3 * 2)
+
+    def test_next_choice_is_cache_hit(self):
+        """Ön ısıtmadan sonra bir sonraki seçim önbellekten gelir"""
+        prewarmer = PreviewPrewarmer(cpu_share=1.0)
+        prewarmer.schedule('session', self.config).result(timeout=30)
+        choice = dict(self.config, color_scheme='Nord', default_cursor_style='Bar')
+        self.assertIsNotNone(prewarmer.get(choice))
+
+    def test_cancel_stops_batch(self):
+        """Yeni bir seçim önceki toplu işi iptal eder"""
+        prewarmer = PreviewPrewarmer(cpu_share=1.0)
+        prewarmer.cancel('session')
+        future = prewarmer._executor.submit(prewarmer._prewarm, 'session', 0, self.config)
+        self.assertEqual(future.result(timeout=30), 0)
+
+    def test_finished_sessions_are_forgotten(self):
+        """Biten ya da iptal edilen oturumların nesil kaydı tutulmaz"""
+        prewarmer = PreviewPrewarmer(cpu_share=1.0, max_entries=10 ** 4)
+        for session in range(3):
+            prewarmer.schedule(session, self.config).result(timeout=60)
+        prewarmer.cancel('gone')
+        self.assertEqual(prewarmer._generations, {})
+
+    def test_cache_is_bounded(self):
+        """Önbellek en fazla max_entries kayıt tutar"""
+        prewarmer = PreviewPrewarmer(max_entries=2)
+        for size in (10, 11, 12):
+            prewarmer.put(dict(self.config, font_size=size), PrewarmedArtifacts('', ''))
+        self.assertEqual(prewarmer.stats()['entries'], 2)
+        self.assertIsNone(prewarmer.get(dict(self.config, font_size=10)))
+
+
+class TestConfigApi(unittest.TestCase):
+    """Yerel HTTP API için testler"""
+
+    def request_all(self, requests):
+        async def run():
+            server = ConfigApiServer(port=0)
+            await server.start()
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            responses = []
+            for method, path, payload in requests:
+                body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+                writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+                await writer.drain()
+                head = (await reader.readuntil(b'\r\n\r\n')).decode()
+                length = int(head.lower().split('content-length:')[1].split('\r\n')[0])
+                status = int(head.split(' ')[1])
+                responses.append((status, json.loads(await reader.readexactly(length))))
+            writer.close()
+            await server.close()
+            return responses
+        return asyncio.run(run())
+
+    def test_keep_alive_and_batch(self):
+        """Aynı bağlantı üzerinden tekil ve toplu istekler yanıtlanır"""
+        (status, single), (batch_status, batch) = self.request_all([
+            ('POST', '/lua', {'color_scheme': 'Nord'}),
+            ('POST', '/lua', [{'font_size': 12}, {'font_size': 20}]),
+        ])
+        self.assertEqual(status, 200)
+        self.assertIn("config.color_scheme = 'Nord'", single['lua'])
+        self.assertEqual(batch_status, 200)
+        self.assertIn('config.font_size = 20', batch[1]['lua'])
+
+    def test_theme_lookup(self):
+        """Tema uç noktaları renkleri döndürür, bilinmeyenler 404 verir"""
+        (status, colors), (missing_status, _) = self.request_all([
+            ('GET', '/themes/Nord', None),
+            ('GET', '/themes/Yok', None),
+        ])
+        self.assertEqual(status, 200)
+        self.assertEqual(colors, COLOR_MAPPINGS['Nord'])
+        self.assertEqual(missing_status, 404)
+
+    def test_invalid_content_length(self):
+        """Sayı olmayan ya da negatif Content-Length 400 yanıtı alır"""
+        async def run(length):
+            server = ConfigApiServer(port=0)
+            await server.start()
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            writer.write(f"POST /lua HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode())
+            await writer.drain()
+            head = (await reader.readuntil(b'\r\n\r\n')).decode()
+            writer.close()
+            await server.close()
+            return int(head.split(' ')[1])
+        for length in ('abc', '-5'):
+            with self.subTest(length=length):
+                self.assertEqual(asyncio.run(asyncio.wait_for(run(length), 10)), 400)
+
+
+class TestWezTermConfig(unittest.TestCase):
+    """Değişmez yapılandırma modeli için testler"""
+
+    def test_mapping_access_and_immutability(self):
+        """Model sözlük gibi okunur ama değiştirilemez"""
+        config = WezTermConfig(font_size=16, window_position=[10, 20])
+        self.assertEqual(config['font_size'], 16)
+        self.assertEqual(config['window_position'][0], 10)
+        self.assertEqual(config.custom_colors['bg'], '#282828')
+        with self.assertRaises(AttributeError):
+            config.font_size = 18
+        with self.assertRaises(TypeError):
+            WezTermConfig(unknown_option=1)
+
+    def test_replace_shares_unchanged_values(self):
+        """replace değişmeyen değerleri paylaşır"""
+        updated = DEFAULT_WEZTERM_CONFIG.replace(padding=12)
+        self.assertIs(updated['custom_colors'], DEFAULT_WEZTERM_CONFIG['custom_colors'])
+        self.assertEqual(updated.changed_fields(DEFAULT_WEZTERM_CONFIG), ['padding'])
+        self.assertEqual(DEFAULT_WEZTERM_CONFIG['padding'], 8)
+
+    def test_usable_as_cache_key(self):
+        """Eşit yapılandırmalar eşit hash üretir"""
+        first = WezTermConfig(hyperlinkRules=['URL Algılama'])
+        second = WezTermConfig.from_mapping(first.to_dict())
+        self.assertEqual(first, second)
+        self.assertEqual(len({first, second}), 1)
+        self.assertFalse(config_has_changed(first, second))
+        self.assertTrue(config_has_changed(first, second.replace(font='Hack')))
+
+    def test_lua_generation_accepts_model(self):
+        """Lua üretimi model ile de çalışır"""
+        lua = ConfigGenerator.generate_wezterm_lua(WezTermConfig(window_position=[5, 6]))
+        self.assertIn('config.initial_position = { x = 5, y = 6 }', lua)
+
+
+class TestLuaEmitter(unittest.TestCase):
+    """Lua yayıcısı ve tuş atamaları için testler"""
+
+    def test_string_escaping(self):
+        """Lua string ifadeleri doğru kaçışlanır"""
+        self.assertEqual(lua_string("it's"), "'it\\'s'")
+        self.assertEqual(lua_string('a\\b\n'), "'a\\\\b\\n'")
+
+    def test_tables_are_streamed(self):
+        """Tablolar girdi girdi akışa yazılır"""
+        stream = io.StringIO()
+        lua = LuaEmitter(stream)
+        with lua.table('config.keys') as keys:
+            keys.item({'key': 'a', 'action': LuaExpr('act.Nop')})
+            self.assertIn("{ key = 'a', action = act.Nop },", stream.getvalue())
+        self.assertTrue(stream.getvalue().endswith('}\n'))
+
+    def test_keys_section_uses_leader(self):
+        """Lider tuşu keys bölümünü ve key_tables'ı üretir"""
+        config = dict(DEFAULT_WEZTERM_CONFIG.to_dict(), leader_key='CTRL + SHIFT + b')
+        lua = ConfigGenerator.generate_wezterm_lua(config)
+        self.assertIn("config.leader = { key = 'b', mods = 'CTRL|SHIFT', timeout_milliseconds = 1000 }", lua)
+        self.assertIn("mods = 'LEADER|CTRL|SHIFT', action = act.SendKey { key = 'b', mods = 'CTRL|SHIFT' }", lua)
+        self.assertIn('config.key_tables = {', lua)
+        lua = ConfigGenerator.generate_wezterm_lua(dict(config, leader_key="CTRL + '"))
+        self.assertIn("action = act.SendKey { key = '\\'', mods = 'CTRL' }", lua)
+
+    def test_user_bindings_are_emitted(self):
+        """Kullanıcı tuş atamaları config.keys'e eklenir"""
+        config = WezTermConfig(keys=[{'key': 't', 'mods': 'CTRL|SHIFT', 'action': "act.SpawnTab 'DefaultDomain'"}])
+        self.assertIsInstance(config['keys'][0], KeyBinding)
+        lua = ConfigGenerator.generate_wezterm_lua(config)
+        self.assertIn("{ key = 't', mods = 'CTRL|SHIFT', action = act.SpawnTab 'DefaultDomain' },", lua)
+
+
+class TestKeyBindingIndex(unittest.TestCase):
+    """Tuş ataması çakışma indeksi testleri"""
+
+    def test_chords_are_normalized(self):
+        """Büyük harf SHIFT eklenmiş küçük harf ile aynı tuştur"""
+        self.assertEqual(binding_key(KeyBinding('T', 'CTRL', None)), binding_key(KeyBinding('t', 'SHIFT|CTRL', None)))
+        self.assertEqual(binding_key(KeyBinding('a', 'CMD', None)), binding_key(KeyBinding('a', 'SUPER', None)))
+
+    def test_duplicate_and_default_conflicts(self):
+        """Aynı tuşa iki atama ve varsayılanı gölgeleyen atama raporlanır"""
+        bindings = [KeyBinding('q', 'CTRL|ALT', 'act.Nop'), KeyBinding('Q', 'CTRL|ALT|SHIFT', 'act.Nop'),
+                    KeyBinding('q', 'CTRL|ALT', 'act.Hide')]
+        kinds = [conflict.kind for conflict in find_conflicts(bindings)]
+        self.assertEqual(kinds, ['duplicate'])
+        conflicts = find_conflicts([KeyBinding('t', 'CTRL|SHIFT', 'act.Nop')])
+        self.assertEqual(conflicts[0].kind, 'shadows_default')
+        self.assertIn('varsayılan', format_conflict(conflicts[0]))
+
+    def test_leader_shadowing(self):
+        """Lider tuşuyla aynı sade atama lideri gölgeler, LEADER ile başlayan atama gölgelemez"""
+        index = KeyBindingIndex()
+        index.set_leader('a', 'CTRL')
+        self.assertEqual(index.add(KeyBinding('a', 'LEADER|CTRL', 'act.Nop')), [])
+        self.assertEqual([c.kind for c in index.add(KeyBinding('a', 'CTRL', 'act.Nop'))], ['shadows_leader'])
+        index.set_leader('b', 'CTRL')
+        self.assertEqual(index.conflicts(), [])
+
+    def test_sync_only_touches_changes(self):
+        """sync eklenen ve kaldırılan atamaları yansıtır"""
+        index = KeyBindingIndex(defaults=[])
+        first = [KeyBinding(str(i), 'ALT', 'act.Nop') for i in range(10)]
+        index.sync(first)
+        self.assertEqual(len(index), 10)
+        index.sync(first[1:] + [KeyBinding('2', 'ALT', 'act.Hide')])
+        self.assertEqual(len(index), 10)
+        self.assertEqual([c.kind for c in index.conflicts()], ['duplicate'])
+        index.sync([])
+        self.assertEqual((len(index), index.conflicts()), (0, []))
+
+    def test_parse_binding_line(self):
+        """'MOD + TUŞ -> aksiyon' satırları ayrıştırılır"""
+        self.assertEqual(parse_binding_line("CTRL|SHIFT + t -> act.SpawnTab 'DefaultDomain'"),
+                         KeyBinding('t', 'CTRL|SHIFT', "act.SpawnTab 'DefaultDomain'"))
+        self.assertEqual(parse_binding_line('CTRL + SHIFT + + -> act.IncreaseFontSize'),
+                         KeyBinding('+', 'CTRL|SHIFT', 'act.IncreaseFontSize'))
+        with self.assertRaises(ValueError):
+            parse_binding_line('CTRL + t')
+        with self.assertRaises(ValueError):
+            parse_binding_line('HYPER + t -> act.Nop')
+
+
+class TestHyperlinkProfiler(unittest.TestCase):
+    """Bağlantı kuralı profilleyici testleri"""
+
+    def test_synthetic_corpus_is_deterministic(self):
+        """Aynı tohum aynı derlemi üretir"""
+        self.assertEqual(list(synthetic_scrollback(200, seed=3)), list(synthetic_scrollback(200, seed=3)))
+        self.assertEqual(len(list(synthetic_scrollback(50))), 50)
+
+    def test_static_analysis(self):
+        """İç içe niceleyiciler işaretlenir, hazır kurallar iç içe niceleyici içermez"""
+        kinds = [risk.kind for risk in analyze_backtracking(r'(\w+\s?)+$')]
+        self.assertIn('nested_quantifier', kinds)
+        self.assertIn('overlapping_alternation', [risk.kind for risk in analyze_backtracking(r'(ab|\wc)+!')])
+        self.assertEqual(analyze_backtracking(r'\bJIRA-\d+\b'), [])
+        for rule in builtin_rules():
+            self.assertNotIn('nested_quantifier', [risk.kind for risk in analyze_backtracking(rule.regex)])
+
+    def test_profile_reports_throughput_and_errors(self):
+        """Profil eşleşme sayısını ve derleme hatalarını raporlar"""
+        rules = builtin_rules(['URL Algılama']) + [parse_rule_arg('kırık=(')]
+        url, broken = profile_rules(rules, synthetic_scrollback(500), probe=False)
+        self.assertEqual(url.lines, 500)
+        self.assertGreater(url.matches, 0)
+        self.assertGreater(url.matches_per_second, 0)
+        self.assertIsNotNone(url.slowdown)
+        self.assertIsNotNone(broken.error)
+        self.assertEqual(len(rule_warnings(broken)), 1)
+
+    def test_probe_detects_catastrophic_backtracking(self):
+        """Üstel geri izleme yapan kural uyarı üretir, doğrusal kural üretmez"""
+        self.assertGreaterEqual(probe_backtracking(r'(a+)+$').exponent, 3)
+        evil, safe = profile_rules([HyperlinkRule('kötü', r'(a+)+$'), HyperlinkRule('iyi', r'\bJIRA-\d+\b')],
+                                   synthetic_scrollback(100), probe=True)
+        self.assertTrue(rule_warnings(evil))
+        self.assertLess(safe.probe.exponent, 1.5)
+
+
+class TestCastReplay(unittest.TestCase):
+    """asciinema kaydı oynatma testleri"""
+
+    def test_read_v2_and_v3(self):
+        """v2 mutlak, v3 göreli zamanları mutlak zamana çevrilir"""
+        header, events = read_cast(SAMPLE_CAST_PATH)
+        self.assertEqual((header.version, header.width), (2, 100))
+        times = [time for time, _, _ in events]
+        self.assertEqual(times, sorted(times))
+
+        v3 = io.StringIO('{"version": 3, "term": {"cols": 90, "rows": 30}}\n[0.5, "o", "a"]\n[0.25, "o", "b"]\n')
+        header, events = read_cast(v3)
+        self.assertEqual((header.width, header.height), (90, 30))
+        self.assertEqual([(time, data) for time, _, data in events], [(0.5, 'a'), (0.75, 'b')])
+
+        with self.assertRaises(CastFormatError):
+            read_cast(io.StringIO('{"version": 1}\n'))
+
+    def test_malformed_casts(self):
+        """Bozuk başlık ve olaylar yalnızca CastFormatError ile reddedilir"""
+        for header in ('{"version": 3, "term": "xterm"}', '{"version": 2, "width": "80", "height": 24}',
+                       '{"version": 2, "width": 80, "height": 24, "idle_time_limit": "2"}'):
+            with self.subTest(header=header), self.assertRaises(CastFormatError):
+                read_cast(io.StringIO(header + '\n'))
+        for event in ('["0.5", "o", "a"]', '[0.5, "o", 42]', '[0.5, 1, "a"]', '[true, "o", "a"]', '{"t": 0.5}',
+                      '[0.5, "o"]'):
+            with self.subTest(event=event), tempfile.TemporaryDirectory() as directory:
+                cast = io.StringIO('{"version": 2, "width": 80, "height": 24}\n' + event + '\n')
+                with self.assertRaises(CastFormatError):
+                    publish_cast(cast, directory)
+
+    def test_chunks_merge_frames_and_cap_idle(self):
+        """Aynı karedeki çıktılar birleşir, girdi olayları atlanır, uzun beklemeler kısaltılır"""
+        events = [(0.0, 'o', 'a'), (0.005, 'o', 'b'), (0.006, 'i', 'x'), (0.1, 'o', 'c'), (30.0, 'o', 'd')]
+        chunks = list(chunk_events(events, idle_time_limit=2.0))
+        self.assertEqual([chunk.data for chunk in chunks], ['ab', 'c', 'd'])
+        self.assertEqual(chunks[-1].time, 2.1)
+
+    def test_publish_is_streamed_and_content_addressed(self):
+        """Yayınlanan kayıt içerik özetiyle adlandırılır ve NDJSON olarak yazılır"""
+        with tempfile.TemporaryDirectory() as directory:
+            url = publish_cast(SAMPLE_CAST_PATH, directory)
+            self.assertEqual(url, publish_cast(SAMPLE_CAST_PATH, directory))
+            with open(os.path.join(directory, url.rsplit('/', 1)[1]), encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual(lines[0]['width'], 100)
+            self.assertTrue(all(len(line) == 2 for line in lines[1:]))
+
+            with io.BytesIO(b'{"version": 2, "width": 10, "height": 5}\n[0.1, "o", "x"]\n') as upload:
+                publish_cast(upload, directory)
+                self.assertFalse(upload.closed)
+            prune_casts(directory, keep=1)
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_pinned_sample_and_used_replays_survive_pruning(self):
+        """Örnek kayıt ve kullanılmaya devam eden kayıtlar diğer yüklemelerle silinmez"""
+        def upload(number):
+            return io.StringIO('{"version": 2, "width": 10, "height": 5}\n' + f'[0.1, "o", "{number}"]\n')
+
+        with tempfile.TemporaryDirectory() as directory:
+            sample_url = publish_cast(SAMPLE_CAST_PATH, directory, pin=True)
+            used_url = publish_cast(upload('used'), directory)
+            first_url = publish_cast(upload('first'), directory)
+            for number in range(MAX_PUBLISHED_CASTS + 5):
+                self.assertTrue(touch_cast(used_url, directory))
+                publish_cast(upload(number), directory)
+            self.assertTrue(touch_cast(sample_url, directory))
+            self.assertTrue(touch_cast(used_url, directory))
+            self.assertFalse(touch_cast(first_url, directory))
+            self.assertEqual(len(os.listdir(directory)), MAX_PUBLISHED_CASTS + 1)
+
+    def test_cast_config_tag(self):
+        """Oynatma etiketi script kapanışını kaçışlar"""
+        self.assertEqual(generate_cast_config(None), '')
+        tag = generate_cast_config('app/static/casts/</script>.ndjson', 2.0)
+        self.assertIn('id="wezterm-cast-config"', tag)
+        self.assertEqual(tag.count('</script>'), 1)
+
+
+class TestAnsiRenderer(unittest.TestCase):
+    """ANSI SGR çıktı işleyici testleri"""
+
+    def test_apply_sgr(self):
+        """16, 256 ve truecolor renkler, iki nokta alt parametreleri ve sıfırlama"""
+        self.assertEqual(apply_sgr(DEFAULT_STYLE, '1;31'), (1, None, BOLD))
+        self.assertEqual(apply_sgr(DEFAULT_STYLE, '94;102'), (12, 10, 0))
+        self.assertEqual(apply_sgr(DEFAULT_STYLE, '38;5;208;48;2;1;2;3'), (208, '#010203', 0))
+        self.assertEqual(apply_sgr(DEFAULT_STYLE, '38:2::255:0:0'), ('#ff0000', None, 0))
+        self.assertEqual(apply_sgr((1, 2, BOLD), ''), DEFAULT_STYLE)
+        self.assertEqual(apply_sgr((1, 2, BOLD), '22;39'), (None, 2, 0))
+        self.assertEqual(apply_sgr(DEFAULT_STYLE, '31;38;5'), (1, None, 0))
+
+    def test_runs_are_merged(self):
+        """Aynı özellikli bitişik metin tek parçada birleşir, diğer kaçışlar atılır"""
+        runs = list(iter_runs('\x1b[31ma\x1b[31mb\x1b[Kc\x1b[0md\x1b]0;title\x07e'))
+        self.assertEqual(runs, [((1, None, 0), 'abc'), (DEFAULT_STYLE, 'de')])
+        self.assertEqual(strip_ansi('\x1b[1mx\x1b[0m\x07'), 'x')
+
+    def test_span_attributes(self):
+        """Kalın renkler parlaklaşır, ters çevirme ön/arka planı değiştirir"""
+        self.assertEqual(span_attributes(DEFAULT_STYLE), ('', ''))
+        self.assertEqual(span_attributes((1, None, BOLD)), ('a-f9 a-b', ''))
+        self.assertEqual(span_attributes((None, 4, INVERSE)), ('a-f4 a-gfg', ''))
+        self.assertEqual(span_attributes((208, None, 0)), ('', 'color:#ff8700'))
+
+    def test_html_is_escaped(self):
+        """Varsayılan stil çıplak, metin HTML olarak kaçışlanmış yazılır"""
+        self.assertEqual(ansi_to_html('<b>&'), '&lt;b&gt;&amp;')
+        self.assertEqual(ansi_to_html('\x1b[32m<ok>\x1b[0m'), '<span class="a-f2">&lt;ok&gt;</span>')
+
+    def test_palettes(self):
+        """Her renk şemasının 16 rengi vardır"""
+        for scheme in COLOR_MAPPINGS:
+            palette = get_ansi_palette('Dark', scheme)
+            self.assertEqual(len(palette), 16, scheme)
+            self.assertTrue(all(color.startswith('#') for color in palette))
+        self.assertEqual(get_ansi_palette('Custom', 'Dracula'), ANSI_PALETTES['Builtin Dark'])
+
+    def test_preview_uses_palette(self):
+        """Önizleme palet değişkenlerini ve sınıf kurallarını içerir"""
+        html = TerminalPreviewGenerator.generate_dynamic_terminal_preview('Dark', 'JetBrains Mono', 14, 'Dracula')
+        self.assertIn(f"--ansi-1:{ANSI_PALETTES['Dracula'][1]}", html)
+        self.assertIn('.a-f1{color:var(--ansi-1)}', html)
+
+
+class TestSchemeGallery(unittest.TestCase):
+    """Şema galerisi küçük resim testleri"""
+
+    def test_thumbnail_is_valid_svg(self):
+        """Küçük resim geçerli SVG'dir ve şemanın renklerini kullanır"""
+        spec = gallery_specs(['Fira Code'], [13])[3]
+        svg = render_thumbnail(spec)
+        root = xml.dom.minidom.parseString(svg).documentElement
+        self.assertEqual(root.tagName, 'svg')
+        self.assertIn(spec.colors['bg'], svg)
+        self.assertIn(spec.palette[1], svg)
+        self.assertIn('Fira Code', root.getAttribute('font-family'))
+
+    def test_specs_cover_catalog(self):
+        """Her şema, yazı tipi ve boyut için bir küçük resim istenir"""
+        specs = gallery_specs(['Hack', 'Menlo'], [12, 14, 16])
+        self.assertEqual(len(specs), len(COLOR_MAPPINGS) * 6)
+        self.assertEqual(len({thumbnail_key(spec) for spec in specs}), len(specs))
+
+    def test_disk_cache(self):
+        """Önbellekteki küçük resimler yeniden çizilmez, renk değişince ad değişir"""
+        specs = gallery_specs(['Hack'], [14])
+        with tempfile.TemporaryDirectory() as directory:
+            urls = render_gallery(specs, directory, workers=0)
+            self.assertEqual(len(os.listdir(os.path.join(directory, 'svg'))), len(specs))
+            first = os.path.join(directory, 'svg', urls[0].rsplit('/', 1)[1])
+            inode = os.stat(first).st_ino
+            self.assertEqual(render_gallery(specs, directory, workers=0), urls)
+            # A rewrite would have renamed a new file into place
+            self.assertEqual(os.stat(first).st_ino, inode)
+
+        edited = specs[0]._replace(colors=dict(specs[0].colors, bg='#000001'))
+        self.assertNotEqual(thumbnail_key(edited), thumbnail_key(specs[0]))
+
+    def test_gallery_html_has_no_script(self):
+        """Galeri yalnızca img etiketlerinden oluşur"""
+        specs = gallery_specs(['Hack'], [14])
+        html = gallery_html(specs, [f"app/static/gallery/{index}.svg" for index in range(len(specs))])
+        self.assertEqual(html.count('<img'), len(specs))
+        self.assertNotIn('<script', html)
+        self.assertNotIn('<iframe', html)
+
+
+def _fill_artifact_cache(directory):
+    # Runs in a worker process: the same keys as the other workers, large enough to be written in pieces
+    cache = ArtifactCache(directory)
+    for index in range(20):
+        cache.put('lua', artifact_key('lua', index), f"-- {index}\n" * 20000)
+    return cache.stats()['total']['writes']
+
+
+class TestArtifactCache(unittest.TestCase):
+    """Disk üzerindeki artifact önbelleği testleri"""
+
+    def test_round_trip_and_stats(self):
+        """Yazılan içerik okunur, isabet ve ıskalar sayılır"""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ArtifactCache(directory)
+            key = artifact_key('lua', {'font_size': 14})
+            self.assertIsNone(cache.get('lua', key))
+            self.assertEqual(cache.get_or_create('lua', key, lambda: 'return {}'), 'return {}')
+            self.assertEqual(cache.get_or_create('lua', key, lambda: self.fail("yeniden üretildi")), 'return {}')
+            self.assertTrue(cache.path('lua', key).endswith('.lua'))
+            stats = cache.stats()
+            self.assertEqual((stats['total']['hits'], stats['total']['misses']), (1, 2))
+            self.assertAlmostEqual(stats['kinds']['lua']['hit_rate'], 1 / 3)
+            self.assertEqual(cache.disk_usage()['lua']['entries'], 1)
+
+    def test_keys_cover_inputs(self):
+        """Anahtar türe ve girdilere bağlıdır, sözlük sırasına bağlı değildir"""
+        self.assertEqual(artifact_key('lua', {'a': 1, 'b': 2}), artifact_key('lua', {'b': 2, 'a': 1}))
+        self.assertNotEqual(artifact_key('lua', {'a': 1}), artifact_key('preview', {'a': 1}))
+        self.assertNotEqual(artifact_key('lua', {'a': 1}), artifact_key('lua', {'a': 2}))
+
+    def test_size_based_lru_eviction(self):
+        """Sınır aşılınca en uzun süre kullanılmayan girdiler silinir"""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ArtifactCache(directory, max_bytes=3000)
+            for index in range(3):
+                cache.put('preview', str(index), 'x' * 1000)
+                os.utime(cache.path('preview', str(index)), (index, index))
+            self.assertIsNotNone(cache.get('preview', '0'))
+            cache.put('preview', '3', 'x' * 1000)
+            self.assertFalse(os.path.exists(cache.path('preview', '1')))
+            self.assertTrue(os.path.exists(cache.path('preview', '0')))
+            self.assertEqual(cache.stats()['total']['evictions'], 1)
+
+    def test_concurrent_processes(self):
+        """Aynı dizine yazan süreçler yalnızca tam dosyalar bırakır"""
+        with tempfile.TemporaryDirectory() as directory:
+            with ProcessPoolExecutor(max_workers=3) as pool:
+                self.assertEqual(list(pool.map(_fill_artifact_cache, [directory] * 3)), [20] * 3)
+            cache = ArtifactCache(directory)
+            self.assertEqual(sorted(os.listdir(os.path.join(directory, 'lua'))),
+                             sorted(os.path.basename(cache.path('lua', artifact_key('lua', index)))
+                                    for index in range(20)))
+            self.assertEqual(cache.get('lua', artifact_key('lua', 7)), "-- 7\n" * 20000)
+
+    def test_prewarmer_survives_restart(self):
+        """Ön ısıtıcı yeniden başlatıldığında çıktıları diskten alır"""
+        config = DEFAULT_WEZTERM_CONFIG.replace(font_size=17)
+        with tempfile.TemporaryDirectory() as directory:
+            first = PreviewPrewarmer(disk_cache=ArtifactCache(directory)).get_or_render(config)
+            restarted = PreviewPrewarmer(disk_cache=ArtifactCache(directory))
+            self.assertEqual(restarted.get_or_render(config), first)
+            self.assertEqual(restarted.stats()['disk']['total']['hits'], 2)
+
+
+class TestLiveApply(unittest.TestCase):
+    """Canlı yapılandırma yazımı testleri"""
+
+    def wait_for(self, applier, **expected):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            stats = applier.stats()
+            if all(stats[name] == value for name, value in expected.items()) and not stats['pending']:
+                return stats
+            time.sleep(0.01)
+        self.fail(f"Beklenen durum oluşmadı: {applier.stats()}")
+
+    def test_burst_is_coalesced_into_one_write(self):
+        """Pencere içindeki art arda değişiklikler tek yazmaya dönüşür"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'wezterm', 'wezterm.lua')
+            applier = LiveApplier(path, debounce_seconds=0.1)
+            for size in range(10, 20):
+                applier.submit(f"return {{ font_size = {size} }}")
+            stats = self.wait_for(applier, writes=1)
+            self.assertEqual(stats['coalesced'], 9)
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual(f.read(), "return { font_size = 19 }")
+            self.assertEqual(os.listdir(os.path.dirname(path)), ['wezterm.lua'])
+
+    def test_unchanged_content_is_skipped(self):
+        """İçerik özeti aynıysa dosyaya dokunulmaz"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'wezterm.lua')
+            atomic_write(path, "return {}")
+            applier = LiveApplier(path, debounce_seconds=0.01)
+            applier.submit("return {}")
+            self.wait_for(applier, unchanged=1)
+            self.assertEqual(applier.stats()['writes'], 0)
+            self.assertFalse(os.path.exists(path + '.bak'))
+
+    def test_first_write_backs_up_and_follows_symlinks(self):
+        """İlk yazım eski dosyayı yedekler, sembolik bağ korunur"""
+        with tempfile.TemporaryDirectory() as directory:
+            target = os.path.join(directory, 'dotfiles.lua')
+            link = os.path.join(directory, 'wezterm.lua')
+            atomic_write(target, "-- el yazımı")
+            os.symlink(target, link)
+            applier = LiveApplier(link, debounce_seconds=0.01)
+            applier.submit("return {}")
+            applier.flush()
+            self.wait_for(applier, writes=1)
+            self.assertTrue(os.path.islink(link))
+            with open(target + '.bak', encoding='utf-8') as f:
+                self.assertEqual(f.read(), "-- el yazımı")
+            with open(link, encoding='utf-8') as f:
+                self.assertEqual(f.read(), "return {}")
+
+
+    def test_split_layout_rewrites_only_changed_files(self):
+        """Bölünmüş çıktıda yalnızca içeriği değişen dosyalar yazılır, artık modüller silinir"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'wezterm.lua')
+            keys_path = os.path.join(directory, 'wezterm_gui', 'keys.lua')
+            applier = LiveApplier(path, debounce_seconds=0.01)
+            applier.submit(ConfigGenerator.split_wezterm_lua(DEFAULT_WEZTERM_CONFIG))
+            applier.flush()
+            self.wait_for(applier, writes=1, files_written=4)
+            os.utime(keys_path, (0, 0))
+
+            applier.submit(ConfigGenerator.split_wezterm_lua(DEFAULT_WEZTERM_CONFIG.replace(font_size=20)))
+            applier.flush()
+            self.wait_for(applier, writes=2, files_written=5, files_unchanged=3)
+            self.assertEqual(os.stat(keys_path).st_mtime, 0)
+
+            applier.submit(ConfigGenerator.split_wezterm_lua(DEFAULT_WEZTERM_CONFIG.replace(hyperlinkRules=[])))
+            applier.flush()
+            self.wait_for(applier, writes=3)
+            self.assertEqual(sorted(os.listdir(os.path.join(directory, 'wezterm_gui'))), ['colors.lua', 'keys.lua'])
+
+            applier.submit(ConfigGenerator.generate_wezterm_lua(DEFAULT_WEZTERM_CONFIG))
+            applier.flush()
+            self.wait_for(applier, writes=4)
+            self.assertEqual(os.listdir(os.path.join(directory, 'wezterm_gui')), [])
+
+class TestLiveSlider(unittest.TestCase):
+    """Canlı kaydırıcı bileşeni testleri"""
+
+    def test_component_and_channel(self):
+        """Bileşen ön ucu mevcuttur, kanal etiketi önizlemeye eklenir"""
+        with open(os.path.join(LIVE_SLIDER_DIR, 'index.html'), encoding='utf-8') as f:
+            frontend = f.read()
+        self.assertIn('streamlit:setComponentValue', frontend)
+        self.assertIn('BroadcastChannel', frontend)
+        self.assertEqual(generate_live_channel_config(None), '')
+        self.assertIn('"wezterm-preview-1"', generate_live_channel_config('wezterm-preview-1'))
+
+    def test_value_keeps_declared_type(self):
+        """Dönen değer bildirilen değerin türündedir"""
+        self.assertEqual(type(live_slider('Dolgu', 0, 20, 8)), int)
+        self.assertEqual(type(live_slider('Satır Yüksekliği', 0.8, 2.0, 1.0, 0.1)), float)
+
+
+class TestColorMath(unittest.TestCase):
+    """Vektörel renk hesapları ve özel tema paleti testleri"""
+
+    def test_oklab_round_trip(self):
+        """sRGB -> OKLab -> sRGB dönüşümü rengi korur"""
+        colors = ['#000000', '#ffffff', '#ff0000', '#282828', '#b8bb26', '#5fafff']
+        srgb = hex_to_srgb(colors)
+        linear = oklab_to_linear(linear_to_oklab(srgb_to_linear(srgb)))
+        self.assertLess(abs(linear - srgb_to_linear(srgb)).max(), 1e-9)
+        self.assertEqual(list(srgb_to_hex(srgb)), colors)
+        self.assertAlmostEqual(float(contrast_ratio(hex_to_srgb('#000000'), hex_to_srgb('#ffffff'))), 21.0)
+
+    def test_derived_colors_meet_contrast(self):
+        """Türetilen renkli ANSI renkleri açık ve koyu arka planlarda yeterli kontrasta sahiptir"""
+        schemes = list(COLOR_MAPPINGS.values()) + [
+            {'bg': '#808080', 'fg': '#101010', 'prompt': '#777777'},
+            {'bg': '#fffff0', 'fg': '#ffffff', 'prompt': '#ffff00'},
+        ]
+        for colors, palette in zip(schemes, derive_palettes(schemes)):
+            self.assertEqual(len(palette['ansi']), 8)
+            self.assertEqual(len(palette['brights']), 8)
+            chromatic = hex_to_srgb(palette['ansi'][1:7] + palette['brights'][1:7])
+            self.assertGreaterEqual(contrast_ratio(chromatic, hex_to_srgb(colors['bg'])).min(), NORMAL_CONTRAST)
+
+    def test_batch_matches_single(self):
+        """Toplu türetme tek tek türetmeyle aynı sonucu verir"""
+        schemes = list(COLOR_MAPPINGS.values())
+        self.assertEqual(derive_palettes(schemes), [derive_palette(colors) for colors in schemes])
+        self.assertEqual(derive_palettes([]), [])
+
+    def test_custom_theme_palette(self):
+        """Özel tema önizlemede ve Lua çıktısında türetilen 16 rengi kullanır"""
+        custom = {'bg': '#1e1e2e', 'fg': '#cdd6f4', 'prompt': '#f5c2e7'}
+        palette = get_ansi_palette('Custom', None, custom)
+        self.assertEqual(len(palette), 16)
+        self.assertNotEqual(palette, ANSI_PALETTES['Builtin Dark'])
+        config = dict(DEFAULT_WEZTERM_CONFIG, theme='Custom', custom_colors=custom)
+        lua = ConfigGenerator.generate_wezterm_lua(config)
+        self.assertIn('brights = {', lua)
+        self.assertIn(palette[1], lua)
+        self.assertIn(derive_palette(custom)['selection_bg'], lua)
+
+
+class TestConfigHistory(unittest.TestCase):
+    """Geri alma/yineleme geçmişi testleri"""
+
+    def test_undo_redo(self):
+        """Geri alma ve yineleme anlık görüntüleri sırayla geri getirir; yeni düzenleme yinelemeyi siler"""
+        history = ConfigHistory()
+        first = DEFAULT_WEZTERM_CONFIG
+        second = first.replace(font_size=16)
+        third = second.replace(opacity=0.8)
+        for config in (first, second, third):
+            self.assertTrue(history.record(config))
+        self.assertFalse(history.record(third.replace()))
+        self.assertIs(history.undo(), second)
+        self.assertIs(history.undo(), first)
+        self.assertIsNone(history.undo())
+        self.assertIs(history.redo(), second)
+        history.record(second.replace(padding=4))
+        self.assertFalse(history.can_redo())
+        self.assertIs(history.undo(), second)
+
+    def test_memory_stays_bounded(self):
+        """Binlerce kaydırıcı düzenlemesinden sonra geçmiş sınırlar içinde kalır"""
+        history = ConfigHistory(max_entries=100, max_bytes=20 * 1024)
+        config = DEFAULT_WEZTERM_CONFIG
+        for step in range(5000):
+            config = config.replace(font_size=8 + step % 24, opacity=round(0.5 + (step % 50) / 100, 2))
+            history.record(config)
+        stats = history.stats()
+        self.assertLessEqual(len(history), 100)
+        self.assertLessEqual(stats['bytes'], 20 * 1024)
+        self.assertGreater(stats['dropped'], 0)
+        self.assertIs(history.current, config)
+
+    def test_snapshots_share_unchanged_values(self):
+        """Bir adımın maliyeti yalnızca değişen alanları içerir"""
+        config = DEFAULT_WEZTERM_CONFIG.replace(keys=[KeyBinding('t', 'CTRL', 'act.Nop')] * 50)
+        edited = config.replace(font_size=20)
+        self.assertIs(edited['keys'], config['keys'])
+        self.assertLess(snapshot_cost(edited, config), snapshot_cost(config) / 4)
+
+    def test_binding_line_round_trip(self):
+        """Geri yüklenen tuş atamaları düzenleyicide aynı atamalara ayrıştırılır"""
+        for line in ("CTRL|SHIFT + t -> act.SpawnTab 'DefaultDomain'", "CTRL + + -> act.IncreaseFontSize",
+                     "F1 -> act.Nop"):
+            binding = parse_binding_line(line)
+            self.assertEqual(parse_binding_line(format_binding_line(binding)), binding)
+
+
+class TestShareLink(unittest.TestCase):
+    """Paylaşım bağlantısı kodlayıcısı testleri"""
+
+    def assertRoundTrip(self, config, max_length):
+        code = encode_config(config)
+        self.assertLessEqual(len(code), max_length, (code, config))
+        self.assertRegex(code, r'^[A-Za-z0-9_-]+$')
+        self.assertEqual(decode_config(code), config)
+
+    def test_default_config_is_tiny(self):
+        """Varsayılan yapılandırma birkaç karaktere sığar"""
+        self.assertRoundTrip(DEFAULT_WEZTERM_CONFIG, 4)
+
+    def test_choice_fields(self):
+        """Her tema, yazı tipi, şema ve imleç stili birleşimi gidip gelir ve kısa kalır"""
+        for theme in THEMES:
+            for font in FONT_OPTIONS:
+                for scheme in COLOR_SCHEMES:
+                    for cursor in CURSOR_STYLES:
+                        config = DEFAULT_WEZTERM_CONFIG.replace(
+                            theme=theme, font=font, color_scheme=scheme, default_cursor_style=cursor,
+                            custom_colors={'bg': '#000000', 'fg': '#ffffff', 'prompt': '#12ab9f'}
+                            if theme == 'Custom' else None)
+                        self.assertRoundTrip(config, 32)
+
+    def test_flags_sizes_and_lists(self):
+        """Boolean alanlar, boyutlar ve bit kümeleri tüm aralıklarında gidip gelir"""
+        booleans = [name for name in DEFAULT_WEZTERM_CONFIG if isinstance(DEFAULT_WEZTERM_CONFIG[name], bool)]
+        for mask in range(1 << len(booleans)):
+            flags = {name: bool(mask >> index & 1) for index, name in enumerate(booleans)}
+            self.assertRoundTrip(DEFAULT_WEZTERM_CONFIG.replace(**flags), 8)
+        for font_size in range(8, 33):
+            for step in range(0, 51, 5):
+                self.assertRoundTrip(DEFAULT_WEZTERM_CONFIG.replace(
+                    font_size=font_size, opacity=round(0.5 + step / 100, 2), padding=step % 21,
+                    line_height=round(0.8 + (step % 13) / 10, 1)), 16)
+        for mask in range(1 << len(WINDOW_DECORATIONS)):
+            for close in CLOSE_CONFIRMATIONS:
+                self.assertRoundTrip(DEFAULT_WEZTERM_CONFIG.replace(
+                    window_decorations=[name for index, name in enumerate(WINDOW_DECORATIONS) if mask >> index & 1],
+                    hyperlinkRules=[name for index, name in enumerate(HYPERLINK_RULE_LABELS) if mask >> index & 1],
+                    window_close_confirmation=close, window_width=400 + mask * 220, window_height=2160,
+                    window_position=[-mask * 100, 3000]), 24)
+
+    def test_free_form_values(self):
+        """Listede olmayan değerler, tuş atamaları ve özel renkler kaybolmadan taşınır"""
+        config = DEFAULT_WEZTERM_CONFIG.replace(
+            theme='Custom', color_scheme='Custom', font='Iosevka Term', leader_key=None,
+            custom_colors={'bg': '#1e1e2e', 'fg': '#cdd6f4', 'prompt': '#f5c2e7'},
+            keys=[KeyBinding('t', 'CTRL|SHIFT', "act.SpawnTab 'DefaultDomain'"),
+                  KeyBinding('Escape', '', "'PopKeyTable'", 'resize_pane')])
+        self.assertRoundTrip(config, 160)
+
+    def test_invalid_codes(self):
+        """Bozuk kodlar ShareLinkError verir"""
+        code = encode_config(DEFAULT_WEZTERM_CONFIG.replace(font='Hack', custom_colors=None))
+        for bad in ('', 'Ag', code[:-2], code + 'AA', '!!!', 'AX8'):
+            with self.assertRaises(ShareLinkError):
+                decode_config(bad)
+        with self.assertRaises(ShareLinkError):
+            encode_config(DEFAULT_WEZTERM_CONFIG.replace(hyperlinkRules=['Bilinmeyen']))
+        # Well-formed codes whose numbers are outside the sidebar's bounds
+        for bad in ('ASD0Aw', 'AQQA', 'AQSAlOvcAw'):
+            with self.assertRaises(ShareLinkError):
+                decode_config(bad)
+        for name, value in (('font_size', 33), ('opacity', 0.49), ('padding', 21), ('line_height', 2.01),
+                            ('window_width', 5000), ('window_height', 100)):
+            with self.subTest(name=name), self.assertRaises(ShareLinkError):
+                decode_config(encode_config(DEFAULT_WEZTERM_CONFIG.replace(**{name: value})))
+
+
+class TestFeatureRegistry(unittest.TestCase):
+    """FeatureRegistry bağımlılık grafiği testleri"""
+
+    def setUp(self):
+        FeatureRegistry.reset()
+        for name in ('theme', 'custom_bg', 'custom_bg_alpha', 'font_size'):
+            st.session_state.pop(name, None)
+        FeatureRegistry.register(Feature('theme', 'Tema', 'Dark', options=['Dark', 'Custom']))
+        FeatureRegistry.register(Feature('custom_bg', 'Tema', '#000000', depends_on={'theme': 'Custom'}))
+        FeatureRegistry.register(Feature('custom_bg_alpha', 'Tema', True, widget_type='checkbox',
+                                         depends_on={'custom_bg': '#000000'}))
+        FeatureRegistry.register(Feature('font_size', 'Tema', 14, widget_type='slider'))
+
+    def tearDown(self):
+        FeatureRegistry.reset()
+
+    def test_topological_order_and_cycles(self):
+        """Bağımlılıklar önce sıralanır, döngü kayıt sırasında reddedilir"""
+        order = FeatureRegistry.topological_order()
+        self.assertLess(order.index('theme'), order.index('custom_bg'))
+        self.assertLess(order.index('custom_bg'), order.index('custom_bg_alpha'))
+        with self.assertRaises(FeatureDependencyError):
+            FeatureRegistry.register(Feature('theme', 'Tema', 'Dark', depends_on={'custom_bg_alpha': True}))
+        with self.assertRaises(FeatureDependencyError):
+            FeatureRegistry.register(Feature('loop', 'Tema', 1, depends_on={'loop': 1}))
+        self.assertEqual(FeatureRegistry.get_feature('theme').depends_on, None)
+
+    def test_only_dependents_are_reevaluated(self):
+        """Bir değer değişince yalnızca ona bağlı özellikler yeniden değerlendirilir"""
+        FeatureRegistry.sync_with_session_state()
+        self.assertFalse(FeatureRegistry.is_visible('custom_bg'))
+        self.assertFalse(FeatureRegistry.is_visible('custom_bg_alpha'))
+
+        st.session_state['theme'] = 'Custom'
+        self.assertEqual(FeatureRegistry.sync_with_session_state(), ['custom_bg', 'custom_bg_alpha'])
+        self.assertTrue(FeatureRegistry.is_visible('custom_bg_alpha'))
+
+        st.session_state['font_size'] = 20
+        evaluations = FeatureRegistry._evaluations
+        self.assertEqual(FeatureRegistry.sync_with_session_state(), [])
+        self.assertEqual(FeatureRegistry._evaluations, evaluations)
+
+        st.session_state['custom_bg'] = '#ffffff'
+        self.assertEqual(FeatureRegistry.sync_with_session_state(), ['custom_bg_alpha'])
+        self.assertFalse(FeatureRegistry.is_visible('custom_bg_alpha'))
+        self.assertTrue(FeatureRegistry.is_visible('custom_bg'))
+
+    def test_failing_condition_snapshots_every_key(self):
+        """İlk koşul tutmasa da sonraki bağımlılıklar kaydedilir, değişmeden yeniden değerlendirilmez"""
+        st.session_state.pop('tab_bar', None)
+        FeatureRegistry.register(Feature('tab_bar', 'Tema', True, widget_type='checkbox'))
+        FeatureRegistry.register(Feature('tab_color', 'Tema', '#000000',
+                                         depends_on={'theme': 'Custom', 'tab_bar': True}))
+        FeatureRegistry.sync_with_session_state()
+        self.assertFalse(FeatureRegistry.is_visible('tab_color'))
+        evaluations = FeatureRegistry._evaluations
+        self.assertEqual(FeatureRegistry.sync_with_session_state(), [])
+        self.assertEqual(FeatureRegistry._evaluations, evaluations)
+
+
+class TestOptionSchema(unittest.TestCase):
+    """Şema tabanlı WezTerm seçenekleri testleri"""
+
+    def setUp(self):
+        self.schema = load_option_schema()
+
+    def test_schema_covers_options(self):
+        """Şema yüzlerce seçeneği kapsar ve varsayılanları kendi türlerine uyar"""
+        self.assertGreater(len(self.schema), 150)
+        for spec in self.schema.specs:
+            self.assertEqual(check_value(spec, spec.default), spec.default)
+            if spec.builtin:
+                self.assertIn(spec.builtin, WezTermConfig.FIELDS)
+        self.assertEqual(self.schema.non_default({spec.name: spec.default for spec in self.schema.editable()}), {})
+        FeatureRegistry.reset()
+        try:
+            FeatureRegistry.register_defaults(self.schema)
+            self.assertEqual(len(FeatureRegistry.topological_order()), len(self.schema.editable()))
+        finally:
+            FeatureRegistry.reset()
+
+    def test_lua_emits_only_changed_options(self):
+        """Lua çıktısına yalnızca varsayılandan farklı seçenekler yazılır, tablo alanları birleşir"""
+        self.assertNotIn('Additional options', ConfigGenerator.generate_wezterm_lua(DEFAULT_WEZTERM_CONFIG))
+        config = DEFAULT_WEZTERM_CONFIG.replace(extra_options={
+            'scrollback_lines': 10000, 'tab_bar_at_bottom': True, 'check_for_updates': True,
+            'inactive_pane_hsb.hue': 0.5, 'inactive_pane_hsb.brightness': 0.6,
+            'harfbuzz_features': ['calt=0', 'liga=0']})
+        self.assertNotIn('check_for_updates', config['extra_options'])
+        lua = ConfigGenerator.generate_wezterm_lua(config)
+        self.assertIn("config.scrollback_lines = 10000", lua)
+        self.assertIn("config.tab_bar_at_bottom = true", lua)
+        self.assertIn("config.harfbuzz_features = { 'calt=0', 'liga=0' }", lua)
+        self.assertIn("config.inactive_pane_hsb = { hue = 0.5, brightness = 0.6 }", lua)
+        self.assertNotIn('check_for_updates', lua)
+
+    def test_round_trips(self):
+        """Ek seçenekler model, sözlük ve paylaşım bağlantısı üzerinden kaybolmadan taşınır"""
+        config = DEFAULT_WEZTERM_CONFIG.replace(extra_options={
+            'scrollback_lines': 0, 'front_end': 'WebGpu', 'inactive_pane_hsb.saturation': 0.25,
+            'harfbuzz_features': ['zero'], 'tab_bar_at_bottom': True})
+        self.assertEqual(WezTermConfig.from_mapping(config.to_dict()), config)
+        self.assertEqual(hash(WezTermConfig.from_mapping(config.to_dict())), hash(config))
+        self.assertEqual(decode_config(encode_config(config)), config)
+
+    def test_invalid_values(self):
+        """Şemaya uymayan değerler ve bilinmeyen seçenekler reddedilir"""
+        for bad in ({'scrollback_lines': -1}, {'scrollback_lines': 'many'}, {'front_end': 'Vulkan'},
+                    {'no_such_option': 1}, {'font_size': 12}):
+            with self.assertRaises(OptionSchemaError):
+                DEFAULT_WEZTERM_CONFIG.replace(extra_options=bad)
+        with self.assertRaises(OptionSchemaError):
+            OptionSchema.from_dict({'categories': [{'name': 'A', 'options': [
+                {'name': 'x', 'type': 'int', 'default': 1, 'depends_on': {'y': True}}]}]})
+
+    def test_every_category_renders(self):
+        """Her seçenek kategorisi açıldığında uygulama hatasız çalışır"""
+        # The app's caches and indexes go to a temporary directory instead of the developer's home
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch('src.artifact_cache.ARTIFACT_CACHE_DIR', os.path.join(directory, 'artifacts')), \
+                mock.patch('src.fonts.FONT_INDEX_PATH', os.path.join(directory, 'fonts.json')), \
+                mock.patch('src.themes.IMPORTED_SCHEMES_PATH', os.path.join(directory, 'schemes.json')):
+            st.cache_resource.clear()
+            try:
+                at = AppTest.from_file(os.path.join(project_root, 'app.py'), default_timeout=120).run()
+                self.assertFalse(at.exception)
+                for category in self.schema.categories:
+                    with self.subTest(category=category):
+                        at.session_state[f"options_{category}"] = True
+                        at.run()
+                        self.assertFalse(at.exception, [exception.value for exception in at.exception])
+            finally:
+                # Cached resources would keep pointing into the removed directory
+                st.cache_resource.clear()
+
+
+# Generates Lua and previews with static/export/wezterm_config.js for configs read from stdin
+PARITY_SCRIPT = """
+const fs = require("fs");
+const input = JSON.parse(fs.readFileSync(0, "utf8"));
+const generator = require(process.argv[1]).create(input.data);
+const output = input.configs.map(config => ({
+    lua: generator.generateLua(config), preview: generator.generatePreview(config, input.runtimeSrc)
+}));
+process.stdout.write(JSON.stringify(output));
+"""
+
+
+@unittest.skipUnless(shutil.which('node'), "Node.js yok")
+class TestStaticExport(unittest.TestCase):
+    """Statik dışa aktarımın JavaScript üreticisinin Python ile eşliği testleri"""
+
+    def run_javascript(self, configs):
+        runtime_src = f"{TERMINAL_RUNTIME_URL}?v={get_terminal_runtime_version()}"
+        payload = json.dumps({'data': export_data(runtime_src), 'runtimeSrc': runtime_src,
+                              'configs': [WezTermConfig.from_mapping(config).to_dict() for config in configs]})
+        result = subprocess.run(['node', '-e', PARITY_SCRIPT, os.path.join(EXPORT_SOURCE_DIR, 'wezterm_config.js')],
+                                input=payload, capture_output=True, text=True, encoding='utf-8', timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return json.loads(result.stdout)
+
+    def assertParity(self, configs):
+        for config, output in zip(configs, self.run_javascript(configs)):
+            preview_html, lua_code = render_artifacts(WezTermConfig.from_mapping(config))
+            self.assertEqual(output['lua'], lua_code, config)
+            self.assertEqual(output['preview'], preview_html, config)
+
+    def test_builtin_schemes_and_toggles(self):
+        """Hazır şemalar, imleç stilleri ve açılıp kapanan bölümler Python ile aynı çıktıyı verir"""
+        configs = []
+        for scheme in COLOR_SCHEMES[:-1]:
+            for cursor in CURSOR_STYLES:
+                configs.append(DEFAULT_WEZTERM_CONFIG.replace(
+                    color_scheme=scheme, default_cursor_style=cursor, enable_tab_bar=cursor != 'Bar',
+                    use_fancy_tab_bar=cursor == 'Block', enable_scroll_bar=cursor == 'Underline'))
+        configs.append(DEFAULT_WEZTERM_CONFIG.replace(
+            leader_key=None, hyperlinkRules=[], window_decorations=[], window_position=[-20, 40],
+            window_fullscreen=True, window_hide_tab_bar_if_only_one_tab=False, line_height=2.0, opacity=1.0))
+        self.assertParity(configs)
+
+    def test_custom_palettes(self):
+        """Özel renklerden türetilen paletler JavaScript'te de bit bit aynıdır"""
+        rng = random.Random(45)
+        configs = [DEFAULT_WEZTERM_CONFIG.replace(
+            theme='Custom', color_scheme='Custom',
+            custom_colors={name: f"#{rng.randrange(1 << 24):06x}" for name in ('bg', 'fg', 'prompt')})
+            for _ in range(40)]
+        configs.append(DEFAULT_WEZTERM_CONFIG.replace(
+            theme='Custom', color_scheme='Custom', custom_colors={'bg': '#FFFFFF', 'fg': '#000000', 'prompt': '#FF0000'}))
+        self.assertParity(configs)
+
+    def test_free_form_values(self):
+        """Tuş atamaları, kaçış gerektiren metinler ve şema seçenekleri aynı biçimde yazılır"""
+        self.assertParity([DEFAULT_WEZTERM_CONFIG.replace(
+            font="It's </script> ü 😀", leader_key='ALT + SHIFT + \\', window_maximized=True,
+            keys=[KeyBinding('t', 'CTRL|SHIFT', "act.SpawnTab 'DefaultDomain'"),
+                  KeyBinding('Escape', '', "'PopKeyTable'", 'copy_mode'),
+                  KeyBinding('ü', 'ALT', "act.SendString '\\t'")],
+            ssh_domains=[SshDomain('web', 'web.example.com'), SshDomain("o'neil", 'db:2222', 'admin', 'None')],
+            launch_menu=[LaunchMenuEntry('Günlük', ('tail', '-f', '/var/log/a b.log'), '~/logs')],
+            extra_options={'scrollback_lines': 10000, 'inactive_pane_hsb.hue': 0.5,
+                           'inactive_pane_hsb.brightness': 1.0, 'harfbuzz_features': ['calt=0', 'liga=0'],
+                           'front_end': 'WebGpu', 'tab_bar_at_bottom': True})])
+
+    def test_export_writes_bundle(self):
+        """Dışa aktarım sayfayı, betikleri ve gömülü veriyi yazar"""
+        with tempfile.TemporaryDirectory() as output_dir:
+            written = export_static_site(output_dir)
+            self.assertEqual(set(written), set(os.listdir(output_dir)))
+            with open(os.path.join(output_dir, 'index.html'), encoding='utf-8') as f:
+                page = f.read()
+            self.assertNotIn('__WEZTERM_EXPORT_DATA__', page)
+            self.assertIn('<script src="wezterm_config.js"></script>', page)
+            data = page.split('type="application/json">', 1)[1].split('</script>', 1)[0]
+            self.assertEqual(json.loads(data)['options'][0]['name'], load_option_schema().editable()[0].name)
+
+
+# Just enough of the wezterm module for the generated config to evaluate
+WEZTERM_STUB = """
+package.loaded.wezterm = {
+  action = setmetatable({}, { __index = function(_, name)
+    return setmetatable({ name = name }, { __call = function(self, args) return { self.name, args } end })
+  end }),
+  config_builder = function() return {} end,
+  font = function(family) return { family = family } end,
+}
+"""
+
+
+class TestSplitLua(unittest.TestCase):
+    """Modüllere bölünmüş Lua çıktısı testleri"""
+
+    def test_sections_move_into_modules(self):
+        """Kullanılan her bölüm kendi modülüne taşınır ve giriş dosyasından require edilir"""
+        config = DEFAULT_WEZTERM_CONFIG.replace(extra_options={'scrollback_lines': 5000})
+        split = ConfigGenerator.split_wezterm_lua(config)
+        self.assertIsInstance(split, SplitLua)
+        self.assertEqual(list(split.modules), ['wezterm_gui/links.lua', 'wezterm_gui/keys.lua',
+                                               'wezterm_gui/options.lua', 'wezterm_gui/colors.lua'])
+        self.assertIn("require('wezterm_gui.keys').apply_to_config(config)", split.entry)
+        self.assertNotIn('config.keys', split.entry)
+        self.assertIn("  config.scrollback_lines = 5000\nend\n", split.modules['wezterm_gui/options.lua'])
+
+    def test_unused_sections_are_left_out(self):
+        """Kullanılmayan bölümler için ne modül ne require satırı üretilir"""
+        split = ConfigGenerator.generate_wezterm_modules(DEFAULT_WEZTERM_CONFIG.replace(hyperlinkRules=[],
+                                                                                        leader_key=''))
+        self.assertEqual(list(split.modules), ['wezterm_gui/colors.lua'])
+        self.assertNotIn('wezterm_gui.keys', split.entry)
+
+    @unittest.skipUnless(lupa, "lupa yok")
+    def test_split_evaluates_to_the_same_config(self):
+        """Bölünmüş çıktı Lua'da tek dosyayla aynı yapılandırmayı üretir"""
+        def to_python(value):
+            if lupa.lua_type(value) == 'table':
+                return {key: to_python(item) for key, item in value.items()}
+            return value
+
+        def evaluate(entry, modules):
+            runtime = lupa.LuaRuntime()
+            runtime.execute(WEZTERM_STUB)
+            for path, source in modules.items():
+                name = path[:-len('.lua')].replace('/', '.')
+                runtime.globals().package.preload[name] = runtime.eval(f"function() {source} end")
+            return to_python(runtime.execute(entry))
+
+        config = DEFAULT_WEZTERM_CONFIG.replace(
+            theme='Custom', extra_options={'scrollback_lines': 5000},
+            keys=[KeyBinding('t', 'SUPER', "act.SpawnTab 'CurrentPaneDomain'")],
+            ssh_domains=[SshDomain('web', 'web.example.com', 'deploy')],
+            launch_menu=[LaunchMenuEntry('htop', ('htop',))])
+        split = ConfigGenerator.split_wezterm_lua(config)
+        single = evaluate(ConfigGenerator.generate_wezterm_lua(config), {})
+        self.assertEqual(evaluate(split.entry, split.modules), single)
+        self.assertEqual(single['scrollback_lines'], 5000)
+
+
+def build_font(family, style='Regular', fixed_pitch=True, units_per_em=1000, avg_width=600):
+    """Minimal sfnt file with the tables the font index reads"""
+    names = [(1, family), (2, style)]
+    strings = b''.join(text.encode('utf-16-be') for _, text in names)
+    records, offset = b'', 0
+    for name_id, text in names:
+        length = len(text.encode('utf-16-be'))
+        records += struct.pack('>HHHHHH', 3, 1, 0x409, name_id, length, offset)
+        offset += length
+    tables = {
+        b'OS/2': struct.pack('>Hh', 4, avg_width) + bytes(28) + bytes([2, 0, 0, 9 if fixed_pitch else 3]) + bytes(6),
+        b'head': bytes(18) + struct.pack('>H', units_per_em) + bytes(34),
+        b'hhea': bytes(4) + struct.pack('>hhh', 800, -200, 0) + bytes(26),
+        b'name': struct.pack('>HHH', 0, len(names), 6 + 12 * len(names)) + records + strings,
+        b'post': bytes(12) + struct.pack('>I', 1 if fixed_pitch else 0) + bytes(16),
+    }
+    directory, body = b'', b''
+    data_offset = 12 + 16 * len(tables)
+    for tag, data in tables.items():
+        directory += struct.pack('>4sIII', tag, 0, data_offset + len(body), len(data))
+        body += data + bytes(-len(data) % 4)
+    return struct.pack('>4sHHHH', b'\x00\x01\x00\x00', len(tables), 0, 0, 0) + directory + body
+
+
+class TestFontIndex(unittest.TestCase):
+    """Yüklü yazı tipi dizini testleri"""
+
+    def write_font(self, path, *args, **kwargs):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(build_font(*args, **kwargs))
+
+    def test_reads_monospace_faces_with_metrics(self):
+        """Eş aralıklı yüzler ölçüleriyle okunur, orantılı yazı tipleri atlanır"""
+        with tempfile.TemporaryDirectory() as directory:
+            self.write_font(os.path.join(directory, 'mono.ttf'), 'Test Mono', units_per_em=2048, avg_width=1229)
+            self.write_font(os.path.join(directory, 'sans.ttf'), 'Test Sans', fixed_pitch=False)
+            face, = read_font_faces(os.path.join(directory, 'mono.ttf'))
+            self.assertEqual((face['family'], face['style'], face['units_per_em']), ('Test Mono', 'Regular', 2048))
+            self.assertEqual(read_font_faces(os.path.join(directory, 'sans.ttf')), [])
+
+    def test_index_rescans_only_changed_directories(self):
+        """Dizin yalnızca değişiklik zamanı değişen klasörleri yeniden tarar ve diske kaydedilir"""
+        with tempfile.TemporaryDirectory() as directory:
+            fonts = os.path.join(directory, 'fonts')
+            index_path = os.path.join(directory, 'index.json')
+            self.write_font(os.path.join(fonts, 'a', 'mono.ttf'), 'Test Mono')
+            self.write_font(os.path.join(fonts, 'a', 'mono-bold.ttf'), 'Test Mono', style='Bold', avg_width=620)
+            self.write_font(os.path.join(fonts, 'b', 'sans.ttf'), 'Test Sans', fixed_pitch=False)
+
+            index = FontIndex([fonts], index_path)
+            self.assertEqual(index.refresh()['files_parsed'], 3)
+            family, = index.families()
+            self.assertEqual((family.name, family.styles, family.cell_width), ('Test Mono', ['Bold', 'Regular'], 0.6))
+            self.assertEqual(family.line_height, 1.0)
+
+            # A new process starts from the persisted index and reads no font files
+            index = FontIndex([fonts], index_path)
+            stats = index.refresh()
+            self.assertEqual((stats['directories'], stats['rescanned'], stats['files_parsed']), (3, 0, 0))
+            self.assertEqual(index.families(), [family])
+
+            self.write_font(os.path.join(fonts, 'b', 'other.ttf'), 'Other Mono')
+            os.utime(os.path.join(fonts, 'b'), ns=(0, 0))
+            stats = index.refresh()
+            self.assertEqual((stats['rescanned'], stats['files_parsed']), (1, 2))
+            self.assertEqual([family.name for family in index.families()], ['Other Mono', 'Test Mono'])
+
+    def test_choices_keep_current_and_bundled_fonts(self):
+        """Seçenekler kurulu ve WezTerm ile gelen aileleri, seçili yazı tipini de içerir"""
+        self.assertEqual(font_choices(['Hack'], 'Menlo'), ['Hack', 'JetBrains Mono', 'Menlo'])
+        self.assertEqual(font_choices([], fallback=['Fira Code']), ['Fira Code', 'JetBrains Mono'])
+
+
+class TestSchemeImport(unittest.TestCase):
+    """iTerm2, base16 ve Alacritty şema içe aktarımı testleri"""
+
+    PALETTE = ['#1d1f21', '#cc6666', '#b5bd68', '#f0c674', '#81a2be', '#b294bb', '#8abeb7', '#c5c8c6',
+               '#969896', '#d54e53', '#b9ca4a', '#e7c547', '#7aa6da', '#c397d8', '#70c0b1', '#eaeaea']
+
+    def write(self, path, content):
+        with open(path, 'wb' if isinstance(content, bytes) else 'w') as f:
+            f.write(content)
+
+    def itermcolors(self, bg, fg, palette):
+        def component(color):
+            return {f'{channel} Component': int(color[1 + offset:3 + offset], 16) / 255
+                    for channel, offset in (('Red', 0), ('Green', 2), ('Blue', 4))}
+        return plistlib.dumps({'Background Color': component(bg), 'Foreground Color': component(fg),
+                               **{f'Ansi {index} Color': component(color) for index, color in enumerate(palette)}})
+
+    def alacritty_toml(self, bg, fg, palette):
+        names = ['black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white']
+        return (f"[colors.primary]\nbackground = '{bg}'\nforeground = '{fg}'\n[colors.normal]\n"
+                + ''.join(f"{name} = '{color}'\n" for name, color in zip(names, palette[:8]))
+                + "[colors.bright]\n" + ''.join(f"{name} = '{color}'\n" for name, color in zip(names, palette[8:])))
+
+    def test_formats_are_normalized_and_deduplicated(self):
+        """Üç biçim de katalog biçimine dönüşür; aynı palet bir kez alınır, hatalı dosyalar raporlanır"""
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'schemes')
+            os.makedirs(source)
+            self.write(os.path.join(source, 'Tomorrow Night.itermcolors'),
+                       self.itermcolors('#1d1f21', '#c5c8c6', self.PALETTE))
+            # Same colors from another terminal: dropped by palette hash
+            self.write(os.path.join(source, 'tomorrow.toml'), self.alacritty_toml('#1d1f21', '#c5c8c6', self.PALETTE))
+            self.write(os.path.join(source, 'ocean.yaml'), 'scheme: "Ocean"\n' + ''.join(
+                f'base0{digit}: "{color[1:]}"\n' for digit, color in zip('0123456789ABCDEF', self.PALETTE)))
+            # Gruvbox is built in already
+            gruvbox = ANSI_PALETTES['Gruvbox']
+            self.write(os.path.join(source, 'gruvbox.toml'), self.alacritty_toml('#282828', '#ebdbb2', gruvbox))
+            self.write(os.path.join(source, 'broken.yml'), 'colors:\n  primary:\n    background: "#zzzzzz"\n')
+
+            index_path = os.path.join(directory, 'schemes.json')
+            report = import_schemes([source], index_path, workers=0)
+            self.assertEqual((report['files'], report['imported'], report['duplicates']), (5, 2, 2))
+            self.assertEqual([os.path.basename(path) for path, _ in report['failed']], ['broken.yml'])
+
+            with mock.patch('src.themes.IMPORTED_SCHEMES_PATH', index_path):
+                self.assertEqual(scheme_names()[-2:], ['Ocean', 'Tomorrow Night'])
+                self.assertEqual(get_colors_for_theme('Dark', 'Tomorrow Night'),
+                                 {'bg': '#1d1f21', 'fg': '#c5c8c6', 'prompt': '#81a2be'})
+                self.assertEqual(get_ansi_palette('Dark', 'Tomorrow Night'), self.PALETTE)
+                self.assertEqual(get_colors_for_theme('Dark', 'Ocean')['fg'], '#b294bb')
+                lua = ConfigGenerator.generate_wezterm_lua(DEFAULT_WEZTERM_CONFIG.replace(color_scheme='Ocean'))
+                self.assertIn("config.color_schemes = {\n  Ocean = {\n    background = '#1d1f21',", lua)
+                self.assertIn("config.color_scheme = 'Ocean'", lua)
+
+    def test_reimport_replaces_changed_scheme(self):
+        """Aynı dosya yeniden içe aktarılınca şeması güncellenir"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'mine.toml')
+            index_path = os.path.join(directory, 'schemes.json')
+            self.write(path, self.alacritty_toml('#000000', '#ffffff', self.PALETTE))
+            import_schemes([path], index_path, workers=0)
+            self.write(path, self.alacritty_toml('#101010', '#ffffff', self.PALETTE))
+            report = import_schemes([path], index_path, workers=0)
+            self.assertEqual((report['imported'], report['schemes']), (1, 1))
+            with mock.patch('src.themes.IMPORTED_SCHEMES_PATH', index_path):
+                self.assertEqual(get_colors_for_theme('Dark', 'mine')['bg'], '#101010')
+
+    def test_malformed_plist_does_not_stop_batch(self):
+        """Kökü sözlük olmayan plist ve beklenmeyen hatalar yalnızca o dosyayı başarısız sayar"""
+        with tempfile.TemporaryDirectory() as directory:
+            self.write(os.path.join(directory, 'array.itermcolors'), plistlib.dumps([1, 2, 3]))
+            self.write(os.path.join(directory, 'good.itermcolors'),
+                       self.itermcolors('#1d1f21', '#c5c8c6', self.PALETTE))
+            index_path = os.path.join(directory, 'schemes.json')
+            with mock.patch('src.scheme_import.MIN_POOL_FILES', 1):
+                report = import_schemes([directory], index_path, workers=2)
+            self.assertEqual(report['imported'], 1)
+            self.assertEqual([os.path.basename(path) for path, _ in report['failed']], ['array.itermcolors'])
+
+            with mock.patch('src.scheme_import.parse_base16', side_effect=RuntimeError('boom')):
+                self.write(os.path.join(directory, 'odd.yaml'), 'base00: "000000"\n')
+                report = import_schemes([os.path.join(directory, 'odd.yaml')], index_path, workers=0)
+            self.assertIn('RuntimeError', report['failed'][0][1])
+
+    def test_color_normalization(self):
+        """Farklı yazımlardaki renkler #rrggbb biçimine çevrilir"""
+        self.assertEqual([normalize_color(value) for value in ('#ABC', '0x1D1F21', 'c5c8c6')],
+                         ['#aabbcc', '#1d1f21', '#c5c8c6'])
+        with self.assertRaises(SchemeImportError):
+            normalize_color('#12345')
+        # YAML reads unquoted 0x1d1f21 as an int
+        self.assertEqual(normalize_color(yaml.safe_load('background: 0x1d1f21')['background']), '#1d1f21')
+        for bad in (True, -1, 0x1000000):
+            with self.assertRaises(SchemeImportError):
+                normalize_color(bad)
+
+
+class TestWarmStart(unittest.TestCase):
+    """Süreç geneli hızlı başlangıç testleri"""
+
+    def test_second_process_reuses_disk_cache(self):
+        """Varsayılan önizleme bellekte hazır olur; ikinci süreç kuralları yeniden profillemez"""
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch('src.warm_start.check_rules', return_value=['URL: uyarı']) as check:
+                prewarmer = PreviewPrewarmer(disk_cache=ArtifactCache(directory))
+                warm_start = build_warm_start(prewarmer)
+                self.assertIs(prewarmer.get(DEFAULT_WEZTERM_CONFIG), warm_start.default_artifacts)
+
+                cache = ArtifactCache(directory)
+                build_warm_start(PreviewPrewarmer(disk_cache=cache))
+                self.assertEqual(check.call_count, 1)
+                self.assertEqual(cache.stats()['total']['writes'], 0)
+                self.assertEqual(hyperlink_rule_warnings(('URL Algılama',), cache), ['URL: uyarı'])
+
+    def test_session_values_do_not_share_containers(self):
+        """Oturumlar varsayılan sözlük ve listeleri kopyalar, değişmez değerleri paylaşır"""
+        defaults = build_warm_start(PreviewPrewarmer()).session_defaults
+        with self.assertRaises(TypeError):
+            defaults['theme'] = 'Light'
+        rules = session_value(defaults['hyperlinkRules'])
+        rules.append('E-posta')
+        self.assertEqual(defaults['hyperlinkRules'], ['URL Algılama'])
+        self.assertIs(session_value(defaults['current_config']), DEFAULT_WEZTERM_CONFIG)
+
+
+class TestListEditor(unittest.TestCase):
+    """Sayfalı liste düzenleyicisi ve SSH alanı / başlatma menüsü seçenekleri testleri"""
+
+    DOMAINS = (SshDomain('web', 'web.example.com'), SshDomain('db', 'db.example.com:2222', 'admin', 'None'))
+
+    def test_row_operations(self):
+        """Satır işlemleri sırayla uygulanır; geçersiz ya da yinelenen satırlar uyarıyla atlanır"""
+        ops = [{'op': 'update', 'index': 0, 'cells': ['www', 'www.example.com', '', 'WezTerm']},
+               {'op': 'insert', 'index': 2, 'cells': ['cache', 'cache.example.com', 'ops', 'None']},
+               {'op': 'delete', 'index': 1},
+               {'op': 'insert', 'index': 0, 'cells': ['www', 'other.example.com', '', 'WezTerm']},
+               {'op': 'update', 'index': 1, 'cells': ['cache', '', '', 'WezTerm']},
+               {'op': 'delete', 'index': 7}]
+        entries, warnings, touched = apply_row_ops(self.DOMAINS, ops, SSH_DOMAINS)
+        self.assertEqual(entries, (SshDomain('www', 'www.example.com'),
+                                   SshDomain('cache', 'cache.example.com', 'ops', 'None')))
+        self.assertEqual(len(warnings), 3)
+        self.assertIn("'www' zaten listede", warnings[0])
+        self.assertIn("'Adres' boş olamaz", warnings[1])
+        self.assertEqual(touched, 1)
+        self.assertEqual(self.DOMAINS[0].name, 'web')
+
+    def test_launch_menu_cells(self):
+        """Başlatma menüsü komutu kabuk sözdizimiyle tek hücrede düzenlenir"""
+        entry = LAUNCH_MENU.parse(['Günlükler', "tail -f '/var/log/my app.log'", ''])
+        self.assertEqual(entry, LaunchMenuEntry('Günlükler', ('tail', '-f', '/var/log/my app.log'), ''))
+        self.assertEqual(LAUNCH_MENU.parse(LAUNCH_MENU.cells(entry)), entry)
+        with self.assertRaises(ValueError):
+            LAUNCH_MENU.parse(['Kırık', "echo 'kapanmamış", ''])
+
+    def test_lua_and_round_trips(self):
+        """Listeler Lua'ya yazılır, sözlük ve paylaşım bağlantısı üzerinden kaybolmadan taşınır"""
+        config = DEFAULT_WEZTERM_CONFIG.replace(
+            ssh_domains=self.DOMAINS,
+            launch_menu=[{'label': 'htop', 'args': ['htop', '-d', '10'], 'cwd': '~'}])
+        lua = ConfigGenerator.generate_wezterm_lua(config)
+        self.assertIn("config.ssh_domains = {\n  { name = 'web', remote_address = 'web.example.com' },\n"
+                      "  { name = 'db', remote_address = 'db.example.com:2222', username = 'admin', "
+                      "multiplexing = 'None' },\n}", lua)
+        self.assertIn("config.launch_menu = {\n  {\n    label = 'htop',\n    args = { 'htop', '-d', '10' },\n"
+                      "    cwd = '~',\n  },\n}", lua)
+        self.assertEqual(list(ConfigGenerator.split_wezterm_lua(config).modules)[2:4],
+                         ['wezterm_gui/domains.lua', 'wezterm_gui/launch_menu.lua'])
+        self.assertEqual(WezTermConfig.from_mapping(config.to_dict()), config)
+        self.assertEqual(decode_config(encode_config(config)), config)
+
+    def test_long_lists_stay_out_of_the_url(self):
+        """Yüzlerce girdili yapılandırmanın kodu adres çubuğu sınırını aşar ama yine de çözülür"""
+        config = DEFAULT_WEZTERM_CONFIG.replace(
+            ssh_domains=[SshDomain(f'host-{index}', f'host-{index}.example.com') for index in range(300)])
+        code = encode_config(config)
+        self.assertGreater(len(code), MAX_URL_CODE_LENGTH)
+        self.assertEqual(decode_config(code), config)
+
+
 if __name__ == '__main__':
     # Test çalıştırıcısı
     print("Basit testler çalıştırılıyor...")